@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ...plugin_utils.controller import ControllerActionModule
+
+
+class ActionModule(ControllerActionModule):
+    """
+    Executes the 'gitlab.users' Module on the Controller (see ControllerActionModule).
+    """
+
+    # Module Name
+    MODULE_NAME = "gitlab.users"
@@ -0,0 +1,432 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: api_metrics
+type: aggregate
+version_added: "1.0.0"
+short_description: Aggregate the API Calls Metrics of the Collection Modules per Play
+description:
+  - Aggregates the C(api_calls) Summaries returned by the Collection Modules (HAProxy, SonarQube, Gitlab, Github and OVH)
+  - Metrics are Aggregated per Host, per Module and per API Endpoint
+  - Prints the API Round Trips, Errors, HAProxy Reloads, Bytes and Latency Percentiles of each Play when the Play Ends
+  - Writes the Metrics of the Run to a Prometheus Textfile (eg. for the node_exporter Textfile Collector) or an OpenMetrics File when C(textfile) is Set
+  - Latency Percentiles are Estimated from the Merged Latency Histograms of the Modules
+requirements:
+  - Enable the Callback in the C(callbacks_enabled) Setting of ansible.cfg
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  top:
+    description:
+      - The Maximum Number of Endpoints Printed per Play (Highest Total Latency First)
+    type: int
+    default: 20
+    env:
+      - name: KUBE_CLOUD_API_METRICS_TOP
+    ini:
+      - section: callback_api_metrics
+        key: top
+  textfile:
+    description:
+      - The Path of the Metrics File Written (Atomically) when the Run Ends
+      - No File is Written when not Set
+    type: path
+    env:
+      - name: KUBE_CLOUD_API_METRICS_TEXTFILE
+    ini:
+      - section: callback_api_metrics
+        key: textfile
+  format:
+    description:
+      - The Format of the Metrics File
+    type: str
+    default: prometheus
+    choices:
+      - prometheus
+      - openmetrics
+    env:
+      - name: KUBE_CLOUD_API_METRICS_FORMAT
+    ini:
+      - section: callback_api_metrics
+        key: format
+'''
+
+EXAMPLES = r'''
+# ansible.cfg
+# [defaults]
+# callbacks_enabled = kube_cloud.general.api_metrics
+#
+# [callback_api_metrics]
+# textfile = /var/lib/node_exporter/textfile_collector/ansible_api.prom
+'''
+
+
+import os
+import tempfile
+import time
+
+from ansible.plugins.callback import CallbackBase
+from ..module_utils.commons_instrumentation import LATENCY_BUCKETS_MS
+
+
+# Metrics Names Prefix
+METRICS_PREFIX = "kube_cloud_api"
+
+
+class ApiMetrics:
+    """
+    Aggregated Statistics of API Calls (Counters and Latency Histogram).
+
+    Attributes:
+        count (int): The Calls.
+        errors (int): The Calls Answered with an HTTP Status >= 400, or Failed without Response.
+        reloads (int): The Calls having Reloaded or Scheduled a Reload of HAProxy.
+        bytes (int): The Request and Response Bodies Size.
+        total_ms (float): The Total Latency (Milliseconds).
+        buckets (List[int]): The Calls by Latency Bucket (see LATENCY_BUCKETS_MS, last is +Inf).
+    """
+
+    def __init__(self):
+        """
+        Initializes Empty Statistics.
+        """
+        self.count = 0
+        self.errors = 0
+        self.reloads = 0
+        self.bytes = 0
+        self.total_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, statistics: dict):
+        """
+        Add Endpoint Statistics of a Module Result (or other Aggregated Statistics).
+
+        Args:
+            statistics (dict): The Endpoint Statistics ('api_calls.endpoints' Values).
+        """
+
+        # Add Counters
+        self.count += statistics.get('count', 0)
+        self.errors += statistics.get('errors', 0)
+        self.reloads += statistics.get('reloads', 0)
+        self.bytes += statistics.get('bytes', 0)
+        self.total_ms += statistics.get('total_ms', 0.0)
+
+        # Merge Histogram (Same Buckets)
+        buckets = statistics.get('buckets', None) or []
+        if len(buckets) == len(self.buckets):
+            self.buckets = [current + added for current, added in zip(self.buckets, buckets)]
+
+    def merge(self, other: 'ApiMetrics'):
+        """
+        Add other Aggregated Statistics.
+        """
+        self.add(vars(other))
+
+    def quantile(self, quantile: float) -> float:
+        """
+        Estimate a Latency Quantile (Linear Interpolation in the Histogram Bucket, like Prometheus).
+
+        Args:
+            quantile (float): The Quantile (eg. 0.95).
+
+        Returns:
+            float: The Latency (Milliseconds, Last Bound for Calls beyond the Last Bucket, at most the Total Latency).
+        """
+
+        # Rank of the Quantile
+        rank = quantile * sum(self.buckets)
+        cumulative = 0
+        lower = 0.0
+
+        # Find Bucket of the Rank
+        for index, count in enumerate(self.buckets):
+
+            # If Rank is in the +Inf Bucket
+            if index == len(LATENCY_BUCKETS_MS):
+                break
+
+            # If Rank is in Bucket
+            upper = float(LATENCY_BUCKETS_MS[index])
+            if count and cumulative + count >= rank:
+                return min(lower + (upper - lower) * (rank - cumulative) / count, self.total_ms)
+
+            # Next Bucket
+            cumulative += count
+            lower = upper
+
+        # Return Last Bound
+        return min(lower, self.total_ms)
+
+
+# Escape a Prometheus Label Value
+def escape_label(value) -> str:
+
+    # Return Escaped Value
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Format Prometheus Labels
+def format_labels(labels: dict) -> str:
+
+    # Return Labels
+    return ','.join('{0}="{1}"'.format(name, escape_label(value)) for name, value in labels.items())
+
+
+class CallbackModule(CallbackBase):
+    """
+    Callback Aggregating the API Calls Metrics of the Collection Modules per Play.
+    """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'kube_cloud.general.api_metrics'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+
+        # Initialize Callback
+        super(CallbackModule, self).__init__(*args, **kwargs)
+
+        # Initialize Plays (name, start, end, series by (host, module, endpoint))
+        self.plays = []
+        self.play = None
+
+    def v2_playbook_on_play_start(self, play):
+
+        # End Previous Play
+        self.end_play()
+
+        # Start Play
+        self.play = dict(
+            name=play.get_name().strip() or 'play',
+            start=time.time(),
+            end=None,
+            series={}
+        )
+        self.plays.append(self.play)
+
+    def v2_runner_on_ok(self, result):
+
+        # Collect Metrics
+        self.collect(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+
+        # Collect Metrics
+        self.collect(result)
+
+    def v2_playbook_on_stats(self, stats):
+
+        # End Last Play
+        self.end_play()
+
+        # If Metrics File is Configured
+        if self.get_option('textfile'):
+
+            # Write Metrics File
+            self.write_textfile(self.get_option('textfile'), self.get_option('format') == 'openmetrics')
+
+    def collect(self, result):
+        """
+        Collect the API Calls Summaries of a Task Result (Loop Items Included).
+        """
+
+        # If no Play is Started
+        if self.play is None:
+            return
+
+        # Resolve Results (Loop Items, or Task Result)
+        task_result = result._result
+        items = task_result.get('results', None)
+        items = items if isinstance(items, list) else [task_result]
+
+        # Resolve Host and Module
+        host = result._host.get_name()
+        module = getattr(result._task, 'resolved_action', None) or result._task.action
+
+        # Add Endpoints Statistics
+        for item in items:
+            api_calls = item.get('api_calls', None) if isinstance(item, dict) else None
+            for endpoint, statistics in ((api_calls or {}).get('endpoints', None) or {}).items():
+                self.play['series'].setdefault((host, module, endpoint), ApiMetrics()).add(statistics)
+
+    def end_play(self):
+        """
+        End the Current Play and Print its Metrics.
+        """
+
+        # If no Play is Started
+        if self.play is None:
+            return
+
+        # End Play
+        play, self.play = self.play, None
+        play['end'] = time.time()
+
+        # If no API Call was Recorded
+        if not play['series']:
+            return
+
+        # Print Metrics Tables
+        self._display.banner("API CALLS [{0}]".format(play['name']))
+        self.display_table('Host', self.group(play['series'], 0))
+        self.display_table('Module', self.group(play['series'], 1))
+        self.display_table('Endpoint', self.group(play['series'], 2), limit=self.get_option('top'))
+
+    @staticmethod
+    def group(series: dict, position: int) -> dict:
+        """
+        Group Series Metrics by one of the Key Parts (0 : Host, 1 : Module, 2 : Endpoint).
+        """
+
+        # Merge Metrics
+        groups = {}
+        for key, metrics in series.items():
+            groups.setdefault(key[position], ApiMetrics()).merge(metrics)
+
+        # Return Groups
+        return groups
+
+    def display_table(self, title: str, groups: dict, limit: int = None):
+        """
+        Print a Metrics Table (Highest Total Latency First).
+        """
+
+        # Sort Rows
+        names = sorted(groups, key=lambda name: groups[name].total_ms, reverse=True)
+
+        # Build Rows
+        rows = [[title, 'Calls', 'Errors', 'Reloads', 'Bytes', 'Total ms', 'p50 ms', 'p95 ms', 'p99 ms']]
+        for name in names[:limit] if limit else names:
+            metrics = groups[name]
+            rows.append([
+                name,
+                str(metrics.count),
+                str(metrics.errors),
+                str(metrics.reloads),
+                str(metrics.bytes),
+                "{0:.1f}".format(metrics.total_ms),
+                "{0:.1f}".format(metrics.quantile(0.50)),
+                "{0:.1f}".format(metrics.quantile(0.95)),
+                "{0:.1f}".format(metrics.quantile(0.99))
+            ])
+
+        # Print Rows (First Column Left Aligned)
+        widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+        for row in rows:
+            self._display.display("  ".join(
+                cell.ljust(widths[index]) if index == 0 else cell.rjust(widths[index])
+                for index, cell in enumerate(row)
+            ))
+
+        # Print Omitted Rows
+        if limit and len(names) > limit:
+            self._display.display("({0} more)".format(len(names) - limit))
+        self._display.display("")
+
+    def render_metrics(self, openmetrics: bool = False) -> str:
+        """
+        Render the Metrics of the Run in the Prometheus Text Format (or OpenMetrics).
+
+        Args:
+            openmetrics (bool): Render in the OpenMetrics Format.
+
+        Returns:
+            str: The Metrics.
+        """
+
+        # Metric Families (name, type, help, samples)
+        counters = [
+            ('calls', 'API Calls made by the Modules.', 'count'),
+            ('errors', 'API Calls Answered with an HTTP Status >= 400, or Failed without Response.', 'errors'),
+            ('reloads', 'HAProxy Reloads Triggered or Scheduled by the API Calls.', 'reloads'),
+            ('bytes', 'Request and Response Bodies Size of the API Calls.', 'bytes')
+        ]
+        lines = []
+
+        # Render Counters
+        for name, description, attribute in counters:
+            family = "{0}_{1}".format(METRICS_PREFIX, name)
+            lines.append("# HELP {0} {1}".format(family if openmetrics else family + "_total", description))
+            lines.append("# TYPE {0} counter".format(family if openmetrics else family + "_total"))
+            for play in self.plays:
+                for (host, module, endpoint), metrics in sorted(play['series'].items()):
+                    method, dummy, path = endpoint.partition(' ')
+                    labels = dict(play=play['name'], host=host, module=module, method=method, endpoint=path)
+                    lines.append("{0}_total{{{1}}} {2}".format(family, format_labels(labels), getattr(metrics, attribute)))
+
+        # Render Latency Histogram (Seconds)
+        family = "{0}_request_duration_seconds".format(METRICS_PREFIX)
+        lines.append("# HELP {0} Latency of the API Calls made by the Modules.".format(family))
+        lines.append("# TYPE {0} histogram".format(family))
+        for play in self.plays:
+            for (host, module, endpoint), metrics in sorted(play['series'].items()):
+                method, dummy, path = endpoint.partition(' ')
+                labels = format_labels(dict(play=play['name'], host=host, module=module, method=method, endpoint=path))
+                cumulative = 0
+                for index, count in enumerate(metrics.buckets):
+                    cumulative += count
+                    bound = "{0:g}".format(LATENCY_BUCKETS_MS[index] / 1000.0) if index < len(LATENCY_BUCKETS_MS) else "+Inf"
+                    lines.append('{0}_bucket{{{1},le="{2}"}} {3}'.format(family, labels, bound, cumulative))
+                lines.append("{0}_sum{{{1}}} {2:.6f}".format(family, labels, metrics.total_ms / 1000.0))
+                lines.append("{0}_count{{{1}}} {2}".format(family, labels, metrics.count))
+
+        # Render Plays Durations
+        family = "{0}_play_duration_seconds".format(METRICS_PREFIX)
+        lines.append("# HELP {0} Duration of the Plays.".format(family))
+        lines.append("# TYPE {0} gauge".format(family))
+        for play in self.plays:
+            lines.append("{0}{{{1}}} {2:.3f}".format(family, format_labels(dict(play=play['name'])), (play['end'] or time.time()) - play['start']))
+
+        # Render Run Timestamp
+        family = "{0}_last_run_timestamp_seconds".format(METRICS_PREFIX)
+        lines.append("# HELP {0} End Time of the Last Run.".format(family))
+        lines.append("# TYPE {0} gauge".format(family))
+        lines.append("{0} {1:.3f}".format(family, time.time()))
+
+        # Terminate OpenMetrics
+        if openmetrics:
+            lines.append("# EOF")
+
+        # Return Metrics
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str, openmetrics: bool = False):
+        """
+        Write the Metrics of the Run to a File (Replaced Atomically, for Textfile Collectors).
+        """
+
+        try:
+
+            # Write Temporary File in the Target Directory
+            directory = os.path.dirname(os.path.abspath(path))
+            descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".api_metrics.")
+
+            try:
+
+                # Write Metrics
+                with os.fdopen(descriptor, 'w') as metrics_file:
+                    metrics_file.write(self.render_metrics(openmetrics))
+
+                # Replace File (Readable by Collectors)
+                os.chmod(temporary_path, 0o644)
+                os.replace(temporary_path, path)
+
+            except BaseException:
+
+                # Remove Temporary File (Never Left in the Collector Directory)
+                os.unlink(temporary_path)
+                raise
+
+        except (IOError, OSError) as write_error:
+
+            # Warn (Metrics never Fail the Run)
+            self._display.warning("Failed to Write API Metrics File '{0}' : {1}".format(path, write_error))
@@ -4,7 +4,10 @@
 # (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 
+import hashlib
 from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from ..module_utils.commons import generate_random_string
 
 
@@ -42,11 +45,24 @@ def pbkdf2_hash(password: str, salt: str = '', rounds: int = 100000):
     # Build Hash Array
     hash_array = pbkdf2_sha512.hash(password, salt=salt.encode(), rounds=rounds).split('$')
 
+    # Build Result from the Raw Salt and Derived Key
+    return _pbkdf2_hash_result(
+        password=password,
+        salt=salt,
+        rounds=rounds,
+        salt_bytes=ab64_decode(hash_array[3]),
+        derived_key=ab64_decode(hash_array[4])
+    )
+
+
+# Build the Hash Result (Single Line '$pbkdf2-sha512$<rounds>$<salt>$<key>' Format, Standard Base64)
+def _pbkdf2_hash_result(password: str, salt: str, rounds: int, salt_bytes: bytes, derived_key: bytes):
+
     # Compute Encoded Salt
-    salt_encoded = b64encode(ab64_decode(hash_array[3])).decode()
+    salt_encoded = b64encode(salt_bytes).decode()
 
     # Compute Encoded Password
-    password_encoded = b64encode(ab64_decode(hash_array[4])).decode()
+    password_encoded = b64encode(derived_key).decode()
 
     # Build Single Line Password
     password_single_line = "${prolog}${rounds}${salt_encoded}${password_encoded}".format(
@@ -62,13 +78,87 @@ def pbkdf2_hash(password: str, salt: str = '', rounds: int = 100000):
         "salt_original": salt,
         "salt": salt_encoded,
         "password_single_line": password_single_line,
-        "password_crypted": password_single_line.split('$')[2] + '$' + password_encoded,
-        "rounds": password_single_line.split('$')[2],
+        "password_crypted": str(rounds) + '$' + password_encoded,
+        "rounds": str(rounds),
         "hash_method": "PBKDF2",
         "hash_algoritm": "SHA512"
     }
 
 
+# Derive a Single Normalized Entry with hashlib (Process Pool Worker)
+def _pbkdf2_hash_entry(entry: tuple):
+
+    # Extract Entry
+    password, salt, rounds = entry
+
+    # Derive Key (Same Derivation as passlib pbkdf2_sha512)
+    derived_key = hashlib.pbkdf2_hmac('sha512', password.encode('utf-8'), salt.encode(), rounds)
+
+    # Build Result (Same Structure as pbkdf2_hash)
+    return _pbkdf2_hash_result(
+        password=password,
+        salt=salt,
+        rounds=rounds,
+        salt_bytes=salt.encode(),
+        derived_key=derived_key
+    )
+
+
+# Define Bulk Hash Function
+def pbkdf2_hash_many(entries: list, max_workers: int = 0):
+
+    # Initialize Normalized Entries
+    normalized = []
+
+    # Iterate over Entries (Dictionary or [password, salt, rounds] Sequence)
+    for entry in entries or []:
+
+        # If Entry is a Dictionary
+        if isinstance(entry, dict):
+
+            # Extract Fields
+            password, salt, rounds = entry.get('password'), entry.get('salt'), entry.get('rounds')
+
+        else:
+
+            # Extract Fields
+            password, salt, rounds = (list(entry) + [None, None])[:3]
+
+        # Check Passord Key
+        if not password or password.strip() == '':
+
+            # Raise Error
+            raise ValueError("The Field 'password' is Mandatory.")
+
+        # Check Salt (Random SALT if Empty)
+        if not salt or salt.strip() == '':
+            salt = generate_random_string(length=16)
+
+        # Check Rounds (Default Rounds if Missing)
+        if not rounds or int(rounds) <= 0:
+            rounds = 100000
+
+        # Add Normalized Entry
+        normalized.append((password, salt, int(rounds)))
+
+    # If Pool is not Useful
+    if len(normalized) <= 1 or max_workers == 1:
+
+        # Hash Serially
+        return [_pbkdf2_hash_entry(entry) for entry in normalized]
+
+    try:
+
+        # Hash on a Process Pool (Pool Size Defaults to CPU Count)
+        with ProcessPoolExecutor(max_workers=max_workers or None) as executor:
+            return list(executor.map(_pbkdf2_hash_entry, normalized, chunksize=max(1, len(normalized) // 32)))
+
+    except (OSError, NotImplementedError, BrokenProcessPool):
+
+        # Hash Serially when Processes are not Available
+        return [_pbkdf2_hash_entry(entry) for entry in normalized]
+
+
 # Filter Module Class
 class FilterModule(object):
 
@@ -78,4 +168,5 @@ class FilterModule(object):
         # Return Filter Method
         return {
             'pbkdf2_hash': pbkdf2_hash,
+            'pbkdf2_hash_many': pbkdf2_hash_many,
         }
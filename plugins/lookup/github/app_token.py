@@ -10,6 +10,9 @@ version_added: "1.0.0"
 short_description: Create and Return Github Application Access Token
 description:
     - Used to Create and Return Github Application Access Token
+    - With 'installation_ids' or 'discover_installations', Tokens of many Installations are minted concurrently
+      with a single App JWT, and returned as a Dictionary keyed by Installation ID
+    - Tokens are cached by (application_id, installation_id) and reused until their expiry (minus a safety margin)
 requirements:
     - requests
     - pyjwt >=2.9.0
@@ -24,9 +27,27 @@ options:
         default: 'https://api.github.com'
     installation_id:
         description:
-        - The Github Application Installation ID
-        required: true
+        - The Github Application Installation ID (Required unless 'installation_ids' or 'discover_installations' is Set)
+        required: false
         type: str
+    installation_ids:
+        description:
+        - The Github Application Installation IDs to Mint Tokens for
+        required: false
+        type: list
+        elements: str
+    discover_installations:
+        description:
+        - Mint Tokens for all Installations of the Application (Discovered with GET /app/installations)
+        required: false
+        type: bool
+        default: false
+    max_workers:
+        description:
+        - The Maximum Number of Concurrent Token Requests (Many Installations)
+        required: false
+        type: int
+        default: 8
     application_id:
         description:
         - The Github Application ID
@@ -73,6 +94,23 @@ options:
         required: false
         type: str
         default: '2022-11-28'
+    cache:
+        description:
+        - Reuse the Access Token until its expiry
+        required: false
+        type: bool
+        default: true
+    cache_path:
+        description:
+        - The On-Disk Token Store shared between Tasks and Hosts (Tokens are kept in memory only when not set)
+        required: false
+        type: str
+    cache_expiry_margin:
+        description:
+        - The Safety Margin (Seconds) before Token expiry, after which a new Token is created
+        required: false
+        type: int
+        default: 300
 '''
 
 EXAMPLES = r'''
@@ -85,21 +123,35 @@ EXAMPLES = r'''
                 base_url='https://api.github.com',
                 installation_id: '12345678',
                 private_key: '...',
-                private_key_format='PEM_PKCS_8'
+                private_key_format='PEM_PKCS_8',
+                cache_path='~/.ansible/tmp/github_app_tokens.json'
+            )
+        }}
+
+- name: "Generate Access Tokens of all Github Application Installations"
+  ansible.builtin.set_fact:
+    installation_tokens: >
+        {{
+            lookup(
+                'kube_cloud.general.github.app_token',
+                application_id='963346',
+                private_key=github_app_private_key,
+                discover_installations=true
             )
         }}
 '''
 
 RETURN = '''
 _raw:
-    description: Githun Application Access Token
-    type: str
+    description: Githun Application Access Token (Dictionary of Tokens keyed by Installation ID for many Installations)
+    type: raw
 '''
 
 
 from ansible.plugins.lookup import LookupBase
 from ...module_utils.github.enums import PrivateKeyFormat
 from ...module_utils.github.client_app_access_token import AppAccessTokenClient
+from ...module_utils.github.token_cache import AppTokenCache
 
 
 class LookupModule(LookupBase):
@@ -113,6 +165,15 @@ class LookupModule(LookupBase):
         # Get Installation ID
         installation_id = kwargs.get('installation_id', None)
 
+        # Get Installation IDs
+        installation_ids = kwargs.get('installation_ids', None)
+
+        # Get Installations Discovery
+        discover_installations = kwargs.get('discover_installations', False)
+
+        # Get Maximum Concurrent Requests
+        max_workers = kwargs.get('max_workers', 8)
+
         # Get Application ID
         application_id = kwargs.get('application_id', None)
 
@@ -134,11 +195,20 @@ class LookupModule(LookupBase):
         # Get Github API Version
         github_api_version = kwargs.get('github_api_version', '2022-11-28')
 
+        # Get Cache Activation
+        cache = kwargs.get('cache', True)
+
+        # Get Cache Store Path
+        cache_path = kwargs.get('cache_path', None)
+
+        # Get Cache Expiry Margin
+        cache_expiry_margin = kwargs.get('cache_expiry_margin', 300)
+
         # Get Installation ID
         private_key_format = PrivateKeyFormat.create(kwargs.get('private_key_format', 'PEM_PKCS_8'))
 
-        # If installation_id is not Provided
-        if not installation_id:
+        # If no Installation is Provided
+        if not installation_id and not installation_ids and not discover_installations:
 
             # Raise Value Exception
             raise ValueError("Initialization failed : 'installation_id' is required")
@@ -163,5 +233,21 @@ class LookupModule(LookupBase):
             jwt_algorithm=jwt_algorithm
         )
 
-        # Create and return Access Token
-        return [client.create_access_token()]
+        # Build Token Cache
+        token_cache = AppTokenCache(
+            cache_path=cache_path,
+            expiry_margin=cache_expiry_margin
+        ) if cache else None
+
+        # If many Installations are Requested
+        if installation_ids or discover_installations:
+
+            # Get (Cached or Created) and return Access Tokens indexed by Installation
+            return [client.get_access_tokens(
+                installation_ids=installation_ids,
+                cache=token_cache,
+                max_workers=max_workers
+            )]
+
+        # Get (Cached or Created) and return Access Token
+        return [client.get_access_token(cache=token_cache)]
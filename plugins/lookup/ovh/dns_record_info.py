@@ -0,0 +1,156 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = '''
+---
+name: dns_record_info
+version_added: "1.0.0"
+short_description: Find and Return OVH DNS Zone Records
+description:
+    - Used to Find and Return the Records of an OVH DNS Zone, optionally filtered by Name and Type
+    - The Account Zone List and the Zone Records are Cached in a File shared with the OVH DNS Modules,
+      and Invalidated when these Modules write to the Zone
+requirements:
+    - ovh >= 0.5.0
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    endpoint:
+        description:
+        - The OVH API Endpoint
+        required: true
+        type: str
+    application_key:
+        description:
+        - The OVH API Application Key
+        required: true
+        type: str
+    application_secret:
+        description:
+        - The OVH API Application Secret
+        required: true
+        type: str
+    consumer_key:
+        description:
+        - The OVH API Consumer Key
+        required: true
+        type: str
+    domain:
+        description:
+        - The targeted domain (Zone)
+        required: true
+        type: str
+    record_name:
+        description:
+        - The name of record in the zone (All Names when not Set)
+        required: false
+        type: str
+    record_type:
+        description:
+        - The DNS record type (All Types when not Set)
+        required: false
+        type: str
+    max_workers:
+        description:
+        - The Maximum Number of Concurrent API Requests
+        required: false
+        type: int
+        default: 8
+    cache:
+        description:
+        - Cache the Account Zone List and the Zone Records between Tasks
+        required: false
+        type: bool
+        default: true
+    cache_path:
+        description:
+        - The Cache File Path (Default under the Temporary Directory of the User)
+        required: false
+        type: str
+    cache_ttl:
+        description:
+        - The Cache Entries Time To Live (Seconds)
+        required: false
+        type: int
+        default: 300
+'''
+
+EXAMPLES = r'''
+- name: "Find ACME Challenge Records"
+  ansible.builtin.set_fact:
+    acme_records: >
+        {{
+            query(
+                'kube_cloud.general.ovh.dns_record_info',
+                endpoint='ovh-eu',
+                application_key=ovh_application_key,
+                application_secret=ovh_application_secret,
+                consumer_key=ovh_consumer_key,
+                domain='kube-cloud.com',
+                record_name='_acme-challenge',
+                record_type='TXT'
+            )
+        }}
+'''
+
+RETURN = '''
+_raw:
+    description: The Matching Records (id, zone, sub_domain, field_type, target, ttl)
+    type: list
+    elements: dict
+'''
+
+
+from dataclasses import asdict
+from ansible.plugins.lookup import LookupBase
+from ...module_utils.ovh.client import build_ovh_zone_client
+
+
+class LookupModule(LookupBase):
+
+    # Execute Plugin
+    def run(self, terms, variables, **kwargs):
+
+        # Get Zone
+        domain = kwargs.get('domain', None)
+
+        # Get Record Name
+        record_name = kwargs.get('record_name', None)
+
+        # Get Record Type
+        record_type = kwargs.get('record_type', None)
+
+        # Get Maximum Concurrent Requests
+        max_workers = kwargs.get('max_workers', 8)
+
+        # If domain is not Provided
+        if not domain:
+
+            # Raise Value Exception
+            raise ValueError("Initialization failed : 'domain' is required")
+
+        # Build Zone Client (Cache Enabled by Default)
+        client = build_ovh_zone_client(dict(kwargs, cache=kwargs.get('cache', True)))
+
+        # If Zone is not managed on OVH Account
+        if domain not in client.list_zones():
+
+            # Raise Value Exception
+            raise ValueError("The target domain [{0}] is unknown".format(domain))
+
+        # If no Filter is Provided
+        if record_name is None and record_type is None:
+
+            # Return all Zone Records
+            return [asdict(record) for record in client.get_records(domain, max_workers=max_workers)]
+
+        # Find and Return Matching Records
+        return [
+            asdict(record) for record in client.find_records(
+                domain,
+                field_type=record_type,
+                sub_domain=record_name,
+                max_workers=max_workers
+            )
+        ]
@@ -1,12 +1,102 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from dataclasses import asdict
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Dict, Any, Callable, Iterable, List
 import os
 import base64
 
 
+# Types Serialized as is (Checked on Exact Type, so Enumerations are not Matched)
+PAYLOAD_SCALAR_TYPES = frozenset([str, int, float, bool, bytes])
+
+# Compiled Payload Serializers by Class
+PAYLOAD_SERIALIZERS = {}
+
+# Clients Shared in the Process by Key (Modules Executed In-Process on the Controller)
+SHARED_CLIENTS = {}
+
+
+# Convert a Value to its Payload Representation
+def to_payload(value: Any) -> Any:
+    """
+    Convert a Value to its Payload Representation (Without Copying Scalars).
+
+    Nested Dataclasses and Dictionaries lose their None Fields and Enumerations are Replaced by their Values.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The payload value.
+    """
+
+    # If Value is a Scalar
+    if type(value) in PAYLOAD_SCALAR_TYPES:
+        return value
+
+    # If Value is an Enumeration
+    if isinstance(value, Enum):
+        return value.value
+
+    # If Value is a Dataclass Instance
+    if is_dataclass(value) and not isinstance(value, type):
+        return payload_serializer(type(value))(value)
+
+    # If Value is a List
+    if isinstance(value, list):
+        return [to_payload(item) for item in value]
+
+    # If Value is a Tuple
+    if isinstance(value, tuple):
+        return tuple(to_payload(item) for item in value)
+
+    # If Value is a Dictionary
+    if isinstance(value, dict):
+        return {key: to_payload(item) for key, item in value.items() if item is not None}
+
+    # Return Value
+    return value
+
+
+# Build and Return the Compiled Payload Serializer of a Dataclass
+def payload_serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build (Once per Class) the Payload Serializer of a Dataclass.
+
+    The Field Names are Resolved when the Serializer is Built, so each Call Walks the Fields Once.
+
+    Args:
+        cls (type): The dataclass.
+
+    Returns:
+        Callable: The serializer, returning the payload of an instance.
+    """
+
+    # If Serializer is Already Built
+    serializer = PAYLOAD_SERIALIZERS.get(cls, None)
+    if serializer is not None:
+        return serializer
+
+    # Resolve Field Names
+    names = tuple(model_field.name for model_field in fields(cls))
+
+    # Serialize Instance Fields (None Fields are Skipped)
+    def serializer(instance: Any) -> Dict[str, Any]:
+        payload = {}
+        for name in names:
+            value = getattr(instance, name)
+            if value is not None:
+                payload[name] = to_payload(value)
+        return payload
+
+    # Register and Return Serializer
+    PAYLOAD_SERIALIZERS[cls] = serializer
+    return serializer
+
+
 # Build and Return Payload from Dict Object
 # Filter All NONE Fields
 def filter_none(instance: Any) -> Dict[str, Any]:
@@ -14,6 +104,8 @@ def filter_none(instance: Any) -> Dict[str, Any]:
     Filter All fields with None Value
 
     Only includes fields that are not None and handles nested dataclasses and lists.
+    None fields of nested dataclasses are also removed and enumerations are replaced by their values.
+    Field values are never deep copied (see payload_serializer).
 
     Args:
         instance (Any): The dataclass instance to convert.
@@ -23,7 +115,78 @@ def filter_none(instance: Any) -> Dict[str, Any]:
     """
 
     # Return Payload
-    return {name: value for name, value in asdict(instance).items() if value is not None}
+    return payload_serializer(type(instance))(instance)
+
+
+# Attribute Built on First Access, then Cached on the Instance
+class LazyAttribute:
+    """
+    Non Data Descriptor Calling a Factory on First Access (eg. Sub-Clients of API Clients).
+
+    The Built Value is Stored in the Instance Dictionary, so Next Accesses are Plain Attribute Reads.
+
+    Attributes:
+        factory (Callable): The Function Building the Value from the Instance.
+        name (str): The Attribute Name.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+
+        # Initialize Factory
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner, name):
+
+        # Initialize Name
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+
+        # If Accessed on Class
+        if instance is None:
+            return self
+
+        # Build and Cache Value
+        value = instance.__dict__[self.name] = self.factory(instance)
+
+        # Return Value
+        return value
+
+
+# Declare a Lazily Built Attribute (Decorator)
+def lazy_attribute(factory: Callable[[Any], Any]) -> LazyAttribute:
+
+    # Return Descriptor
+    return LazyAttribute(factory)
+
+
+# Return the Client Shared in the Process under a Key (Built on First Use)
+def shared_client(key: tuple, factory: Callable[[], Any]) -> Any:
+    """
+    Return the Client Shared in the Process under a Key, Built by the Factory on First Use.
+
+    A Module Process on the Target Host Builds its Clients Once, so this only Matters when Modules
+    are Executed In-Process on the Controller (see ControllerActionModule) : the Items of a Loop
+    then Reuse the Client and its Pooled Connections.
+
+    Args:
+        key (tuple): The Client Key (Every Parameter the Client is Built from).
+        factory (Callable): The Client Factory.
+
+    Returns:
+        Any: The Client.
+    """
+
+    # If Client is not Built
+    if key not in SHARED_CLIENTS:
+
+        # Build Client
+        SHARED_CLIENTS[key] = factory()
+
+    # Return Client
+    return SHARED_CLIENTS[key]
 
 
 # Check if Http Status Code is OK
@@ -51,3 +214,37 @@ def generate_random_string(length: int = 16):
 
     # Truncate string to the desired length and return result
     return random_string[:length]
+
+
+# Execute Function on each Item with a Bounded Thread Pool
+def run_concurrently(function: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 8) -> List[Any]:
+    """
+    Execute the given function on each item using a bounded thread pool.
+
+    Args:
+        function (Callable): The function to call with each item.
+        items (Iterable): The items to process.
+        max_workers (int): The maximum number of concurrent calls.
+
+    Returns:
+        List[Any]: The function results, in the same order as the items.
+
+    Raises:
+        Exception: The first exception raised by a call (once all calls are completed).
+    """
+
+    # Materialize Items
+    items = list(items)
+
+    # If there is Nothing to Process
+    if len(items) == 0:
+
+        # Return Empty Result
+        return []
+
+    # Compute Pool Size (At least One Worker, Never More Than Items)
+    pool_size = min(max(max_workers or 1, 1), len(items))
+
+    # Execute Calls and Return Ordered Results
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        return list(executor.map(function, items))
@@ -4,6 +4,25 @@ __metaclass__ = type
 from enum import Enum
 
 
+# Case Insensitive Lookup Tables by Enumeration Class (Built Once per Class)
+ENUM_LOOKUPS = {}
+
+
+# Build the Case Insensitive Lookup Table (Names and Values) of an Enumeration
+def build_enum_lookup(cls) -> dict:
+
+    # Initialize Table
+    lookup = {}
+
+    # Register Members in Reverse Order (First Declared Member Wins on Conflicts)
+    for member in reversed(list(cls)):
+        lookup[str(member.value).upper()] = member
+        lookup[member.name.upper()] = member
+
+    # Return Table
+    return lookup
+
+
 # Base Enumeration
 class BaseEnum(str, Enum):
 
@@ -17,17 +36,19 @@ class BaseEnum(str, Enum):
             # Return None
             return None
 
-        # Iterate on Enum members
-        for member in cls:
+        # If Value is Already a Member
+        if isinstance(value, cls):
 
-            # If member match on value
-            if member.name == value.upper() or member.value.upper == value.upper:
+            # Return the Member
+            return value
 
-                # Return the Member
-                return member
+        # Get Lookup Table (Built on First Call)
+        lookup = ENUM_LOOKUPS.get(cls, None)
+        if lookup is None:
+            lookup = ENUM_LOOKUPS[cls] = build_enum_lookup(cls)
 
-        # Return None
-        return None
+        # Return the Member matching Name or Value (Case Insensitive)
+        return lookup.get(str(value).upper(), None)
 
     # Return Name List
     @classmethod
@@ -0,0 +1,485 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+# Environment Variable of the JSONL Trace File Path (One Line per API Call, Appended)
+TRACE_ENV_VAR = "KUBE_CLOUD_API_TRACE"
+
+# Latency Histogram Buckets Upper Bounds (Milliseconds, Mergeable between Tasks)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Header of the Responses Scheduling an HAProxy Reload (Data Plane API, Writes not Forcing the Reload)
+RELOAD_HEADER = "Reload-ID"
+
+# HAProxy Data Plane API Paths Reloading HAProxy on Forced Writes (eg. '?force_reload=true')
+RELOADING_WRITE_PATH = re.compile(r'/services/haproxy/(?:configuration|storage)/')
+
+# HAProxy Data Plane API Transaction Commit Path (eg. 'PUT /services/haproxy/transactions/{id}')
+TRANSACTION_COMMIT_PATH = re.compile(r'/services/haproxy/transactions/[^/]+/?$')
+
+# Named URL Segments by API (Object Names Replaced by a Placeholder)
+ENDPOINT_TEMPLATES = (
+
+    # HAProxy Data Plane API Configuration and Storage Objects (eg. '/configuration/backends/web')
+    (re.compile(r'(/services/haproxy/(?:configuration|storage)/[\w-]+/)[^/]+'), r'\1{name}'),
+
+    # OVH DNS Zones (eg. '/domain/zone/example.com/record')
+    (re.compile(r'(/domain/zone/)[^/]+'), r'\1{zone}'),
+
+    # Github Repositories, Organizations and Users (eg. '/repos/owner/repo/installation')
+    (re.compile(r'(/repos/)[^/]+/[^/]+'), r'\1{owner}/{repo}'),
+    (re.compile(r'(/(?:orgs|users)/)(?!\d+/)[^/]+(?=/)'), r'\1{name}')
+)
+
+# Identifier URL Segments (Numbers, UUIDs, Hashes and Generated Keys with Digits)
+IDENTIFIER_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|(?=[^/]*\d)[\w-]{16,})$')
+
+
+# Check if an URL Segment is an Identifier (Numbers, UUIDs, Hashes, Domain Names, Emails and Encoded Paths)
+def is_identifier_segment(segment: str) -> bool:
+
+    # Return Check
+    return bool(
+        IDENTIFIER_SEGMENT.match(segment) or
+        '%' in segment or
+        '@' in segment or
+        ('.' in segment and any(character.isalpha() for character in segment))
+    )
+
+
+# Check if an API Call Reloaded or Scheduled a Reload of HAProxy (Data Plane API)
+def is_reload(method: str, url: str, status, headers=None) -> bool:
+    """
+    Check if an API Call Reloaded HAProxy : Successful Writes Scheduling a Reload (Reload-ID Header),
+    Successful Configuration Writes Forcing the Reload outside a Transaction, and Transaction Commits.
+
+    Args:
+        method (str): The HTTP Method.
+        url (str): The Request URL (with its Query).
+        status (Union[int, str]): The Response Status Code, or the Exception Name of a Failed Call.
+        headers (Mapping): The Response Headers.
+
+    Returns:
+        bool: True if the Call Reloaded HAProxy.
+    """
+
+    # If Call Failed
+    if not isinstance(status, int) or not 200 <= status < 300:
+        return False
+
+    # If Reload is Scheduled
+    if headers is not None and RELOAD_HEADER in headers:
+        return True
+
+    # If Call is not a Write
+    method = (method or '').upper()
+    if method not in ('POST', 'PUT', 'DELETE'):
+        return False
+
+    # Split URL Path and Query
+    parts = urlsplit(url or '')
+    query = parse_qs(parts.query)
+
+    # If Call Commits a Transaction
+    if method == 'PUT' and TRANSACTION_COMMIT_PATH.search(parts.path):
+        return True
+
+    # Reload if Configuration Write is Forced outside a Transaction
+    return bool(
+        RELOADING_WRITE_PATH.search(parts.path) and
+        not query.get('transaction_id', None) and
+        query.get('force_reload', [''])[-1].lower() == 'true'
+    )
+
+
+# Build the Endpoint Template of an URL (eg. '/v2/services/haproxy/configuration/backends/{name}')
+def endpoint_template(url: str) -> str:
+    """
+    Build the Endpoint Template of an URL : Query and Host are Dropped, Object Names and Identifiers
+    are Replaced by Placeholders, so Calls to the Same Endpoint are Aggregated.
+
+    Args:
+        url (str): The Request URL.
+
+    Returns:
+        str: The Endpoint Template.
+    """
+
+    # Extract Path
+    path = urlsplit(url).path or '/'
+
+    # Replace Named Segments
+    for pattern, replacement in ENDPOINT_TEMPLATES:
+        path = pattern.sub(replacement, path)
+
+    # Replace Identifier Segments
+    return '/'.join('{id}' if is_identifier_segment(segment) else segment for segment in path.split('/'))
+
+
+class ApiCallRecorder:
+    """
+    Recorder of the API Calls of a Module (Method, Endpoint Template, Status, Bytes and Latency).
+
+    Calls are Aggregated by Endpoint (Counters and a Latency Histogram, Mergeable between Tasks), and
+    Appended to a JSONL Trace File when the 'KUBE_CLOUD_API_TRACE' Environment Variable is Set.
+    Calls are only Recorded while the Recorder is Started (see instrument_module). The Recorder is
+    safe to share between Threads.
+
+    Attributes:
+        module_name (str): The Name of the Recorded Module.
+        latencies (List[float]): The Calls Latencies (Milliseconds).
+        endpoints (Dict[str, dict]): The Calls Statistics by 'METHOD Endpoint Template'.
+        reloads (int): The Calls having Reloaded or Scheduled a Reload of HAProxy.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Recorder (Stopped).
+        """
+
+        # Initialize Lock
+        self.lock = threading.Lock()
+
+        # Initialize State
+        self.active = False
+        self.module_name = None
+        self.trace = None
+        self.latencies = []
+        self.endpoints = {}
+        self.reloads = 0
+
+    def start(self, module_name: str = None, trace_path: Optional[str] = None):
+        """
+        Clear the Recorded Calls and Start Recording.
+
+        Args:
+            module_name (str): The Name of the Recorded Module.
+            trace_path (str): The JSONL Trace File Path (None Disables the Trace).
+        """
+
+        # Stop Previous Recording
+        self.stop()
+
+        # Reset State
+        with self.lock:
+            self.active = True
+            self.module_name = module_name
+            self.latencies = []
+            self.endpoints = {}
+            self.reloads = 0
+
+            # If Trace is Enabled
+            if trace_path:
+
+                try:
+
+                    # Open Trace File (Appended, Line Buffered)
+                    self.trace = open(trace_path, 'a', buffering=1, encoding='utf-8')
+
+                except (IOError, OSError):
+
+                    # Disable Trace (Tracing never Fails the Module)
+                    self.trace = None
+
+    def stop(self):
+        """
+        Stop Recording (Recorded Calls are Kept).
+        """
+
+        # Stop and Close Trace File
+        with self.lock:
+            self.active = False
+            if self.trace is not None:
+                self.trace.close()
+                self.trace = None
+
+    def record(self, method: str, url: str, status, size: int, latency: float, reload: bool = False):
+        """
+        Record an API Call.
+
+        Args:
+            method (str): The HTTP Method.
+            url (str): The Request URL.
+            status (Union[int, str]): The Response Status Code, or the Exception Name of a Failed Call (Counted as Error).
+            size (int): The Request and Response Bodies Size (Bytes).
+            latency (float): The Call Latency (Milliseconds).
+            reload (bool): The Call Reloaded or Scheduled a Reload of HAProxy.
+        """
+
+        # If Recorder is Stopped
+        if not self.active:
+            return
+
+        # Build Endpoint Key
+        template = endpoint_template(url)
+        endpoint = "{0} {1}".format(method.upper(), template)
+
+        # Update Statistics
+        with self.lock:
+
+            # Keep Latency
+            self.latencies.append(latency)
+            self.reloads += 1 if reload else 0
+
+            # Initialize Endpoint Statistics
+            statistics = self.endpoints.get(endpoint, None)
+            if statistics is None:
+                statistics = self.endpoints[endpoint] = dict(
+                    count=0,
+                    errors=0,
+                    reloads=0,
+                    bytes=0,
+                    total_ms=0.0,
+                    buckets=[0] * (len(LATENCY_BUCKETS_MS) + 1)
+                )
+
+            # Update Endpoint Statistics
+            statistics['count'] += 1
+            statistics['errors'] += 1 if not isinstance(status, int) or status >= 400 else 0
+            statistics['reloads'] += 1 if reload else 0
+            statistics['bytes'] += size
+            statistics['total_ms'] += latency
+            statistics['buckets'][next(
+                (index for index, bound in enumerate(LATENCY_BUCKETS_MS) if latency <= bound),
+                len(LATENCY_BUCKETS_MS)
+            )] += 1
+
+            # If Trace is Enabled
+            if self.trace is not None:
+
+                # Append Trace Line
+                self.trace.write(json.dumps(dict(
+                    time=round(time.time(), 3),
+                    pid=os.getpid(),
+                    module=self.module_name,
+                    method=method.upper(),
+                    endpoint=template,
+                    status=status,
+                    bytes=size,
+                    latency_ms=round(latency, 3),
+                    reload=reload
+                )) + "\n")
+
+    def record_response(
+        self,
+        response,
+        latency: float = None,
+        read_body: bool = True,
+        method: str = None,
+        request_size: int = None
+    ):
+        """
+        Record the API Call of a requests Response.
+
+        Args:
+            response (requests.Response): The Response.
+            latency (float): The Call Latency (Milliseconds, Default : Response Elapsed Time).
+            read_body (bool): Read the Body when the Response has no Content Length (Not for Streams).
+            method (str): The HTTP Method (Default : Method of the Response Request).
+            request_size (int): The Request Body Size (Default : Size of the Response Request Body).
+        """
+
+        # If Recorder is Stopped
+        if not self.active:
+            return
+
+        # Resolve Latency and Request Body Size
+        elapsed = getattr(response, 'elapsed', None)
+        latency = latency if latency is not None else (elapsed.total_seconds() * 1000 if elapsed else 0.0)
+        request = getattr(response, 'request', None)
+        body = getattr(request, 'body', None) if request is not None else None
+        if request_size is None:
+            request_size = len(body) if isinstance(body, (bytes, str)) else 0
+
+        # Resolve Response Body Size (Content Length, else Read Body)
+        size = response.headers.get('Content-Length', None)
+        if size is not None and size.isdigit():
+            size = int(size)
+        else:
+            size = len(response.content or b'') if read_body else 0
+
+        # Record Call
+        method = method or (request.method if request is not None else 'GET')
+        self.record(
+            method=method,
+            url=response.url or '',
+            status=response.status_code,
+            size=size + request_size,
+            latency=latency,
+            reload=is_reload(method, response.url, response.status_code, response.headers)
+        )
+
+    def record_error(self, method: str, url: str, error: Exception, latency: float, request_size: int = 0):
+        """
+        Record an API Call Failed without Response (eg. Connection Error, Timeout).
+
+        Args:
+            method (str): The HTTP Method.
+            url (str): The Request URL.
+            error (Exception): The Raised Exception (its Name is Recorded as Status).
+            latency (float): The Call Latency (Milliseconds).
+            request_size (int): The Request Body Size (Bytes).
+        """
+
+        # Record Call
+        self.record(
+            method=method,
+            url=url or '',
+            status=type(error).__name__,
+            size=request_size,
+            latency=latency
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build the Summary of the Recorded Calls (Returned as 'api_calls' in Module Results).
+
+        Returns:
+            Dict[str, Any]: The Calls Count, Total, P95 and Max Latency (Milliseconds), Bytes,
+                Errors, HAProxy Reloads and the Statistics by Endpoint.
+        """
+
+        # Copy State
+        with self.lock:
+            latencies = sorted(self.latencies)
+            endpoints = {endpoint: dict(statistics, buckets=list(statistics['buckets'])) for endpoint, statistics in self.endpoints.items()}
+            reloads = self.reloads
+
+        # Round Endpoint Latencies
+        for statistics in endpoints.values():
+            statistics['total_ms'] = round(statistics['total_ms'], 3)
+
+        # Return Summary
+        return dict(
+            count=len(latencies),
+            total_ms=round(sum(latencies), 3),
+            p95_ms=round(latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)], 3) if latencies else 0.0,
+            max_ms=round(latencies[-1], 3) if latencies else 0.0,
+            bytes=sum(statistics['bytes'] for statistics in endpoints.values()),
+            errors=sum(statistics['errors'] for statistics in endpoints.values()),
+            reloads=reloads,
+            endpoints=endpoints
+        )
+
+
+# API Calls Recorder of the Process (Shared by all Instrumented Sessions)
+API_CALLS = ApiCallRecorder()
+
+
+# Compute the Body Size of a Request from its requests Arguments
+def request_body_size(kwargs: dict) -> int:
+
+    # JSON Body
+    if kwargs.get('json', None) is not None:
+        return len(json.dumps(kwargs['json']))
+
+    # Raw Body (Streams and Forms are not Measured)
+    data = kwargs.get('data', None)
+    return len(data) if isinstance(data, (bytes, str)) else 0
+
+
+# Record the API Calls of a requests Session
+def instrument_session(session):
+    """
+    Record the API Calls of a requests Session (Request Method Wrapped Once).
+
+    Calls are Timed End to End, and Calls Failed without Response (Connection Errors, Timeouts) are
+    Recorded as Errors with the Exception Name as Status, then Raised.
+
+    Args:
+        session (requests.Session): The Session.
+
+    Returns:
+        requests.Session: The Session.
+    """
+
+    # If Session is Already Instrumented
+    if getattr(session, 'api_calls_recorded', False):
+        return session
+
+    # Session Request Method
+    request = session.request
+
+    def recorded_request(method, url, *args, **kwargs):
+
+        # Execute Request
+        start = time.perf_counter()
+        try:
+            response = request(method, url, *args, **kwargs)
+        except Exception as error:
+
+            # Record Failed Call and Raise
+            API_CALLS.record_error(method, url, error, (time.perf_counter() - start) * 1000, request_body_size(kwargs))
+            raise
+
+        # Record Call (Streamed Responses Bodies are not Read)
+        API_CALLS.record_response(
+            response,
+            latency=(time.perf_counter() - start) * 1000,
+            read_body=not kwargs.get('stream', False),
+            method=method
+        )
+
+        # Return Response
+        return response
+
+    # Wrap Request Method
+    session.request = recorded_request
+    session.api_calls_recorded = True
+
+    # Return Session
+    return session
+
+
+# Record the API Calls of a Module and Add their Summary to its Result
+def instrument_module(module):
+    """
+    Start Recording the API Calls of a Module, and Add their Summary ('api_calls') to the Module
+    Result when it Exits or Fails.
+
+    Args:
+        module (AnsibleModule): The Module.
+
+    Returns:
+        AnsibleModule: The Module.
+    """
+
+    # Start Recording
+    API_CALLS.start(
+        module_name=getattr(module, '_name', None),
+        trace_path=os.environ.get(TRACE_ENV_VAR, None)
+    )
+
+    # Module Exit Methods
+    exit_json = module.exit_json
+    fail_json = module.fail_json
+
+    def instrumented_exit_json(**kwargs):
+
+        # Stop Recording and Exit with Summary
+        API_CALLS.stop()
+        kwargs.setdefault('api_calls', API_CALLS.summary())
+        exit_json(**kwargs)
+
+    def instrumented_fail_json(msg, **kwargs):
+
+        # Stop Recording and Fail with Summary
+        API_CALLS.stop()
+        kwargs.setdefault('api_calls', API_CALLS.summary())
+        fail_json(msg, **kwargs)
+
+    # Wrap Exit Methods
+    module.exit_json = instrumented_exit_json
+    module.fail_json = instrumented_fail_json
+
+    # Return Module
+    return module
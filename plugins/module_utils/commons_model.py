@@ -0,0 +1,310 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from operator import attrgetter
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+
+# Convert a Field Value to an Hashable Value
+def freeze(value: Any) -> Any:
+
+    # If Value is a List
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+
+    # If Value is a Set
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+
+    # If Value is a Dictionary
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+
+    # Return Value
+    return value
+
+
+# Convert a List Field Value to an Hashable Set
+def freeze_unordered(value: Any) -> frozenset:
+
+    # Return Set
+    return frozenset(freeze(item) for item in value or [])
+
+
+# Base Model
+class BaseModel:
+    """
+    Base of Models Compared Field-Wise (Subclasses are Declared with '@dataclass(eq=False)').
+
+    Equality and Hash are Computed over a Tuple of the Declared Content Fields, so Models can be
+    used in Sets and as Dictionary Keys (eg. Set-Based Diffs). The Identity Fields Key a Model
+    in Indexes (eg. Desired and Existing Models Joined by Name).
+
+    Attributes:
+        IDENTITY_FIELDS (Tuple[str]): The Fields Identifying the Model (Default : Content Fields).
+        CONTENT_FIELDS (Tuple[str]): The Fields Compared for Equality.
+        UNORDERED_FIELDS (Tuple[str]): The List Fields Compared as Sets.
+    """
+
+    # Identity Fields
+    IDENTITY_FIELDS: Tuple[str, ...] = ()
+
+    # Content Fields
+    CONTENT_FIELDS: Tuple[str, ...] = ()
+
+    # Unordered List Fields
+    UNORDERED_FIELDS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+
+        # Initialize Subclass
+        super().__init_subclass__(**kwargs)
+
+        # Generate Field Getters
+        cls._content_getter = cls.build_getter(cls.CONTENT_FIELDS)
+        cls._identity_getter = cls.build_getter(cls.IDENTITY_FIELDS or cls.CONTENT_FIELDS)
+
+    @classmethod
+    def build_getter(cls, names: Tuple[str, ...]):
+        """
+        Build the Getter of the Tuple of Hashable Values of Fields.
+
+        Args:
+            names (Tuple[str]): The Field Names.
+
+        Returns:
+            Callable: The Getter.
+        """
+
+        # If no Field is Declared
+        if not names:
+
+            # Return Empty Tuple Getter
+            return staticmethod(lambda instance: ())
+
+        # Field Converters (Unordered Lists as Sets)
+        converters = tuple(freeze_unordered if name in cls.UNORDERED_FIELDS else freeze for name in names)
+
+        # Build Fields Getter
+        getter = attrgetter(*names)
+
+        # If a Single Field is Declared (Getter Returns the Value)
+        if len(names) == 1:
+
+            # Return Single Value Getter
+            return staticmethod(lambda instance: (converters[0](getter(instance)),))
+
+        # Return Values Getter
+        return staticmethod(lambda instance: tuple(
+            converter(value) for converter, value in zip(converters, getter(instance))
+        ))
+
+    def identity(self) -> tuple:
+        """
+        Returns the Identity Tuple of the Model.
+        """
+        return self._identity_getter(self)
+
+    def content(self) -> tuple:
+        """
+        Returns the Content Tuple of the Model.
+        """
+        return self._content_getter(self)
+
+    def __eq__(self, other):
+
+        # If Other is not a Model of the Same Class
+        if not isinstance(other, type(self)) and not isinstance(self, type(other)):
+
+            # Return False
+            return False
+
+        # Return comparison
+        return self.content() == other.content()
+
+    def __ne__(self, other):
+
+        # Return Negated comparison
+        return not self.__eq__(other)
+
+    def __hash__(self):
+
+        # Return Content Hash
+        return hash(self.content())
+
+
+# Index Models by Identity
+def index_models(models: Iterable[BaseModel]) -> Dict[tuple, BaseModel]:
+    """
+    Index Models by Identity (Last Model Wins).
+
+    Args:
+        models (Iterable[BaseModel]): The Models.
+
+    Returns:
+        Dict[tuple, BaseModel]: The Models by Identity Tuple.
+    """
+    return {model.identity(): model for model in models or []}
+
+
+# Compute the Differences between Desired and Existing Models
+def diff_models(
+    desired: Iterable[BaseModel],
+    existing: Iterable[BaseModel]
+) -> Tuple[List[BaseModel], List[BaseModel], List[BaseModel]]:
+    """
+    Compute the Differences between Desired and Existing Models with Hash Joins on Identity.
+
+    Args:
+        desired (Iterable[BaseModel]): The Desired Models.
+        existing (Iterable[BaseModel]): The Existing Models.
+
+    Returns:
+        Tuple[List, List, List]: The Models to Create (Unknown Identity), to Update (Same Identity,
+            Different Content) and to Delete (Existing Identity not Desired), in Input Order.
+    """
+
+    # Index Models
+    desired_index = index_models(desired)
+    existing_index = index_models(existing)
+
+    # Return Differences
+    return (
+        [model for key, model in desired_index.items() if key not in existing_index],
+        [model for key, model in desired_index.items() if key in existing_index and existing_index[key] != model],
+        [model for key, model in existing_index.items() if key not in desired_index]
+    )
+
+
+# Check if a Field Value is Unset (None or Empty Collection)
+def is_unset_value(value: Any) -> bool:
+
+    # Return Check
+    return value is None or (isinstance(value, (list, dict, set, tuple)) and len(value) == 0)
+
+
+# Compact Model Base
+class CompactModel:
+    """
+    Base of the Slotted Compact Variants of Dataclass Models (see compact_model).
+
+    Instances have no '__dict__' : Each Field is a Slot, and Unset Fields (None or Empty Collections)
+    all Point to None, so Read-Heavy Snapshots of Thousands of Objects use a Fraction of the Memory
+    of the Dataclass Instances. Field Values are Shared with the Source (Never Copied).
+
+    Attributes:
+        MODEL (Type): The Dataclass Model.
+        FIELDS (Tuple[str]): The Field Names (Slots).
+    """
+
+    # No Instance Dictionary
+    __slots__ = ()
+
+    # Dataclass Model
+    MODEL = None
+
+    # Field Names
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, **values):
+
+        # Set Fields (Unset Fields are None)
+        for name in self.FIELDS:
+            value = values.get(name, None)
+            setattr(self, name, None if is_unset_value(value) else value)
+
+    @classmethod
+    def from_model(cls, model: Any) -> 'CompactModel':
+        """
+        Build the Compact Variant of a Model Instance.
+
+        Args:
+            model (Any): The Dataclass Instance.
+
+        Returns:
+            CompactModel: The Compact Instance.
+        """
+
+        # Build Instance without Keyword Arguments
+        instance = cls.__new__(cls)
+        for name in cls.FIELDS:
+            value = getattr(model, name)
+            setattr(instance, name, None if is_unset_value(value) else value)
+
+        # Return Instance
+        return instance
+
+    @classmethod
+    def from_models(cls, models: Iterable[Any]) -> 'List[CompactModel]':
+        """
+        Build the Compact Variants of Model Instances.
+        """
+        return [cls.from_model(model) for model in models or []]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the Set Fields of the Instance.
+        """
+        return {name: getattr(self, name) for name in self.FIELDS if getattr(self, name) is not None}
+
+    def to_model(self) -> Any:
+        """
+        Returns the Dataclass Model Instance (Unset Fields get the Model Defaults).
+        """
+        return self.MODEL(**self.to_dict())
+
+    def __eq__(self, other):
+
+        # If Other is not a Compact Model of the Same Class
+        if type(other) is not type(self):
+
+            # Return False
+            return False
+
+        # Return comparison
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __ne__(self, other):
+
+        # Return Negated comparison
+        return not self.__eq__(other)
+
+    # Mutable Instances are not Hashable
+    __hash__ = None
+
+    def __repr__(self):
+
+        # Return Set Fields Representation
+        return "{0}({1})".format(
+            type(self).__name__,
+            ", ".join("{0}={1!r}".format(name, value) for name, value in self.to_dict().items())
+        )
+
+
+# Build the Compact Variant Class of a Dataclass Model
+def compact_model(model: Type) -> Type[CompactModel]:
+    """
+    Build the Slotted Compact Variant Class of a Dataclass Model (eg. 'CompactServer' for 'Server').
+
+    Args:
+        model (Type): The Dataclass Model.
+
+    Returns:
+        Type[CompactModel]: The Compact Class (one Slot per Model Field).
+    """
+
+    # Resolve Field Names
+    names = tuple(model_field.name for model_field in fields(model))
+
+    # Build and Return Class
+    return type(
+        "Compact{0}".format(model.__name__),
+        (CompactModel,),
+        dict(
+            __slots__=names,
+            __doc__="Slotted Compact Variant of {0} (see CompactModel).".format(model.__name__),
+            MODEL=model,
+            FIELDS=names
+        )
+    )
@@ -0,0 +1,373 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+
+from .commons_instrumentation import instrument_session
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+class RateLimitedSession:
+    """
+    Pooled, Rate-Limit Aware HTTP Session (Base of the Gitlab and Github Sessions).
+
+    The HTTP Connections are kept alive in a Pool sized for the Concurrent Requests. The Rate-Limit
+    Headers (Limit/Remaining/Reset) are tracked per Rate-Limit Key (see rate_limit_key) and per
+    Resource, Requests are delayed until the Reset when no Request Remains, and Rate-Limited Responses
+    are retried after Retry-After, the Reset or with Exponential Backoff. The Session is safe to share
+    between Threads (API Calls are Recorded by commons_instrumentation).
+
+    Sub-Classes set the Header Names, and override retry_delay to change how Rate-Limited Responses
+    are Detected (the Default is a 429 Status).
+
+    Attributes:
+        min_remaining (int): The Remaining Requests under which Requests wait for the Reset.
+        max_retries (int): The Maximum Number of Retries of a Rate-Limited Request.
+        backoff (float): The First Retry Delay (Seconds) when the API gives no Retry-After.
+        max_wait (float): The Maximum Single Wait (Seconds), Longer Waits raise instead.
+        rate_limits (dict): The Last Known Rate-Limits by (Rate-Limit Key, Resource).
+        counters (dict): The Requests, Retries and Throttling Counters.
+    """
+
+    # Rate-Limit Headers
+    HEADER_LIMIT = "RateLimit-Limit"
+    HEADER_REMAINING = "RateLimit-Remaining"
+    HEADER_RESET = "RateLimit-Reset"
+    HEADER_RETRY_AFTER = "Retry-After"
+
+    # Rate-Limit Resource Header (None when the API has a Single Resource)
+    HEADER_RESOURCE = None
+
+    # Default Resource (When the API does not Send the Resource Header)
+    DEFAULT_RESOURCE = "core"
+
+    # Rate-Limited Status
+    STATUS_TOO_MANY_REQUESTS = 429
+
+    # Rate-Limited Responses Counters
+    LIMIT_COUNTERS = ('rate_limited',)
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        min_remaining: int = 0,
+        max_retries: int = 5,
+        backoff: float = 1,
+        max_wait: float = 300,
+        headers: dict = None
+    ):
+        """
+        Initializes the Session.
+
+        Args:
+            pool_size (int): The HTTP Connection Pool Size (Concurrent Requests)
+            min_remaining (int): The Remaining Requests under which Requests wait for the Reset
+            max_retries (int): The Maximum Number of Retries of a Rate-Limited Request
+            backoff (float): The First Retry Delay (Seconds) when the API gives no Retry-After
+            max_wait (float): The Maximum Single Wait (Seconds), Longer Waits raise instead
+            headers (dict): The Headers Preset on every Request (eg. Authorization)
+        """
+
+        # Build Pooled HTTP Session
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size)))
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size)))
+
+        # Record API Calls
+        instrument_session(self.session)
+
+        # Preset Headers
+        self.session.headers.update(headers or {})
+
+        # Initialize Throttling Configuration
+        self.min_remaining = min_remaining
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+
+        # Initialize Rate-Limits ((Rate-Limit Key, Resource) -> State) and Counters
+        self.rate_limits = {}
+        self.counters = dict(
+            requests=0,
+            retries=0,
+            throttled=0,
+            throttled_seconds=0.0,
+            **{name: 0 for name in self.LIMIT_COUNTERS}
+        )
+
+        # Initialize Lock
+        self.lock = threading.Lock()
+
+    def get(self, url: str, **kwargs):
+        """
+        Execute a GET Request.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """
+        Execute a POST Request.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        """
+        Execute a PUT Request.
+        """
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        """
+        Execute a DELETE Request.
+        """
+        return self.request("DELETE", url, **kwargs)
+
+    def rate_limit_key(self, headers: dict) -> str:
+        """
+        Build the Rate-Limit Key of a Request (Requests with the Same Key Share a Rate-Limit).
+
+        Args:
+            headers (dict): The Request Headers
+
+        Returns:
+            str: The Key ('default' : One Rate-Limit for the Session).
+        """
+        return "default"
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Execute a Request, waiting for Rate-Limit Resets and retrying Rate-Limited Responses.
+
+        Args:
+            method (str): The HTTP Method
+            url (str): The Request URL
+            kwargs: The requests Arguments (headers, json, timeout, ...)
+
+        Returns:
+            requests.Response: The Last Response.
+
+        Raises:
+            ValueError: If a Rate-Limit Wait exceeds 'max_wait'.
+        """
+
+        # Build Rate-Limit Key
+        key = self.rate_limit_key(kwargs.get('headers', None))
+
+        # Initialize Attempt
+        attempt = 0
+
+        # Execute until Not Rate-Limited
+        while True:
+
+            # Wait if no Request Remains
+            self.throttle(key)
+
+            # Execute Request
+            response = self.session.request(method, url, **kwargs)
+
+            # Track Rate-Limit
+            self.track(key, response)
+
+            # Compute Retry Delay (None if Not Rate-Limited)
+            delay = self.retry_delay(response, attempt)
+
+            # If Not Rate-Limited or Retries Exhausted
+            if delay is None or attempt >= self.max_retries:
+
+                # Return Response
+                return response
+
+            # Count Retry and Wait
+            self.count('retries')
+            self.wait(delay)
+
+            # Next Attempt
+            attempt += 1
+
+    def count(self, name: str, value: float = 1):
+        """
+        Increment a Counter.
+
+        Args:
+            name (str): The Counter Name
+            value (float): The Increment
+        """
+        with self.lock:
+            self.counters[name] += value
+
+    def track(self, key: str, response):
+        """
+        Track the Rate-Limit Headers of a Response.
+
+        Args:
+            key (str): The Rate-Limit Key
+            response (requests.Response): The Response
+        """
+
+        # Extract Headers
+        headers = response.headers
+
+        # Count Request
+        with self.lock:
+
+            # Increment Requests
+            self.counters['requests'] += 1
+
+            # If Rate-Limit Headers are not Provided
+            if headers.get(self.HEADER_REMAINING, None) is None:
+
+                # Return
+                return
+
+            # Resolve Resource
+            resource = headers.get(self.HEADER_RESOURCE, None) if self.HEADER_RESOURCE else None
+
+            # Keep Rate-Limit State
+            self.rate_limits[(key, resource or self.DEFAULT_RESOURCE)] = dict(
+                limit=int(headers.get(self.HEADER_LIMIT, 0)),
+                remaining=int(headers.get(self.HEADER_REMAINING, 0)),
+                reset=int(headers.get(self.HEADER_RESET, 0))
+            )
+
+    def throttle(self, key: str):
+        """
+        Wait until the Reset when the Key has no Remaining Requests on the Default Resource.
+
+        Args:
+            key (str): The Rate-Limit Key
+        """
+
+        # Find Rate-Limit State
+        with self.lock:
+            state = self.rate_limits.get((key, self.DEFAULT_RESOURCE), None)
+
+        # If State is Unknown or Requests Remain
+        if state is None or state['remaining'] > self.min_remaining:
+
+            # Return
+            return
+
+        # Compute Delay until Reset
+        delay = state['reset'] - time.time()
+
+        # If Reset is Passed
+        if delay <= 0:
+
+            # Return
+            return
+
+        # Count Throttling
+        with self.lock:
+            self.counters['throttled'] += 1
+            self.counters['throttled_seconds'] += delay
+
+        # Wait
+        self.wait(delay)
+
+    def retry_after(self, response):
+        """
+        Extract the Retry-After Delay of a Response.
+
+        Args:
+            response (requests.Response): The Response
+
+        Returns:
+            float: The Delay (Seconds), or None if not Provided in Seconds.
+        """
+
+        # Extract Retry-After
+        retry_after = response.headers.get(self.HEADER_RETRY_AFTER, None)
+
+        # Return Delay
+        return float(retry_after) if retry_after is not None and str(retry_after).strip().isdigit() else None
+
+    def retry_delay(self, response, attempt: int):
+        """
+        Compute the Retry Delay of a Rate-Limited Response (429 Status).
+
+        Args:
+            response (requests.Response): The Response
+            attempt (int): The Attempt Number (0 for the First Request)
+
+        Returns:
+            float: The Delay (Seconds), or None if the Response is not Rate-Limited.
+        """
+
+        # If Response is not Rate-Limited
+        if response.status_code != self.STATUS_TOO_MANY_REQUESTS:
+
+            # Not Rate-Limited
+            return None
+
+        # Count Rate-Limit
+        self.count('rate_limited')
+
+        # If Retry-After is Provided (Seconds)
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+
+            # Return Retry-After
+            return retry_after
+
+        # If Reset is Provided
+        if response.headers.get(self.HEADER_RESET, None) is not None:
+
+            # Return Delay until Reset
+            return max(0, int(response.headers.get(self.HEADER_RESET)) - time.time())
+
+        # Return Exponential Backoff
+        return self.backoff * (2 ** attempt)
+
+    def wait(self, delay: float):
+        """
+        Wait for a Rate-Limit Delay.
+
+        Args:
+            delay (float): The Delay (Seconds)
+
+        Raises:
+            ValueError: If the Delay exceeds 'max_wait'.
+        """
+
+        # If Delay is too Long
+        if delay > self.max_wait:
+
+            # Raise Value Exception
+            raise ValueError("[{0}] - Rate-Limit Wait of {1:.0f}s exceeds 'max_wait' ({2}s)".format(
+                type(self).__name__,
+                delay,
+                self.max_wait
+            ))
+
+        # Wait
+        time.sleep(delay)
+
+    def get_counters(self) -> dict:
+        """
+        Retrieves the Requests, Retries and Throttling Counters.
+
+        Returns:
+            dict: The Counters.
+        """
+        with self.lock:
+            return dict(self.counters)
+
+    def get_rate_limits(self) -> dict:
+        """
+        Retrieves the Last Known Rate-Limits, keyed by '<rate-limit key>:<resource>'.
+
+        Returns:
+            dict: The Rate-Limits (limit, remaining, reset).
+        """
+        with self.lock:
+            return {
+                "{0}:{1}".format(key, resource): dict(state)
+                for (key, resource), state in self.rate_limits.items()
+            }
@@ -0,0 +1,209 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Ensure a Directory Exists and is Private to the Current User
+def ensure_private_directory(path: str, forbidden_mode: int = 0o077) -> str:
+    """
+    Create a Directory (Owner Only) if Missing, and Check it is Owned by the Current User and not
+    Open to other Users, so a Directory Created First by an other User (eg. under a Shared
+    Temporary Directory) is never Used.
+
+    Args:
+        path (str): The Directory Path.
+        forbidden_mode (int): The Permission Bits the Directory must not have (Default : any Group or Other Bit).
+
+    Returns:
+        str: The Directory Path.
+
+    Raises:
+        ValueError: If the Directory is not a Directory, is Owned by an other User or has Forbidden Permissions.
+    """
+
+    # Create Directory (Owner Only)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+    # Read Directory Status (Symbolic Links are not Followed)
+    status = os.lstat(path)
+
+    # If Path is not a Directory (eg. Symbolic Link)
+    if not stat.S_ISDIR(status.st_mode):
+
+        # Raise Value Exception
+        raise ValueError("[ensure_private_directory] - '{0}' is not a Directory".format(path))
+
+    # If Directory is Owned by an other User
+    if hasattr(os, 'getuid') and status.st_uid != os.getuid():
+
+        # Raise Value Exception
+        raise ValueError("[ensure_private_directory] - '{0}' is not Owned by the Current User".format(path))
+
+    # If Directory is Open to other Users
+    if stat.S_IMODE(status.st_mode) & forbidden_mode:
+
+        # Raise Value Exception
+        raise ValueError("[ensure_private_directory] - '{0}' is Accessible by other Users (Mode {1:o})".format(
+            path,
+            stat.S_IMODE(status.st_mode)
+        ))
+
+    # Return Path
+    return path
+
+
+class LockedJsonStore:
+    """
+    JSON File Store shared between Processes.
+
+    Reads hold a Shared Lock and Updates an Exclusive Lock (fcntl Lock File next to the Store), the
+    Store is Replaced Atomically and Readable by the Owner only. Its Directory is Created if Missing,
+    and Refused when Owned by an other User or Writable by other Users.
+
+    Attributes:
+        path (str): The Store File Path.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the Store.
+
+        Args:
+            path (str): The Store File Path
+        Raises:
+            ValueError: If File Locking is not Available, or the Store Directory is not Private to the Current User.
+        """
+
+        # If File Locking is not Available
+        if not IMPORTS_OK:
+
+            # Raise Value Exception
+            raise ValueError("[LockedJsonStore] - Initialization failed : On-Disk Store requires 'fcntl'")
+
+        # Initialize Path
+        self.path = os.path.abspath(os.path.expanduser(path))
+
+        # Ensure Store Directory Exists (not Writable by other Users)
+        ensure_private_directory(os.path.dirname(self.path), forbidden_mode=0o022)
+
+    @contextmanager
+    def locked(self, exclusive: bool):
+        """
+        Lock the Store (Shared Lock for Reads, Exclusive Lock for Writes).
+
+        Args:
+            exclusive (bool): Acquire an Exclusive Lock
+        Raises:
+            ValueError: If the Store Directory is not Private to the Current User.
+        """
+
+        # Ensure Store Directory Exists (not Writable by other Users)
+        ensure_private_directory(os.path.dirname(self.path), forbidden_mode=0o022)
+
+        # Open Lock File
+        lock_fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+
+            # Acquire Lock
+            fcntl.flock(lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+            # Execute Block
+            yield
+
+        finally:
+
+            # Release Lock
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def read(self) -> dict:
+        """
+        Read the Store (Missing or Corrupted Store is read as Empty). The Caller holds the Lock.
+
+        Returns:
+            dict: The Stored Entries.
+        """
+
+        try:
+
+            # Read Store
+            with open(self.path, 'r') as store:
+                entries = json.load(store)
+
+        except (IOError, ValueError):
+
+            # Empty Store
+            return {}
+
+        # Return Entries
+        return entries if isinstance(entries, dict) else {}
+
+    def write(self, entries: dict):
+        """
+        Write the Store Atomically. The Caller holds the Exclusive Lock.
+
+        Args:
+            entries (dict): The Entries to Store
+        """
+
+        # Create Temporary File (Owner Only) in the Store Directory
+        fd, temporary_path = tempfile.mkstemp(dir=os.path.dirname(self.path))
+
+        try:
+
+            # Write Entries
+            with os.fdopen(fd, 'w') as store:
+                json.dump(entries, store)
+
+            # Replace Store
+            os.replace(temporary_path, self.path)
+
+        except Exception:
+
+            # Remove Temporary File
+            os.unlink(temporary_path)
+            raise
+
+    def load(self) -> dict:
+        """
+        Read the Store under a Shared Lock.
+
+        Returns:
+            dict: The Stored Entries.
+        """
+
+        # Read Store
+        with self.locked(exclusive=False):
+            return self.read()
+
+    def update(self, function):
+        """
+        Update the Store under an Exclusive Lock.
+
+        Args:
+            function (Callable[[dict], dict]): Returns the New Entries from the Stored Entries (None to Keep the Store).
+        """
+
+        # Update Store
+        with self.locked(exclusive=True):
+
+            # Compute New Entries
+            entries = function(self.read())
+
+            # If Entries are Changed
+            if entries is not None:
+
+                # Write Store
+                self.write(entries)
@@ -1,17 +1,17 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ...module_utils.commons import is_2xx
+from ...module_utils.commons import is_2xx, run_concurrently
 from ...module_utils.github.enums import PrivateKeyFormat
 from ...module_utils.commons_security import convert_to_pkcs8
 from ...module_utils.commons_security import JwtTokenAuth
+from ...module_utils.github.token_cache import AppTokenCache
+from ...module_utils.github.session import GithubSession
 
-try:
-    import requests
-    import time
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+import hashlib
+import threading
+import time
+from typing import Dict, List
 
 
 class AppAccessTokenClient:
@@ -39,9 +39,27 @@ class AppAccessTokenClient:
     # Create Access Token URI
     CREATE_ACCESS_TOKEN_URI = "app/installations/{installation_id}/access_tokens"
 
+    # List Installations URI
+    LIST_INSTALLATIONS_URI = "app/installations?per_page={page_size}&page={page}"
+
+    # List Installations Page Size
+    LIST_INSTALLATIONS_PAGE_SIZE = 100
+
     # URL Format
     URL_TEMPLATE = "{base_url}/{uri}"
 
+    # Minimum Remaining Validity (Seconds) of a Memoized JWT
+    JWT_REUSE_MARGIN = 5
+
+    # Memoized PKCS#8 Keys (Source Key Digest -> Converted Key)
+    CONVERTED_KEYS = {}
+
+    # Memoized Signed JWTs ((App ID, Algorithm, Key Digest) -> (Auth, Expiry))
+    SIGNED_JWTS = {}
+
+    # Memoized Keys and JWTs Lock
+    MEMO_LOCK = threading.Lock()
+
     def __init__(
         self,
         app_installation_id: str,
@@ -61,7 +79,7 @@ class AppAccessTokenClient:
         Args:
             api_base_url (str): The Github API base URL (eg. https://api.github.com).
             api_version (str): The Github API Version (eg. 2022-11-28)
-            app_installation_id (str): The Github App Installation ID (eg. 123456789)
+            app_installation_id (str): The Github App Installation ID (eg. 123456789), None for Multi Installations Use
             app_private_key (str): The Github App Private Key
             private_key_format (PrivateKeyFormat): The Github API Private Key Format (eg. PEM_PKCS_8)
             app_private_key_password (str): The Github API Private Key Password
@@ -71,12 +89,6 @@ class AppAccessTokenClient:
             ValueError: If any of the required parameters are not provided.
         """
 
-        # If app_installation_id is not Provided
-        if not app_installation_id:
-
-            # Raise Value Exception
-            raise ValueError("[AppAccessTokenClient] - Initialization failed : 'app_installation_id' is required")
-
         # If app_id is not Provided
         if not app_id:
 
@@ -104,53 +116,231 @@ class AppAccessTokenClient:
         # Initialize JWT Algorithm
         self.jwt_algorithm = jwt_algorithm
 
-        # IAT
-        jwt_iat = int(time.time()) - jwt_exp_clock_drift
+        # Initialize Private Key Details
+        self.app_private_key = app_private_key
+        self.app_private_key_password = app_private_key_password
+        self.private_key_format = private_key_format
+
+        # Initialize JWT Duration and Clock Drift
+        self.jwt_key_duration = jwt_key_duration
+        self.jwt_exp_clock_drift = jwt_exp_clock_drift
+
+        # Initialize Private Key Digest (Memoization Key)
+        self.private_key_digest = hashlib.sha256(
+            "{0}:{1}".format(app_private_key, app_private_key_password or '').encode()
+        ).hexdigest()
+
+        # Initialize Auth (Signed on first use)
+        self.auth = None
+
+        # Initialize HTTP Session (Created on first use)
+        self.session = None
+        self.session_lock = threading.Lock()
+
+    # Method used to Get the Pooled, Rate-Limit Aware HTTP Session
+    def get_session(self, pool_size: int = 10) -> GithubSession:
+
+        # Create Session Once
+        with self.session_lock:
+
+            # If Session is not Created
+            if self.session is None:
+
+                # Build Session with a Connection Pool sized for Concurrent Requests
+                self.session = GithubSession(pool_size=pool_size)
+
+        # Return Session
+        return self.session
+
+    # Method used to Build the App JWT Request Headers
+    def get_headers(self) -> dict:
 
-        # Initialize Private Key
-        compliant_private_key = app_private_key
+        # Sign or Reuse JWT
+        self.auth = self.get_auth()
 
-        # If Key format is not PKCS#8
-        if private_key_format != PrivateKeyFormat.PEM_PKCS_8:
+        # Return Headers
+        return {
+            "Content-Type": self.CONTENT_TYPE_JSON,
+            "Accept": self.ACCEPT,
+            "Authorization": self.auth.get_auth_header_value(),
+            self.HEADER_NAME_API_VERSION: str(self.api_version)
+        }
+
+    # Method used to Get the PKCS#8 Private Key (Converted once per Key)
+    def get_private_key(self) -> str:
+
+        # If Key format is PKCS#8
+        if self.private_key_format == PrivateKeyFormat.PEM_PKCS_8:
+
+            # Return Key
+            return self.app_private_key
+
+        # Find Memoized Key
+        with self.MEMO_LOCK:
+            compliant_private_key = self.CONVERTED_KEYS.get(self.private_key_digest, None)
+
+        # If Key is not Converted Yet
+        if compliant_private_key is None:
 
             # Convert Key
             compliant_private_key = convert_to_pkcs8(
-                private_key_content=app_private_key,
-                key_password=app_private_key_password
+                private_key_content=self.app_private_key,
+                key_password=self.app_private_key_password
             )
 
-        # Initialize Auth
-        self.auth = JwtTokenAuth(
-            jwt_algorithm=jwt_algorithm,
+            # Memoize Key
+            with self.MEMO_LOCK:
+                self.CONVERTED_KEYS[self.private_key_digest] = compliant_private_key
+
+        # Return Key
+        return compliant_private_key
+
+    # Method used to Get the App JWT Authentication (Signed once until its Expiry)
+    def get_auth(self) -> JwtTokenAuth:
+
+        # Build Memoization Key
+        memo_key = (str(self.app_id), self.jwt_algorithm, self.private_key_digest)
+
+        # Current Time
+        now = int(time.time())
+
+        # Find Memoized JWT
+        with self.MEMO_LOCK:
+            auth, expiry = self.SIGNED_JWTS.get(memo_key, (None, 0))
+
+        # If Memoized JWT is Still Valid
+        if auth is not None and expiry - self.JWT_REUSE_MARGIN > now:
+
+            # Return Auth
+            return auth
+
+        # IAT (Backdated to Absorb Clock Drift)
+        jwt_iat = now - self.jwt_exp_clock_drift
+
+        # Expiry
+        jwt_exp = now + self.jwt_key_duration
+
+        # Sign JWT
+        auth = JwtTokenAuth(
+            jwt_algorithm=self.jwt_algorithm,
             jwt_payload={
-                "iss": app_id,
+                "iss": self.app_id,
                 "iat": jwt_iat,
-                "exp": jwt_iat + jwt_key_duration,
-                "alg": jwt_algorithm
+                "exp": jwt_exp,
+                "alg": self.jwt_algorithm
             },
-            jwt_private_key=compliant_private_key
+            jwt_private_key=self.get_private_key()
         )
 
+        # Memoize JWT
+        with self.MEMO_LOCK:
+            self.SIGNED_JWTS[memo_key] = (auth, jwt_exp)
+
+        # Return Auth
+        return auth
+
+    # Method used to Get Github App Access Token (Reused from Cache until its Expiry)
+    def get_access_token(self, cache: AppTokenCache = None, installation_id: str = None) -> dict:
+
+        # Resolve Installation ID
+        installation_id = installation_id or self.app_installation_id
+
+        # If Cache is Provided
+        if cache is not None:
+
+            # Find Cached Token
+            token = cache.get(app_id=self.app_id, installation_id=installation_id, api_base_url=self.api_base_url)
+
+            # If Token is Found
+            if token is not None:
+
+                # Return Token
+                return token
+
+        # Create Token
+        token = self.create_access_token(installation_id=installation_id)
+
+        # If Cache is Provided
+        if cache is not None:
+
+            # Store Token
+            cache.put(app_id=self.app_id, installation_id=installation_id, token=token, api_base_url=self.api_base_url)
+
+        # Return Token
+        return token
+
+    # Method used to List Github App Installations
+    def list_installations(self) -> List[dict]:
+
+        # Initialize Result
+        installations = []
+
+        # Initialize Page
+        page = 1
+
+        # Read all Pages
+        while True:
+
+            # Build the Operation URL
+            url = self.URL_TEMPLATE.format(
+                base_url=self.api_base_url,
+                uri=self.LIST_INSTALLATIONS_URI.format(
+                    page_size=self.LIST_INSTALLATIONS_PAGE_SIZE,
+                    page=page
+                )
+            )
+
+            # Execute Request
+            response = self.get_session().get(url=url, headers=self.get_headers())
+
+            # If Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                raise ValueError("API Error : [Statue : {status}, Message : {message}]".format(
+                    status=response.status_code,
+                    message=response.json().get("message", '')
+                ))
+
+            # Extract Page
+            items = response.json()
+
+            # Add Installations
+            installations.extend(items)
+
+            # If Last Page
+            if len(items) < self.LIST_INSTALLATIONS_PAGE_SIZE:
+
+                # Return Installations
+                return installations
+
+            # Next Page
+            page += 1
+
     # Method used to Create Github App Access Token
-    def create_access_token(self) -> str:
+    def create_access_token(self, installation_id: str = None) -> dict:
+
+        # Resolve Installation ID
+        installation_id = installation_id or self.app_installation_id
+
+        # If Installation ID is not Provided
+        if not installation_id:
+
+            # Raise Value Exception
+            raise ValueError("[AppAccessTokenClient] - Create Access Token : 'installation_id' is required")
 
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.api_base_url,
             uri=self.CREATE_ACCESS_TOKEN_URI.format(
-                installation_id=self.app_installation_id
+                installation_id=installation_id
             )
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.get_session().post(
             url=url,
-            headers={
-                "Content-Type": self.CONTENT_TYPE_JSON,
-                "Accept": self.ACCEPT,
-                "Authorization": self.auth.get_auth_header_value(),
-                self.HEADER_NAME_API_VERSION: str(self.api_version)
-            }
+            headers=self.get_headers()
         )
 
         # If Object Exists
@@ -166,3 +356,36 @@ class AppAccessTokenClient:
                 status=response.json()["status"],
                 message=response.json()["message"]
             ))
+
+    # Method used to Get Access Tokens of many Installations (Listed or Discovered)
+    def get_access_tokens(
+        self,
+        installation_ids: List[str] = None,
+        cache: AppTokenCache = None,
+        max_workers: int = 8
+    ) -> Dict[str, dict]:
+
+        # Size the Session Pool for the Workers
+        self.get_session(pool_size=max(1, max_workers))
+
+        # If Installations are not Provided
+        if not installation_ids:
+
+            # Discover Installations
+            installation_ids = [installation['id'] for installation in self.list_installations()]
+
+        # Deduplicate Installations (Keep Order)
+        installation_ids = list(dict.fromkeys(str(installation_id) for installation_id in installation_ids))
+
+        # Sign the JWT Once before Minting
+        self.get_auth()
+
+        # Mint Tokens Concurrently
+        tokens = run_concurrently(
+            lambda installation_id: self.get_access_token(cache=cache, installation_id=installation_id),
+            installation_ids,
+            max_workers=max_workers
+        )
+
+        # Return Tokens indexed by Installation
+        return dict(zip(installation_ids, tokens))
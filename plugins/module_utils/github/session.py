@@ -0,0 +1,117 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import time
+
+from ..commons_session import RateLimitedSession
+
+
+class GithubSession(RateLimitedSession):
+    """
+    Rate-Limit Aware HTTP Session for the Github API.
+
+    The Rate-Limit Headers (X-RateLimit-Limit/Remaining/Reset/Resource) are tracked per Token
+    (Authorization Header) and per Resource. Requests are delayed until the Reset when a Token
+    has no Remaining Requests, and Secondary Rate-Limit Responses (429, or 403 with Retry-After
+    or a Rate-Limit Message) are retried with backoff. See RateLimitedSession.
+    """
+
+    # Rate-Limit Headers
+    HEADER_LIMIT = "X-RateLimit-Limit"
+    HEADER_REMAINING = "X-RateLimit-Remaining"
+    HEADER_RESET = "X-RateLimit-Reset"
+    HEADER_RESOURCE = "X-RateLimit-Resource"
+    HEADER_RETRY_AFTER = "Retry-After"
+
+    # Default Resource (When GitHub does not Send the Resource Header)
+    DEFAULT_RESOURCE = "core"
+
+    # Rate-Limited Responses Counters
+    LIMIT_COUNTERS = ('primary_limited', 'secondary_limited')
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        min_remaining: int = 0,
+        max_retries: int = 3,
+        backoff: float = 60,
+        max_wait: float = 900
+    ):
+        """
+        Initializes the Github Session.
+
+        Args:
+            pool_size (int): The HTTP Connection Pool Size (Concurrent Requests)
+            min_remaining (int): The Remaining Requests under which Requests wait for the Reset
+            max_retries (int): The Maximum Number of Retries of a Rate-Limited Request
+            backoff (float): The First Retry Delay (Seconds) when GitHub gives no Retry-After
+            max_wait (float): The Maximum Single Wait (Seconds), Longer Waits raise instead
+        """
+
+        # Initialize Session
+        super(GithubSession, self).__init__(
+            pool_size=pool_size,
+            min_remaining=min_remaining,
+            max_retries=max_retries,
+            backoff=backoff,
+            max_wait=max_wait
+        )
+
+    def rate_limit_key(self, headers: dict) -> str:
+        """
+        Build the Rate-Limit Key of a Request (Token is never Kept in Clear).
+
+        Args:
+            headers (dict): The Request Headers
+
+        Returns:
+            str: The Authorization Header Digest ('anonymous' without Authorization).
+        """
+
+        # Extract Authorization
+        authorization = (headers or {}).get("Authorization", None)
+
+        # Return Digest
+        return hashlib.sha256(authorization.encode()).hexdigest()[:16] if authorization else "anonymous"
+
+    def retry_delay(self, response, attempt: int):
+        """
+        Compute the Retry Delay of a Rate-Limited Response (Primary or Secondary Rate-Limit).
+
+        Args:
+            response (requests.Response): The Response
+            attempt (int): The Attempt Number (0 for the First Request)
+
+        Returns:
+            float: The Delay (Seconds), or None if the Response is not Rate-Limited.
+        """
+
+        # If Response is not a Rate-Limit Status
+        if response.status_code not in (403, self.STATUS_TOO_MANY_REQUESTS):
+
+            # Not Rate-Limited
+            return None
+
+        # Extract Headers
+        headers = response.headers
+        retry_after = self.retry_after(response)
+
+        # If Primary Rate-Limit is Exhausted
+        if retry_after is None and headers.get(self.HEADER_REMAINING, None) == '0':
+
+            # Count and Wait for Reset
+            self.count('primary_limited')
+            return max(0, int(headers.get(self.HEADER_RESET, 0)) - time.time())
+
+        # If 403 is not a Secondary Rate-Limit (Permission Error)
+        if response.status_code == 403 and retry_after is None and 'rate limit' not in response.text.lower():
+
+            # Not Rate-Limited
+            return None
+
+        # Count Secondary Rate-Limit
+        self.count('secondary_limited')
+
+        # Return Retry-After, or Exponential Backoff
+        return retry_after if retry_after is not None else self.backoff * (2 ** attempt)
@@ -0,0 +1,177 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from ..commons_store import LockedJsonStore
+
+
+# Parse Github Timestamp (eg. 2016-07-11T22:14:10Z) to Epoch Seconds
+def parse_expires_at(expires_at: str) -> float:
+
+    # If Timestamp is not Provided
+    if not expires_at:
+
+        # Return Expired
+        return 0
+
+    # Parse and Return Epoch
+    return datetime.strptime(expires_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+class AppTokenCache:
+    """
+    Cache of Github App Installation Access Tokens, keyed by (api_base_url, app_id, installation_id).
+
+    Tokens are reused until their 'expires_at' minus a safety margin. Tokens are kept in memory,
+    and optionally in a JSON file shared between processes (see LockedJsonStore).
+
+    Attributes:
+        cache_path (str): The On-Disk Store Path (None to keep Tokens in memory only).
+        store (LockedJsonStore): The On-Disk Store (None to keep Tokens in memory only).
+        expiry_margin (int): The Safety Margin (Seconds) removed from Tokens Expiry.
+    """
+
+    # In Memory Tokens (Shared by all Instances of the Process)
+    MEMORY = {}
+
+    # In Memory Tokens Lock
+    MEMORY_LOCK = threading.Lock()
+
+    # Cache Key Format
+    KEY_TEMPLATE = "{api_base_url}:{app_id}:{installation_id}"
+
+    # Default Github API Base URL
+    DEFAULT_API_BASE_URL = "https://api.github.com"
+
+    def __init__(self, cache_path: str = None, expiry_margin: int = 300):
+        """
+        Initializes the Token Cache.
+
+        Args:
+            cache_path (str): The On-Disk Store Path (None to keep Tokens in memory only)
+            expiry_margin (int): The Safety Margin (Seconds) removed from Tokens Expiry
+        Raises:
+            ValueError: If the On-Disk Store is requested and File Locking is not Available, or its Directory is not Private.
+        """
+
+        # Initialize Store
+        self.cache_path = os.path.expanduser(cache_path) if cache_path else None
+        self.store = LockedJsonStore(self.cache_path) if self.cache_path else None
+
+        # Initialize Expiry Margin
+        self.expiry_margin = expiry_margin
+
+    def is_valid(self, token: dict) -> bool:
+        """
+        Check if a Token is still valid, with the Safety Margin.
+
+        Args:
+            token (dict): The Access Token Payload (token, expires_at, ...)
+
+        Returns:
+            bool: True if the Token can be reused.
+        """
+        return bool(token) and parse_expires_at(token.get('expires_at', None)) - self.expiry_margin > time.time()
+
+    def key(self, app_id: str, installation_id: str, api_base_url: str = None) -> str:
+        """
+        Build the Cache Key of a Token (Apps with the Same IDs on distinct Github Servers don't Share Tokens).
+
+        Args:
+            app_id (str): The Github App ID
+            installation_id (str): The Github App Installation ID
+            api_base_url (str): The Github API Base URL (Default : https://api.github.com)
+
+        Returns:
+            str: The Key.
+        """
+        return self.KEY_TEMPLATE.format(
+            api_base_url=(api_base_url or self.DEFAULT_API_BASE_URL).rstrip('/').lower(),
+            app_id=app_id,
+            installation_id=installation_id
+        )
+
+    def get(self, app_id: str, installation_id: str, api_base_url: str = None) -> dict:
+        """
+        Retrieves a valid Access Token from the Cache.
+
+        Args:
+            app_id (str): The Github App ID
+            installation_id (str): The Github App Installation ID
+            api_base_url (str): The Github API Base URL (Default : https://api.github.com)
+
+        Returns:
+            dict: The Access Token Payload, or None if Missing or Expired.
+        """
+
+        # Build Key
+        key = self.key(app_id=app_id, installation_id=installation_id, api_base_url=api_base_url)
+
+        # Find Token in Memory
+        with self.MEMORY_LOCK:
+            token = self.MEMORY.get(key, None)
+
+        # If Token is Valid
+        if self.is_valid(token):
+
+            # Return Token
+            return token
+
+        # If On-Disk Store is not Enabled
+        if self.store is None:
+
+            # Return None
+            return None
+
+        # Find Token in Store
+        token = self.store.load().get(key, None)
+
+        # If Token is not Valid
+        if not self.is_valid(token):
+
+            # Return None
+            return None
+
+        # Keep Token in Memory
+        with self.MEMORY_LOCK:
+            self.MEMORY[key] = token
+
+        # Return Token
+        return token
+
+    def put(self, app_id: str, installation_id: str, token: dict, api_base_url: str = None):
+        """
+        Store an Access Token in the Cache.
+
+        Args:
+            app_id (str): The Github App ID
+            installation_id (str): The Github App Installation ID
+            api_base_url (str): The Github API Base URL (Default : https://api.github.com)
+            token (dict): The Access Token Payload (token, expires_at, ...)
+        """
+
+        # Build Key
+        key = self.key(app_id=app_id, installation_id=installation_id, api_base_url=api_base_url)
+
+        # Keep Token in Memory
+        with self.MEMORY_LOCK:
+            self.MEMORY[key] = token
+
+        # If On-Disk Store is not Enabled
+        if self.store is None:
+
+            # Return
+            return
+
+        # Drop Expired Tokens and Add Token
+        def add_token(tokens: dict) -> dict:
+            tokens = {k: v for k, v in tokens.items() if self.is_valid(v)}
+            tokens[key] = token
+            return tokens
+
+        # Update Store
+        self.store.update(add_token)
@@ -1,7 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from .client_group import GroupClient
+from .client_member import MemberClient
 from .client_user import UserClient
+from .session import GitlabSession
 from ..commons_security import HttpTokenAuth
 
 
@@ -11,16 +14,19 @@ class Client:
 
     Attributes:
         base_url (str): The base URL of the Gitlab API.
-        auth (HTTPBasicAuth): The HTTP basic authentication credentials.
+        auth (HttpTokenAuth): The HTTP Token authentication credentials.
+        session (GitlabSession): The Pooled, Rate-Limit Aware Session shared by Sub Clients.
     """
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str, api_version: str = "v4", pool_size: int = 10):
         """
         Initializes the GitlabClient with the given base URL and credentials.
 
         Args:
             base_url (str): The base URL (scheme://host:port) of the Gitlab API.
             token (str): The Token for HTTP basic authentication.
+            api_version (str): The Gitlab API Version (eg. v4)
+            pool_size (int): The HTTP Connection Pool Size (Concurrent Requests)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -43,10 +49,31 @@ class Client:
         # Initialize Basic Authentication
         self.auth = HttpTokenAuth(token=token)
 
+        # Initialize Session (Token Preset in Headers)
+        self.session = GitlabSession(
+            authorization=self.auth.get_auth_header_value(),
+            pool_size=pool_size
+        )
+
         # Initialize User Client
         self.user = UserClient(
             base_url=base_url,
-            auth=self.auth
+            api_version=api_version,
+            session=self.session
+        )
+
+        # Initialize Group Client
+        self.group = GroupClient(
+            base_url=base_url,
+            api_version=api_version,
+            session=self.session
+        )
+
+        # Initialize Member Client
+        self.member = MemberClient(
+            base_url=base_url,
+            api_version=api_version,
+            session=self.session
         )
 
 
@@ -59,8 +86,11 @@ def gitlab_client(params: dict):
         'token'
     ]
 
+    # Accept Modules 'access_token' Parameter as Token
+    params = dict(params, token=params.get('token', params.get('access_token', None)))
+
     # Match Required Keys with Parameters (Build Boolean array)
-    credential_parameters = [cred_key in params for cred_key in credential_keys]
+    credential_parameters = [params.get(cred_key, None) is not None for cred_key in credential_keys]
 
     # If All Credentials keyx are present in Module Parameters
     if not all(credential_parameters):
@@ -68,5 +98,8 @@ def gitlab_client(params: dict):
         # Error Message for Module
         raise ValueError("Missing Client API Parameters")
 
-    # Build and Return Client
-    return Client(**{credential: params[credential] for credential in credential_keys})
+    # Build and Return Client (Connection Pool sized for the Module Workers)
+    return Client(
+        pool_size=params.get('max_workers', None) or 10,
+        **{credential: params[credential] for credential in credential_keys}
+    )
@@ -0,0 +1,139 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ..commons import is_2xx, run_concurrently
+from ...module_utils.gitlab.models import Group
+from ...module_utils.gitlab.session import GitlabSession
+from typing import Dict, List
+from urllib.parse import quote
+
+try:
+    from requests.exceptions import HTTPError
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+class GroupClient:
+    """
+    Client for interacting with the Gitlab API for Group.
+
+    Attributes:
+        base_url (str): The base URL of the Gitlab API.
+        api_version (str): The Gitlab API Version.
+        session (GitlabSession): The Pooled Gitlab Session (Token Preset).
+    """
+
+    # Get Group URI (ID or URL-Encoded Full Path)
+    GET_GROUP_URI = "groups/{group}?with_projects=false"
+
+    # URL Format
+    URL_TEMPLATE = "{base_url}/api/{version}/{uri}"
+
+    def __init__(self, base_url: str, api_version: str, session: GitlabSession):
+        """
+        Initializes the GroupClient with the given base URL and session.
+
+        Args:
+            base_url (str): The base URL (scheme://host:port) of the Gitlab API.
+            api_version (str): The Gitlab API Version (eg. v4)
+            session (GitlabSession): The Pooled Gitlab Session (Token Preset)
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Base URL is not Provided
+        if not base_url:
+
+            # Raise Value Exception
+            raise ValueError("[GroupClient] - Initialization failed : 'base_url' is required")
+
+        # If session is not Provided
+        if not session:
+
+            # Raise Value Exception
+            raise ValueError("[GroupClient] - Initialization failed : 'session' is required")
+
+        # Initialize Base URL
+        self.base_url = base_url.rstrip('/')
+
+        # Initialize Version
+        self.api_version = api_version if api_version else "v4"
+
+        # Initialize Session
+        self.session = session
+
+    def get_group(self, group: str = '') -> Group:
+        """
+        Retrieves the detail of Group from the Gitlab API.
+
+        Args:
+            group (str): The ID or the Full Path of the Group (eg. 'platform/backend').
+
+        Returns:
+            Group: The Group details.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails or the Group is not Found.
+        """
+
+        # If group is Empty or Blank
+        if len(str(group).strip()) == 0:
+
+            # Raise Value Exception
+            raise ValueError("[GroupClient] - Group Retrieve : 'group' is required and must be not blank")
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=self.GET_GROUP_URI.format(
+                group=quote(str(group).strip().strip('/'), safe='')
+            )
+        )
+
+        # Execute Request
+        response = self.session.get(
+            url=url
+        )
+
+        # If Object Exists
+        if is_2xx(response.status_code):
+
+            # Return Group
+            return Group.from_api_response(response.json())
+
+        # If Group is not Found
+        if response.status_code == 404:
+
+            # Raise Exception
+            raise HTTPError(
+                "{code} - Group not Found (Group : {group})".format(
+                    code="404",
+                    group=group
+                )
+            )
+
+        # Raise Exception
+        response.raise_for_status()
+
+    def get_groups(self, groups: List[str], max_workers: int = 8) -> Dict[str, Group]:
+        """
+        Retrieves many Groups concurrently.
+
+        Args:
+            groups (List[str]): The IDs or the Full Paths of the Groups.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            Dict[str, Group]: The Groups indexed by the Requested ID or Full Path.
+
+        Raises:
+            requests.exceptions.HTTPError: If one of the API requests fails.
+        """
+
+        # Deduplicate Groups (Keep Order)
+        groups = list(dict.fromkeys(str(group).strip() for group in groups))
+
+        # Retrieve Groups Concurrently
+        return dict(zip(groups, run_concurrently(self.get_group, groups, max_workers=max_workers)))
@@ -0,0 +1,361 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ..commons import is_2xx, run_concurrently
+from ...module_utils.gitlab.enums import AccessLevel, MemberSource
+from ...module_utils.gitlab.models import Member
+from ...module_utils.gitlab.session import GitlabSession
+from typing import Dict, Iterator, List, Tuple
+
+
+class MemberClient:
+    """
+    Client for interacting with the Gitlab API for Group and Project Members.
+
+    Members are addressed by their Source (Group or Project) and the Source ID.
+    Only Direct Members are Listed (Inherited Members can't be Edited on the Source).
+
+    Attributes:
+        base_url (str): The base URL of the Gitlab API.
+        api_version (str): The Gitlab API Version.
+        session (GitlabSession): The Pooled Gitlab Session (Token Preset).
+    """
+
+    # Define Content Type application/json
+    CONTENT_TYPE_JSON = "application/json"
+
+    # List Members URI (Next Pages are Followed from the 'Link' Header)
+    LIST_MEMBERS_URI = "{source}/{source_id}/members?per_page={page_size}"
+
+    # List Members Page Size
+    LIST_MEMBERS_PAGE_SIZE = 100
+
+    # Add Member URI
+    ADD_MEMBER_URI = "{source}/{source_id}/members"
+
+    # Update / Remove Member URI
+    MEMBER_URI = "{source}/{source_id}/members/{user_id}"
+
+    # URL Format
+    URL_TEMPLATE = "{base_url}/api/{version}/{uri}"
+
+    # Member Expiry Date Clearing the Expiry (Sent as null, None Leaves the Expiry Unchanged)
+    CLEAR_EXPIRY = ""
+
+    def __init__(self, base_url: str, api_version: str, session: GitlabSession):
+        """
+        Initializes the MemberClient with the given base URL and session.
+
+        Args:
+            base_url (str): The base URL (scheme://host:port) of the Gitlab API.
+            api_version (str): The Gitlab API Version (eg. v4)
+            session (GitlabSession): The Pooled Gitlab Session (Token Preset)
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Base URL is not Provided
+        if not base_url:
+
+            # Raise Value Exception
+            raise ValueError("[MemberClient] - Initialization failed : 'base_url' is required")
+
+        # If session is not Provided
+        if not session:
+
+            # Raise Value Exception
+            raise ValueError("[MemberClient] - Initialization failed : 'session' is required")
+
+        # Initialize Base URL
+        self.base_url = base_url.rstrip('/')
+
+        # Initialize Version
+        self.api_version = api_version if api_version else "v4"
+
+        # Initialize Session
+        self.session = session
+
+    @staticmethod
+    def build_payload(member: Member, **fields) -> dict:
+        """
+        Build the Membership Payload (Access Level and Expiry), without None Fields.
+
+        A None Expiry Date is not Sent (Expiry Unchanged), while the CLEAR_EXPIRY Expiry Date is Sent
+        as null (Expiry Removed).
+
+        Args:
+            member (Member): The Member.
+            fields: The Additional Payload Fields.
+
+        Returns:
+            dict: The Payload.
+        """
+
+        # Build Payload without None Fields
+        payload = dict(fields, access_level=member.access_level)
+        payload = {name: value for name, value in payload.items() if value is not None}
+
+        # If Expiry Date is Set or Cleared
+        if member.expires_at is not None:
+
+            # Add Expiry Date (null Clears the Expiry)
+            payload['expires_at'] = member.expires_at if member.expires_at != MemberClient.CLEAR_EXPIRY else None
+
+        # Return Payload
+        return payload
+
+    def iter_members(self, source_id: int, source: MemberSource = MemberSource.GROUP) -> Iterator[Member]:
+        """
+        Stream the Direct Members of a Group or a Project.
+
+        Args:
+            source_id (int): The Group or Project ID.
+            source (MemberSource): The Members Source (Group or Project).
+
+        Yields:
+            Member: The Members.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the First Page URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=self.LIST_MEMBERS_URI.format(
+                source=source.value,
+                source_id=source_id,
+                page_size=self.LIST_MEMBERS_PAGE_SIZE
+            )
+        )
+
+        # While Pages Remain
+        while url:
+
+            # Execute Request
+            response = self.session.get(
+                url=url
+            )
+
+            # If Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                response.raise_for_status()
+
+            # Yield Page Members
+            for item in response.json():
+                yield Member.from_api_response(item)
+
+            # Follow Next Page
+            url = response.links.get('next', {}).get('url', None)
+
+    def get_members_index(
+        self,
+        source_ids: List[int],
+        source: MemberSource = MemberSource.GROUP,
+        max_workers: int = 8
+    ) -> Dict[int, Dict[str, Member]]:
+        """
+        Retrieves the Direct Members of many Groups or Projects concurrently.
+
+        Args:
+            source_ids (List[int]): The Group or Project IDs.
+            source (MemberSource): The Members Source (Group or Project).
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            Dict[int, Dict[str, Member]]: The Members indexed by Source ID, then by Username (Lower Case).
+
+        Raises:
+            requests.exceptions.HTTPError: If one of the API requests fails.
+        """
+
+        # Deduplicate Sources (Keep Order)
+        source_ids = list(dict.fromkeys(source_ids))
+
+        # Read Members Concurrently
+        members = run_concurrently(
+            lambda source_id: {member.username.lower(): member for member in self.iter_members(source_id, source)},
+            source_ids,
+            max_workers=max_workers
+        )
+
+        # Return Members indexed by Source
+        return dict(zip(source_ids, members))
+
+    def add_member(self, source_id: int, member: Member, source: MemberSource = MemberSource.GROUP) -> Member:
+        """
+        Add a Member to a Group or a Project.
+
+        Args:
+            source_id (int): The Group or Project ID.
+            member (Member): The Member to Add (User ID, Access Level and Expiry).
+            source (MemberSource): The Members Source (Group or Project).
+
+        Returns:
+            Member: The Added Member.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=self.ADD_MEMBER_URI.format(
+                source=source.value,
+                source_id=source_id
+            )
+        )
+
+        # Execute Request
+        response = self.session.post(
+            url=url,
+            json=self.build_payload(member, user_id=member.id),
+            headers={
+                "Content-Type": self.CONTENT_TYPE_JSON
+            }
+        )
+
+        # If OK
+        if is_2xx(response.status_code):
+
+            # Return Member
+            return Member.from_api_response(response.json())
+
+        # Raise Exception
+        response.raise_for_status()
+
+    def update_member(self, source_id: int, member: Member, source: MemberSource = MemberSource.GROUP) -> Member:
+        """
+        Update the Access Level and Expiry of a Group or a Project Member.
+
+        Args:
+            source_id (int): The Group or Project ID.
+            member (Member): The Member to Update (User ID, Access Level and Expiry).
+            source (MemberSource): The Members Source (Group or Project).
+
+        Returns:
+            Member: The Updated Member.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=self.MEMBER_URI.format(
+                source=source.value,
+                source_id=source_id,
+                user_id=member.id
+            )
+        )
+
+        # Execute Request
+        response = self.session.put(
+            url=url,
+            json=self.build_payload(member),
+            headers={
+                "Content-Type": self.CONTENT_TYPE_JSON
+            }
+        )
+
+        # If OK
+        if is_2xx(response.status_code):
+
+            # Return Member
+            return Member.from_api_response(response.json())
+
+        # Raise Exception
+        response.raise_for_status()
+
+    def remove_member(self, source_id: int, user_id: int, source: MemberSource = MemberSource.GROUP):
+        """
+        Remove a Member from a Group or a Project.
+
+        Args:
+            source_id (int): The Group or Project ID.
+            user_id (int): The Member User ID.
+            source (MemberSource): The Members Source (Group or Project).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=self.MEMBER_URI.format(
+                source=source.value,
+                source_id=source_id,
+                user_id=user_id
+            )
+        )
+
+        # Execute Request
+        response = self.session.delete(
+            url=url
+        )
+
+        # If Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+    def apply_members(
+        self,
+        to_add: List[Tuple[int, Member]] = None,
+        to_update: List[Tuple[int, Member]] = None,
+        to_remove: List[Tuple[int, int]] = None,
+        source: MemberSource = MemberSource.GROUP,
+        max_workers: int = 8
+    ):
+        """
+        Apply many Membership Operations with bounded concurrency, in Phases so a Source never
+        Loses its Last Owner : Additions and Promotions to Owner first, then the other Updates
+        (eg. Demotions), then the Removals. The Operations of a Phase run Concurrently.
+
+        Args:
+            to_add (List[Tuple[int, Member]]): The (Source ID, Member) to Add
+            to_update (List[Tuple[int, Member]]): The (Source ID, Member) to Update
+            to_remove (List[Tuple[int, int]]): The (Source ID, User ID) to Remove
+            source (MemberSource): The Members Source (Group or Project)
+            max_workers (int): The Maximum Number of Concurrent Requests
+
+        Raises:
+            requests.exceptions.HTTPError: If one of the API requests fails.
+        """
+
+        # Owner Access Level
+        owner_level = AccessLevel.OWNER.level
+
+        # Build Operation Phases (Owners Granted before any Owner is Demoted or Removed)
+        phases = [
+            [(self.add_member, dict(source_id=source_id, member=member)) for source_id, member in to_add or []] +
+            [
+                (self.update_member, dict(source_id=source_id, member=member))
+                for source_id, member in to_update or [] if member.access_level == owner_level
+            ],
+            [
+                (self.update_member, dict(source_id=source_id, member=member))
+                for source_id, member in to_update or [] if member.access_level != owner_level
+            ],
+            [(self.remove_member, dict(source_id=source_id, user_id=user_id)) for source_id, user_id in to_remove or []]
+        ]
+
+        # Apply Phases in Order
+        for operations in phases:
+
+            # Apply Operations
+            run_concurrently(
+                lambda operation: operation[0](source=source, **operation[1]),
+                operations,
+                max_workers=max_workers
+            )
@@ -1,12 +1,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ..commons import filter_none, is_2xx
-from ..commons_security import HttpTokenAuth
+from ..commons import filter_none, is_2xx, run_concurrently
 from ...module_utils.gitlab.models import User
+from ...module_utils.gitlab.session import GitlabSession
+from typing import Dict, Iterator, List
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     IMPORTS_OK = True
 except ImportError:
@@ -19,7 +19,7 @@ class UserClient:
 
     Attributes:
         base_url (str): The base URL of the Gitlab API.
-        auth (HttpTokenAuth): The HTTP Token authentication credentials.
+        session (GitlabSession): The Pooled Gitlab Session (Token Preset).
     """
 
     # Définir la constante pour application/json
@@ -28,9 +28,21 @@ class UserClient:
     # Get User By Name URI (Return List so that extract the First One)
     GET_USER_BY_NAME_URI = "users?username={username}"
 
+    # List Users URI (Keyset Pagination, Next Pages are Followed from the 'Link' Header)
+    LIST_USERS_URI = "users?pagination=keyset&per_page={page_size}&order_by=id&sort=asc"
+
+    # List Users Page Size
+    LIST_USERS_PAGE_SIZE = 100
+
     # Create User URI
     CREATE_USER_URI = "users"
 
+    # Block User URI
+    BLOCK_USER_URI = "users/{user_id}/block"
+
+    # Unblock User URI
+    UNBLOCK_USER_URI = "users/{user_id}/unblock"
+
     # Update User URI
     UPDATE_USER_URI = "users/{user_id}"
 
@@ -40,14 +52,14 @@ class UserClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/api/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth: HttpTokenAuth):
+    def __init__(self, base_url: str, api_version: str, session: GitlabSession):
         """
         Initializes the UserClient with the given base URL and credentials.
 
         Args:
             base_url (str): The base URL (scheme://host:port) of the Gitlab API.
             api_version (str): The Gitlab API Version (v1 or v2)
-            auth (HttpTokenAuth): The Authentication Configuration
+            session (GitlabSession): The Pooled Gitlab Session (Token Preset)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -58,11 +70,11 @@ class UserClient:
             # Raise Value Exception
             raise ValueError("[UserClient] - Initialization failed : 'base_url' is required")
 
-        # If auth is not Provided
-        if not auth:
+        # If session is not Provided
+        if not session:
 
             # Raise Value Exception
-            raise ValueError("[UserClient] - Initialization failed : 'auth' is required")
+            raise ValueError("[UserClient] - Initialization failed : 'session' is required")
 
         # Initialize Base URL
         self.base_url = base_url.rstrip('/')
@@ -70,8 +82,61 @@ class UserClient:
         # Initialize Version
         self.api_version = api_version if api_version else "v4"
 
-        # Initialize Basic Authentication
-        self.auth = auth
+        # Initialize Session
+        self.session = session
+
+    def iter_users(self) -> Iterator[User]:
+        """
+        Stream all Users from the Gitlab API, with Keyset Pagination.
+
+        Yields:
+            User: The Users, ordered by ID.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the First Page URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=self.LIST_USERS_URI.format(
+                page_size=self.LIST_USERS_PAGE_SIZE
+            )
+        )
+
+        # While Pages Remain
+        while url:
+
+            # Execute Request
+            response = self.session.get(
+                url=url
+            )
+
+            # If Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                response.raise_for_status()
+
+            # Yield Page Users
+            for item in response.json():
+                yield User.from_api_response(item)
+
+            # Follow Next Page
+            url = response.links.get('next', {}).get('url', None)
+
+    def get_users_index(self) -> Dict[str, User]:
+        """
+        Retrieves all Users from the Gitlab API, indexed by Username (Lower Case).
+
+        Returns:
+            Dict[str, User]: The Users indexed by Username.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+        return {user.username.lower(): user for user in self.iter_users()}
 
     def get_user_by_name(self, username: str = '') -> User:
         """
@@ -103,11 +168,8 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.get(
-            url=url,
-            headers={
-                "Authorization": self.auth.get_auth_header_value()
-            }
+        response = self.session.get(
+            url=url
         )
 
         # If Object Exists
@@ -135,6 +197,53 @@ class UserClient:
             # Raise Exception
             response.raise_for_status()
 
+    def get_user_ids(self, usernames: List[str], max_workers: int = 8) -> Dict[str, int]:
+        """
+        Retrieves the IDs of many Users concurrently (Without an Administrator Token).
+
+        Args:
+            usernames (List[str]): The Logins of the Users.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            Dict[str, int]: The User IDs indexed by Username (Lower Case), Unknown Users are Omitted.
+
+        Raises:
+            requests.exceptions.HTTPError: If one of the API requests fails.
+        """
+
+        # Deduplicate Usernames (Keep Order)
+        usernames = list(dict.fromkeys(username.strip().lower() for username in usernames))
+
+        # Search User
+        def find_user_id(username: str):
+
+            # Execute Request
+            response = self.session.get(
+                url=self.URL_TEMPLATE.format(
+                    base_url=self.base_url,
+                    version=self.api_version,
+                    uri=self.GET_USER_BY_NAME_URI.format(
+                        username=username
+                    )
+                )
+            )
+
+            # If Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                response.raise_for_status()
+
+            # Return First User ID (None if Not Found)
+            return next((user['id'] for user in response.json()), None)
+
+        # Search Users Concurrently
+        user_ids = run_concurrently(find_user_id, usernames, max_workers=max_workers)
+
+        # Return Found User IDs
+        return {username: user_id for username, user_id in zip(usernames, user_ids) if user_id is not None}
+
     def create_user(self, user: User = None) -> User:
         """
         Create a User on Gitlab API.
@@ -163,12 +272,11 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=filter_none(user),
             headers={
-                "Content-Type": self.CONTENT_TYPE_JSON,
-                "Authorization": self.auth.get_auth_header_value()
+                "Content-Type": self.CONTENT_TYPE_JSON
             }
         )
 
@@ -203,11 +311,8 @@ class UserClient:
             # Raise Value Exception
             raise ValueError("[UserClient] - User Update : 'user' details are required")
 
-        # Find The User
-        existing_user = self.get_user_by_name(username=user.username.strip())
-
-        # Get User ID
-        user_id = existing_user.id
+        # Get User ID (Search The User when Unknown)
+        user_id = user.id if user.id is not None else self.get_user_by_name(username=user.username.strip()).id
 
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
@@ -219,12 +324,11 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.session.put(
             url=url,
             json=filter_none(user),
             headers={
-                "Content-Type": self.CONTENT_TYPE_JSON,
-                "Authorization": self.auth.get_auth_header_value()
+                "Content-Type": self.CONTENT_TYPE_JSON
             }
         )
 
@@ -268,17 +372,15 @@ class UserClient:
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
+            version=self.api_version,
             uri=self.DELETE_USER_URI.format(
                 id_delete=user_id
             )
         )
 
         # Execute Request
-        response = requests.delete(
-            url=url,
-            headers={
-                "Authorization": self.auth.get_auth_header_value()
-            }
+        response = self.session.delete(
+            url=url
         )
 
         # If Object Exists
@@ -286,3 +388,72 @@ class UserClient:
 
             # Raise Exception
             response.raise_for_status()
+
+    def set_user_blocked(self, user_id: int, blocked: bool = True):
+        """
+        Block or Unblock a User on Gitlab API.
+
+        Args:
+            user_id (int): The ID of the User
+            blocked (bool): Block (True) or Unblock (False) the User
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            version=self.api_version,
+            uri=(self.BLOCK_USER_URI if blocked else self.UNBLOCK_USER_URI).format(
+                user_id=user_id
+            )
+        )
+
+        # Execute Request
+        response = self.session.post(
+            url=url
+        )
+
+        # If Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+    def apply_users(
+        self,
+        to_create: List[User] = None,
+        to_update: List[User] = None,
+        to_block: List[int] = None,
+        to_unblock: List[int] = None,
+        max_workers: int = 8
+    ):
+        """
+        Apply many User Operations with bounded concurrency.
+
+        Args:
+            to_create (List[User]): The Users to Create
+            to_update (List[User]): The Users to Update (with their ID)
+            to_block (List[int]): The IDs of the Users to Block
+            to_unblock (List[int]): The IDs of the Users to Unblock
+            max_workers (int): The Maximum Number of Concurrent Requests
+
+        Raises:
+            requests.exceptions.HTTPError: If one of the API requests fails.
+        """
+
+        # Build Operations
+        operations = (
+            [(self.create_user, dict(user=user)) for user in to_create or []] +
+            [(self.update_user, dict(user=user)) for user in to_update or []] +
+            [(self.set_user_blocked, dict(user_id=user_id, blocked=True)) for user_id in to_block or []] +
+            [(self.set_user_blocked, dict(user_id=user_id, blocked=False)) for user_id in to_unblock or []]
+        )
+
+        # Apply Operations
+        run_concurrently(
+            lambda operation: operation[0](**operation[1]),
+            operations,
+            max_workers=max_workers
+        )
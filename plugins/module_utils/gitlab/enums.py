@@ -0,0 +1,69 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ..commons_enum import BaseEnum
+
+
+# Gitlab Numeric Access Levels (Indexed by Access Level Name)
+ACCESS_LEVELS = {
+    "no_access": 0,
+    "minimal_access": 5,
+    "guest": 10,
+    "planner": 15,
+    "reporter": 20,
+    "developer": 30,
+    "maintainer": 40,
+    "owner": 50
+}
+
+
+# Define an enumeration for Member Access Level
+class AccessLevel(BaseEnum):
+    """
+    Represents Member Access Level.
+
+    Attributes:
+        NO_ACCESS (str): No Access (0).
+        MINIMAL_ACCESS (str): Minimal Access (5).
+        GUEST (str): Guest (10).
+        PLANNER (str): Planner (15).
+        REPORTER (str): Reporter (20).
+        DEVELOPER (str): Developer (30).
+        MAINTAINER (str): Maintainer (40).
+        OWNER (str): Owner (50).
+    """
+    NO_ACCESS = "no_access"
+    MINIMAL_ACCESS = "minimal_access"
+    GUEST = "guest"
+    PLANNER = "planner"
+    REPORTER = "reporter"
+    DEVELOPER = "developer"
+    MAINTAINER = "maintainer"
+    OWNER = "owner"
+
+    @property
+    def level(self) -> int:
+        """
+        Returns the Gitlab Numeric Access Level.
+        """
+        return ACCESS_LEVELS[self.value]
+
+    @classmethod
+    def from_level(cls, level: int):
+        """
+        Returns the Access Level of a Gitlab Numeric Access Level (None if Unknown).
+        """
+        return next((member for member in cls if member.level == level), None)
+
+
+# Define an enumeration for Member Source
+class MemberSource(BaseEnum):
+    """
+    Represents the Resource owning Members.
+
+    Attributes:
+        GROUP (str): Group Members.
+        PROJECT (str): Project Members.
+    """
+    GROUP = "groups"
+    PROJECT = "projects"
@@ -162,3 +162,108 @@ class User:
             note=response.get('note', None),
             skip_confirmation=response.get('skip_confirmation', None)
         )
+
+
+# Group
+@dataclass
+class Group:
+    """
+    Represents a Group.
+
+    Attributes:
+        id (int): The Group ID.
+        name (str): The Group Name.
+        path (str): The Group Path.
+        full_path (str): The Group Full Path (Including Parent Groups).
+        description (str): The Group Description.
+        visibility (str): The Group Visibility.
+        parent_id (int): The Parent Group ID.
+        web_url (str): The Group Web URL.
+    """
+    id: int                                                        # The Group ID.
+    full_path: str                                                 # The Group Full Path.
+    name: Optional[str] = field(default=None)                      # The Group Name.
+    path: Optional[str] = field(default=None)                      # The Group Path.
+    description: Optional[str] = field(default=None)               # The Group Description.
+    visibility: Optional[str] = field(default=None)                # The Group Visibility.
+    parent_id: Optional[int] = field(default=None)                 # The Parent Group ID.
+    web_url: Optional[str] = field(default=None)                   # The Group Web URL.
+
+    def __post_init__(self):
+
+        # Check id
+        if self.id is None:
+            raise ValueError("The 'id' field is required.")
+
+        # Check full_path
+        if not self.full_path:
+            raise ValueError("The 'full_path' field is required.")
+
+    @classmethod
+    def from_api_response(cls: Type['Group'], response: dict) -> 'Group':
+        """
+        Build a Group from the API Response.
+        """
+        return Group(
+            id=response.get('id', None),
+            full_path=response.get('full_path', None),
+            name=response.get('name', None),
+            path=response.get('path', None),
+            description=response.get('description', None),
+            visibility=response.get('visibility', None),
+            parent_id=response.get('parent_id', None),
+            web_url=response.get('web_url', None)
+        )
+
+
+# Member (of a Group or a Project)
+@dataclass
+class Member:
+    """
+    Represents a Member.
+
+    Attributes:
+        id (int): The Member User ID.
+        username (str): The Member User Login.
+        access_level (int): The Member Numeric Access Level.
+        expires_at (str): The Membership Expiry Date (YYYY-MM-DD, Empty to Clear the Expiry on Update).
+        name (str): The Member User Name.
+        member_state (str): The Member User State.
+        web_url (str): The Member User Web URL.
+    """
+    id: int                                                        # The Member User ID.
+    username: str                                                  # The Member User Login.
+    access_level: int                                              # The Member Numeric Access Level.
+    expires_at: Optional[str] = field(default=None)                # The Membership Expiry Date.
+    name: Optional[str] = field(default=None)                      # The Member User Name.
+    member_state: Optional[str] = field(default=None)              # The Member User State.
+    web_url: Optional[str] = field(default=None)                   # The Member User Web URL.
+
+    def __post_init__(self):
+
+        # Check id
+        if self.id is None:
+            raise ValueError("The 'id' field is required.")
+
+        # Check username
+        if not self.username:
+            raise ValueError("The 'username' field is required.")
+
+        # Check access_level
+        if self.access_level is None:
+            raise ValueError("The 'access_level' field is required.")
+
+    @classmethod
+    def from_api_response(cls: Type['Member'], response: dict) -> 'Member':
+        """
+        Build a Member from the API Response.
+        """
+        return Member(
+            id=response.get('id', None),
+            username=response.get('username', None),
+            access_level=response.get('access_level', None),
+            expires_at=response.get('expires_at', None),
+            name=response.get('name', None),
+            member_state=response.get('state', None),
+            web_url=response.get('web_url', None)
+        )
@@ -0,0 +1,59 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ..commons_session import RateLimitedSession
+
+
+class GitlabSession(RateLimitedSession):
+    """
+    Pooled, Rate-Limit Aware HTTP Session for the Gitlab API.
+
+    The Token is preset in the Session Headers. The Rate-Limit Headers (RateLimit-Limit/Remaining/Reset)
+    are tracked, Requests are delayed until the Reset when no Request Remains, and Rate-Limited Responses
+    (429) are retried after Retry-After (or with Exponential Backoff). See RateLimitedSession.
+    """
+
+    # Rate-Limit Headers
+    HEADER_LIMIT = "RateLimit-Limit"
+    HEADER_REMAINING = "RateLimit-Remaining"
+    HEADER_RESET = "RateLimit-Reset"
+    HEADER_RETRY_AFTER = "Retry-After"
+
+    def __init__(
+        self,
+        authorization: str,
+        pool_size: int = 10,
+        min_remaining: int = 0,
+        max_retries: int = 5,
+        backoff: float = 1,
+        max_wait: float = 300
+    ):
+        """
+        Initializes the Gitlab Session.
+
+        Args:
+            authorization (str): The Authorization Header Value (Preset on every Request)
+            pool_size (int): The HTTP Connection Pool Size (Concurrent Requests)
+            min_remaining (int): The Remaining Requests under which Requests wait for the Reset
+            max_retries (int): The Maximum Number of Retries of a Rate-Limited Request
+            backoff (float): The First Retry Delay (Seconds) when Gitlab gives no Retry-After
+            max_wait (float): The Maximum Single Wait (Seconds), Longer Waits raise instead
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Authorization is not Provided
+        if not authorization:
+
+            # Raise Value Exception
+            raise ValueError("[GitlabSession] - Initialization failed : 'authorization' is required")
+
+        # Initialize Session (Authorization Header Preset)
+        super(GitlabSession, self).__init__(
+            pool_size=pool_size,
+            min_remaining=min_remaining,
+            max_retries=max_retries,
+            backoff=backoff,
+            max_wait=max_wait,
+            headers={"Authorization": authorization}
+        )
@@ -1,16 +1,9 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .client_backends import BackendClient
-from .client_frontends import FrontendClient
-from .client_transactions import TransactionClient
-from .client_configurations import ConfigurationClient
-from .client_acls import AclClient
-from .client_servers import ServerClient
-from .client_backend_switching_rules import BackendSwitchingRuleClient
-from .client_http_request_rules import HttpRequestRuleClient
-from .client_binds import BindClient
-from .client_ssl_certificates import SslCertificateClient
+from importlib import import_module
+from ..commons import lazy_attribute
+from .session import DataPlaneSession, dataplane_session
 
 try:
     from requests.auth import HTTPBasicAuth     # type: ignore
@@ -19,6 +12,34 @@ except ImportError:
     IMPORTS_OK = False
 
 
+# Sub-Client Classes Importable from this Module (Module Imported on First Access)
+SUB_CLIENT_MODULES = {
+    'BackendClient': '.client_backends',
+    'FrontendClient': '.client_frontends',
+    'TransactionClient': '.client_transactions',
+    'ConfigurationClient': '.client_configurations',
+    'AclClient': '.client_acls',
+    'ServerClient': '.client_servers',
+    'BackendSwitchingRuleClient': '.client_backend_switching_rules',
+    'HttpRequestRuleClient': '.client_http_request_rules',
+    'BindClient': '.client_binds',
+    'SslCertificateClient': '.client_ssl_certificates'
+}
+
+
+# Import and Return a Sub-Client Class on First Access (eg. 'from .client import BackendClient')
+def __getattr__(name: str):
+
+    # If Name is not a Sub-Client Class
+    if name not in SUB_CLIENT_MODULES:
+
+        # Raise Attribute Exception
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+    # Import and Return Sub-Client Class
+    return getattr(import_module(SUB_CLIENT_MODULES[name], __package__), name)
+
+
 class Client:
     """
     Client for interacting with the HAProxy Data Plane API.
@@ -26,6 +47,7 @@ class Client:
     Attributes:
         base_url (str): The base URL of the HAProxy Data Plane API.
         auth (HTTPBasicAuth): The HTTP basic authentication credentials.
+        session (DataPlaneSession): The Data Plane Session Shared by Sub-Clients.
     """
 
     # Servers URI
@@ -34,7 +56,7 @@ class Client:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, username: str, password: str):
+    def __init__(self, base_url: str, api_version: str, username: str, password: str, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -43,6 +65,7 @@ class Client:
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             username (str): The username for HTTP basic authentication.
             password (str): The password for HTTP basic authentication.
+            session (DataPlaneSession): The Data Plane Session Shared by Sub-Clients (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -74,74 +97,157 @@ class Client:
         # Initialize Basic Authentication
         self.auth = HTTPBasicAuth(username, password)
 
-        # Initialize Backend Client
-        self.backend = BackendClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+        # Initialize Shared Session
+        self.session = session if session else DataPlaneSession()
+
+    @lazy_attribute
+    def backend(self):
+        """
+        Backend Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Backend Client
+        from .client_backends import BackendClient
+        return BackendClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Frontend Client
-        self.frontend = FrontendClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def frontend(self):
+        """
+        Frontend Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Frontend Client
+        from .client_frontends import FrontendClient
+        return FrontendClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Transaction Client
-        self.transaction = TransactionClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def transaction(self):
+        """
+        Transaction Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Transaction Client
+        from .client_transactions import TransactionClient
+        return TransactionClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def configuration(self):
+        """
+        Configuration Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Configuration Client
+        from .client_configurations import ConfigurationClient
+        return ConfigurationClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize ACL Client
-        self.acl = AclClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def acl(self):
+        """
+        ACL Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ACL Client
+        from .client_acls import AclClient
+        return AclClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Backend Switching Rule Client
-        self.besr = BackendSwitchingRuleClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def besr(self):
+        """
+        Backend Switching Rule Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Backend Switching Rule Client
+        from .client_backend_switching_rules import BackendSwitchingRuleClient
+        return BackendSwitchingRuleClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Bind Client
-        self.bind = BindClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def bind(self):
+        """
+        Bind Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Bind Client
+        from .client_binds import BindClient
+        return BindClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Server Client
-        self.server = ServerClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def server(self):
+        """
+        Server Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Server Client
+        from .client_servers import ServerClient
+        return ServerClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize Http Request Rule Client
-        self.request_rule = HttpRequestRuleClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def request_rule(self):
+        """
+        Http Request Rule Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Http Request Rule Client
+        from .client_http_request_rules import HttpRequestRuleClient
+        return HttpRequestRuleClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
-        # Initialize SSL Certificate Client
-        self.ssl_certificate = SslCertificateClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+    @lazy_attribute
+    def ssl_certificate(self):
+        """
+        SSL Certificate Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build SSL Certificate Client
+        from .client_ssl_certificates import SslCertificateClient
+        return SslCertificateClient(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session
         )
 
 
@@ -165,5 +271,8 @@ def haproxy_client(params: dict):
         # Error Message for Module
         raise ValueError("Missing Client API Parameters")
 
-    # Build and Return Client
-    return Client(**{credential: params[credential] for credential in credential_keys})
+    # Build and Return Client (Shared Session, Delegating to the Local Worker if Requested)
+    return Client(
+        session=dataplane_session(params),
+        **{credential: params[credential] for credential in credential_keys}
+    )
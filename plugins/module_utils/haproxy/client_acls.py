@@ -4,10 +4,10 @@ __metaclass__ = type
 from ...module_utils.commons import filter_none, is_2xx
 from .models import Acl
 from .client_configurations import ConfigurationClient
+from .session import DataPlaneSession
 from typing import List
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     IMPORTS_OK = True
 except ImportError:
@@ -47,7 +47,7 @@ class AclClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -55,6 +55,7 @@ class AclClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (DataPlaneSession): The Shared Data Plane Session (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -80,11 +81,15 @@ class AclClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize Session
+        self.session = session if session else DataPlaneSession()
+
         # Initialize Configuration Client
         self.configuration = ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session
         )
 
     def get_acls(self, parent_name: str, parent_type: str = 'backend') -> List[Acl]:
@@ -110,7 +115,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -152,7 +157,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -209,7 +214,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -273,7 +278,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=filter_none(acl),
             headers={
@@ -345,7 +350,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.session.put(
             url=url,
             json=filter_none(acl),
             headers={
@@ -413,7 +418,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.session.delete(
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
@@ -4,14 +4,9 @@ __metaclass__ = type
 from ...module_utils.commons import filter_none, is_2xx
 from .models import BackendSwitchingRule
 from .client_configurations import ConfigurationClient
+from .session import DataPlaneSession
 from typing import List
 
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
-
 
 class BackendSwitchingRuleClient:
     """
@@ -43,7 +38,7 @@ class BackendSwitchingRuleClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -51,6 +46,7 @@ class BackendSwitchingRuleClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (DataPlaneSession): The Shared Data Plane Session (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -76,11 +72,15 @@ class BackendSwitchingRuleClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize Session
+        self.session = session if session else DataPlaneSession()
+
         # Initialize Configuration Client
         self.configuration = ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session
         )
 
     def get_backend_switching_rules(self, frontend_name: str) -> List[BackendSwitchingRule]:
@@ -105,7 +105,7 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -144,7 +144,7 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -205,7 +205,7 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=filter_none(besr),
             headers={
@@ -274,7 +274,7 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.session.put(
             url=url,
             json=filter_none(besr),
             headers={
@@ -340,7 +340,7 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.session.delete(
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
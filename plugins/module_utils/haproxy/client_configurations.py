@@ -2,12 +2,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ...module_utils.commons import is_2xx
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .session import DataPlaneSession
 
 
 class ConfigurationClient:
@@ -25,7 +20,7 @@ class ConfigurationClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -33,6 +28,7 @@ class ConfigurationClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (DataPlaneSession): The Shared Data Plane Session (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -58,6 +54,9 @@ class ConfigurationClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize Session
+        self.session = session if session else DataPlaneSession()
+
     def get_configuration_version(self):
         """
         Get HAProxy Configuration Version.
@@ -77,7 +76,7 @@ class ConfigurationClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
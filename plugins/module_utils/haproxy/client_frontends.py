@@ -4,12 +4,7 @@ __metaclass__ = type
 from ...module_utils.commons import filter_none, is_2xx
 from .models import Frontend
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .session import DataPlaneSession
 
 
 class FrontendClient:
@@ -39,7 +34,7 @@ class FrontendClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -47,6 +42,7 @@ class FrontendClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (DataPlaneSession): The Shared Data Plane Session (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -72,11 +68,15 @@ class FrontendClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize Session
+        self.session = session if session else DataPlaneSession()
+
         # Initialize Configuration Client
         self.configuration = ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session
         )
 
     def get_frontends(self):
@@ -98,7 +98,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -133,7 +133,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -191,7 +191,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=filter_none(frontend),
             headers={
@@ -257,7 +257,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.session.put(
             url=url,
             json=filter_none(frontend),
             headers={
@@ -319,7 +319,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.session.delete(
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
@@ -2,10 +2,10 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from .client_configurations import ConfigurationClient
+from .session import DataPlaneSession
 from ...module_utils.commons import is_2xx
 
 try:
-    import requests
     import os
     IMPORTS_OK = True
 except ImportError:
@@ -36,7 +36,7 @@ class SslCertificateClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -44,6 +44,7 @@ class SslCertificateClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (DataPlaneSession): The Shared Data Plane Session (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -69,11 +70,15 @@ class SslCertificateClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize Session
+        self.session = session if session else DataPlaneSession()
+
         # Initialize Configuration Client
         self.configuration = ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session
         )
 
     def get_certificates(self):
@@ -95,7 +100,7 @@ class SslCertificateClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -130,7 +135,7 @@ class SslCertificateClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -195,7 +200,7 @@ class SslCertificateClient:
         try:
 
             # Execute Request
-            response = requests.post(
+            response = self.session.post(
                 url=url,
                 files=files,
                 auth=self.auth
@@ -273,7 +278,7 @@ class SslCertificateClient:
         }
 
         # Execute request
-        response = requests.put(url, data=certificate_content, headers=headers, auth=self.auth)
+        response = self.session.put(url, data=certificate_content, headers=headers, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -317,7 +322,7 @@ class SslCertificateClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -2,14 +2,9 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from .client_configurations import ConfigurationClient
+from .session import DataPlaneSession
 from ...module_utils.commons import is_2xx
 
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
-
 
 class TransactionClient:
     """
@@ -38,7 +33,7 @@ class TransactionClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session: DataPlaneSession = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -46,6 +41,7 @@ class TransactionClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (DataPlaneSession): The Shared Data Plane Session (Default : New Local Session)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -71,11 +67,15 @@ class TransactionClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize Session
+        self.session = session if session else DataPlaneSession()
+
         # Initialize Configuration Client
         self.configuration = ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session
         )
 
     def create_transaction(self):
@@ -100,7 +100,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.post(url, auth=self.auth)
+        response = self.session.post(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -143,7 +143,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -176,7 +176,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -211,7 +211,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.put(url, auth=self.auth)
+        response = self.session.put(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -245,7 +245,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth)
 
         # If Object Exists
         if not is_2xx(response.status_code):
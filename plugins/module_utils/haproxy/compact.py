@@ -0,0 +1,57 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from typing import Any, List, Type
+from ..commons_model import CompactModel, compact_model, is_unset_value
+from .diff import model_hints, parse_value, unwrap_response
+from .models import Server, Backend, Bind
+
+
+# Slotted Compact Variants (Read-Heavy Snapshot and Diff Paths)
+CompactServer = compact_model(Server)
+CompactBackend = compact_model(Backend)
+CompactBind = compact_model(Bind)
+
+
+# Parse an API Payload into a Compact Model
+def compact_from_api_response(cls: Type[CompactModel], response: dict) -> CompactModel:
+    """
+    Parse a Data Plane API Payload Directly into a Compact Model (No Intermediate Dataclass).
+
+    Enumerations are Parsed to their (Shared) Members, Unknown Keys are Ignored.
+
+    Args:
+        cls (Type[CompactModel]): The Compact Class (eg. CompactServer).
+        response (dict): The API Payload (Wrapped or Not).
+
+    Returns:
+        CompactModel: The Compact Instance.
+    """
+
+    # Unwrap Payload and Resolve Types
+    payload = unwrap_response(response)
+    hints = model_hints(cls.MODEL)
+
+    # Set Fields
+    instance = cls.__new__(cls)
+    for name in cls.FIELDS:
+        value = payload.get(name, None)
+        setattr(instance, name, None if is_unset_value(value) else parse_value(hints[name], value))
+
+    # Return Instance
+    return instance
+
+
+# Parse a List of API Payloads into Compact Models
+def compact_snapshot(cls: Type[CompactModel], responses: Any) -> List[CompactModel]:
+    """
+    Parse a Data Plane API List Response (eg. all Servers of a Backend) into Compact Models.
+
+    Args:
+        cls (Type[CompactModel]): The Compact Class (eg. CompactServer).
+        responses (Any): The API List Response (Wrapped or Not).
+
+    Returns:
+        List[CompactModel]: The Compact Instances.
+    """
+    return [compact_from_api_response(cls, response) for response in unwrap_response(responses) or []]
@@ -0,0 +1,256 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Dict, Type, Union, get_type_hints
+from ..commons_model import CompactModel
+from .enums import EnableDisableEnum
+
+
+# Values the HAProxy Configuration Implies when a Field is not Set (by Model Name)
+# Fields typed 'EnableDisableEnum' are 'disabled' when not Set
+SERVER_SIDE_DEFAULTS = dict(
+    Server=dict(weight=1, rise=2, fall=3, inter=2000)
+)
+
+
+# Resolved Field Types by Model
+MODEL_HINTS = {}
+
+
+# Resolve the Field Types of a Model (Once per Model)
+def model_hints(cls: Type) -> Dict[str, Any]:
+
+    # If Types are not Resolved
+    if cls not in MODEL_HINTS:
+
+        # Resolve Field Types
+        MODEL_HINTS[cls] = get_type_hints(cls)
+
+    # Return Types
+    return MODEL_HINTS[cls]
+
+
+# Unwrap a Data Plane API Response (v2 wraps Configuration Objects in {'_version', 'data'})
+def unwrap_response(response: Any) -> Any:
+
+    # If Response is Wrapped
+    if isinstance(response, dict) and '_version' in response and 'data' in response:
+
+        # Return Object
+        return response['data']
+
+    # Return Response
+    return response
+
+
+# Resolve the Concrete Type of a Type Hint (Optional[X] is X)
+def resolve_hint(hint: Any) -> Any:
+
+    # If Hint is an Union (Optional)
+    if getattr(hint, '__origin__', None) is Union:
+
+        # Return First non None Type
+        return next((arg for arg in hint.__args__ if arg is not type(None)), hint)
+
+    # Return Hint
+    return hint
+
+
+# Parse an API Value with a Type Hint
+def parse_value(hint: Any, value: Any) -> Any:
+
+    # Resolve Type
+    hint = resolve_hint(hint)
+
+    # If Value is a Nested Model
+    if is_dataclass(hint) and isinstance(value, dict):
+        return from_api_payload(hint, value)
+
+    # If Value is a List
+    if getattr(hint, '__origin__', None) is list and isinstance(value, list):
+        return [parse_value(hint.__args__[0], item) for item in value]
+
+    # If Value is an Enumeration (Unknown Values are Kept)
+    if isinstance(hint, type) and issubclass(hint, Enum) and not isinstance(value, hint):
+        try:
+            return hint(value)
+        except ValueError:
+            return value
+
+    # Return Value
+    return value
+
+
+# Parse an API Payload into a Model
+def from_api_payload(cls: Type, payload: dict) -> Any:
+    """
+    Parse a Data Plane API Payload into a Model (Nested Models, Lists and Enumerations).
+
+    Unknown Keys are Ignored.
+
+    Args:
+        cls (Type): The Model Class (eg. Backend).
+        payload (dict): The API Payload (Wrapped or Not).
+
+    Returns:
+        Any: The Model, or the Unwrapped Payload if it does not Validate against the Model.
+    """
+
+    # Unwrap Payload
+    payload = unwrap_response(payload)
+
+    # Resolve Field Types
+    hints = model_hints(cls)
+
+    # Parse Known Fields
+    values = {
+        model_field.name: parse_value(hints[model_field.name], payload[model_field.name])
+        for model_field in fields(cls)
+        if payload.get(model_field.name, None) is not None
+    }
+
+    try:
+
+        # Build Model
+        return cls(**values)
+
+    except (TypeError, ValueError):
+
+        # Keep Payload (Missing Required Fields)
+        return payload
+
+
+# Check if a Value is Unset (None or Empty Collection)
+def is_unset(value: Any) -> bool:
+
+    # Return Check
+    return value is None or (isinstance(value, (list, dict)) and len(value) == 0)
+
+
+# Normalize a Value for Comparison (Models and Enumerations to Plain Values, Unset Fields Removed)
+def normalize(value: Any) -> Any:
+
+    # If Value is a Model
+    if is_dataclass(value) and not isinstance(value, type):
+        value = {model_field.name: getattr(value, model_field.name) for model_field in fields(value)}
+
+    # If Value is a Compact Model
+    if isinstance(value, CompactModel):
+        value = value.to_dict()
+
+    # If Value is a Dictionary
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items() if not is_unset(item)}
+
+    # If Value is a List
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+
+    # If Value is an Enumeration
+    if isinstance(value, Enum):
+        return value.value
+
+    # Return Value
+    return value
+
+
+# Build the Implied Values of a Model (Server Side Defaults)
+def model_defaults(cls: Type) -> Dict[str, Any]:
+
+    # Resolve Field Types
+    hints = model_hints(cls)
+
+    # Switches are Disabled when not Set
+    defaults = {
+        model_field.name: EnableDisableEnum.DISABLED.value
+        for model_field in fields(cls)
+        if resolve_hint(hints[model_field.name]) is EnableDisableEnum
+    }
+
+    # Add Known Defaults
+    defaults.update(SERVER_SIDE_DEFAULTS.get(cls.__name__, {}))
+
+    # Return Defaults
+    return defaults
+
+
+# Compare a Desired Value with a Live Value (Only Desired Keys of Dictionaries are Compared)
+def compare(desired: Any, live: Any, path: str, changes: Dict[str, dict]):
+
+    # If Desired Value is a Dictionary
+    if isinstance(desired, dict):
+
+        # Compare Desired Keys
+        live = live if isinstance(live, dict) else {}
+        for key, item in desired.items():
+            compare(item, live.get(key, None), "{0}.{1}".format(path, key) if path else key, changes)
+        return
+
+    # If Desired Value is a List (Ordered, Items Compared on their Desired Keys)
+    if isinstance(desired, list):
+
+        # Compare Items
+        item_changes = {}
+        if isinstance(live, list) and len(live) == len(desired):
+            for index, item in enumerate(desired):
+                compare(item, live[index], str(index), item_changes)
+
+        # If List Differs
+        if not isinstance(live, list) or len(live) != len(desired) or item_changes:
+            changes[path] = dict(before=live, after=desired)
+        return
+
+    # If Value Differs
+    if desired != live:
+        changes[path] = dict(before=live, after=desired)
+
+
+# Compute the Differences between a Desired Model and a Live API Object
+def diff_model(desired: Any, live: Any) -> Dict[str, dict]:
+    """
+    Compute the Field Level Differences between a Desired Model and a Live API Object.
+
+    The Live Object is Parsed into the Model and Completed with the Server Side Defaults.
+    Only the Fields Set on the Desired Model are Compared (Unset Fields Keep their Live Value).
+
+    Args:
+        desired (Any): The Desired Model (eg. Backend).
+        live (Any): The Live Object (API Response, Model or Compact Model).
+
+    Returns:
+        Dict[str, dict]: The Changes by Field Path ('balance.algorithm'), with 'before' and 'after' Values.
+    """
+
+    # Normalize Live Object (Models and Compact Models are not Parsed)
+    is_model = is_dataclass(live) or isinstance(live, CompactModel)
+    live_values = normalize(live if is_model else from_api_payload(type(desired), live or {}))
+
+    # Complete with Implied Values
+    for key, value in model_defaults(type(desired)).items():
+        live_values.setdefault(key, value)
+
+    # Compare Desired Fields
+    changes = {}
+    compare(normalize(desired), live_values, '', changes)
+
+    # Return Changes
+    return changes
+
+
+# Build the Ansible Diff Output of Changes
+def diff_output(changes: Dict[str, dict]) -> dict:
+    """
+    Build the Ansible '--diff' Output of Changes.
+
+    Args:
+        changes (Dict[str, dict]): The Changes by Field Path (see diff_model).
+
+    Returns:
+        dict: The Diff (before, after).
+    """
+    return dict(
+        before={path: change['before'] for path, change in changes.items()},
+        after={path: change['after'] for path, change in changes.items()}
+    )
@@ -3,6 +3,7 @@ __metaclass__ = type
 
 from typing import List, Dict, Optional, Type
 from dataclasses import dataclass, field
+from ..commons_model import BaseModel
 from .enums import EnableDisableEnum, LoadBalancingAlgorithm, CookieType
 from .enums import WebSocketProtocol, HealthCheckType, TimeoutStatus
 from .enums import ErrorStatus, OkStatus, HttpMethod, ProxyProtocol, FrontendLevel
@@ -392,8 +393,55 @@ class IgnorePersist:
 
 
 # HTTP Request Rule Configuration
-@dataclass
-class HttpRequestRule:
+@dataclass(eq=False)
+class HttpRequestRule(BaseModel):
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = (
+        'type',
+        'acl_file',
+        'acl_keyfmt',
+        'auth_realm',
+        'bandwidth_limit_limit',
+        'bandwidth_limit_name',
+        'bandwidth_limit_period',
+        'capture_id',
+        'capture_len',
+        'capture_sample',
+        'cond',
+        'cond_test',
+        'deny_status',
+        'expr',
+        'hdr_format',
+        'hdr_match',
+        'hdr_method',
+        'hdr_name',
+        'hint_format',
+        'hint_name',
+        'log_level',
+        'lua_action',
+        'lua_params',
+        'map_file',
+        'map_keyfmt',
+        'map_valuefmt',
+        'mark_value',
+        'method_fmt',
+        'nice_value',
+        'normalizer',
+        'normalizer_full',
+        'normalizer_strict',
+        'path_fmt',
+        'path_match',
+        'protocol',
+        'redir_code',
+        'redir_option',
+        'redir_type',
+        'redir_value',
+        'resolvers',
+        'return_content',
+        'return_content_type',
+        'return_status_code'
+    )
+
     index: Optional[int] = None
     type: Optional[HttpRequestRuleType] = None
     acl_file: Optional[str] = None
@@ -439,65 +487,16 @@ class HttpRequestRule:
     return_content_type: Optional[str] = None
     return_status_code: Optional[int] = None
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of HttpRequestRule
-        if not isinstance(other, HttpRequestRule):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "type", None) == getattr(other, "type", None) and
-            getattr(self, "acl_file", None) == getattr(other, "acl_file", None) and
-            getattr(self, "acl_keyfmt", None) == getattr(other, "acl_keyfmt", None) and
-            getattr(self, "auth_realm", None) == getattr(other, "auth_realm", None) and
-            getattr(self, "bandwidth_limit_limit", None) == getattr(other, "bandwidth_limit_limit", None) and
-            getattr(self, "bandwidth_limit_name", None) == getattr(other, "bandwidth_limit_name", None) and
-            getattr(self, "bandwidth_limit_period", None) == getattr(other, "bandwidth_limit_period", None) and
-            getattr(self, "capture_id", None) == getattr(other, "capture_id", None) and
-            getattr(self, "capture_len", None) == getattr(other, "capture_len", None) and
-            getattr(self, "capture_sample", None) == getattr(other, "capture_sample", None) and
-            getattr(self, "cond", None) == getattr(other, "cond", None) and
-            getattr(self, "cond_test", None) == getattr(other, "cond_test", None) and
-            getattr(self, "deny_status", None) == getattr(other, "deny_status", None) and
-            getattr(self, "expr", None) == getattr(other, "expr", None) and
-            getattr(self, "hdr_format", None) == getattr(other, "hdr_format", None) and
-            getattr(self, "hdr_match", None) == getattr(other, "hdr_match", None) and
-            getattr(self, "hdr_method", None) == getattr(other, "hdr_method", None) and
-            getattr(self, "hdr_name", None) == getattr(other, "hdr_name", None) and
-            getattr(self, "hint_format", None) == getattr(other, "hint_format", None) and
-            getattr(self, "hint_name", None) == getattr(other, "hint_name", None) and
-            getattr(self, "log_level", None) == getattr(other, "log_level", None) and
-            getattr(self, "lua_action", None) == getattr(other, "lua_action", None) and
-            getattr(self, "lua_params", None) == getattr(other, "lua_params", None) and
-            getattr(self, "map_file", None) == getattr(other, "map_file", None) and
-            getattr(self, "map_keyfmt", None) == getattr(other, "map_keyfmt", None) and
-            getattr(self, "map_valuefmt", None) == getattr(other, "map_valuefmt", None) and
-            getattr(self, "mark_value", None) == getattr(other, "mark_value", None) and
-            getattr(self, "method_fmt", None) == getattr(other, "method_fmt", None) and
-            getattr(self, "nice_value", None) == getattr(other, "nice_value", None) and
-            getattr(self, "normalizer", None) == getattr(other, "normalizer", None) and
-            getattr(self, "normalizer_full", None) == getattr(other, "normalizer_full", None) and
-            getattr(self, "normalizer_strict", None) == getattr(other, "normalizer_strict", None) and
-            getattr(self, "path_fmt", None) == getattr(other, "path_fmt", None) and
-            getattr(self, "path_match", None) == getattr(other, "path_match", None) and
-            getattr(self, "protocol", None) == getattr(other, "protocol", None) and
-            getattr(self, "redir_code", None) == getattr(other, "redir_code", None) and
-            getattr(self, "redir_option", None) == getattr(other, "redir_option", None) and
-            getattr(self, "redir_type", None) == getattr(other, "redir_type", None) and
-            getattr(self, "redir_value", None) == getattr(other, "redir_value", None) and
-            getattr(self, "resolvers", None) == getattr(other, "resolvers", None) and
-            getattr(self, "return_content", None) == getattr(other, "return_content", None) and
-            getattr(self, "return_content_type", None) == getattr(other, "return_content_type", None) and
-            getattr(self, "return_status_code", None) == getattr(other, "return_status_code", None)
-        )
-
 
 # Stats Auth Configuration
-@dataclass
-class StatsAuth:
+@dataclass(eq=False)
+class StatsAuth(BaseModel):
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('user',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('user', 'passwd')
+
     user: str
     passwd: str
 
@@ -511,20 +510,6 @@ class StatsAuth:
         if not self.passwd:
             raise ValueError("[StatsAuth] - The 'passwd' field is required.")
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of StatsAuth
-        if not isinstance(other, StatsAuth):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "user", '') == getattr(other, "user", '') and
-            getattr(self, "passwd", '') == getattr(other, "passwd", '')
-        )
-
 
 # Stats Options Configuration
 @dataclass
@@ -703,28 +688,19 @@ class Bind:
 
 
 # ACL Configuration
-@dataclass
-class Acl:
+@dataclass(eq=False)
+class Acl(BaseModel):
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('acl_name',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('acl_name', 'criterion', 'value')
+
     acl_name: str
     criterion: str
     value: str
     index: Optional[int] = None
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of Acl
-        if not isinstance(other, Acl):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "acl_name", None) == getattr(other, "acl_name", None) and
-            getattr(self, "criterion", None) == getattr(other, "criterion", None) and
-            getattr(self, "value", None) == getattr(other, "value", None)
-        )
-
     @classmethod
     def from_api_response(cls: Type['Acl'], response: dict) -> 'Acl':
         """
@@ -763,28 +739,19 @@ class Acl:
 
 
 # Backend Switching Rule Configuration
-@dataclass
-class BackendSwitchingRule:
+@dataclass(eq=False)
+class BackendSwitchingRule(BaseModel):
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('name',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('cond', 'cond_test', 'name')
+
     cond: ConditionType
     cond_test: str
     name: str
     index: Optional[int] = None
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of BackendSwitchingRule
-        if not isinstance(other, BackendSwitchingRule):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "cond", None) == getattr(other, "cond", None) and
-            getattr(self, "cond_test", None) == getattr(other, "cond_test", None) and
-            getattr(self, "name", None) == getattr(other, "name", None)
-        )
-
     @classmethod
     def from_api_response(cls: Type['BackendSwitchingRule'], response: dict) -> 'BackendSwitchingRule':
         """
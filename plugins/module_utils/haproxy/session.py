@@ -0,0 +1,157 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+from ..commons import shared_client
+from ..commons_instrumentation import API_CALLS, instrument_session, request_body_size
+from .worker import WorkerUnavailable, start_worker
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+class DataPlaneSession:
+    """
+    Pooled HTTP Session for the HAProxy Data Plane API, Shared by all Sub-Clients of a Client.
+
+    Requests are Executed on Kept-Alive Connections, or Delegated to the Local Persistent Worker
+    (see DataPlaneWorker) when one is Configured. If the Worker cannot be Reached, Requests fall
+    back to the Local Session. File Uploads are always Executed Locally.
+
+    Attributes:
+        session (requests.Session): The Local Pooled Session.
+        worker (WorkerClient): The Worker Client (None when Requests are Executed Locally).
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        worker: bool = False,
+        worker_socket: str = None,
+        worker_idle_timeout: float = 600,
+        worker_cache_ttl: float = 5
+    ):
+        """
+        Initializes the Data Plane Session.
+
+        Args:
+            pool_size (int): The HTTP Connection Pool Size
+            worker (bool): Delegate Requests to the Local Worker (Started if None Answers)
+            worker_socket (str): The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR or the Temporary Directory)
+            worker_idle_timeout (float): The Idle Delay (Seconds) after which a Started Worker Exits
+            worker_cache_ttl (float): The Worker Cached Reads Time To Live (Seconds, 0 Disables the Cache)
+        """
+
+        # Build Pooled HTTP Session
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size)))
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size)))
+
+        # Record API Calls
+        instrument_session(self.session)
+
+        # Initialize Worker (None if not Requested or not Reachable)
+        self.worker = None
+        if worker:
+            try:
+                self.worker = start_worker(
+                    socket_path=worker_socket,
+                    idle_timeout=worker_idle_timeout,
+                    cache_ttl=worker_cache_ttl
+                )
+            except (WorkerUnavailable, OSError):
+                self.worker = None
+
+    def get(self, url: str, **kwargs):
+        """
+        Execute a GET Request.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """
+        Execute a POST Request.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        """
+        Execute a PUT Request.
+        """
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        """
+        Execute a DELETE Request.
+        """
+        return self.request("DELETE", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Execute a Request through the Worker (if Configured) or the Local Session.
+
+        Args:
+            method (str): The HTTP Method
+            url (str): The Request URL
+            kwargs: The requests Arguments (auth, headers, params, json, data, files, timeout)
+
+        Returns:
+            requests.Response: The Response.
+        """
+
+        # If a Worker is Configured (Uploads are not Delegated)
+        if self.worker is not None and 'files' not in kwargs:
+
+            try:
+
+                # Execute Request through Worker (Latency Measured End to End)
+                start = time.perf_counter()
+                try:
+                    response = self.worker.request(method, url, **kwargs)
+                except requests.exceptions.RequestException as error:
+
+                    # Record Failed Call and Raise
+                    API_CALLS.record_error(method, url, error, (time.perf_counter() - start) * 1000, request_body_size(kwargs))
+                    raise
+
+                # Record Call
+                API_CALLS.record_response(
+                    response,
+                    latency=(time.perf_counter() - start) * 1000,
+                    method=method,
+                    request_size=request_body_size(kwargs)
+                )
+
+                # Return Response
+                return response
+
+            except WorkerUnavailable:
+
+                # Fall back to Local Session (Worker not Reached, Request not Sent)
+                self.worker = None
+
+        # Execute Request Locally
+        return self.session.request(method, url, **kwargs)
+
+
+# Build and Return the Data Plane Session from Dictionnary Vars (Worker Options are Optional, Shared in the Process)
+def dataplane_session(params: dict) -> DataPlaneSession:
+
+    # Session Options (Credentials are not Bound to the Session)
+    options = dict(
+        worker=params.get('worker', False),
+        worker_socket=params.get('worker_socket', None),
+        worker_idle_timeout=params.get('worker_idle_timeout', 600),
+        worker_cache_ttl=params.get('worker_cache_ttl', 5)
+    )
+
+    # Build and Return Session
+    return shared_client(
+        ('haproxy',) + tuple(sorted(options.items())),
+        lambda: DataPlaneSession(**options)
+    )
@@ -0,0 +1,578 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import base64
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+from ..commons_store import ensure_private_directory
+
+try:
+    import fcntl
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Build and Return the Default Worker Socket Path (Private Directory of the Current User)
+def default_socket_path() -> str:
+
+    # If the User Runtime Directory is Defined (Private to the User)
+    runtime_directory = os.environ.get('XDG_RUNTIME_DIR', None)
+    if runtime_directory and os.path.isdir(runtime_directory):
+
+        # Return Path under the Runtime Directory
+        return os.path.join(runtime_directory, "ansible-kube-cloud-haproxy", "worker.sock")
+
+    # Return Path under the Temporary Directory
+    return os.path.join(
+        tempfile.gettempdir(),
+        "ansible-kube-cloud-haproxy-{0}".format(os.getuid() if hasattr(os, 'getuid') else 'user'),
+        "worker.sock"
+    )
+
+
+# Exception Raised when the Worker cannot be Reached
+class WorkerUnavailable(Exception):
+    pass
+
+
+# Encode an HTTP Response into a Worker Message
+def encode_response(response, cached: bool = False) -> dict:
+
+    # Return Message
+    return dict(
+        status_code=response.status_code,
+        reason=response.reason,
+        url=response.url,
+        headers=dict(response.headers),
+        content=base64.b64encode(response.content or b'').decode('ascii'),
+        cached=cached
+    )
+
+
+# Decode a Worker Message into an HTTP Response
+def decode_response(message: dict):
+
+    # Build Response
+    response = requests.models.Response()
+    response.status_code = message['status_code']
+    response.reason = message['reason']
+    response.url = message['url']
+    response.headers = CaseInsensitiveDict(message['headers'])
+    response._content = base64.b64decode(message['content'])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+
+    # Return Response
+    return response
+
+
+class DataPlaneWorker(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Long-Lived Local Worker Executing Data Plane API Requests for the HAProxy Modules.
+
+    The Worker Listens on a Unix Socket (Owner Only) and Keeps, across Tasks, a Pooled HTTP Session
+    (Kept-Alive Connections) and a Cache of the Configuration Reads (Configuration Snapshots and
+    Lists). The Configuration Version and the Reads inside a Transaction are never Cached, since
+    Optimistic Locking needs their Current Value. Any Write to a Data Plane API Flushes the Cached
+    Reads of that API, and Cached Reads Expire after 'cache_ttl' Seconds (Changes not made through
+    the Worker are Seen after the TTL). The Worker Exits after 'idle_timeout' Seconds without Request.
+
+    Attributes:
+        idle_timeout (float): The Idle Delay (Seconds) after which the Worker Exits.
+        cache_ttl (float): The Cached Reads Time To Live (Seconds, 0 Disables the Cache).
+        counters (dict): The Requests, Cache Hits and Flushes Counters.
+    """
+
+    # Threads do not Block the Worker Exit
+    daemon_threads = True
+
+    # Cached Read Paths
+    CACHED_PATH = "/services/haproxy/configuration/"
+
+    # Uncached Read Paths (Configuration Version, Read before each Versioned Write)
+    UNCACHED_PATH = "/services/haproxy/configuration/version"
+
+    # Maximum Message Size (Bytes)
+    MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, socket_path: str, idle_timeout: float = 600, cache_ttl: float = 5, pool_size: int = 16):
+        """
+        Initializes the Worker and Binds its Socket.
+
+        Args:
+            socket_path (str): The Unix Socket Path
+            idle_timeout (float): The Idle Delay (Seconds) after which the Worker Exits
+            cache_ttl (float): The Cached Reads Time To Live (Seconds, 0 Disables the Cache)
+            pool_size (int): The HTTP Connection Pool Size (per Host)
+        """
+
+        # Initialize Configuration
+        self.idle_timeout = idle_timeout
+        self.cache_ttl = cache_ttl
+
+        # Build Pooled HTTP Session
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=max(1, pool_size)))
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=max(1, pool_size)))
+
+        # Initialize Cache ({(url, params, username): (expires_at, auth, message)}) and Counters
+        self.cache = {}
+        self.counters = dict(requests=0, cache_hits=0, cache_flushes=0)
+        self.last_request = time.monotonic()
+        self.lock = threading.Lock()
+
+        # Bind Socket (Owner Only)
+        previous_umask = os.umask(0o177)
+        try:
+            socketserver.UnixStreamServer.__init__(self, socket_path, WorkerRequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def execute(self, request: dict) -> dict:
+        """
+        Execute a Request Message and Return the Response Message.
+
+        Args:
+            request (dict): The Request (method, url, auth, headers, params, json, data, timeout)
+
+        Returns:
+            dict: The Response, or the Error (error, message).
+        """
+
+        # Register Activity
+        with self.lock:
+            self.last_request = time.monotonic()
+            self.counters['requests'] += 1
+
+        # If Request is a Ping
+        if request['method'] == 'PING':
+            return dict(status="ok", pid=os.getpid(), **self.counters)
+
+        # Build Cache Key and API Key
+        auth = tuple(request['auth']) if request.get('auth', None) else None
+        cache_key = (request['url'], json.dumps(request.get('params', None), sort_keys=True), auth[0] if auth else None)
+        api = "{0.scheme}://{0.netloc}".format(urlsplit(request['url']))
+
+        # If Request is a Cacheable Read
+        cacheable = self.is_cacheable(request)
+        if cacheable:
+
+            # Return Cached Response
+            with self.lock:
+                entry = self.cache.get(cache_key, None)
+                if entry and entry[0] > time.monotonic() and entry[1] == auth:
+                    self.counters['cache_hits'] += 1
+                    return dict(entry[2], cached=True)
+
+        # If Request is a Write
+        if request['method'] != 'GET':
+
+            # Flush Cached Reads of the API
+            self.flush(api)
+
+        try:
+
+            # Execute Request
+            response = self.session.request(
+                request['method'],
+                request['url'],
+                auth=auth,
+                headers=request.get('headers', None),
+                params=request.get('params', None),
+                json=request.get('json', None),
+                data=request.get('data', None),
+                timeout=request.get('timeout', None)
+            )
+
+        except requests.exceptions.RequestException as request_error:
+
+            # Return Error
+            return dict(error=type(request_error).__name__, message=str(request_error))
+
+        # Encode Response
+        message = encode_response(response)
+
+        # Cache Successful Reads
+        if cacheable and 200 <= response.status_code < 300:
+            with self.lock:
+                self.cache[cache_key] = (time.monotonic() + self.cache_ttl, auth, message)
+
+        # Return Response
+        return message
+
+    def is_cacheable(self, request: dict) -> bool:
+        """
+        Check if a Request is a Cacheable Read (Configuration Read, outside a Transaction, except the Version).
+
+        Args:
+            request (dict): The Request Message
+
+        Returns:
+            bool: True if the Response may be Cached.
+        """
+
+        # If Cache is Disabled or Request is not a Read
+        if request['method'] != 'GET' or self.cache_ttl <= 0:
+            return False
+
+        # Split URL Path
+        path = urlsplit(request['url']).path.rstrip('/')
+
+        # If Request is not a Configuration Read, or Reads the Version
+        if self.CACHED_PATH not in path + '/' or path.endswith(self.UNCACHED_PATH):
+            return False
+
+        # Cacheable if Read is outside a Transaction
+        return not (request.get('params', None) or {}).get('transaction_id', None) and 'transaction_id=' not in request['url']
+
+    def flush(self, api: str):
+        """
+        Flush the Cached Reads of a Data Plane API.
+
+        Args:
+            api (str): The API Root (scheme://host:port)
+        """
+
+        # Remove Entries
+        with self.lock:
+            for key in [key for key in self.cache if key[0].startswith(api)]:
+                del self.cache[key]
+            self.counters['cache_flushes'] += 1
+
+    def watch_idle(self):
+        """
+        Stop the Worker after 'idle_timeout' Seconds without Request.
+        """
+
+        # Check Activity
+        while True:
+            time.sleep(max(0.5, min(self.idle_timeout / 10.0, 30)))
+            if time.monotonic() - self.last_request > self.idle_timeout:
+                self.shutdown()
+                return
+
+    def run(self):
+        """
+        Serve Requests until the Worker is Idle, then Remove the Socket.
+        """
+
+        # Start Idle Watcher
+        threading.Thread(target=self.watch_idle, daemon=True).start()
+
+        try:
+
+            # Serve Requests
+            self.serve_forever(poll_interval=0.5)
+
+        finally:
+
+            # Close and Remove Socket
+            self.server_close()
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+
+
+class WorkerRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler of a Worker Connection (One JSON Line Request, One JSON Line Response).
+    """
+
+    def handle(self):
+
+        # Read Request
+        line = self.rfile.readline(DataPlaneWorker.MAX_MESSAGE_SIZE)
+        if not line:
+            return
+
+        try:
+
+            # Execute Request
+            message = self.server.execute(json.loads(line.decode('utf-8')))
+
+        except (ValueError, KeyError, TypeError) as message_error:
+
+            # Build Error
+            message = dict(error="InvalidRequest", message=str(message_error))
+
+        # Write Response
+        self.wfile.write(json.dumps(message).encode('utf-8') + b"\n")
+
+
+class WorkerClient:
+    """
+    Client of the Local Data Plane API Worker (see DataPlaneWorker).
+
+    Attributes:
+        socket_path (str): The Worker Unix Socket Path.
+        timeout (float): The Socket Timeout (Seconds) when no Request Timeout is Given.
+    """
+
+    def __init__(self, socket_path: str = None, timeout: float = 300):
+        """
+        Initializes the Worker Client.
+
+        Args:
+            socket_path (str): The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR or the Temporary Directory)
+            timeout (float): The Socket Timeout (Seconds) when no Request Timeout is Given
+        """
+
+        # Initialize Configuration
+        self.socket_path = socket_path if socket_path else default_socket_path()
+        self.timeout = timeout
+
+    def check_socket(self):
+        """
+        Check the Worker Socket is a Socket Owned by the Current User and not Open to other Users.
+
+        Raises:
+            WorkerUnavailable: If the Socket is Missing or not Private to the Current User.
+        """
+
+        try:
+
+            # Read Socket Status (Symbolic Links are not Followed)
+            status = os.lstat(self.socket_path)
+
+        except OSError as status_error:
+
+            # Raise Unavailable
+            raise WorkerUnavailable("[WorkerClient] - Worker '{0}' Unavailable : {1}".format(self.socket_path, status_error))
+
+        # If Path is not a Socket, is Owned by an other User or is Open to other Users
+        if not stat.S_ISSOCK(status.st_mode) or \
+                (hasattr(os, 'getuid') and status.st_uid != os.getuid()) or \
+                stat.S_IMODE(status.st_mode) & 0o077:
+
+            # Raise Unavailable (Never Connect)
+            raise WorkerUnavailable("[WorkerClient] - Worker '{0}' Refused : not a Socket Private to the Current User".format(self.socket_path))
+
+    def send(self, message: dict, timeout: float = None) -> dict:
+        """
+        Send a Message to the Worker and Return its Response Message.
+
+        Raises:
+            WorkerUnavailable: If the Worker cannot be Reached, or its Socket is not Private (the Message is not Sent).
+            requests.exceptions.ConnectionError: If the Worker Fails after the Message is Sent.
+        """
+
+        # Check Socket before Connecting
+        self.check_socket()
+
+        # Open Connection
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout if timeout else self.timeout)
+
+        try:
+
+            try:
+
+                # Connect
+                connection.connect(self.socket_path)
+
+            except OSError as socket_error:
+
+                # Raise Unavailable (Nothing Sent)
+                raise WorkerUnavailable("[WorkerClient] - Worker '{0}' Unavailable : {1}".format(self.socket_path, socket_error))
+
+            try:
+
+                # Send Message and Read Response Line
+                connection.sendall(json.dumps(message).encode('utf-8') + b"\n")
+                with connection.makefile('rb') as stream:
+                    line = stream.readline()
+
+            except OSError as socket_error:
+
+                # Raise Connection Error (the Worker may have Executed the Request)
+                raise requests.exceptions.ConnectionError("[WorkerClient] - Worker '{0}' Failed : {1}".format(self.socket_path, socket_error))
+
+        finally:
+
+            # Close Connection
+            connection.close()
+
+        # If Worker Closed the Connection
+        if not line:
+            raise requests.exceptions.ConnectionError("[WorkerClient] - Worker '{0}' Closed the Connection".format(self.socket_path))
+
+        # Return Response
+        return json.loads(line.decode('utf-8'))
+
+    def ping(self) -> dict:
+        """
+        Returns the Worker Status (pid and Counters).
+
+        Raises:
+            WorkerUnavailable: If the Worker cannot be Reached.
+        """
+        return self.send(dict(method='PING'), timeout=2)
+
+    def is_alive(self) -> bool:
+        """
+        Check if the Worker Answers.
+        """
+
+        try:
+
+            # Ping Worker
+            return self.ping().get('status', None) == 'ok'
+
+        except (WorkerUnavailable, requests.exceptions.ConnectionError):
+
+            # Return Unavailable
+            return False
+
+    def request(self, method: str, url: str, auth=None, **kwargs):
+        """
+        Execute an HTTP Request through the Worker.
+
+        Args:
+            method (str): The HTTP Method
+            url (str): The Request URL
+            auth: The Basic Authentication (requests.auth.HTTPBasicAuth or (username, password))
+            kwargs: The requests Arguments (headers, params, json, data, timeout)
+
+        Returns:
+            requests.Response: The Response.
+
+        Raises:
+            WorkerUnavailable: If the Worker cannot be Reached.
+            requests.exceptions.ConnectionError: If the Worker cannot Reach the Data Plane API.
+        """
+
+        # Encode Authentication
+        if auth is not None and not isinstance(auth, (tuple, list)):
+            auth = (auth.username, auth.password)
+
+        # Send Request
+        message = self.send(
+            dict(
+                method=method.upper(),
+                url=url,
+                auth=list(auth) if auth else None,
+                headers=kwargs.get('headers', None),
+                params=kwargs.get('params', None),
+                json=kwargs.get('json', None),
+                data=kwargs.get('data', None),
+                timeout=kwargs.get('timeout', None)
+            ),
+            timeout=kwargs.get('timeout', None)
+        )
+
+        # If Worker Failed to Execute Request
+        if 'error' in message:
+            raise requests.exceptions.ConnectionError("[Worker] - {0} : {1}".format(message['error'], message['message']))
+
+        # Return Response
+        return decode_response(message)
+
+
+# Start a Detached Worker (if None Answers on the Socket)
+def start_worker(socket_path: str = None, idle_timeout: float = 600, cache_ttl: float = 5, wait: float = 5) -> WorkerClient:
+    """
+    Start a Detached Worker Process (Double Fork) Listening on the Socket, unless a Worker Already Answers.
+
+    Concurrent Starts are Serialized with a Lock File, and Stale Sockets are Replaced. The Socket Directory
+    must be Owned by the Current User and not Open to other Users.
+
+    Args:
+        socket_path (str): The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR or the Temporary Directory)
+        idle_timeout (float): The Idle Delay (Seconds) after which the Worker Exits
+        cache_ttl (float): The Cached Reads Time To Live (Seconds, 0 Disables the Cache)
+        wait (float): The Maximum Delay (Seconds) for the Worker to Answer
+
+    Returns:
+        WorkerClient: The Client of the Running Worker.
+
+    Raises:
+        WorkerUnavailable: If the Socket Directory is not Private, or the Worker does not Answer in Time.
+    """
+
+    # Build Client
+    client = WorkerClient(socket_path=socket_path)
+
+    try:
+
+        # Create Private Directory (Refused if Owned by an other User or Open to other Users)
+        ensure_private_directory(os.path.dirname(os.path.abspath(client.socket_path)))
+
+    except (ValueError, OSError) as directory_error:
+
+        # Raise Unavailable
+        raise WorkerUnavailable("[StartWorker] - Worker '{0}' Refused : {1}".format(client.socket_path, directory_error))
+
+    # If Worker Already Answers
+    if client.is_alive():
+        return client
+
+    # Lock Start
+    lock_fd = os.open(client.socket_path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+        # If Worker Started Meanwhile
+        if client.is_alive():
+            return client
+
+        # Remove Stale Socket
+        if os.path.exists(client.socket_path):
+            os.unlink(client.socket_path)
+
+        # Fork Worker (and Reap the Intermediate Process)
+        pid = os.fork()
+        if pid == 0:
+            run_detached(client.socket_path, idle_timeout, cache_ttl)
+        os.waitpid(pid, 0)
+
+        # Wait for Worker
+        deadline = time.monotonic() + wait
+        while not client.is_alive():
+            if time.monotonic() > deadline:
+                raise WorkerUnavailable("[StartWorker] - Worker '{0}' did not Start".format(client.socket_path))
+            time.sleep(0.05)
+
+    finally:
+
+        # Release Lock
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
+
+    # Return Client
+    return client
+
+
+# Detach the Forked Process and Run the Worker (Never Returns)
+def run_detached(socket_path: str, idle_timeout: float, cache_ttl: float):
+
+    try:
+
+        # Detach from Session, Fork Again (not a Session Leader) and Leave the Module Directory
+        os.setsid()
+        if os.fork() != 0:
+            os._exit(0)
+        os.chdir("/")
+
+        # Release Standard Streams (Ansible Waits for the Module Output to Close) and Inherited Descriptors
+        null_fd = os.open(os.devnull, os.O_RDWR)
+        for standard_fd in (0, 1, 2):
+            os.dup2(null_fd, standard_fd)
+        os.closerange(3, 1024)
+
+        # Run Worker
+        DataPlaneWorker(socket_path, idle_timeout=idle_timeout, cache_ttl=cache_ttl).run()
+
+    finally:
+
+        # Never Return to the Module Code
+        os._exit(0)
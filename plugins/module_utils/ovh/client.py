@@ -1,6 +1,11 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from ..commons import shared_client
+from ..commons_instrumentation import instrument_session
+from .client_zone import ZoneClient
+from .zone_cache import ZoneCache, account_digest
+
 try:
     import ovh
     from ovh.exceptions import APIError     # type: ignore
@@ -9,14 +14,28 @@ except ImportError:
     HAS_OVH = False
 
 
-# Build and Return OVH Client from Module Informations
-def ovh_client(module):
+# Build an OVH Client Recording its API Calls (python-ovh Requests Session)
+def build_recorded_ovh_client(**credentials):
+
+    # Build OVH Client
+    client = ovh.Client(**credentials)
+
+    # Record API Calls of the Client Session
+    if getattr(client, '_session', None) is not None:
+        instrument_session(client._session)
+
+    # Return Client
+    return client
+
+
+# Build and Return OVH Client from Dictionnary Vars
+def build_ovh_client(params: dict):
 
     # If OVH Lib is not loaded
     if not HAS_OVH:
 
-        # Fail Message
-        module.fail_json(msg='Python module python-ovh is required')
+        # Error Message
+        raise ValueError('Python module python-ovh is required')
 
     # Required Module Keys
     credential_keys = [
@@ -27,21 +46,36 @@ def ovh_client(module):
     ]
 
     # Match Required Keys with Mocule Parameters
-    # Find each credential_keys entry in module.params (Build Boolean array)
-    credential_parameters = [cred_key in module.params for cred_key in credential_keys]
+    # Find each credential_keys entry in params (Build Boolean array)
+    credential_parameters = [cred_key in params for cred_key in credential_keys]
 
-    try:
+    # If All Credentials keyx are present in Parameters
+    if all(credential_parameters):
 
-        # If All Credentials keyx are present in Module Parameters
-        if all(credential_parameters):
+        # Build OVH Client from Parameters (Shared in the Process)
+        credentials = {credential: params[credential] for credential in credential_keys}
+        return shared_client(
+            ('ovh',) + tuple(credentials[credential] for credential in credential_keys),
+            lambda: build_recorded_ovh_client(**credentials)
+        )
 
-            # Build OVH Client from Module Parameters
-            client = ovh.Client(**{credential: module.params[credential] for credential in credential_keys})
+    # Build Default OVH Client (Shared in the Process)
+    return shared_client(('ovh',), build_recorded_ovh_client)
 
-        else:
 
-            # Build Default OVH Client
-            client = ovh.Client()
+# Build and Return OVH Client from Module Informations
+def ovh_client(module):
+
+    # If OVH Lib is not loaded
+    if not HAS_OVH:
+
+        # Fail Message
+        module.fail_json(msg='Python module python-ovh is required')
+
+    try:
+
+        # Build OVH Client from Module Parameters
+        client = build_ovh_client(module.params)
 
     except APIError as api_error:
 
@@ -50,3 +84,34 @@ def ovh_client(module):
 
     # Return Client
     return client
+
+
+# Build and Return OVH Zone Client (Cached when 'cache' is Enabled) from Dictionnary Vars
+def build_ovh_zone_client(params: dict, client=None) -> ZoneClient:
+
+    # Build Cache if Enabled
+    cache = ZoneCache(
+        account=account_digest(params),
+        cache_path=params.get('cache_path', None),
+        ttl=params.get('cache_ttl', None) or 300
+    ) if params.get('cache', False) else None
+
+    # Build and Return Zone Client
+    return ZoneClient(client if client is not None else build_ovh_client(params), cache=cache)
+
+
+# Build and Return OVH Zone Client from Module Informations
+def ovh_zone_client(module) -> ZoneClient:
+
+    # Build OVH Client from Module
+    client = ovh_client(module)
+
+    try:
+
+        # Build Zone Client
+        return build_ovh_zone_client(module.params, client=client)
+
+    except ValueError as cache_error:
+
+        # Error Message for Mocule
+        module.fail_json(msg="Failed to build OVH Zone Cache: {0}".format(cache_error))
@@ -0,0 +1,582 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ..commons import run_concurrently
+from ...module_utils.ovh.models import DnsRecord
+from ...module_utils.ovh.zone_cache import ZoneCache
+from ...module_utils.ovh.zone_file import ZoneFile, parse_zone_file, render_zone_file, QUOTED_RECORD_TYPES
+from dataclasses import asdict, dataclass, field, replace
+from typing import Dict, List, Tuple
+
+
+# Zone Synchronization Plan
+@dataclass
+class ZonePlan:
+    """
+    Represents the Differences between the Current and the Desired Records of a Zone.
+
+    Attributes:
+        current (ZoneFile): The Current Zone (Exported).
+        desired (ZoneFile): The Desired Zone (Current SOA and Apex NS are Kept unless NS are Desired).
+        to_create (List[DnsRecord]): The Records to Create.
+        to_update (List[DnsRecord]): The Records whose TTL Changes.
+        to_delete (List[DnsRecord]): The Records to Delete.
+    """
+    current: ZoneFile
+    desired: ZoneFile
+    to_create: List[DnsRecord] = field(default_factory=list)
+    to_update: List[DnsRecord] = field(default_factory=list)
+    to_delete: List[DnsRecord] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the Number of Record Changes.
+        """
+        return len(self.to_create) + len(self.to_update) + len(self.to_delete)
+
+
+# Build the Identity of a Record Value (Lower Case Name, Type, Unquoted Value)
+def record_identity(record: DnsRecord) -> tuple:
+
+    # Return Identity
+    return (
+        record.sub_domain.lower(),
+        record.field_type,
+        record.target.strip('"') if record.field_type in QUOTED_RECORD_TYPES else record.target
+    )
+
+
+class ZoneClient:
+    """
+    Client for interacting with the OVH DNS Zone API.
+
+    Attributes:
+        client (ovh.Client): The OVH API Client (Signed Requests).
+        cache (ZoneCache): The Zone List and Zone Records Cache (None to Disable).
+    """
+
+    # Zones URI
+    ZONES_URI = "/domain/zone"
+
+    # Zone Records URI
+    RECORDS_URI = "/domain/zone/{zone}/record"
+
+    # Zone Record URI
+    RECORD_URI = "/domain/zone/{zone}/record/{record_id}"
+
+    # Zone Refresh URI
+    REFRESH_URI = "/domain/zone/{zone}/refresh"
+
+    # Zone Export URI
+    EXPORT_URI = "/domain/zone/{zone}/export"
+
+    # Zone Import URI
+    IMPORT_URI = "/domain/zone/{zone}/import"
+
+    def __init__(self, client, cache: ZoneCache = None):
+        """
+        Initializes the ZoneClient with the given OVH API Client.
+
+        Args:
+            client (ovh.Client): The OVH API Client.
+            cache (ZoneCache): The Zone List and Zone Records Cache (None to Disable).
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Client is not Provided
+        if client is None:
+
+            # Raise Value Exception
+            raise ValueError("[ZoneClient] - Initialization failed : 'client' is required")
+
+        # Initialize Client
+        self.client = client
+
+        # Initialize Cache
+        self.cache = cache
+
+    def cached(self, key: str, loader):
+        """
+        Return the Cached Value of a Key, or Load and Cache it.
+
+        Args:
+            key (str): The Cache Key.
+            loader (Callable): The Value Loader (Called on Cache Miss).
+
+        Returns:
+            Any: The Value.
+        """
+
+        # If Cache is Disabled
+        if self.cache is None:
+
+            # Load Value
+            return loader()
+
+        # Find Cached Value
+        value = self.cache.get(key)
+
+        # If Value is not Cached
+        if value is None:
+
+            # Load and Cache Value
+            value = loader()
+            self.cache.put(key, value)
+
+        # Return Value
+        return value
+
+    def invalidate(self, zone: str):
+        """
+        Invalidate the Cached Entries of a Zone (Called after Writes).
+
+        Args:
+            zone (str): The Zone Name.
+        """
+
+        # If Cache is Enabled
+        if self.cache is not None:
+
+            # Drop Zone Entries
+            self.cache.invalidate_zone(zone)
+
+    def list_zones(self) -> List[str]:
+        """
+        Retrieves the Zones of the OVH Account.
+
+        Returns:
+            List[str]: The Zone Names.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+        return self.cached(ZoneCache.ZONES_KEY, lambda: self.client.get(self.ZONES_URI))
+
+    def list_record_ids(self, zone: str, field_type: str = None, sub_domain: str = None) -> List[int]:
+        """
+        Retrieves the Record IDs of a Zone, optionally filtered by Type and Name.
+
+        Args:
+            zone (str): The Zone Name.
+            field_type (str): The Record Type Filter.
+            sub_domain (str): The Record Name Filter.
+
+        Returns:
+            List[int]: The Record IDs.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+
+        # Build Filters (OVH Client drops None Filters)
+        filters = {
+            name: value
+            for name, value in dict(fieldType=field_type, subDomain=sub_domain).items()
+            if value is not None
+        }
+
+        # Return Record IDs
+        return self.cached(
+            ZoneCache.ZONE_KEY_TEMPLATE.format(zone=zone, name="ids:{0}:{1}".format(field_type or '', sub_domain or '')),
+            lambda: self.client.get(self.RECORDS_URI.format(zone=zone), **filters)
+        )
+
+    def get_record(self, zone: str, record_id: int) -> DnsRecord:
+        """
+        Retrieves the Detail of a Record.
+
+        Args:
+            zone (str): The Zone Name.
+            record_id (int): The Record ID.
+
+        Returns:
+            DnsRecord: The Record.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+        return DnsRecord.from_api_response(
+            self.client.get(self.RECORD_URI.format(zone=zone, record_id=record_id))
+        )
+
+    def get_records(self, zone: str, max_workers: int = 8) -> List[DnsRecord]:
+        """
+        Retrieves all Records of a Zone (IDs listed Once, Details fetched concurrently).
+
+        Args:
+            zone (str): The Zone Name.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            List[DnsRecord]: The Records.
+
+        Raises:
+            ovh.exceptions.APIError: If one of the API requests fails.
+        """
+
+        # Fetch Records (IDs Listed Once, Details Fetched Concurrently)
+        def load_records():
+            return [
+                asdict(record) for record in run_concurrently(
+                    lambda record_id: self.get_record(zone, record_id),
+                    self.list_record_ids(zone),
+                    max_workers=max_workers
+                )
+            ]
+
+        # Return Records
+        return [
+            DnsRecord(**record)
+            for record in self.cached(ZoneCache.ZONE_KEY_TEMPLATE.format(zone=zone, name="records"), load_records)
+        ]
+
+    def find_records(self, zone: str, field_type: str = None, sub_domain: str = None, max_workers: int = 8) -> List[DnsRecord]:
+        """
+        Retrieves the Records of a Zone matching a Type and a Name (Served from the Cached Zone Records when Available).
+
+        Args:
+            zone (str): The Zone Name.
+            field_type (str): The Record Type Filter.
+            sub_domain (str): The Record Name Filter.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            List[DnsRecord]: The Matching Records.
+
+        Raises:
+            ovh.exceptions.APIError: If one of the API requests fails.
+        """
+
+        # Find Cached Zone Records
+        records = self.cache.get(ZoneCache.ZONE_KEY_TEMPLATE.format(zone=zone, name="records")) if self.cache is not None else None
+
+        # If Zone Records are Cached
+        if records is not None:
+
+            # Return Matching Records
+            return [
+                DnsRecord(**record) for record in records
+                if (field_type is None or record['field_type'] == field_type.upper()) and
+                (sub_domain is None or record['sub_domain'].lower() == sub_domain.lower())
+            ]
+
+        # Fetch Matching Records Concurrently
+        return run_concurrently(
+            lambda record_id: self.get_record(zone, record_id),
+            self.list_record_ids(zone, field_type=field_type.upper() if field_type else None, sub_domain=sub_domain),
+            max_workers=max_workers
+        )
+
+    def get_records_index(self, zone: str, max_workers: int = 8) -> Dict[Tuple[str, str], List[DnsRecord]]:
+        """
+        Retrieves all Records of a Zone indexed by Record Key (Lower Case Name, Type).
+
+        Args:
+            zone (str): The Zone Name.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            Dict[Tuple[str, str], List[DnsRecord]]: The Records (ordered by ID) indexed by Key.
+
+        Raises:
+            ovh.exceptions.APIError: If one of the API requests fails.
+        """
+
+        # Initialize Index
+        index = {}
+
+        # Index Records
+        for record in sorted(self.get_records(zone, max_workers=max_workers), key=lambda record: record.id or 0):
+            index.setdefault(record.key, []).append(record)
+
+        # Return Index
+        return index
+
+    def create_record(self, zone: str, record: DnsRecord, invalidate: bool = True) -> DnsRecord:
+        """
+        Create a Record (The Zone must be Refreshed to Publish it).
+
+        Args:
+            zone (str): The Zone Name.
+            record (DnsRecord): The Record to Create.
+            invalidate (bool): Invalidate the Cached Zone Entries.
+
+        Returns:
+            DnsRecord: The Created Record.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+
+        # Create Record
+        created = DnsRecord.from_api_response(
+            self.client.post(self.RECORDS_URI.format(zone=zone), **record.to_payload())
+        )
+
+        # If Cache must be Invalidated
+        if invalidate:
+            self.invalidate(zone)
+
+        # Return Created Record
+        return created
+
+    def update_record(self, zone: str, record: DnsRecord, invalidate: bool = True):
+        """
+        Update a Record Value and TTL (The Zone must be Refreshed to Publish it).
+
+        Args:
+            zone (str): The Zone Name.
+            record (DnsRecord): The Record to Update (with its ID).
+            invalidate (bool): Invalidate the Cached Zone Entries.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+        self.client.put(
+            self.RECORD_URI.format(zone=zone, record_id=record.id),
+            subDomain=record.sub_domain,
+            target=record.target,
+            ttl=record.ttl
+        )
+
+        # If Cache must be Invalidated
+        if invalidate:
+            self.invalidate(zone)
+
+    def delete_record(self, zone: str, record_id: int, invalidate: bool = True):
+        """
+        Delete a Record (The Zone must be Refreshed to Publish it).
+
+        Args:
+            zone (str): The Zone Name.
+            record_id (int): The Record ID.
+            invalidate (bool): Invalidate the Cached Zone Entries.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+        self.client.delete(self.RECORD_URI.format(zone=zone, record_id=record_id))
+
+        # If Cache must be Invalidated
+        if invalidate:
+            self.invalidate(zone)
+
+    def refresh_zone(self, zone: str):
+        """
+        Refresh a Zone (Publish its Pending Changes).
+
+        Args:
+            zone (str): The Zone Name.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+        self.client.post(self.REFRESH_URI.format(zone=zone))
+
+    def apply_records(
+        self,
+        zone: str,
+        to_create: List[DnsRecord] = None,
+        to_update: List[DnsRecord] = None,
+        to_delete: List[DnsRecord] = None,
+        max_workers: int = 8
+    ) -> bool:
+        """
+        Apply many Record Operations with bounded concurrency, then Refresh the Zone Once.
+
+        Args:
+            zone (str): The Zone Name.
+            to_create (List[DnsRecord]): The Records to Create.
+            to_update (List[DnsRecord]): The Records to Update (with their ID).
+            to_delete (List[DnsRecord]): The Records to Delete (with their ID).
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            bool: True if the Zone has Changed (and has been Refreshed).
+
+        Raises:
+            ovh.exceptions.APIError: If one of the API requests fails.
+        """
+
+        # Build Operations
+        operations = (
+            [(self.create_record, dict(record=record)) for record in to_create or []] +
+            [(self.update_record, dict(record=record)) for record in to_update or []] +
+            [(self.delete_record, dict(record_id=record.id)) for record in to_delete or []]
+        )
+
+        # If Nothing Changes
+        if not operations:
+
+            # Zone is not Refreshed
+            return False
+
+        try:
+
+            # Apply Operations (Cache is Invalidated Once)
+            run_concurrently(
+                lambda operation: operation[0](zone=zone, invalidate=False, **operation[1]),
+                operations,
+                max_workers=max_workers
+            )
+
+        finally:
+
+            # Invalidate Cached Zone Entries (Even after Partial Writes)
+            self.invalidate(zone)
+
+        # Refresh Zone Once
+        self.refresh_zone(zone)
+
+        # Zone has Changed
+        return True
+
+    def export_zone(self, zone: str) -> ZoneFile:
+        """
+        Export and Parse the Zone File of a Zone (One Request for the whole Zone).
+
+        Args:
+            zone (str): The Zone Name.
+
+        Returns:
+            ZoneFile: The Parsed Zone.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+            ValueError: If the Zone File can't be Parsed.
+        """
+        return parse_zone_file(self.client.get(self.EXPORT_URI.format(zone=zone)), zone)
+
+    def import_zone(self, zone: str, zone_file: ZoneFile):
+        """
+        Replace all Records of a Zone with a Zone File (One Request for the whole Zone).
+
+        Args:
+            zone (str): The Zone Name.
+            zone_file (ZoneFile): The Zone to Import.
+
+        Raises:
+            ovh.exceptions.APIError: If the API request fails.
+        """
+
+        try:
+
+            # Import Zone File
+            self.client.post(self.IMPORT_URI.format(zone=zone), zoneFile=render_zone_file(zone_file))
+
+        finally:
+
+            # Invalidate Cached Zone Entries
+            self.invalidate(zone)
+
+    @staticmethod
+    def plan_zone(current: ZoneFile, desired_records: List[DnsRecord]) -> ZonePlan:
+        """
+        Compute the Differences between the Current Zone and the Desired Records.
+
+        The Desired Records are the whole Zone : Current Records which are not Desired are Deleted,
+        except the SOA and the Apex NS Records (Kept unless Apex NS Records are Desired).
+
+        Args:
+            current (ZoneFile): The Current Zone.
+            desired_records (List[DnsRecord]): The Desired Records.
+
+        Returns:
+            ZonePlan: The Plan.
+        """
+
+        # Build Desired Zone (Last Definition of a Value Wins)
+        desired_index = {record_identity(record): record for record in desired_records}
+
+        # If Apex NS Records are not Desired
+        if not any(key[0] == '' and key[1] == 'NS' for key in desired_index):
+
+            # Keep Current Apex NS Records
+            desired_index.update({
+                record_identity(record): record
+                for record in current.records if record.sub_domain == '' and record.field_type == 'NS'
+            })
+
+        # Index Current Records
+        current_index = {record_identity(record): record for record in current.records}
+
+        # Build Plan
+        return ZonePlan(
+            current=current,
+            desired=replace(current, records=list(desired_index.values())),
+            to_create=[record for key, record in desired_index.items() if key not in current_index],
+            to_update=[
+                record for key, record in desired_index.items()
+                if key in current_index and current_index[key].ttl != record.ttl
+            ],
+            to_delete=[record for key, record in current_index.items() if key not in desired_index]
+        )
+
+    def apply_zone_plan(self, zone: str, plan: ZonePlan, import_threshold: int = 20, max_workers: int = 8) -> str:
+        """
+        Apply a Zone Plan, with a single Import for large Plans, or Record Patches for small Plans.
+
+        Args:
+            zone (str): The Zone Name.
+            plan (ZonePlan): The Plan.
+            import_threshold (int): The Number of Changes from which the Zone is Imported.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            str: The Applied Strategy ('none', 'patch' or 'import').
+
+        Raises:
+            ovh.exceptions.APIError: If one of the API requests fails.
+        """
+
+        # If Nothing Changes
+        if plan.size == 0:
+
+            # Nothing Applied
+            return 'none'
+
+        # If Plan is Large
+        if plan.size >= import_threshold:
+
+            # Import Desired Zone
+            self.import_zone(zone, plan.desired)
+
+            # Zone Imported
+            return 'import'
+
+        # Find Current Records of Changed Keys (With their IDs)
+        changed_keys = list(dict.fromkeys(
+            (record.field_type, record.sub_domain) for record in plan.to_update + plan.to_delete
+        ))
+        identified = {
+            record_identity(record): record
+            for records in run_concurrently(
+                lambda key: self.find_records(zone, field_type=key[0], sub_domain=key[1]),
+                changed_keys,
+                max_workers=max_workers
+            )
+            for record in records
+        }
+
+        # If a Changed Record can't be Identified (Export and API Values differ)
+        if any(record_identity(record) not in identified for record in plan.to_update + plan.to_delete):
+
+            # Import Desired Zone
+            self.import_zone(zone, plan.desired)
+
+            # Zone Imported
+            return 'import'
+
+        # Apply Record Patches and Refresh Zone Once
+        self.apply_records(
+            zone,
+            to_create=plan.to_create,
+            to_update=[replace(record, id=identified[record_identity(record)].id) for record in plan.to_update],
+            to_delete=[identified[record_identity(record)] for record in plan.to_delete],
+            max_workers=max_workers
+        )
+
+        # Zone Patched
+        return 'patch'
@@ -0,0 +1,382 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ipaddress
+import random
+import time
+from typing import Dict, List
+from ..commons import run_concurrently
+
+try:
+    import dns.exception
+    import dns.flags
+    import dns.message
+    import dns.query
+    import dns.rcode
+    import dns.rdatatype
+    import dns.resolver
+    HAS_DNSPYTHON = True
+except ImportError:
+    HAS_DNSPYTHON = False
+
+
+class DnsQueryError(Exception):
+    """
+    Raised when a DNS Query fails (Network Error, Malformed or Failed Response).
+    """
+
+
+# Read and Return the System Resolvers (resolv.conf)
+def system_resolvers() -> List[str]:
+
+    try:
+
+        # Read Configuration
+        return list(dns.resolver.Resolver(configure=True).nameservers)
+
+    except dns.exception.DNSException:
+
+        # No Resolver
+        return []
+
+
+# Check if a Value is an IP Address
+def is_ip_address(value: str) -> bool:
+
+    try:
+
+        # Parse Address
+        ipaddress.ip_address(value)
+        return True
+
+    except ValueError:
+
+        # Not an Address
+        return False
+
+
+# Decode a Record Data to Text (Addresses, Names and Joined TXT Character Strings)
+def rdata_text(rdata) -> str:
+
+    # If Record is a Text (Character Strings are Joined)
+    if rdata.rdtype == dns.rdatatype.TXT:
+        return b"".join(rdata.strings).decode('utf-8', 'replace')
+
+    # If Record is a Name
+    if rdata.rdtype in (dns.rdatatype.NS, dns.rdatatype.CNAME):
+        return rdata.target.to_text(omit_final_dot=True)
+
+    # Return Text (eg. Address)
+    return rdata.to_text()
+
+
+class PropagationWaiter:
+    """
+    Waits until Records are Visible on all the Authoritative Nameservers of a Zone (dnspython Queries).
+
+    Attributes:
+        resolvers (List[str]): The Recursive Resolvers used to Find the Nameservers (Default from resolv.conf).
+        port (int): The DNS Port of the Resolvers and Nameservers.
+        query_timeout (float): The Timeout of each Query (Seconds).
+    """
+
+    def __init__(self, resolvers: List[str] = None, port: int = 53, query_timeout: float = 2):
+        """
+        Initializes the Waiter.
+
+        Args:
+            resolvers (List[str]): The Recursive Resolvers (Default from resolv.conf)
+            port (int): The DNS Port
+            query_timeout (float): The Timeout of each Query (Seconds)
+        Raises:
+            ValueError: If dnspython is Missing, or no Resolver is Available.
+        """
+
+        # If dnspython is Missing
+        if not HAS_DNSPYTHON:
+
+            # Raise Value Exception
+            raise ValueError("Python module dnspython is required")
+
+        # Initialize Resolvers
+        self.resolvers = resolvers or system_resolvers()
+
+        # If no Resolver is Available
+        if not self.resolvers:
+
+            # Raise Value Exception
+            raise ValueError("[PropagationWaiter] - Initialization failed : No DNS Resolver Available")
+
+        # Initialize Port and Timeout
+        self.port = port
+        self.query_timeout = query_timeout
+
+        # Build Recursive Resolver (Resolvers Tried in Order, each with the Query Timeout)
+        self.resolver = dns.resolver.Resolver(configure=False)
+        self.resolver.nameservers = list(self.resolvers)
+        self.resolver.port = port
+        self.resolver.timeout = query_timeout
+        self.resolver.lifetime = query_timeout * len(self.resolvers)
+
+    def resolve(self, name: str, field_type: str) -> List[str]:
+        """
+        Resolve a Name with the first Resolver Answering.
+
+        Args:
+            name (str): The Name.
+            field_type (str): The Record Type.
+
+        Returns:
+            List[str]: The Values of the Records of this Type (Empty if the Name is Unknown).
+
+        Raises:
+            DnsQueryError: If no Resolver Answers.
+        """
+
+        try:
+
+            # Query Resolvers
+            answer = self.resolver.resolve(name, field_type, raise_on_no_answer=False)
+
+        except dns.resolver.NXDOMAIN:
+
+            # Unknown Name
+            return []
+
+        except dns.exception.DNSException as query_error:
+
+            # Raise Query Exception
+            raise DnsQueryError("[DnsResolver] - {0} {1} : {2}".format(field_type, name, query_error))
+
+        # Return Values
+        return [rdata_text(rdata) for rdata in answer.rrset or []]
+
+    def resolve_address(self, host: str) -> str:
+        """
+        Resolve a Nameserver Host to an Address (Addresses are Returned as-is).
+
+        Args:
+            host (str): The Host Name or Address.
+
+        Returns:
+            str: The Address.
+
+        Raises:
+            DnsQueryError: If the Host has no Address.
+        """
+
+        # If Host is an Address
+        if is_ip_address(host):
+
+            # Return Address
+            return host
+
+        # Resolve IPv4 then IPv6 Addresses
+        addresses = self.resolve(host, 'A') or self.resolve(host, 'AAAA')
+
+        # If Host has no Address
+        if not addresses:
+
+            # Raise Query Exception
+            raise DnsQueryError("[DnsResolver] - Nameserver {0} has no Address".format(host))
+
+        # Return First Address
+        return addresses[0]
+
+    def find_nameservers(self, zone: str, max_workers: int = 8) -> Dict[str, str]:
+        """
+        Find the Authoritative Nameservers of a Zone (NS Set), with their Addresses.
+
+        Args:
+            zone (str): The Zone Name.
+            max_workers (int): The Maximum Number of Concurrent Queries.
+
+        Returns:
+            Dict[str, str]: The Nameserver Addresses by Host.
+
+        Raises:
+            DnsQueryError: If the NS Set or a Nameserver Address can't be Resolved.
+        """
+
+        # Resolve NS Set
+        hosts = sorted(set(host.lower() for host in self.resolve(zone, 'NS')))
+
+        # If Zone has no Nameserver
+        if not hosts:
+
+            # Raise Query Exception
+            raise DnsQueryError("[DnsResolver] - Zone {0} has no NS Record".format(zone))
+
+        # Resolve Nameserver Addresses Concurrently
+        return self.resolve_addresses(hosts, max_workers=max_workers)
+
+    def resolve_addresses(self, hosts: List[str], max_workers: int = 8) -> Dict[str, str]:
+        """
+        Resolve Nameserver Hosts to Addresses Concurrently.
+
+        Args:
+            hosts (List[str]): The Host Names or Addresses.
+            max_workers (int): The Maximum Number of Concurrent Queries.
+
+        Returns:
+            Dict[str, str]: The Addresses by Host.
+
+        Raises:
+            DnsQueryError: If a Host has no Address.
+        """
+        return dict(zip(hosts, run_concurrently(self.resolve_address, hosts, max_workers=max_workers)))
+
+    def visible_values(self, address: str, name: str) -> List[str]:
+        """
+        Read the TXT Values of a Name on an Authoritative Nameserver (Without Recursion, TCP on Truncation).
+
+        Args:
+            address (str): The Nameserver Address.
+            name (str): The Record Name.
+
+        Returns:
+            List[str]: The TXT Values, or None if the Nameserver does not Answer.
+        """
+
+        # Build Query (Recursion not Desired)
+        query = dns.message.make_query(name, 'TXT')
+        query.flags &= ~dns.flags.RD
+
+        try:
+
+            # Query Nameserver (Response, Used TCP)
+            response = dns.query.udp_with_fallback(query, address, timeout=self.query_timeout, port=self.port)[0]
+
+        except (dns.exception.DNSException, OSError):
+
+            # Nameserver did not Answer
+            return None
+
+        # If Nameserver Failed (Unknown Names are Answered without Value)
+        if response.rcode() not in (dns.rcode.NOERROR, dns.rcode.NXDOMAIN):
+
+            # Nameserver did not Answer
+            return None
+
+        # Return Values
+        return [rdata_text(rdata) for rrset in response.answer if rrset.rdtype == dns.rdatatype.TXT for rdata in rrset]
+
+    def wait_txt(
+        self,
+        name: str,
+        values: List[str],
+        nameservers: Dict[str, str],
+        timeout: float = 300,
+        initial_delay: float = 1,
+        max_delay: float = 30,
+        backoff_factor: float = 2,
+        jitter: float = 0.5,
+        max_workers: int = 8
+    ) -> dict:
+        """
+        Wait until TXT Values are Visible on all the Nameservers, polling them Concurrently
+        with exponential backoff and jitter, until a total deadline.
+
+        Only the Nameservers not Serving all the Values Yet are Polled again.
+
+        Args:
+            name (str): The Record Name (eg. '_acme-challenge.www.kube-cloud.com').
+            values (List[str]): The Expected TXT Values.
+            nameservers (Dict[str, str]): The Nameserver Addresses by Host.
+            timeout (float): The Total Deadline (Seconds)
+            initial_delay (float): The First Delay between two Polls (Seconds)
+            max_delay (float): The Maximum Delay between two Polls (Seconds)
+            backoff_factor (float): The Delay Multiplier applied after each Poll
+            jitter (float): The Random Fraction (0 to 1) removed from each Delay
+            max_workers (int): The Maximum Number of Concurrent Queries.
+
+        Returns:
+            dict: Propagation Details (attempts, elapsed_ms, nameservers with address and visible_after_ms).
+
+        Raises:
+            TimeoutError: If the Values are not Visible on all the Nameservers before the Deadline.
+        """
+
+        # Initialize Clock
+        started = time.monotonic()
+        deadline = started + timeout
+
+        # Initialize State
+        delay = initial_delay
+        attempts = 0
+        expected = set(values)
+        pending = dict(nameservers)
+        visible_after = {}
+        last_values = {}
+
+        # Compute Elapsed Milliseconds
+        def elapsed_ms():
+            return int((time.monotonic() - started) * 1000)
+
+        # Poll until Deadline
+        while True:
+
+            # Count Attempt
+            attempts += 1
+
+            # Query Pending Nameservers Concurrently
+            hosts = list(pending)
+            answers = run_concurrently(
+                lambda host: self.visible_values(pending[host], name),
+                hosts,
+                max_workers=max_workers
+            )
+
+            # Iterate over Answers
+            for host, answer in zip(hosts, answers):
+
+                # Keep Last Answer
+                last_values[host] = answer
+
+                # If all Values are Visible
+                if answer is not None and expected.issubset(answer):
+
+                    # Nameserver is Ready
+                    visible_after[host] = elapsed_ms()
+                    del pending[host]
+
+            # If all Nameservers are Ready
+            if not pending:
+
+                # Return Propagation Details
+                return dict(
+                    attempts=attempts,
+                    elapsed_ms=elapsed_ms(),
+                    nameservers={
+                        host: dict(address=address, visible_after_ms=visible_after[host])
+                        for host, address in nameservers.items()
+                    }
+                )
+
+            # Compute Remaining Time
+            remaining = deadline - time.monotonic()
+
+            # If Deadline is Reached
+            if remaining <= 0:
+
+                # Raise Exception
+                raise TimeoutError(
+                    "TXT {0} not Visible after {1} ms ({2} Attempts) on : {3}".format(
+                        name,
+                        elapsed_ms(),
+                        attempts,
+                        ", ".join(
+                            "{0} ({1})".format(
+                                host,
+                                'NO ANSWER' if last_values.get(host) is None else ", ".join(last_values[host]) or 'NO VALUE'
+                            )
+                            for host in sorted(pending)
+                        )
+                    )
+                )
+
+            # Sleep (Jittered Delay, Bounded by the Deadline)
+            time.sleep(min(remaining, delay * (1 - random.uniform(0, jitter))))
+
+            # Increase Delay
+            delay = min(max_delay, delay * backoff_factor)
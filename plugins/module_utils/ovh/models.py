@@ -0,0 +1,79 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from typing import Optional, Type
+from dataclasses import dataclass, field
+
+
+# DNS Zone Record
+@dataclass
+class DnsRecord:
+    """
+    Represents an OVH DNS Zone Record.
+    Refer at : `https://eu.api.ovh.com/console/#/domain/zone/%7BzoneName%7D/record`
+
+    Attributes:
+        sub_domain (str): The Record Name, Relative to the Zone ('' for the Zone Apex).
+        field_type (str): The Record Type (eg. A, CNAME, TXT).
+        target (str): The Record Value.
+        ttl (int): The Record TTL (0 for the Zone Default TTL).
+        id (int): The Record ID.
+        zone (str): The Record Zone.
+    """
+    sub_domain: str                                                # The Record Name (Relative to the Zone).
+    field_type: str                                                # The Record Type.
+    target: str                                                    # The Record Value.
+    ttl: int = 0                                                   # The Record TTL.
+    id: Optional[int] = field(default=None)                        # The Record ID.
+    zone: Optional[str] = field(default=None)                      # The Record Zone.
+
+    def __post_init__(self):
+
+        # Check sub_domain
+        if self.sub_domain is None:
+            raise ValueError("DnsRecord : The 'sub_domain' field is required.")
+
+        # Check field_type
+        if not self.field_type:
+            raise ValueError("DnsRecord : The 'field_type' field is required.")
+
+        # Normalize Record Type
+        self.field_type = self.field_type.upper()
+
+    def __str__(self):
+        """
+        Returns a dictionary representation of the object.
+        """
+        return str(self.__dict__)
+
+    @property
+    def key(self) -> tuple:
+        """
+        Returns the Record Key (Lower Case Name, Type), shared by all Values of a Record Set.
+        """
+        return (self.sub_domain.lower(), self.field_type)
+
+    def to_payload(self) -> dict:
+        """
+        Returns the OVH API Payload of the Record.
+        """
+        return dict(
+            fieldType=self.field_type,
+            subDomain=self.sub_domain,
+            target=self.target,
+            ttl=self.ttl
+        )
+
+    @classmethod
+    def from_api_response(cls: Type['DnsRecord'], response: dict) -> 'DnsRecord':
+        """
+        Build a Record from the OVH API Response.
+        """
+        return DnsRecord(
+            id=response.get('id', None),
+            zone=response.get('zone', None),
+            sub_domain=response.get('subDomain', None) or '',
+            field_type=response.get('fieldType', None),
+            target=response.get('target', None),
+            ttl=response.get('ttl', None) or 0
+        )
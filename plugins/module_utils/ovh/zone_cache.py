@@ -0,0 +1,158 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import os
+import tempfile
+import time
+
+from ..commons_store import LockedJsonStore
+
+
+# Build and Return the Default Cache Path (Temporary Directory of the Current User)
+def default_cache_path() -> str:
+
+    # Return Path
+    return os.path.join(
+        tempfile.gettempdir(),
+        "ansible-kube-cloud-ovh-{0}".format(os.getuid() if hasattr(os, 'getuid') else 'user'),
+        "zones.json"
+    )
+
+
+# Build and Return the Cache Account Key (Credentials are never Kept in Clear)
+def account_digest(params: dict) -> str:
+
+    # Return Digest
+    return hashlib.sha256(
+        "{0}:{1}:{2}".format(
+            params.get('endpoint', None),
+            params.get('application_key', None),
+            params.get('consumer_key', None)
+        ).encode()
+    ).hexdigest()[:16]
+
+
+class ZoneCache:
+    """
+    Cache of OVH Zone Lists and Zone Records, shared between Tasks and Processes.
+
+    Entries are kept per OVH Account in a JSON file (see LockedJsonStore) and expire after a TTL.
+    Writes to a Zone must invalidate the Zone Entries.
+
+    Attributes:
+        account (str): The OVH Account Key (see account_digest).
+        cache_path (str): The On-Disk Store Path.
+        store (LockedJsonStore): The On-Disk Store.
+        ttl (int): The Entries Time To Live (Seconds).
+    """
+
+    # Zone List Entry Key
+    ZONES_KEY = "zones"
+
+    # Zone Entry Key Format
+    ZONE_KEY_TEMPLATE = "zone:{zone}:{name}"
+
+    def __init__(self, account: str, cache_path: str = None, ttl: int = 300):
+        """
+        Initializes the Zone Cache.
+
+        Args:
+            account (str): The OVH Account Key (see account_digest)
+            cache_path (str): The On-Disk Store Path (Default under the Temporary Directory)
+            ttl (int): The Entries Time To Live (Seconds)
+        Raises:
+            ValueError: If File Locking is not Available, or the Store Directory is not Private.
+        """
+
+        # Initialize Account
+        self.account = account
+
+        # Initialize Store
+        self.cache_path = os.path.expanduser(cache_path) if cache_path else default_cache_path()
+        self.store = LockedJsonStore(self.cache_path)
+
+        # Initialize TTL
+        self.ttl = ttl
+
+    def zone_key(self, zone: str, name: str) -> str:
+        """
+        Build the Key of a Zone Entry.
+
+        Args:
+            zone (str): The Zone Name
+            name (str): The Entry Name (eg. 'index', 'ids:TXT:_acme-challenge')
+
+        Returns:
+            str: The Key.
+        """
+        return self.ZONE_KEY_TEMPLATE.format(zone=zone, name=name)
+
+    def is_valid(self, entry: dict) -> bool:
+        """
+        Check if an Entry is not Expired.
+
+        Args:
+            entry (dict): The Entry (stored_at, value)
+
+        Returns:
+            bool: True if the Entry can be reused.
+        """
+        return isinstance(entry, dict) and entry.get('stored_at', 0) + self.ttl > time.time()
+
+    def get(self, key: str):
+        """
+        Retrieves a valid Entry Value.
+
+        Args:
+            key (str): The Entry Key
+
+        Returns:
+            Any: The Value, or None if Missing or Expired.
+        """
+
+        # Read Entry
+        entry = self.store.load().get(self.account, {}).get(key, None)
+
+        # Return Value if Valid
+        return entry['value'] if self.is_valid(entry) else None
+
+    def put(self, key: str, value):
+        """
+        Store an Entry Value.
+
+        Args:
+            key (str): The Entry Key
+            value (Any): The Value (JSON Serializable)
+        """
+
+        # Drop Expired Account Entries and Add Entry
+        def add_entry(store: dict) -> dict:
+            entries = {k: v for k, v in store.get(self.account, {}).items() if self.is_valid(v)}
+            entries[key] = dict(stored_at=time.time(), value=value)
+            store[self.account] = entries
+            return store
+
+        # Update Store
+        self.store.update(add_entry)
+
+    def invalidate_zone(self, zone: str):
+        """
+        Drop all Entries of a Zone (Called after Writes to the Zone).
+
+        Args:
+            zone (str): The Zone Name
+        """
+
+        # Zone Entries Prefix
+        prefix = self.zone_key(zone, '')
+
+        # Drop Zone Entries (Store Kept if Account has no Entry)
+        def drop_entries(store: dict) -> dict:
+            if self.account not in store:
+                return None
+            store[self.account] = {k: v for k, v in store[self.account].items() if not k.startswith(prefix)}
+            return store
+
+        # Update Store
+        self.store.update(drop_entries)
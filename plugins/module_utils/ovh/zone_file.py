@@ -0,0 +1,245 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+from dataclasses import dataclass, field
+from typing import List
+from .models import DnsRecord
+
+
+# Zone File Token (Quoted String or Word)
+TOKEN_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|[^\s"]+')
+
+# DNS Classes
+DNS_CLASSES = ['IN', 'CH', 'HS', 'CS']
+
+# Record Types with Quoted Values
+QUOTED_RECORD_TYPES = ['TXT', 'SPF', 'DKIM', 'DMARC']
+
+# Record Types Kept from the Current Zone (Managed by OVH)
+PRESERVED_RECORD_TYPES = ['SOA']
+
+
+# Parsed Zone File
+@dataclass
+class ZoneFile:
+    """
+    Represents a Parsed Zone File.
+
+    Attributes:
+        zone (str): The Zone Name.
+        default_ttl (int): The Zone Default TTL ($TTL Directive).
+        records (List[DnsRecord]): The Zone Records (TTL 0 for the Default TTL), without SOA.
+        preserved (List[str]): The Raw Lines of the Records Managed by OVH (SOA).
+    """
+    zone: str
+    default_ttl: int = 3600
+    records: List[DnsRecord] = field(default_factory=list)
+    preserved: List[str] = field(default_factory=list)
+
+
+# Remove Comment of a Zone File Line (';' outside Quotes)
+def strip_comment(line: str) -> str:
+
+    # Initialize Quote State
+    quoted = False
+    escaped = False
+
+    # Find Comment Start
+    for index, character in enumerate(line):
+
+        # Track Quotes and Escapes
+        if escaped:
+            escaped = False
+        elif character == '\\':
+            escaped = True
+        elif character == '"':
+            quoted = not quoted
+        elif character == ';' and not quoted:
+            return line[:index]
+
+    # No Comment
+    return line
+
+
+# Join Zone File Lines Continued with Parentheses
+def logical_lines(content: str) -> List[str]:
+
+    # Initialize Lines
+    lines, pending, depth = [], None, 0
+
+    # Iterate over Physical Lines
+    for raw_line in content.splitlines():
+
+        # Remove Comment
+        line = strip_comment(raw_line).rstrip()
+
+        # If Line is Empty
+        if not line.strip():
+
+            # Next Line
+            continue
+
+        # Update Parentheses Depth (Outside Quotes)
+        unquoted = re.sub(r'"(?:[^"\\]|\\.)*"', '', line)
+        depth += unquoted.count('(') - unquoted.count(')')
+
+        # Join Continued Line
+        pending = line if pending is None else "{0} {1}".format(pending, line.strip())
+
+        # If Parentheses are Balanced
+        if depth <= 0:
+
+            # Keep Logical Line
+            lines.append(pending)
+            pending, depth = None, 0
+
+    # Keep Unbalanced Trailing Line
+    if pending is not None:
+        lines.append(pending)
+
+    # Return Lines
+    return lines
+
+
+# Convert an Owner Name to a Name Relative to the Zone
+def relative_name(owner: str, origin: str, zone: str) -> str:
+
+    # Build Absolute Name
+    if owner == '@':
+        absolute = origin
+    elif owner.endswith('.'):
+        absolute = owner[:-1]
+    else:
+        absolute = "{0}.{1}".format(owner, origin) if origin else owner
+
+    # Relativize to Zone
+    if absolute.lower() == zone.lower():
+        return ''
+    if absolute.lower().endswith('.' + zone.lower()):
+        return absolute[:-(len(zone) + 1)]
+
+    # Out of Zone Name (Kept Absolute)
+    return absolute + '.'
+
+
+# Parse a Zone File (eg. OVH Export)
+def parse_zone_file(content: str, zone: str) -> ZoneFile:
+    """
+    Parse a Zone File into Records, Relative to the Zone.
+
+    Args:
+        content (str): The Zone File Content.
+        zone (str): The Zone Name.
+
+    Returns:
+        ZoneFile: The Parsed Zone.
+
+    Raises:
+        ValueError: If a Record Line can't be Parsed.
+    """
+
+    # Initialize Zone
+    zone = zone.rstrip('.')
+    parsed = ZoneFile(zone=zone)
+    origin, owner = zone, '@'
+
+    # Iterate over Logical Lines
+    for line in logical_lines(content or ''):
+
+        # Tokenize Line (Parentheses are only Line Continuations)
+        tokens = TOKEN_PATTERN.findall(line.replace('(', ' ').replace(')', ' '))
+
+        # If Line is a $TTL Directive
+        if tokens[0].upper() == '$TTL':
+            parsed.default_ttl = int(tokens[1])
+            continue
+
+        # If Line is a $ORIGIN Directive
+        if tokens[0].upper() == '$ORIGIN':
+            origin = tokens[1].rstrip('.')
+            continue
+
+        # If Line Defines an Owner (Not Indented)
+        if not line[0].isspace():
+            owner = tokens.pop(0)
+
+        # Read Optional TTL and Class (Any Order)
+        ttl = 0
+        while tokens and (tokens[0].isdigit() or tokens[0].upper() in DNS_CLASSES):
+            token = tokens.pop(0)
+            if token.isdigit():
+                ttl = int(token)
+
+        # If Type is Missing
+        if len(tokens) < 2:
+
+            # Raise Value Exception
+            raise ValueError("[ZoneFile] - Invalid Record Line : {0}".format(line.strip()))
+
+        # Extract Type and Value
+        field_type = tokens[0].upper()
+        target = " ".join(tokens[1:])
+
+        # If Record is Managed by OVH
+        if field_type in PRESERVED_RECORD_TYPES:
+
+            # Keep Raw Line
+            parsed.preserved.append(" ".join(TOKEN_PATTERN.findall(line)))
+            continue
+
+        # Add Record
+        parsed.records.append(DnsRecord(
+            sub_domain=relative_name(owner, origin, zone),
+            field_type=field_type,
+            target=target,
+            ttl=ttl,
+            zone=zone
+        ))
+
+    # Return Parsed Zone
+    return parsed
+
+
+# Quote Record Value if its Type requires Quotes
+def quote_target(field_type: str, target: str) -> str:
+
+    # If Value must be Quoted and is not Quoted
+    if field_type in QUOTED_RECORD_TYPES and not target.startswith('"'):
+
+        # Return Quoted Value
+        return '"{0}"'.format(target.replace('"', '\\"'))
+
+    # Return Value
+    return target
+
+
+# Render a Zone File
+def render_zone_file(zone_file: ZoneFile) -> str:
+    """
+    Render a Zone File (Preserved Lines First, then Records).
+
+    Args:
+        zone_file (ZoneFile): The Zone.
+
+    Returns:
+        str: The Zone File Content.
+    """
+
+    # Initialize Lines
+    lines = ["$TTL {0}".format(zone_file.default_ttl)]
+
+    # Add Preserved Lines
+    lines.extend(zone_file.preserved)
+
+    # Add Records (Stable Order)
+    for record in sorted(zone_file.records, key=lambda item: (item.sub_domain.lower(), item.field_type, item.target)):
+        lines.append("{owner}\t{ttl}IN {field_type}\t{target}".format(
+            owner=record.sub_domain or '@',
+            ttl="{0}\t".format(record.ttl) if record.ttl else '',
+            field_type=record.field_type,
+            target=quote_target(record.field_type, record.target)
+        ))
+
+    # Return Content
+    return "\n".join(lines) + "\n"
@@ -1,18 +1,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .client_settings import SettingsClient
-from .client_user import UserClient
-from .client_group import GroupClient
-from .client_group_global_permissions import GroupGlobalPermissionClient
-from .client_group_membership import GroupMembershipClient
-from .client_alm_settings_github import AlmSettingsGithubClient
-from .client_alm_settings_gitlab import AlmSettingsGitlabClient
-from .client_alm_settings_azure import AlmSettingsAzureClient
-from .client_alm_settings_bitbucket import AlmSettingsBitbucketClient
-from .client_alm_settings_bitbucket_cloud import AlmSettingsBitbucketCloudClient
-from .client_alm_access_token import AlmAccessTokenClient
-from .client_projects import ProjectClient
+from importlib import import_module
+from ..commons import lazy_attribute
 
 try:
     from requests.auth import HTTPBasicAuth     # type: ignore
@@ -21,6 +11,38 @@ except ImportError:
     IMPORTS_OK = False
 
 
+# Sub-Client Classes Importable from this Module (Module Imported on First Access)
+SUB_CLIENT_MODULES = {
+    'SettingsClient': '.client_settings',
+    'UserClient': '.client_user',
+    'GroupClient': '.client_group',
+    'GroupGlobalPermissionClient': '.client_group_global_permissions',
+    'GroupMembershipClient': '.client_group_membership',
+    'AlmSettingsClient': '.client_alm_settings',
+    'AlmSettingsGithubClient': '.client_alm_settings',
+    'AlmSettingsGitlabClient': '.client_alm_settings',
+    'AlmSettingsAzureClient': '.client_alm_settings',
+    'AlmSettingsBitbucketClient': '.client_alm_settings',
+    'AlmSettingsBitbucketCloudClient': '.client_alm_settings',
+    'AlmAccessTokenClient': '.client_alm_access_token',
+    'ProjectClient': '.client_projects',
+    'SystemClient': '.client_system'
+}
+
+
+# Import and Return a Sub-Client Class on First Access (eg. 'from .client import GroupClient')
+def __getattr__(name: str):
+
+    # If Name is not a Sub-Client Class
+    if name not in SUB_CLIENT_MODULES:
+
+        # Raise Attribute Exception
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+    # Import and Return Sub-Client Class
+    return getattr(import_module(SUB_CLIENT_MODULES[name], __package__), name)
+
+
 class Client:
     """
     Client for interacting with the SonarQube API.
@@ -66,75 +88,180 @@ class Client:
         # Initialize Basic Authentication
         self.auth = HTTPBasicAuth(username, password)
 
-        # Initialize Settings Client
-        self.settings = SettingsClient(
-            base_url=base_url,
+    @lazy_attribute
+    def settings(self):
+        """
+        Settings Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Settings Client
+        from .client_settings import SettingsClient
+        return SettingsClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize User Client
-        self.user = UserClient(
-            base_url=base_url,
+    @lazy_attribute
+    def user(self):
+        """
+        User Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build User Client
+        from .client_user import UserClient
+        return UserClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize Group Client
-        self.group = GroupClient(
-            base_url=base_url,
+    @lazy_attribute
+    def group(self):
+        """
+        Group Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Group Client
+        from .client_group import GroupClient
+        return GroupClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize Group Membership Client
-        self.membership = GroupMembershipClient(
-            base_url=base_url,
+    @lazy_attribute
+    def membership(self):
+        """
+        Group Membership Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Group Membership Client
+        from .client_group_membership import GroupMembershipClient
+        return GroupMembershipClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize Group Membership Client
-        self.group_global_permission = GroupGlobalPermissionClient(
-            base_url=base_url,
+    @lazy_attribute
+    def group_global_permission(self):
+        """
+        Group Global Permission Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Group Global Permission Client
+        from .client_group_global_permissions import GroupGlobalPermissionClient
+        return GroupGlobalPermissionClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize ALM Settings Github Client
-        self.alm_settings_github = AlmSettingsGithubClient(
-            base_url=base_url,
+    @lazy_attribute
+    def alm_settings(self):
+        """
+        ALM Settings Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Settings Client
+        from .client_alm_settings import AlmSettingsClient
+        return AlmSettingsClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize ALM Settings Gitlab Client
-        self.alm_settings_gitlab = AlmSettingsGitlabClient(
-            base_url=base_url,
-            auth=self.auth
+    @lazy_attribute
+    def alm_settings_github(self):
+        """
+        ALM Settings Github Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Settings Github Client (Shares the ALM Settings Client)
+        from .client_alm_settings import AlmSettingsGithubClient
+        return AlmSettingsGithubClient(
+            engine=self.alm_settings
         )
 
-        # Initialize ALM Settings Azure Client
-        self.alm_settings_azure = AlmSettingsAzureClient(
-            base_url=base_url,
-            auth=self.auth
+    @lazy_attribute
+    def alm_settings_gitlab(self):
+        """
+        ALM Settings Gitlab Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Settings Gitlab Client (Shares the ALM Settings Client)
+        from .client_alm_settings import AlmSettingsGitlabClient
+        return AlmSettingsGitlabClient(
+            engine=self.alm_settings
         )
 
-        # Initialize ALM Settings Bitbucket Client
-        self.alm_settings_bitbucket = AlmSettingsBitbucketClient(
-            base_url=base_url,
-            auth=self.auth
+    @lazy_attribute
+    def alm_settings_azure(self):
+        """
+        ALM Settings Azure Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Settings Azure Client (Shares the ALM Settings Client)
+        from .client_alm_settings import AlmSettingsAzureClient
+        return AlmSettingsAzureClient(
+            engine=self.alm_settings
+        )
+
+    @lazy_attribute
+    def alm_settings_bitbucket(self):
+        """
+        ALM Settings Bitbucket Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Settings Bitbucket Client (Shares the ALM Settings Client)
+        from .client_alm_settings import AlmSettingsBitbucketClient
+        return AlmSettingsBitbucketClient(
+            engine=self.alm_settings
         )
 
-        # Initialize ALM Settings Bitbucket Cloud Client
-        self.alm_settings_bitbucket_cloud = AlmSettingsBitbucketCloudClient(
-            base_url=base_url,
+    @lazy_attribute
+    def alm_settings_bitbucket_cloud(self):
+        """
+        ALM Settings Bitbucket Cloud Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Settings Bitbucket Cloud Client (Shares the ALM Settings Client)
+        from .client_alm_settings import AlmSettingsBitbucketCloudClient
+        return AlmSettingsBitbucketCloudClient(
+            engine=self.alm_settings
+        )
+
+    @lazy_attribute
+    def alm_access_token(self):
+        """
+        ALM Access Token Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build ALM Access Token Client
+        from .client_alm_access_token import AlmAccessTokenClient
+        return AlmAccessTokenClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize Access Token ALM Client
-        self.alm_access_token = AlmAccessTokenClient(
-            base_url=base_url,
+    @lazy_attribute
+    def project(self):
+        """
+        Project Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build Project Client
+        from .client_projects import ProjectClient
+        return ProjectClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
-        # Initialize Project Client
-        self.project = ProjectClient(
-            base_url=base_url,
+    @lazy_attribute
+    def system(self):
+        """
+        System Client (Module Imported and Client Built on First Access).
+        """
+
+        # Import and Build System Client
+        from .client_system import SystemClient
+        return SystemClient(
+            base_url=self.base_url,
             auth=self.auth
         )
 
@@ -2,12 +2,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ..commons import is_2xx
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .session import sonarqube_session
 
 
 class AlmAccessTokenClient:
@@ -57,6 +52,9 @@ class AlmAccessTokenClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
     def set_access_token(self, alm_name: str = None, access_token: str = '', token_username: str = None) -> dict:
         """
         Update ALM Access Token on SonarQube API.
@@ -107,7 +105,7 @@ class AlmAccessTokenClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth
         )
@@ -0,0 +1,600 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ..commons import is_2xx, run_concurrently
+from typing import Any, Dict, List, Optional
+from .enums import DevOpsPlatform
+from .models import AlmSettingsGithub
+from .models import AlmSettingsGitlab
+from .models import AlmSettingsAzure
+from .models import AlmSettingsBitbucket
+from .models import AlmSettingsBitbucketCloud
+from .session import sonarqube_session
+
+try:
+    from requests.exceptions import HTTPError
+    from urllib.parse import quote
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+class AlmSettingsClient:
+    """
+    Client for interacting with the Sonarqube API for all ALM Settings Types.
+
+    The ALM Definitions of all Types are listed once and kept in an Index, and every
+    Create/Update/Delete Operation is dispatched by Type from the Settings Schemas.
+
+    Attributes:
+        base_url (str): The base URL of the Sonarqube API.
+        auth (HTTPBasicAuth): The HTTP basic authentication credentials.
+        definitions (dict): The ALM Settings Index (Key -> Setting), Loaded on first use.
+    """
+
+    # Définir la constante pour application/json
+    CONTENT_TYPE_JSON = "application/json"
+
+    # Get Settings List URI
+    GET_ALL_SETTINGS_URI = "api/alm_settings/list_definitions"
+
+    # Create Setting URI
+    CREATE_SETTING_URI = "api/alm_settings/create_{platform}?{parameters}"
+
+    # Update Setting URI
+    UPDATE_SETTING_URI = "api/alm_settings/update_{platform}?{parameters}"
+
+    # Delete Setting URI
+    DELETE_SETTING_URI = "api/alm_settings/delete?key={key}"
+
+    # URL Format
+    URL_TEMPLATE = "{base_url}/{uri}"
+
+    # Settings Schemas (Platform -> Model and API Parameters [API Name, Model Field])
+    SETTINGS_SCHEMAS = {
+        DevOpsPlatform.GITHUB: dict(
+            model=AlmSettingsGithub,
+            parameters=[
+                ("key", "key"), ("url", "url"), ("appId", "app_id"),
+                ("clientId", "client_id"), ("clientSecret", "client_secret"),
+                ("privateKey", "private_key"), ("webhookSecret", "webhook_secret")
+            ]
+        ),
+        DevOpsPlatform.GITLAB: dict(
+            model=AlmSettingsGitlab,
+            parameters=[
+                ("key", "key"), ("url", "url"), ("personalAccessToken", "personal_access_token")
+            ]
+        ),
+        DevOpsPlatform.AZURE: dict(
+            model=AlmSettingsAzure,
+            parameters=[
+                ("key", "key"), ("url", "url"), ("personalAccessToken", "personal_access_token")
+            ]
+        ),
+        DevOpsPlatform.BITBUCKET: dict(
+            model=AlmSettingsBitbucket,
+            parameters=[
+                ("key", "key"), ("url", "url"), ("personalAccessToken", "personal_access_token")
+            ]
+        ),
+        DevOpsPlatform.BITBUCKET_CLOUD: dict(
+            model=AlmSettingsBitbucketCloud,
+            parameters=[
+                ("key", "key"), ("clientId", "client_id"),
+                ("clientSecret", "client_secret"), ("workspace", "workspace")
+            ]
+        )
+    }
+
+    def __init__(self, base_url: str, auth):
+        """
+        Initializes the SonarQube API Client with the given base URL and credentials.
+
+        Args:
+            base_url (str): The base URL (scheme://host:port) of the Sonarqube API.
+            auth (HTTPBasicAuth): The Authentication Configuration
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Base URL is not Provided
+        if not base_url:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - Initialization failed : 'base_url' is required")
+
+        # If auth is not Provided
+        if not auth:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - Initialization failed : 'auth' is required")
+
+        # Initialize Base URL
+        self.base_url = base_url.rstrip('/')
+
+        # Initialize Basic Authentication
+        self.auth = auth
+
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
+        # Initialize Settings Index (Loaded on first use)
+        self.definitions = None
+
+    def build_setting(self, platform: DevOpsPlatform, params: dict) -> Any:
+        """
+        Build a Setting Model of the given Platform from a Dictionary of Model Fields.
+
+        Args:
+            platform (DevOpsPlatform): The ALM Setting Platform
+            params (dict): The Model Fields (Unknown and None Fields are Ignored)
+
+        Returns:
+            Any: The Setting Model Instance.
+
+        Raises:
+            ValueError: If the Platform is not Supported or a required Field is Missing.
+        """
+
+        # Find Schema
+        schema = self.get_schema(platform)
+
+        # Build Model Field Names
+        field_names = [parameter[1] for parameter in schema['parameters']] + ['new_key']
+
+        # Build Instance
+        return schema['model'](
+            **{k: v for k, v in params.items() if v is not None and k in field_names}
+        )
+
+    def get_schema(self, platform: DevOpsPlatform) -> dict:
+        """
+        Retrieves the Settings Schema of the given Platform.
+
+        Args:
+            platform (DevOpsPlatform): The ALM Setting Platform
+
+        Returns:
+            dict: The Schema (model, parameters).
+
+        Raises:
+            ValueError: If the Platform is not Supported.
+        """
+
+        # Find Schema
+        schema = self.SETTINGS_SCHEMAS.get(platform, None)
+
+        # If Platform is not Supported
+        if schema is None:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - Unsupported ALM Platform : {0}".format(platform))
+
+        # Return Schema
+        return schema
+
+    def get_settings(self, platform: Optional[DevOpsPlatform] = None, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Retrieves all ALM Settings from the Sonarqube API, indexed by Key.
+
+        The Definitions of all Types are listed in a single call, kept and reused by subsequent calls.
+
+        Args:
+            platform (DevOpsPlatform): Restrict the Result to the given Platform (All Platforms if None)
+            refresh (bool): Force Reload of the ALM Definitions
+
+        Returns:
+            Dict[str, Any]: The ALM Settings indexed by Key.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # If Index is not Loaded
+        if self.definitions is None or refresh:
+
+            # Build the Operation URL
+            url = self.URL_TEMPLATE.format(
+                base_url=self.base_url,
+                uri=self.GET_ALL_SETTINGS_URI
+            )
+
+            # Execute Request
+            response = self.session.get(url, auth=self.auth)
+
+            # If HTTP Result is Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                response.raise_for_status()
+
+            # Extract Definitions
+            definitions = response.json()
+
+            # Build and Keep Index
+            self.definitions = {
+                item.get('key', ''): schema['model'].from_api_response(response=item)
+                for schema_platform, schema in self.SETTINGS_SCHEMAS.items()
+                for item in definitions.get(schema_platform.value, [])
+            }
+
+        # If Platform is not Provided
+        if platform is None:
+
+            # Return Index
+            return dict(self.definitions)
+
+        # Return Platform Settings
+        return {
+            key: setting for key, setting in self.definitions.items()
+            if setting.DEVOPS_PLAFORM == platform
+        }
+
+    def get_setting(self, key: str = '', platform: Optional[DevOpsPlatform] = None) -> Any:
+        """
+        Retrieves the details of given ALM Setting from the Sonarqube API.
+
+        Args:
+            key (str): The Key of the ALM Setting to Retrieve
+            platform (DevOpsPlatform): The Expected Platform of the Setting (Any Platform if None)
+
+        Returns:
+            Any: Details of ALM Setting.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails or the Setting is not Found.
+        """
+
+        # If key is None
+        if len(key.strip()) == 0:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - Retrieve : 'key' is required")
+
+        # Find Setting in the Index
+        setting = self.get_settings(platform=platform).get(key.strip(), None)
+
+        # If Setting is not Found
+        if setting is None:
+
+            # Raise Exception
+            raise HTTPError(
+                "{code} - AlmSettings not Found (Key : {key})".format(
+                    code="404",
+                    key=key
+                )
+            )
+
+        # Return Setting
+        return setting
+
+    def build_parameters(self, setting: Any, encode_parameters: bool = True, with_new_key: bool = False) -> str:
+        """
+        Build the Query Parameters of a Create/Update Operation from the Setting Schema.
+
+        Args:
+            setting (Any): The ALM Setting
+            encode_parameters (bool): URL Encode the Parameters Values
+            with_new_key (bool): Add the 'newKey' Parameter when Provided
+
+        Returns:
+            str: The Query Parameters.
+        """
+
+        # Build Parameters List (None Values are not Sent)
+        parameters = [
+            (api_name, getattr(setting, name, None))
+            for api_name, name in self.get_schema(setting.DEVOPS_PLAFORM)['parameters']
+        ]
+
+        # If new_key is Requested and Provided
+        if with_new_key and setting.new_key:
+
+            # Add New Key
+            parameters.append(("newKey", setting.new_key))
+
+        # Return Query Parameters
+        return "&".join(
+            "{name}={value}".format(
+                name=api_name,
+                value=quote(string=value, safe="") if encode_parameters else value
+            )
+            for api_name, value in parameters if value is not None
+        )
+
+    def create_setting(self, setting: Any = None, encode_parameters: bool = True) -> Any:
+        """
+        Create an ALM Setting on SonarQube API.
+
+        Args:
+            setting (Any): The ALM Setting to Create.
+            encode_parameters (bool): URL Encode the Parameters Values
+
+        Returns:
+            Any: Details of Created ALM Setting.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # If setting is None
+        if setting is None:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - creation : 'setting' details are required")
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.CREATE_SETTING_URI.format(
+                platform=setting.DEVOPS_PLAFORM.value,
+                parameters=self.build_parameters(setting=setting, encode_parameters=encode_parameters)
+            )
+        )
+
+        # Execute Request
+        response = self.session.post(
+            url=url,
+            auth=self.auth
+        )
+
+        # If Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+        # If Index is Loaded
+        if self.definitions is not None:
+
+            # Keep Created Setting
+            self.definitions[setting.key] = setting
+
+        # Return Setting
+        return setting
+
+    def update_setting(self, setting: Any = None, encode_parameters: bool = True) -> Any:
+        """
+        Update an ALM Setting on SonarQube API.
+
+        Args:
+            setting (Any): The ALM Setting to Update.
+            encode_parameters (bool): URL Encode the Parameters Values
+
+        Returns:
+            Any: Details of Updated ALM Setting.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # If setting is None
+        if setting is None:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - Update : 'setting' details are required")
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.UPDATE_SETTING_URI.format(
+                platform=setting.DEVOPS_PLAFORM.value,
+                parameters=self.build_parameters(
+                    setting=setting,
+                    encode_parameters=encode_parameters,
+                    with_new_key=True
+                )
+            )
+        )
+
+        # Execute Request
+        response = self.session.post(
+            url=url,
+            auth=self.auth
+        )
+
+        # If Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+        # If Index is Loaded
+        if self.definitions is not None:
+
+            # Keep Updated Setting (Under its New Key if Renamed)
+            self.definitions.pop(setting.key, None)
+            self.definitions[setting.new_key or setting.key] = setting
+
+        # Return Setting
+        return setting
+
+    def delete_setting(self, key: str = ''):
+        """
+        Delete ALM Setting from the Sonarqube API.
+
+        Args:
+            key (str): The Key of the ALM Setting to Delete
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # If key is None
+        if len(key.strip()) == 0:
+
+            # Raise Value Exception
+            raise ValueError("[AlmSettingsClient] - Delete : 'key' is required")
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.DELETE_SETTING_URI.format(
+                key=key.strip()
+            )
+        )
+
+        # Execute Request
+        response = self.session.post(url, auth=self.auth)
+
+        # If Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+        # If Index is Loaded
+        if self.definitions is not None:
+
+            # Forget Deleted Setting
+            self.definitions.pop(key.strip(), None)
+
+    def apply_settings(
+        self,
+        to_create: List[Any] = None,
+        to_update: List[Any] = None,
+        to_delete: List[str] = None,
+        encode_parameters: bool = True,
+        max_workers: int = 8
+    ):
+        """
+        Apply many ALM Settings Operations with bounded concurrency.
+
+        Args:
+            to_create (List[Any]): The ALM Settings to Create
+            to_update (List[Any]): The ALM Settings to Update
+            to_delete (List[str]): The Keys of the ALM Settings to Delete
+            encode_parameters (bool): URL Encode the Parameters Values
+            max_workers (int): The Maximum Number of Concurrent Requests
+
+        Raises:
+            requests.exceptions.HTTPError: If one of the API requests fails.
+        """
+
+        # Build Operations
+        operations = (
+            [(self.create_setting, setting) for setting in to_create or []] +
+            [(self.update_setting, setting) for setting in to_update or []]
+        )
+
+        # Apply Create/Update Operations
+        run_concurrently(
+            lambda operation: operation[0](setting=operation[1], encode_parameters=encode_parameters),
+            operations,
+            max_workers=max_workers
+        )
+
+        # Apply Delete Operations
+        run_concurrently(
+            lambda key: self.delete_setting(key=key),
+            to_delete or [],
+            max_workers=max_workers
+        )
+
+
+class AlmSettingsPlatformClient:
+    """
+    Client for interacting with the Sonarqube API for the ALM Settings of a single Platform.
+
+    Delegates every Operation to a shared AlmSettingsClient.
+
+    Attributes:
+        engine (AlmSettingsClient): The Shared ALM Settings Client.
+    """
+
+    # Settings Platform
+    DEVOPS_PLATFORM = None
+
+    def __init__(self, engine: AlmSettingsClient):
+        """
+        Initializes the Platform Client with the shared ALM Settings Client.
+
+        Args:
+            engine (AlmSettingsClient): The Shared ALM Settings Client.
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If engine is not Provided
+        if not engine:
+
+            # Raise Value Exception
+            raise ValueError("[{0}] - Initialization failed : 'engine' is required".format(type(self).__name__))
+
+        # Initialize Engine
+        self.engine = engine
+
+    def get_setting(self, key: str = ''):
+        """
+        Retrieves the details of given ALM Setting of the Platform.
+
+        Args:
+            key (str): The Key of the ALM Setting to Retrieve
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails or the Setting is not Found.
+        """
+        return self.engine.get_setting(key=key, platform=self.DEVOPS_PLATFORM)
+
+    def create_setting(self, setting=None, encode_parameters: bool = True):
+        """
+        Create an ALM Setting of the Platform.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+        return self.engine.create_setting(setting=setting, encode_parameters=encode_parameters)
+
+    def update_setting(self, setting=None, encode_parameters: bool = True):
+        """
+        Update an ALM Setting of the Platform.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+        return self.engine.update_setting(setting=setting, encode_parameters=encode_parameters)
+
+    def delete_setting(self, key: str = ''):
+        """
+        Delete an ALM Setting of the Platform.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+        return self.engine.delete_setting(key=key)
+
+
+class AlmSettingsGithubClient(AlmSettingsPlatformClient):
+    """
+    Client for interacting with the Sonarqube API for AlmSettingsGithub.
+    """
+    DEVOPS_PLATFORM = DevOpsPlatform.GITHUB
+
+
+class AlmSettingsGitlabClient(AlmSettingsPlatformClient):
+    """
+    Client for interacting with the Sonarqube API for AlmSettingsGitlab.
+    """
+    DEVOPS_PLATFORM = DevOpsPlatform.GITLAB
+
+
+class AlmSettingsAzureClient(AlmSettingsPlatformClient):
+    """
+    Client for interacting with the Sonarqube API for AlmSettingsAzure.
+    """
+    DEVOPS_PLATFORM = DevOpsPlatform.AZURE
+
+
+class AlmSettingsBitbucketClient(AlmSettingsPlatformClient):
+    """
+    Client for interacting with the Sonarqube API for AlmSettingsBitbucket.
+    """
+    DEVOPS_PLATFORM = DevOpsPlatform.BITBUCKET
+
+
+class AlmSettingsBitbucketCloudClient(AlmSettingsPlatformClient):
+    """
+    Client for interacting with the Sonarqube API for AlmSettingsBitbucketCloud.
+    """
+    DEVOPS_PLATFORM = DevOpsPlatform.BITBUCKET_CLOUD
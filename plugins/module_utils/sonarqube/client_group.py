@@ -3,9 +3,9 @@ __metaclass__ = type
 
 from ..commons import is_2xx
 from ...module_utils.sonarqube.models import Group
+from .session import sonarqube_session
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     from ..sonarqube.client_group_global_permissions import GroupGlobalPermissionClient
     IMPORTS_OK = True
@@ -72,6 +72,9 @@ class GroupClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
         # Intialize Global Permission Client
         self.global_permission_client = GroupGlobalPermissionClient(
             base_url=base_url,
@@ -107,7 +110,7 @@ class GroupClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If HTTP Result is OK
         if is_2xx(response.status_code):
@@ -161,7 +164,7 @@ class GroupClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth,
             json=group.to_api_json(),
@@ -228,7 +231,7 @@ class GroupClient:
         )
 
         # Execute Request
-        response = requests.patch(
+        response = self.session.patch(
             url=url,
             auth=self.auth,
             json=group.to_api_json(),
@@ -294,7 +297,7 @@ class GroupClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth)
 
         # If Object Exists
         if not is_2xx(response.status_code):
@@ -1,12 +1,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ..commons import is_2xx
+from ..commons import is_2xx, run_concurrently
+from ..commons_model import diff_models
 from ...module_utils.sonarqube.models import GroupGlobalPermission
-from typing import List
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+from .session import sonarqube_session
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     IMPORTS_OK = True
 except ImportError:
@@ -31,6 +33,15 @@ class GroupGlobalPermissionClient:
     # Delete Group Global Permission URI
     DELETE_GROUP_GLOBAL_PERMISSION_URI = "api/permissions/remove_group?groupName={group}&permission={permission}"
 
+    # Search Groups Global Permissions URI (Paginated)
+    SEARCH_GROUPS_PERMISSIONS_URI = "api/permissions/groups?ps={page_size}&p={page}"
+
+    # Search Groups Global Permissions Query Parameter
+    SEARCH_GROUPS_PERMISSIONS_QUERY = "&q={query}"
+
+    # Search Groups Global Permissions Page Size (API Maximum)
+    SEARCH_PAGE_SIZE = 100
+
     # URL Format
     URL_TEMPLATE = "{base_url}/{uri}"
 
@@ -64,6 +75,9 @@ class GroupGlobalPermissionClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
     def create_permission(self, permission: GroupGlobalPermission = None) -> GroupGlobalPermission:
         """
         Create a GroupGlobalPermission on SonarQube API.
@@ -88,13 +102,13 @@ class GroupGlobalPermissionClient:
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
             uri=self.CREATE_GLOBAL_PERMISSION_URI.format(
-                group=permission.group_name.strip(),
-                permission=permission.permission_name.strip()
+                group=quote(permission.group_name.strip(), safe=''),
+                permission=quote(permission.permission_name.strip(), safe='')
             )
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth,
             headers={
@@ -134,13 +148,13 @@ class GroupGlobalPermissionClient:
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
             uri=self.DELETE_GROUP_GLOBAL_PERMISSION_URI.format(
-                group=permission.group_name,
-                permission=permission.permission_name
+                group=quote(permission.group_name.strip(), safe=''),
+                permission=quote(permission.permission_name.strip(), safe='')
             )
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth,
             headers={
@@ -154,6 +168,221 @@ class GroupGlobalPermissionClient:
             # Raise Exception
             response.raise_for_status()
 
+    def get_permissions_matrix(self, query: str = '') -> Dict[str, List[str]]:
+        """
+        Retrieves the Global Permissions of all Groups from the SonarQube API.
+
+        Args:
+            query (str): Optional Group Name Filter (Applied by the API when at least 3 characters long)
+
+        Returns:
+            Dict[str, List[str]]: The Permission Names indexed by Group Name.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Initialize Matrix
+        matrix = {}
+
+        # Initialize Page
+        page = 1
+
+        # Iterate on Pages
+        while True:
+
+            # Build the Operation URI
+            uri = self.SEARCH_GROUPS_PERMISSIONS_URI.format(
+                page_size=self.SEARCH_PAGE_SIZE,
+                page=page
+            )
+
+            # If Query is Usable by the API
+            if query and len(query.strip()) >= 3:
+
+                # Add Query Parameter (Encoded, eg. for Names with '&', '+' or Spaces)
+                uri = uri + self.SEARCH_GROUPS_PERMISSIONS_QUERY.format(
+                    query=quote(query.strip(), safe='')
+                )
+
+            # Build the Operation URL
+            url = self.URL_TEMPLATE.format(
+                base_url=self.base_url,
+                uri=uri
+            )
+
+            # Execute Request
+            response = self.session.get(url, auth=self.auth)
+
+            # If Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                response.raise_for_status()
+
+            # Extract Payload
+            payload = response.json()
+
+            # Extract Groups
+            groups = payload.get('groups', [])
+
+            # Iterate on Groups
+            for group in groups:
+
+                # Index Group Permissions
+                matrix[group['name']] = list(group.get('permissions', []))
+
+            # Extract Total
+            total = payload.get('paging', {}).get('total', 0)
+
+            # If Last Page is Reached
+            if len(groups) == 0 or page * self.SEARCH_PAGE_SIZE >= total:
+
+                # Stop
+                break
+
+            # Next Page
+            page += 1
+
+        # Return Matrix
+        return matrix
+
+    def get_group_permissions(self, group_name: str = '') -> List[str]:
+        """
+        Retrieves the Global Permissions of given Group from the SonarQube API.
+
+        Args:
+            group_name (str): The Target Group Name.
+
+        Returns:
+            List[str]: The Group Permission Names.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # If group_name is blank
+        if len(group_name.strip()) == 0:
+
+            # Raise Value Exception
+            raise ValueError("[GroupGlobalPermissionClient] - Permissions Retrieve : 'group_name' is required")
+
+        # Read Matrix (Filtered by Group Name) and Return Group Permissions
+        return self.get_permissions_matrix(query=group_name).get(group_name.strip(), [])
+
+    @staticmethod
+    def compute_permissions_delta(
+        current: Dict[str, List[str]],
+        desired: Dict[str, List[str]]
+    ) -> Tuple[List[GroupGlobalPermission], List[GroupGlobalPermission]]:
+        """
+        Compute the Permissions to Add and to Remove for the Desired Groups.
+
+        Only Groups present in the desired matrix are reconciled (Hash Join of the Desired and Current
+        Permissions, see diff_models).
+
+        Args:
+            current (Dict[str, List[str]]): The Current Permission Names indexed by Group Name.
+            desired (Dict[str, List[str]]): The Desired Permission Names indexed by Group Name.
+
+        Returns:
+            Tuple[List[GroupGlobalPermission], List[GroupGlobalPermission]]: The Permissions to Add and to Remove.
+        """
+
+        # Build Desired Permissions (Sorted by Group and Permission Name)
+        desired_permissions = [
+            GroupGlobalPermission(group_name=group_name, permission_name=name)
+            for group_name in sorted(desired.keys())
+            for name in sorted(set(name.strip() for name in (desired[group_name] or [])))
+        ]
+
+        # Build Current Permissions of the Desired Groups
+        current_permissions = [
+            GroupGlobalPermission(group_name=group_name, permission_name=name)
+            for group_name in sorted(desired.keys())
+            for name in sorted(set(current.get(group_name, [])))
+        ]
+
+        # Compute Delta (Missing and Extra Permissions, Permissions have no Content to Update)
+        to_add, to_update, to_remove = diff_models(desired_permissions, current_permissions)
+
+        # Return Delta
+        return to_add, to_remove
+
+    def apply_permissions_delta(
+        self,
+        to_add: List[GroupGlobalPermission] = None,
+        to_remove: List[GroupGlobalPermission] = None,
+        max_workers: int = 8
+    ):
+        """
+        Apply Permission Additions and Removals Concurrently on SonarQube API.
+
+        Args:
+            to_add (List[GroupGlobalPermission]): The Permissions to Add.
+            to_remove (List[GroupGlobalPermission]): The Permissions to Remove.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Raises:
+            requests.exceptions.HTTPError: If an API request fails.
+        """
+
+        # Build Operations List
+        operations = (
+            [(self.create_permission, permission) for permission in (to_add or [])] +
+            [(self.delete_permission, permission) for permission in (to_remove or [])]
+        )
+
+        # Execute Operations
+        run_concurrently(
+            function=lambda operation: operation[0](permission=operation[1]),
+            items=operations,
+            max_workers=max_workers
+        )
+
+    def reconcile_permissions(
+        self,
+        desired: Dict[str, List[str]] = None,
+        max_workers: int = 8
+    ) -> Tuple[List[GroupGlobalPermission], List[GroupGlobalPermission]]:
+        """
+        Reconcile Global Permissions of many Groups on SonarQube API.
+
+        The Permission Matrix is read once, and only the Delta is applied.
+
+        Args:
+            desired (Dict[str, List[str]]): The Desired Permission Names indexed by Group Name.
+            max_workers (int): The Maximum Number of Concurrent Requests.
+
+        Returns:
+            Tuple[List[GroupGlobalPermission], List[GroupGlobalPermission]]: The Added and Removed Permissions.
+
+        Raises:
+            requests.exceptions.HTTPError: If an API request fails.
+        """
+
+        # If No Desired Matrix is Provided
+        if not desired:
+
+            # Nothing to Reconcile
+            return [], []
+
+        # Compute Delta from Current Matrix
+        to_add, to_remove = self.compute_permissions_delta(
+            current=self.get_permissions_matrix(),
+            desired=desired
+        )
+
+        # Apply Delta
+        self.apply_permissions_delta(
+            to_add=to_add,
+            to_remove=to_remove,
+            max_workers=max_workers
+        )
+
+        # Return Delta
+        return to_add, to_remove
+
     def delete_all_permissions(self, group_name: str = '', ignore_error: bool = True):
         """
         Delete all Group Global Permission on SonarQube API.
@@ -171,8 +400,8 @@ class GroupGlobalPermissionClient:
             # Raise Value Exception
             raise ValueError("[GroupGlobalPermissionClient] - RemoveAll : 'group_name' is required")
 
-        # Iterate on Available Permission List
-        for permission_name in GroupGlobalPermission.AVAILABLE_PERMISSIONS:
+        # Iterate on Currently Granted Permissions
+        for permission_name in self.get_group_permissions(group_name=group_name):
 
             try:
 
@@ -196,6 +425,8 @@ class GroupGlobalPermissionClient:
         """
         Initialize Group Global Permissions from the Sonarqube API.
 
+        Only the Missing Permissions are Added and the Extra Permissions Removed.
+
         Args:
             group_name (str): The Target Group Name
             permission_names (list): The Permissions Names to Associate to the Group
@@ -210,33 +441,29 @@ class GroupGlobalPermissionClient:
             # Raise Value Exception
             raise ValueError("[GroupGlobalPermissionClient#initialize_permissions] : 'group_name' is required")
 
-        # Clean Group Permissions
-        self.delete_all_permissions(
-            group_name=group_name,
-            ignore_error=True
-        )
-
-        # Created Permissions
-        permissions = []
-
         # If Given Permissions Names is not provided
         if permission_names is None:
 
             # Initialize to Empty
             permission_names = []
 
-        # Iterate on Permission Names
-        for permission_name in permission_names:
+        # Compute Delta from Current Group Permissions
+        to_add, to_remove = self.compute_permissions_delta(
+            current={group_name.strip(): self.get_group_permissions(group_name=group_name)},
+            desired={group_name.strip(): permission_names}
+        )
 
-            # Create Global Permission
-            permissions.append(
-                self.create_permission(
-                    permission=GroupGlobalPermission(
-                        group_name=group_name.strip(),
-                        permission_name=permission_name.strip()
-                    )
-                )
-            )
+        # Apply Delta
+        self.apply_permissions_delta(
+            to_add=to_add,
+            to_remove=to_remove
+        )
 
         # Return permissions
-        return permissions
+        return [
+            GroupGlobalPermission(
+                group_name=group_name.strip(),
+                permission_name=permission_name.strip()
+            )
+            for permission_name in permission_names
+        ]
@@ -4,12 +4,12 @@ __metaclass__ = type
 from ..commons import is_2xx, is_not_found
 from ...module_utils.sonarqube.models import GroupMembership
 from typing import List
+from .session import sonarqube_session
 
 try:
-    import requests
     from requests.exceptions import HTTPError
-    from .client import GroupClient
-    from .client import UserClient
+    from .client_group import GroupClient
+    from .client_user import UserClient
     IMPORTS_OK = True
 except ImportError:
     IMPORTS_OK = False
@@ -69,6 +69,9 @@ class GroupMembershipClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
         # Initialize Group Client
         self.group_client = GroupClient(
             base_url=base_url,
@@ -114,7 +117,7 @@ class GroupMembershipClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If HTTP Result is OK
         if is_2xx(response.status_code):
@@ -168,7 +171,7 @@ class GroupMembershipClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth,
             json=membership.to_api_json(),
@@ -214,7 +217,7 @@ class GroupMembershipClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth)
 
         # If Object Exists
         if not is_2xx(response.status_code) and not is_not_found(response.status_code):
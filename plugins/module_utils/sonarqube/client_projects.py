@@ -1,13 +1,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ..commons import is_2xx
+from ..commons import is_2xx, run_concurrently
+from typing import Dict, List
 from .models import Project
 from .models import ImportDopProjectSpec
 from .models import DevOpsPlatform
+from .session import sonarqube_session
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     IMPORTS_OK = True
 except ImportError:
@@ -32,6 +33,12 @@ class ProjectClient:
     # Search Project URI
     SEARCH_PROJECT_BY_KEY_URI = "api/projects/search?projects={project_key}&ps=1&p=1"
 
+    # Search Projects URI (Comma Separated Keys)
+    SEARCH_PROJECTS_BY_KEYS_URI = "api/projects/search?projects={project_keys}&ps={page_size}&p=1"
+
+    # Maximum Number of Project Keys per Search/Delete Request (Keep URL Length Reasonable)
+    PROJECT_KEYS_BATCH_SIZE = 50
+
     # Delete Project URI
     DELETE_PROJECT_BY_KEY = "api/projects/bulk_delete?projects={project_key}"
 
@@ -70,25 +77,33 @@ class ProjectClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-    def get_dop(self, dop_key: str = '') -> DevOpsPlatform:
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
+        # Initialize DevOps Platform Settings Index (Loaded on First Use)
+        self.dops = None
+
+    def get_dops(self, refresh: bool = False) -> Dict[str, DevOpsPlatform]:
         """
-        Retrieves the details of given DevOps Platform from the Sonarqube API.
+        Retrieves all DevOps Platforms from the Sonarqube API, indexed by Key.
+
+        The Settings are loaded once and reused by subsequent calls.
 
         Args:
-            dop_key (str): The DOP Key
+            refresh (bool): Force Reload of the DevOps Platforms Settings
 
         Returns:
-            DevOpsPlatform: Details of DOP in JSON format.
+            Dict[str, DevOpsPlatform]: The DevOps Platforms indexed by Key.
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
-        # If dop key is None
-        if len(dop_key.strip()) == 0:
+        # If Index is Already Loaded
+        if self.dops is not None and not refresh:
 
-            # Raise Value Exception
-            raise ValueError("[ProjectClient] - DOP Retrieve : 'dop_key' is required")
+            # Return Index
+            return self.dops
 
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
@@ -97,35 +112,59 @@ class ProjectClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
-        # If HTTP Result is OK
-        if is_2xx(response.status_code):
+        # If HTTP Result is Not OK
+        if not is_2xx(response.status_code):
 
-            # Extract List
-            dops = response.json()['dopSettings']
+            # Raise Exception
+            response.raise_for_status()
 
-            # Find DOP in the List
-            dop = next((dop for dop in dops if dop.get('key', '') == dop_key.strip()), None)
+        # Build and Keep Index
+        self.dops = {
+            dop.get('key', ''): DevOpsPlatform.from_api_response(response=dop)
+            for dop in response.json()['dopSettings']
+        }
 
-            # If List is empty
-            if dop is None:
+        # Return Index
+        return self.dops
 
-                # Raise Exception
-                raise HTTPError(
-                    "{code} - DevOpsPlatform not Found (Key : {key})".format(
-                        code="404",
-                        key=dop_key
-                    )
-                )
+    def get_dop(self, dop_key: str = '') -> DevOpsPlatform:
+        """
+        Retrieves the details of given DevOps Platform from the Sonarqube API.
 
-            # Return JSON
-            return DevOpsPlatform.from_api_response(response=dop)
+        Args:
+            dop_key (str): The DOP Key
 
-        else:
+        Returns:
+            DevOpsPlatform: Details of DOP in JSON format.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # If dop key is None
+        if len(dop_key.strip()) == 0:
+
+            # Raise Value Exception
+            raise ValueError("[ProjectClient] - DOP Retrieve : 'dop_key' is required")
+
+        # Find DOP in the Index
+        dop = self.get_dops().get(dop_key.strip(), None)
+
+        # If DOP is not Found
+        if dop is None:
 
             # Raise Exception
-            response.raise_for_status()
+            raise HTTPError(
+                "{code} - DevOpsPlatform not Found (Key : {key})".format(
+                    code="404",
+                    key=dop_key
+                )
+            )
+
+        # Return DOP
+        return dop
 
     def get_project(self, project_key: str = '') -> DevOpsPlatform:
         """
@@ -156,7 +195,7 @@ class ProjectClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If HTTP Result is OK
         if is_2xx(response.status_code):
@@ -183,6 +222,61 @@ class ProjectClient:
             # Raise Exception
             response.raise_for_status()
 
+    def search_projects(self, project_keys: List[str] = None) -> Dict[str, Project]:
+        """
+        Retrieves the details of many Projects from the Sonarqube API.
+
+        Keys are searched by batches with the multi-key 'projects' parameter.
+
+        Args:
+            project_keys (List[str]): The Project Keys
+
+        Returns:
+            Dict[str, Project]: The Existing Projects indexed by Key.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Initialize Index
+        projects = {}
+
+        # Clean Keys (Unique, Not Blank)
+        keys = sorted(set(key.strip() for key in (project_keys or []) if key and key.strip()))
+
+        # Iterate on Batches
+        for start in range(0, len(keys), self.PROJECT_KEYS_BATCH_SIZE):
+
+            # Extract Batch
+            batch = keys[start:start + self.PROJECT_KEYS_BATCH_SIZE]
+
+            # Build the Operation URL
+            url = self.URL_TEMPLATE.format(
+                base_url=self.base_url,
+                uri=self.SEARCH_PROJECTS_BY_KEYS_URI.format(
+                    project_keys=",".join(batch),
+                    page_size=len(batch)
+                )
+            )
+
+            # Execute Request
+            response = self.session.get(url, auth=self.auth)
+
+            # If HTTP Result is Not OK
+            if not is_2xx(response.status_code):
+
+                # Raise Exception
+                response.raise_for_status()
+
+            # Iterate on Found Projects
+            for component in response.json()['components']:
+
+                # Index Project
+                projects[component.get('key')] = Project.from_api_response(response=component)
+
+        # Return Index
+        return projects
+
     def delete_project(self, project_key: str = '') -> Project:
         """
         Delete Project from the Sonarqube API.
@@ -209,7 +303,7 @@ class ProjectClient:
         )
 
         # Execute Request
-        response = requests.post(url, auth=self.auth)
+        response = self.session.post(url, auth=self.auth)
 
         # If Object Exists
         if not is_2xx(response.status_code):
@@ -235,7 +329,7 @@ class ProjectClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth,
             json=project_spec.to_api_json(dop_id=dop.id),
@@ -254,3 +348,50 @@ class ProjectClient:
 
             # Raise Exception
             response.raise_for_status()
+
+    def delete_projects(self, project_keys: List[str] = None):
+        """
+        Delete many Projects from the Sonarqube API (By Batches).
+
+        Args:
+            project_keys (List[str]): The Project Keys
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Clean Keys (Unique, Not Blank)
+        keys = sorted(set(key.strip() for key in (project_keys or []) if key and key.strip()))
+
+        # Iterate on Batches
+        for start in range(0, len(keys), self.PROJECT_KEYS_BATCH_SIZE):
+
+            # Delete Batch
+            self.delete_project(
+                project_key=",".join(keys[start:start + self.PROJECT_KEYS_BATCH_SIZE])
+            )
+
+    def import_dop_projects(self, project_specs: List[ImportDopProjectSpec] = None, max_workers: int = 8) -> List[dict]:
+        """
+        Import many DevOps Platform Projects with Bounded Concurrency.
+
+        Args:
+            project_specs (List[ImportDopProjectSpec]): The Projects to Import
+            max_workers (int): The Maximum Number of Concurrent Imports
+
+        Returns:
+            List[dict]: The Imported Projects in JSON format (Same Order as Specifications).
+
+        Raises:
+            requests.exceptions.HTTPError: If an API request fails.
+        """
+
+        # Load DevOps Platforms Index Once (Before Concurrent Imports)
+        self.get_dops()
+
+        # Import Projects
+        return run_concurrently(
+            function=lambda project_spec: self.import_dop_project(project_spec=project_spec),
+            items=project_specs or [],
+            max_workers=max_workers
+        )
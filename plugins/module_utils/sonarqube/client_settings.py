@@ -2,9 +2,9 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ..commons import is_2xx
+from .session import sonarqube_session
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     from urllib.parse import quote
     IMPORTS_OK = True
@@ -65,6 +65,9 @@ class SettingsClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
     def get_setting(self, key: str, component: str = ''):
         """
         Retrieves the details of given Setting (key/component) from the Sonarqube API.
@@ -104,7 +107,7 @@ class SettingsClient:
             )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -237,7 +240,7 @@ class SettingsClient:
                 )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth
         )
@@ -323,7 +326,7 @@ class SettingsClient:
             )
 
         # Execute Request
-        response = requests.post(url, auth=self.auth)
+        response = self.session.post(url, auth=self.auth)
 
         # If Object Exists
         if not is_2xx(response.status_code):
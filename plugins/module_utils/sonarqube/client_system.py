@@ -0,0 +1,267 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import time
+from ..commons import is_2xx
+from .enums import SystemStatus
+from .session import sonarqube_session
+
+try:
+    from requests.exceptions import HTTPError, RequestException
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+class SystemClient:
+    """
+    Client for interacting with the Sonarqube API for System Status.
+
+    Attributes:
+        base_url (str): The base URL of the Sonarqube API.
+        auth (HTTPBasicAuth): The HTTP basic authentication credentials (Optional, Status API is Public).
+    """
+
+    # Définir la constante pour application/json
+    CONTENT_TYPE_JSON = "application/json"
+
+    # Get Status URI
+    GET_STATUS_URI = "api/system/status"
+
+    # Migrate Database URI
+    MIGRATE_DB_URI = "api/system/migrate_db"
+
+    # URL Format
+    URL_TEMPLATE = "{base_url}/{uri}"
+
+    def __init__(self, base_url: str, auth=None):
+        """
+        Initializes the SonarQube API Client with the given base URL and credentials.
+
+        Args:
+            base_url (str): The base URL (scheme://host:port) of the Sonarqube API.
+            auth (HTTPBasicAuth): The Authentication Configuration (Optional)
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Base URL is not Provided
+        if not base_url:
+
+            # Raise Value Exception
+            raise ValueError("[SystemClient] - Initialization failed : 'base_url' is required")
+
+        # Initialize Base URL
+        self.base_url = base_url.rstrip('/')
+
+        # Initialize Basic Authentication
+        self.auth = auth
+
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
+    def get_status(self, request_timeout: float = 10) -> dict:
+        """
+        Retrieves the System Status from the Sonarqube API.
+
+        Args:
+            request_timeout (float): The HTTP Request Timeout (Seconds)
+
+        Returns:
+            dict: System Status in JSON format (id, version, status).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.GET_STATUS_URI
+        )
+
+        # Execute Request
+        response = self.session.get(url, auth=self.auth, timeout=request_timeout)
+
+        # If HTTP Result is Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+        # Return JSON
+        return response.json()
+
+    def migrate_db(self, request_timeout: float = 10) -> dict:
+        """
+        Trigger the Database Migration on the Sonarqube API.
+
+        Args:
+            request_timeout (float): The HTTP Request Timeout (Seconds)
+
+        Returns:
+            dict: Migration State in JSON format.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.MIGRATE_DB_URI
+        )
+
+        # Execute Request
+        response = self.session.post(url, auth=self.auth, timeout=request_timeout)
+
+        # If HTTP Result is Not OK
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+        # Return JSON
+        return response.json()
+
+    def wait_ready(
+        self,
+        timeout: float = 300,
+        initial_delay: float = 1,
+        max_delay: float = 30,
+        backoff_factor: float = 2,
+        jitter: float = 0.5,
+        migrate_db: bool = False,
+        request_timeout: float = 10
+    ) -> dict:
+        """
+        Wait until the Sonarqube Server is UP, polling the Status with exponential backoff and jitter.
+
+        Connection errors and non 2xx responses are retried until the deadline. The delay is reset
+        to 'initial_delay' each time the reported Status changes.
+
+        Args:
+            timeout (float): The Total Deadline (Seconds)
+            initial_delay (float): The First Delay between two Polls (Seconds)
+            max_delay (float): The Maximum Delay between two Polls (Seconds)
+            backoff_factor (float): The Delay Multiplier applied after each Poll
+            jitter (float): The Random Fraction (0 to 1) removed from each Delay
+            migrate_db (bool): Trigger the Database Migration when the Server requires it
+            request_timeout (float): The HTTP Request Timeout (Seconds)
+
+        Returns:
+            dict: Readiness Details (status, version, attempts, elapsed_ms, first_response_ms,
+                  migration_triggered, transitions).
+
+        Raises:
+            requests.exceptions.HTTPError: If the Server is DOWN, or needs a Migration that is not Requested.
+            TimeoutError: If the Server is not UP before the Deadline.
+        """
+
+        # Initialize Clock
+        started = time.monotonic()
+        deadline = started + timeout
+
+        # Initialize State
+        delay = initial_delay
+        attempts = 0
+        last_status = None
+        first_response_ms = None
+        migration_triggered = False
+        transitions = []
+
+        # Compute Elapsed Milliseconds
+        def elapsed_ms():
+            return int((time.monotonic() - started) * 1000)
+
+        # Poll until Deadline
+        while True:
+
+            # Count Attempt
+            attempts += 1
+
+            try:
+
+                # Read Status
+                payload = self.get_status(request_timeout=request_timeout)
+
+            except RequestException:
+
+                # Server is not Reachable Yet
+                payload = None
+
+            # If a Status was Received
+            if payload is not None:
+
+                # Resolve Status
+                status = SystemStatus.create(payload.get('status', ''))
+
+                # Keep First Response Time
+                if first_response_ms is None:
+                    first_response_ms = elapsed_ms()
+
+                # If Status Changed
+                if status != last_status:
+
+                    # Record Transition and Reset Delay
+                    transitions.append(dict(status=payload.get('status', ''), elapsed_ms=elapsed_ms()))
+                    last_status = status
+                    delay = initial_delay
+
+                # If Server is Ready
+                if status == SystemStatus.UP:
+
+                    # Return Readiness Details
+                    return dict(
+                        status=status.value,
+                        version=payload.get('version', None),
+                        attempts=attempts,
+                        elapsed_ms=elapsed_ms(),
+                        first_response_ms=first_response_ms,
+                        migration_triggered=migration_triggered,
+                        transitions=transitions
+                    )
+
+                # If Server is Down
+                if status == SystemStatus.DOWN:
+
+                    # Raise Exception
+                    raise HTTPError("503 - SonarQube Server is DOWN (Version : {0})".format(payload.get('version', None)))
+
+                # If Database Migration is Required
+                if status == SystemStatus.DB_MIGRATION_NEEDED:
+
+                    # If Migration is not Requested
+                    if not migrate_db:
+
+                        # Raise Exception
+                        raise HTTPError("503 - SonarQube Database Migration is Required")
+
+                    # If Migration is not Triggered Yet
+                    if not migration_triggered:
+
+                        # Trigger Migration
+                        self.migrate_db(request_timeout=request_timeout)
+                        migration_triggered = True
+
+            # Compute Remaining Time
+            remaining = deadline - time.monotonic()
+
+            # If Deadline is Reached
+            if remaining <= 0:
+
+                # Raise Exception
+                raise TimeoutError(
+                    "SonarQube Server not Ready after {0} ms ({1} Attempts, Last Status : {2})".format(
+                        elapsed_ms(),
+                        attempts,
+                        last_status.value if last_status else 'UNREACHABLE'
+                    )
+                )
+
+            # Sleep (Jittered Delay, Bounded by the Deadline)
+            time.sleep(min(remaining, delay * (1 - random.uniform(0, jitter))))
+
+            # Increase Delay
+            delay = min(max_delay, delay * backoff_factor)
@@ -3,9 +3,9 @@ __metaclass__ = type
 
 from ..commons import is_2xx
 from ...module_utils.sonarqube.models import User
+from .session import sonarqube_session
 
 try:
-    import requests
     from requests.exceptions import HTTPError
     IMPORTS_OK = True
 except ImportError:
@@ -71,6 +71,9 @@ class UserClient:
         # Initialize Basic Authentication
         self.auth = auth
 
+        # Initialize HTTP Session (Pooled, Shared in the Process)
+        self.session = sonarqube_session()
+
     def get_user(self, login: str = '') -> User:
         """
         Retrieves the details of given User from the Sonarqube API.
@@ -100,7 +103,7 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth)
 
         # If HTTP Result is OK
         if is_2xx(response.status_code):
@@ -154,7 +157,7 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.session.post(
             url=url,
             auth=self.auth,
             json=user.to_api_json(),
@@ -215,7 +218,7 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.patch(
+        response = self.session.patch(
             url=url,
             auth=self.auth,
             json=user.to_api_json(),
@@ -270,7 +273,7 @@ class UserClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth)
 
         # If Object Exists
         if not is_2xx(response.status_code):
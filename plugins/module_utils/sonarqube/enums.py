@@ -49,3 +49,24 @@ class ProjectCodeDefinitionType(BaseEnum):
     PREVIOUS_VERSION = "PREVIOUS_VERSION"
     NUMBER_OF_DAYS = "NUMBER_OF_DAYS"
     REFERENCE_BRANCH = "REFERENCE_BRANCH"
+
+
+# Define an enumeration for System Status
+class SystemStatus(BaseEnum):
+    """
+    Represents SonarQube System Status (api/system/status).
+
+    Attributes:
+        STARTING (str): Server is Starting.
+        UP (str): Server is Up and Ready.
+        DOWN (str): Server is Down (Startup Failed).
+        RESTARTING (str): Server is Restarting.
+        DB_MIGRATION_NEEDED (str): Database Migration is Required.
+        DB_MIGRATION_RUNNING (str): Database Migration is Running.
+    """
+    STARTING = "STARTING"
+    UP = "UP"
+    DOWN = "DOWN"
+    RESTARTING = "RESTARTING"
+    DB_MIGRATION_NEEDED = "DB_MIGRATION_NEEDED"
+    DB_MIGRATION_RUNNING = "DB_MIGRATION_RUNNING"
@@ -3,6 +3,7 @@ __metaclass__ = type
 
 from typing import List, Dict, Optional, Type
 from dataclasses import dataclass, field
+from ..commons_model import BaseModel
 from .enums import DevOpsPlatform
 from .enums import ProjectVisibility
 
@@ -84,8 +85,8 @@ class Setting:
 
 
 # Group Definition
-@dataclass
-class Group:
+@dataclass(eq=False)
+class Group(BaseModel):
     """
     Represents SonarQube Group.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api_v2#/authorizations/groups--post`
@@ -95,6 +96,16 @@ class Group:
         group_id (str): The SonarQube Group Internal ID.
         group_description (str) : The SonarQube Group Description.
     """
+
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('group_name',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('group_name', 'group_description', 'global_permissions')
+
+    # Unordered Content Fields (Compared as Sets)
+    UNORDERED_FIELDS = ('global_permissions',)
+
     group_name: str
     group_id: Optional[str] = None
     group_description: Optional[str] = None
@@ -121,21 +132,6 @@ class Group:
             "description": self.group_description
         }
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of Group
-        if not isinstance(other, Group):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "group_name", None) == getattr(other, "group_name", None) and
-            getattr(self, "group_description", None) == getattr(other, "group_description", None) and
-            set(getattr(self, "global_permissions", [])) == set(getattr(other, "global_permissions", []))
-        )
-
     @classmethod
     def from_api_response(cls: Type['Group'], response: dict) -> 'Group':
         """
@@ -149,8 +145,8 @@ class Group:
 
 
 # User Definition
-@dataclass
-class User:
+@dataclass(eq=False)
+class User(BaseModel):
     """
     Represents SonarQube User.
     Refer at : `https://next.sonarqube.com/sonarqube/web_api_v2#/users-management/users--post`
@@ -165,6 +161,16 @@ class User:
         user_scm_accounts (list): The SonarQube User SCM Accounts.
         user_groups (list): The SonarQube User Groups
     """
+
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('user_login',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('user_login', 'user_name', 'user_email', 'user_password', 'user_scm_accounts', 'user_groups')
+
+    # Unordered Content Fields (Compared as Sets)
+    UNORDERED_FIELDS = ('user_scm_accounts', 'user_groups')
+
     user_login: str
     user_name: str
     user_id: Optional[str] = None
@@ -203,24 +209,6 @@ class User:
             "scmAccounts": self.user_scm_accounts
         }
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of User
-        if not isinstance(other, User):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "user_login", None) == getattr(other, "user_login", None) and
-            getattr(self, "user_name", None) == getattr(other, "user_name", None) and
-            getattr(self, "user_email", None) == getattr(other, "user_email", None) and
-            getattr(self, "user_password", None) == getattr(other, "user_password", None) and
-            set(getattr(self, "user_scm_accounts", [])) == set(getattr(other, "user_scm_accounts", [])) and
-            set(getattr(self, "user_groups", [])) == set(getattr(other, "user_groups", []))
-        )
-
     @classmethod
     def from_api_response(cls: Type['User'], response: dict) -> 'User':
         """
@@ -237,8 +225,8 @@ class User:
 
 
 # Group Membership Definition
-@dataclass
-class GroupMembership:
+@dataclass(eq=False)
+class GroupMembership(BaseModel):
     """
     Represents SonarQube Group Membership.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api_v2#/authorizations/group-memberships--post`
@@ -248,6 +236,13 @@ class GroupMembership:
         user_id (str): The SonarQube User ID.
         group_id (str): The SonarQube Group ID.
     """
+
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('user_id', 'group_id')
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('id', 'user_id', 'group_id')
+
     user_id: str
     group_id: str
     id: Optional[str] = ''
@@ -277,21 +272,6 @@ class GroupMembership:
             "groupId": self.group_id
         }
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of GroupMembership
-        if not isinstance(other, GroupMembership):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "id", '') == getattr(other, "id", '') and
-            getattr(self, "user_id", '') == getattr(other, "user_id", '') and
-            getattr(self, "group_id", '') == getattr(other, "group_id", '')
-        )
-
     @classmethod
     def from_api_response(cls: Type['GroupMembership'], response: dict) -> 'GroupMembership':
         """
@@ -336,8 +316,8 @@ class GroupMembership:
 
 
 # Group Global Permissions
-@dataclass
-class GroupGlobalPermission:
+@dataclass(eq=False)
+class GroupGlobalPermission(BaseModel):
     """
     Represents SonarQube Group Global Permissions.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api/api/permissions`
@@ -347,6 +327,9 @@ class GroupGlobalPermission:
         permission (str): The SonarQube Permission Name.
     """
 
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('group_name', 'permission_name')
+
     # Définir la constante pour application/json
     AVAILABLE_PERMISSIONS = [
         "admin",
@@ -395,24 +378,10 @@ class GroupGlobalPermission:
             permission_name=response['permission']
         )
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of GroupGlobalPermission
-        if not isinstance(other, GroupGlobalPermission):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "group_name", '') == getattr(other, "group_name", '') and
-            getattr(self, "permission_name", '') == getattr(other, "permission_name", '')
-        )
-
 
 # ALM Github Settings
-@dataclass
-class AlmSettingsGithub:
+@dataclass(eq=False)
+class AlmSettingsGithub(BaseModel):
     """
     Represents SonarQube ALM Settings for Github Integration.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api/api/alm_settings`
@@ -429,6 +398,12 @@ class AlmSettingsGithub:
         webhook_secret (str): The SonarQube ALM Setting Webhook Secret
     """
 
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('key',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('key', 'url', 'app_id', 'client_id', 'client_secret', 'webhook_secret')
+
     # Définir la constante pour application/json
     DEVOPS_PLAFORM = DevOpsPlatform.GITHUB
 
@@ -496,28 +471,10 @@ class AlmSettingsGithub:
             webhook_secret=response.get('webhookSecret', None)
         )
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of AlmSettingsGithub
-        if not isinstance(other, AlmSettingsGithub):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "key", '') == getattr(other, "key", '') and
-            getattr(self, "url", '') == getattr(other, "url", '') and
-            getattr(self, "app_id", '') == getattr(other, "app_id", '') and
-            getattr(self, "client_id", '') == getattr(other, "client_id", '') and
-            getattr(self, "client_secret", '') == getattr(other, "client_secret", '') and
-            getattr(self, "webhook_secret", '') == getattr(other, "webhook_secret", '')
-        )
-
 
 # ALM Gitlab Settings
-@dataclass
-class AlmSettingsGitlab:
+@dataclass(eq=False)
+class AlmSettingsGitlab(BaseModel):
     """
     Represents SonarQube ALM Settings for Gitlab Integration.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api/api/alm_settings`
@@ -529,6 +486,12 @@ class AlmSettingsGitlab:
         personal_access_token (str): The SonarQube ALM Setting Personal Access Token.
     """
 
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('key',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('key', 'url', 'personal_access_token')
+
     # Définir la constante pour application/json
     DEVOPS_PLAFORM = DevOpsPlatform.GITLAB
 
@@ -575,25 +538,10 @@ class AlmSettingsGitlab:
             personal_access_token=response.get('personalAccessToken', None)
         )
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of AlmSettingsGitlab
-        if not isinstance(other, AlmSettingsGitlab):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "key", '') == getattr(other, "key", '') and
-            getattr(self, "url", '') == getattr(other, "url", '') and
-            getattr(self, "personal_access_token", '') == getattr(other, "personal_access_token", '')
-        )
-
 
 # ALM Azure Settings
-@dataclass
-class AlmSettingsAzure:
+@dataclass(eq=False)
+class AlmSettingsAzure(BaseModel):
     """
     Represents SonarQube ALM Settings for Azure Integration.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api/api/alm_settings`
@@ -605,6 +553,12 @@ class AlmSettingsAzure:
         personal_access_token (str): The SonarQube ALM Setting Personal Access Token.
     """
 
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('key',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('key', 'url', 'personal_access_token')
+
     # Définir la constante pour application/json
     DEVOPS_PLAFORM = DevOpsPlatform.AZURE
 
@@ -651,25 +605,10 @@ class AlmSettingsAzure:
             personal_access_token=response.get('personalAccessToken', None)
         )
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of AlmSettingsAzure
-        if not isinstance(other, AlmSettingsAzure):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "key", '') == getattr(other, "key", '') and
-            getattr(self, "url", '') == getattr(other, "url", '') and
-            getattr(self, "personal_access_token", '') == getattr(other, "personal_access_token", '')
-        )
-
 
 # ALM Bitbucket Settings
-@dataclass
-class AlmSettingsBitbucket:
+@dataclass(eq=False)
+class AlmSettingsBitbucket(BaseModel):
     """
     Represents SonarQube ALM Settings for Bitbucket Integration.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api/api/alm_settings`
@@ -681,6 +620,12 @@ class AlmSettingsBitbucket:
         personal_access_token (str): The SonarQube ALM Setting Personal Access Token.
     """
 
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('key',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('key', 'url', 'personal_access_token')
+
     # Définir la constante pour application/json
     DEVOPS_PLAFORM = DevOpsPlatform.BITBUCKET
 
@@ -727,25 +672,10 @@ class AlmSettingsBitbucket:
             personal_access_token=response.get('personalAccessToken', None)
         )
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of AlmSettingsBitbucket
-        if not isinstance(other, AlmSettingsBitbucket):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "key", '') == getattr(other, "key", '') and
-            getattr(self, "url", '') == getattr(other, "url", '') and
-            getattr(self, "personal_access_token", '') == getattr(other, "personal_access_token", '')
-        )
-
 
 # ALM BitbucketCloud Settings
-@dataclass
-class AlmSettingsBitbucketCloud:
+@dataclass(eq=False)
+class AlmSettingsBitbucketCloud(BaseModel):
     """
     Represents SonarQube ALM Settings for BitbucketCloud Integration.
     Refer at : `http://next.sonarqube.com/sonarqube/web_api/api/alm_settings`
@@ -758,6 +688,12 @@ class AlmSettingsBitbucketCloud:
         workspace (str): The SonarQube ALM Setting Application Workspace.
     """
 
+    # Identity Fields (Index Key)
+    IDENTITY_FIELDS = ('key',)
+
+    # Content Fields (Equality and Hash)
+    CONTENT_FIELDS = ('key', 'client_id', 'client_secret', 'workspace')
+
     # Définir la constante pour application/json
     DEVOPS_PLAFORM = DevOpsPlatform.BITBUCKET_CLOUD
 
@@ -811,22 +747,6 @@ class AlmSettingsBitbucketCloud:
             workspace=response.get('workspace', None)
         )
 
-    def __eq__(self, other):
-
-        # If Class is not Instance of AlmSettingsBitbucketCloud
-        if not isinstance(other, AlmSettingsBitbucketCloud):
-
-            # Return False
-            return False
-
-        # Return comparison
-        return (
-            getattr(self, "key", '') == getattr(other, "key", '') and
-            getattr(self, "client_id", '') == getattr(other, "client_id", '') and
-            getattr(self, "client_secret", '') == getattr(other, "client_secret", '') and
-            getattr(self, "workspace", '') == getattr(other, "workspace", '')
-        )
-
 
 # DOP Informations
 @dataclass
@@ -0,0 +1,47 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from http.cookiejar import DefaultCookiePolicy
+from ..commons import shared_client
+from ..commons_instrumentation import instrument_session
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Build the Pooled SonarQube HTTP Session
+def build_sonarqube_session(pool_size: int = 10):
+    """
+    Build the Pooled SonarQube HTTP Session (Kept-Alive Connections, API Calls Recorded).
+
+    Cookies are Refused, so every Request is Authenticated with its Credentials only, as with one-shot
+    Requests (SonarQube Applies its CSRF Checks to Cookie Authenticated Requests).
+
+    Args:
+        pool_size (int): The HTTP Connection Pool Size.
+
+    Returns:
+        requests.Session: The Session.
+    """
+
+    # Build Pooled HTTP Session
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size)))
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size)))
+
+    # Refuse Cookies
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    # Record API Calls and Return Session
+    return instrument_session(session)
+
+
+# Return the SonarQube HTTP Session Shared in the Process (Credentials are Sent per Request)
+def sonarqube_session():
+
+    # Return Session
+    return shared_client(('sonarqube',), build_sonarqube_session)
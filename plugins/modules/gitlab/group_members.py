@@ -0,0 +1,544 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: group_members
+version_added: "1.0.0"
+short_description: Bulk Group Membership Management
+description:
+    - Used to Synchronize the Direct Members of many Groups in a single Task
+    - Current Members of all Groups are read concurrently (with Pagination), then only the Differences
+      (Added Members, Changed Access Levels or Expiry Dates, Removed Members) are applied, with bounded concurrency
+requirements:
+    - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    base_url:
+        description:
+        - The Gitlab API Base URL
+        required: true
+        type: str
+    access_token:
+        description:
+        - The Gitlab API Access Token (Owner of the Groups)
+        required: true
+        type: str
+    groups:
+        description:
+        - The Groups Memberships
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            group:
+                description:
+                - The Group ID or Full Path (eg. 'platform/backend').
+                required: true
+                type: str
+            members:
+                description:
+                - The Group Members.
+                required: false
+                type: list
+                elements: dict
+                default: []
+                suboptions:
+                    username:
+                        description:
+                        - The Member Login.
+                        required: true
+                        type: str
+                    access_level:
+                        description:
+                        - The Member Access Level (Required for 'present' State).
+                        required: false
+                        choices: ['minimal_access', 'guest', 'planner', 'reporter', 'developer', 'maintainer', 'owner']
+                        type: str
+                    expires_at:
+                        description:
+                        - The Membership Expiry Date (YYYY-MM-DD).
+                        - Set to V(null) or an Empty String to Remove the Expiry of an Existing Member.
+                        - The Current Expiry is Kept when not Set.
+                        required: false
+                        type: str
+                    state:
+                        description:
+                        - The Membership State
+                        required: false
+                        choices: ['present', 'absent']
+                        default: 'present'
+                        type: str
+            purge:
+                description:
+                - Remove the Direct Members which are not Listed in O(groups[].members).
+                - The Token Owner is Removed too if it is a Direct Member and not Listed.
+                - The Last Direct Owner of a Group is never Removed by the Purge (a Warning is Returned).
+                required: false
+                type: bool
+                default: false
+    max_workers:
+        description:
+        - The Maximum Number of Concurrent API Requests
+        required: false
+        type: int
+        default: 8
+'''
+
+EXAMPLES = r'''
+- name: "Synchronize Gitlab Groups Members"
+  kube_cloud.general.gitlab.group_members:
+    base_url: "https://gitlab.example.com"
+    access_token: "glpat_cv182gTX22lMnB8876"
+    max_workers: 16
+    groups:
+      - group: "platform/backend"
+        purge: true
+        members:
+          - username: "jdoe"
+            access_level: "maintainer"
+          - username: "intern"
+            access_level: "developer"
+            expires_at: "2025-12-31"
+          - username: "hired"
+            access_level: "developer"
+            expires_at: null
+      - group: "platform/frontend"
+        members:
+          - username: "leaver"
+            state: "absent"
+'''
+
+from ansible.module_utils.basic import AnsibleModule, _load_params
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.gitlab.client import gitlab_client, Client
+from ...module_utils.gitlab.enums import AccessLevel
+from ...module_utils.gitlab.models import Member
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Find and Return Groups
+def get_groups(module: AnsibleModule, client: Client) -> dict:
+
+    try:
+
+        # Call Client
+        return client.group.get_groups(
+            groups=[params['group'] for params in module.params['groups']],
+            max_workers=module.params['max_workers']
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Groups] - Failed Find Gitlab Groups : {0}".format(
+                api_error
+            )
+        )
+
+
+# Find and Return Members of Groups
+def get_members_index(module: AnsibleModule, client: Client, group_ids: list) -> dict:
+
+    try:
+
+        # Call Client
+        return client.member.get_members_index(
+            source_ids=group_ids,
+            max_workers=module.params['max_workers']
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Members] - Failed List Gitlab Groups Members : {0}".format(
+                api_error
+            )
+        )
+
+
+# Find and Return User IDs
+def get_user_ids(module: AnsibleModule, client: Client, usernames: list) -> dict:
+
+    try:
+
+        # Call Client
+        return client.user.get_user_ids(
+            usernames=usernames,
+            max_workers=module.params['max_workers']
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Users] - Failed Find Gitlab Users : {0}".format(
+                api_error
+            )
+        )
+
+
+# Apply Membership Operations
+def apply_members(module: AnsibleModule, client: Client, **operations):
+
+    try:
+
+        # Call Client
+        return client.member.apply_members(
+            max_workers=module.params['max_workers'],
+            **operations
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Apply Members] - Failed Apply Gitlab Groups Members : {0}".format(
+                api_error
+            )
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True, no_log=False),
+        access_token=dict(type='str', required=True, no_log=True),
+        groups=dict(
+            type='list',
+            elements='dict',
+            required=True,
+            options=dict(
+                group=dict(type='str', required=True, no_log=False),
+                members=dict(
+                    type='list',
+                    elements='dict',
+                    required=False,
+                    default=[],
+                    options=dict(
+                        username=dict(type='str', required=True, no_log=False),
+                        access_level=dict(
+                            type='str',
+                            required=False,
+                            default=None,
+                            choices=['minimal_access', 'guest', 'planner', 'reporter', 'developer', 'maintainer', 'owner']
+                        ),
+                        expires_at=dict(type='str', required=False, default=None, no_log=False),
+                        state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
+                    ),
+                    required_if=[
+                        ('state', 'present', ('access_level',))
+                    ]
+                ),
+                purge=dict(type='bool', required=False, default=False)
+            )
+        ),
+        max_workers=dict(type='int', required=False, default=8)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule) -> Client:
+
+    try:
+
+        # Build Client from Module
+        return gitlab_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build Gitlab API Client"
+        )
+
+
+# Resolve the Requested Expiry Date of a Member (None : Unchanged, Client CLEAR_EXPIRY : Removed)
+def resolve_expiry(client: Client, params: dict, raw_params) -> str:
+
+    # If Expiry Date is Set
+    if params['expires_at']:
+
+        # Return Expiry Date
+        return params['expires_at'].strip()
+
+    # If Expiry Date is Explicitly Set to null or Empty (Not Distinguishable from Unset after Validation)
+    if isinstance(raw_params, dict) and 'expires_at' in raw_params:
+
+        # Clear Expiry
+        return client.member.CLEAR_EXPIRY
+
+    # Keep Current Expiry
+    return None
+
+
+# Build Requested Memberships (Group ID -> (Requested Members by Username, Purge Flag))
+def build_requested_memberships(module: AnsibleModule, client: Client, groups: dict) -> dict:
+
+    # Initialize Memberships
+    memberships = {}
+
+    # Raw Groups Parameters (Explicit null Expiry Dates are Kept)
+    raw_groups = _load_params().get('groups', None)
+    raw_groups = raw_groups if isinstance(raw_groups, list) and len(raw_groups) == len(module.params['groups']) else None
+
+    # Iterate over Requested Groups (Groups Listed Twice are Merged, Last Member Definition Wins)
+    for index, params in enumerate(module.params['groups']):
+
+        # Find Group
+        group = groups[str(params['group']).strip()]
+
+        # Find or Initialize Group Membership
+        members, purge = memberships.get(group.id, ({}, False))
+
+        # Raw Members Parameters
+        raw_members = raw_groups[index].get('members', None) if raw_groups and isinstance(raw_groups[index], dict) else None
+        raw_members = raw_members if isinstance(raw_members, list) and len(raw_members) == len(params['members']) else None
+
+        # Add Requested Members (with Resolved Expiry Date)
+        members.update({
+            member['username'].strip().lower(): dict(
+                member,
+                expires_at=resolve_expiry(client, member, raw_members[position] if raw_members else None)
+            )
+            for position, member in enumerate(params['members'])
+        })
+
+        # Keep Membership
+        memberships[group.id] = (members, purge or params['purge'])
+
+    # Return Memberships
+    return memberships
+
+
+# Describe Membership Operation
+def describe_membership(group_path: str, member: Member) -> dict:
+
+    # Find Access Level Name
+    access_level = AccessLevel.from_level(member.access_level)
+
+    # Return Description
+    return dict(
+        group=group_path,
+        username=member.username,
+        access_level=access_level.value if access_level is not None else member.access_level
+    )
+
+
+# Remove the Last Direct Owner of a Group from the Purged Members
+def keep_last_owner(module: AnsibleModule, group_path: str, current_members: dict, requested_members: dict, purged: list) -> list:
+
+    # Owner Access Level
+    owner_level = AccessLevel.OWNER.level
+
+    # Purged Owners (Sorted, First is Kept if Needed)
+    purged_owners = sorted(
+        (member for member in purged if member.access_level == owner_level),
+        key=lambda member: member.username.lower()
+    )
+
+    # If no Owner is Purged
+    if not purged_owners:
+
+        # Keep Purge
+        return purged
+
+    # If a Listed Member Remains or Becomes an Owner (Owners are Granted before Removals, see apply_members)
+    if any(
+        params['state'] == 'present' and params['access_level'] == AccessLevel.OWNER.value
+        for params in requested_members.values()
+    ):
+
+        # Keep Purge
+        return purged
+
+    # Keep the First Purged Owner (no Listed Member Remains an Owner)
+    kept = purged_owners[0]
+    module.warn("[Purge Members] - Last Owner '{0}' of Group '{1}' is not Removed".format(kept.username, group_path))
+
+    # Return Purged Members without the Kept Owner
+    return [member for member in purged if member is not kept]
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: Client):
+
+    # Find Groups
+    groups = get_groups(module=module, client=client)
+
+    # Index Group Paths by ID
+    group_paths = {group.id: group.full_path for group in groups.values()}
+
+    # Build Requested Memberships
+    memberships = build_requested_memberships(module=module, client=client, groups=groups)
+
+    # Read Current Members of all Groups
+    members_index = get_members_index(module=module, client=client, group_ids=list(memberships.keys()))
+
+    # Find Users which are not Members Yet
+    new_usernames = [
+        username
+        for group_id, (members, purge) in memberships.items()
+        for username, params in members.items()
+        if params['state'] == 'present' and username not in members_index[group_id]
+    ]
+
+    # Resolve User IDs of Future Members
+    user_ids = get_user_ids(module=module, client=client, usernames=new_usernames) if new_usernames else {}
+
+    # Find Unknown Users
+    unknown_usernames = sorted(set(new_usernames) - set(user_ids.keys()))
+
+    # If Users are Unknown
+    if unknown_usernames:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Find Users] - Gitlab Users not Found : {0}".format(", ".join(unknown_usernames))
+        )
+
+    # Initialize Operations
+    to_add, to_update, to_remove = [], [], []
+
+    # Iterate over Memberships
+    for group_id, (members, purge) in memberships.items():
+
+        # Current Group Members
+        current_members = members_index[group_id]
+
+        # Iterate over Requested Members
+        for username, params in members.items():
+
+            # Find Current Member
+            current_member = current_members.get(username, None)
+
+            # If Member must be Removed
+            if params['state'] == 'absent':
+
+                # If User is a Member
+                if current_member is not None:
+
+                    # Remove Member
+                    to_remove.append((group_id, current_member))
+
+                # Next Member
+                continue
+
+            # Requested Access Level
+            access_level = AccessLevel(params['access_level']).level
+
+            # If User is not a Member
+            if current_member is None:
+
+                # Add Member (Without Expiry when Cleared)
+                to_add.append((group_id, Member(
+                    id=user_ids[username],
+                    username=params['username'].strip(),
+                    access_level=access_level,
+                    expires_at=params['expires_at'] or None
+                )))
+
+            # If Access Level or Expiry Date differs (Cleared Expiry Matches no Current Expiry)
+            elif current_member.access_level != access_level or (
+                params['expires_at'] is not None and params['expires_at'] != (current_member.expires_at or client.member.CLEAR_EXPIRY)
+            ):
+
+                # Update Member
+                to_update.append((group_id, Member(
+                    id=current_member.id,
+                    username=current_member.username,
+                    access_level=access_level,
+                    expires_at=params['expires_at']
+                )))
+
+        # If Unlisted Members must be Removed
+        if purge:
+
+            # Find Unlisted Members
+            purged = [current_member for username, current_member in current_members.items() if username not in members]
+
+            # Keep the Last Owner (Gitlab Groups need an Owner)
+            purged = keep_last_owner(
+                module=module,
+                group_path=group_paths[group_id],
+                current_members=current_members,
+                requested_members=members,
+                purged=purged
+            )
+
+            # Remove Unlisted Members
+            to_remove.extend((group_id, current_member) for current_member in purged)
+
+    # If Not in Check Mode
+    if not module.check_mode:
+
+        # Apply Operations
+        apply_members(
+            module=module,
+            client=client,
+            to_add=to_add,
+            to_update=to_update,
+            to_remove=[(group_id, member.id) for group_id, member in to_remove]
+        )
+
+    # Exit Module
+    module.exit_json(
+        changed=len(to_add) + len(to_update) + len(to_remove) > 0,
+        added=[describe_membership(group_paths[group_id], member) for group_id, member in to_add],
+        updated=[describe_membership(group_paths[group_id], member) for group_id, member in to_update],
+        removed=[describe_membership(group_paths[group_id], member) for group_id, member in to_remove],
+        msg="Gitlab Groups Members Synchronized ({0} Groups, {1} Added, {2} Updated, {3} Removed)".format(
+            len(memberships),
+            len(to_add),
+            len(to_update),
+            len(to_remove)
+        )
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build Client from Module
+    client = build_client(module)
+
+    # Execute Module
+    run_module(
+        module=module,
+        client=client
+    )
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
@@ -244,6 +244,7 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
 from ...module_utils.gitlab.client import UserClient, gitlab_client, Client
 from ...module_utils.gitlab.models import User
 from ...module_utils.commons import filter_none
@@ -504,6 +505,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module)
 
@@ -0,0 +1,409 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: users
+version_added: "1.0.0"
+short_description: Bulk User Management
+description:
+    - Used to Create, Update, Block and Unblock many Users in a single Task
+    - All Users are read once (Keyset Pagination) and indexed by Username, instead of one Search per User
+    - Operations are applied with bounded concurrency
+    - Requires an Administrator Access Token
+requirements:
+    - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    base_url:
+        description:
+        - The Gitlab API Base URL
+        required: true
+        type: str
+    access_token:
+        description:
+        - The Gitlab API Admin Access Token
+        required: true
+        type: str
+    users:
+        description:
+        - The Users to Manage
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            username:
+                description:
+                - The User Login.
+                required: true
+                type: str
+            name:
+                description:
+                - The User Name (Required for 'present' State).
+                required: false
+                type: str
+            email:
+                description:
+                - The User Private Email (Required for 'present' State).
+                required: false
+                type: str
+            password:
+                description:
+                - The User Password (Required for Creation, Sent on Update only with O(update_password=always)).
+                required: false
+                type: str
+            admin:
+                description:
+                - The User Admin Flag.
+                required: false
+                type: bool
+            external:
+                description:
+                - The User External Flag.
+                required: false
+                type: bool
+            can_create_group:
+                description:
+                - The User Create Group Enabled Flag.
+                required: false
+                type: bool
+            projects_limit:
+                description:
+                - The User Project Limit.
+                required: false
+                type: str
+            organization:
+                description:
+                - The User Organization.
+                required: false
+                type: str
+            job_title:
+                description:
+                - The User Job Title.
+                required: false
+                type: str
+            location:
+                description:
+                - The User Location.
+                required: false
+                type: str
+            public_email:
+                description:
+                - The User Public Email.
+                required: false
+                type: str
+            note:
+                description:
+                - The User Admin Note.
+                required: false
+                type: str
+            skip_confirmation:
+                description:
+                - The User Skip Confirmation Flag (Used for Creation).
+                required: false
+                type: bool
+            state:
+                description:
+                - The User State
+                required: false
+                choices: ['present', 'blocked']
+                default: 'present'
+                type: str
+    update_password:
+        description:
+        - Send the Password of Existing Users ('always') or only when Creating Users ('on_create')
+        required: false
+        choices: ['always', 'on_create']
+        default: 'on_create'
+        type: str
+    max_workers:
+        description:
+        - The Maximum Number of Concurrent API Requests
+        required: false
+        type: int
+        default: 8
+'''
+
+EXAMPLES = r'''
+- name: "Provision Gitlab Users"
+  kube_cloud.general.gitlab.users:
+    base_url: "https://gitlab.example.com"
+    access_token: "glat_cv182gTX22lMnB8876"
+    max_workers: 16
+    users:
+      - username: "jdoe"
+        name: "John Doe"
+        email: "jdoe@example.com"
+        password: "S3cr3t-P4ssw0rd"
+        skip_confirmation: true
+      - username: "leaver"
+        state: "blocked"
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.gitlab.client import UserClient, gitlab_client, Client
+from ...module_utils.gitlab.models import User
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Compared User Fields (Fields not Returned by the API are never Compared)
+COMPARED_FIELDS = [
+    "name", "email", "external", "can_create_group", "projects_limit",
+    "organization", "job_title", "location", "public_email", "note"
+]
+
+
+# Find and Return Users Index
+def get_users_index(module: AnsibleModule, client: UserClient) -> dict:
+
+    try:
+
+        # Call Client
+        return client.get_users_index()
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Users] - Failed List Gitlab Users : {0}".format(
+                api_error
+            )
+        )
+
+
+# Apply User Operations
+def apply_users(module: AnsibleModule, client: UserClient, **operations):
+
+    try:
+
+        # Call Client
+        return client.apply_users(
+            max_workers=module.params['max_workers'],
+            **operations
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Apply Users] - Failed Apply Gitlab Users : {0}".format(
+                api_error
+            )
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True, no_log=False),
+        access_token=dict(type='str', required=True, no_log=True),
+        users=dict(
+            type='list',
+            elements='dict',
+            required=True,
+            options=dict(
+                username=dict(type='str', required=True, no_log=False),
+                name=dict(type='str', required=False, default=None, no_log=False),
+                email=dict(type='str', required=False, default=None, no_log=False),
+                password=dict(type='str', required=False, default=None, no_log=True),
+                admin=dict(type='bool', required=False, default=None, no_log=False),
+                external=dict(type='bool', required=False, default=None, no_log=False),
+                can_create_group=dict(type='bool', required=False, default=None, no_log=False),
+                projects_limit=dict(type='str', required=False, default=None, no_log=False),
+                organization=dict(type='str', required=False, default=None, no_log=False),
+                job_title=dict(type='str', required=False, default=None, no_log=False),
+                location=dict(type='str', required=False, default=None, no_log=False),
+                public_email=dict(type='str', required=False, default=None, no_log=False),
+                note=dict(type='str', required=False, default=None, no_log=False),
+                skip_confirmation=dict(type='bool', required=False, default=None, no_log=False),
+                state=dict(type='str', required=False, default='present', choices=['present', 'blocked'])
+            ),
+            required_if=[
+                ('state', 'present', ('name', 'email'))
+            ]
+        ),
+        update_password=dict(type='str', required=False, default='on_create', choices=['always', 'on_create'], no_log=False),
+        max_workers=dict(type='int', required=False, default=8)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule) -> Client:
+
+    try:
+
+        # Build Client from Module
+        return gitlab_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build Gitlab API Client"
+        )
+
+
+# Build Requested User from Configuration
+def build_requested_user(params: dict) -> User:
+
+    # Build Requested Instance
+    return User(
+        **{k: v for k, v in params.items() if v is not None and k != 'state'}
+    )
+
+
+# Check if Existing User differs from Requested User
+def user_differs(existing_user: User, user: User) -> bool:
+
+    # Compare Requested Fields Returned by the API
+    return any(
+        getattr(user, name) is not None and
+        getattr(existing_user, name) is not None and
+        str(getattr(user, name)) != str(getattr(existing_user, name))
+        for name in COMPARED_FIELDS
+    ) or (user.admin is not None and existing_user.is_admin is not None and user.admin != existing_user.is_admin)
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, user_client: UserClient):
+
+    # Read all Users Once
+    existing_users = get_users_index(module=module, client=user_client)
+
+    # Initialize Operations
+    to_create, to_update, to_block, to_unblock = [], [], [], []
+
+    # Index Requested Users by Username (Last Definition Wins)
+    requested_users = {params['username'].strip().lower(): params for params in module.params['users']}
+
+    # Iterate over Requested Users
+    for username, params in requested_users.items():
+
+        # Find Existing Instance
+        existing_user = existing_users.get(username, None)
+
+        # If Requested State is 'blocked'
+        if params['state'] == 'blocked':
+
+            # If User Exists and is not Blocked
+            if existing_user is not None and existing_user.user_state != 'blocked':
+
+                # Block User
+                to_block.append(existing_user)
+
+            # Next User
+            continue
+
+        # Build Requested Instance
+        user = build_requested_user(dict(params, username=params['username'].strip()))
+
+        # If User don't exists
+        if existing_user is None:
+
+            # If Password is not Provided
+            if not user.password:
+
+                # Set Module Error
+                module.fail_json(
+                    msg="[Create User] - 'password' is required to Create Gitlab User [{0}]".format(user.username)
+                )
+
+            # Create User
+            to_create.append(user)
+
+            # Next User
+            continue
+
+        # If User is Blocked
+        if existing_user.user_state == 'blocked':
+
+            # Unblock User
+            to_unblock.append(existing_user)
+
+        # If Password must be Sent or User differs
+        if (user.password and module.params['update_password'] == 'always') or user_differs(existing_user, user):
+
+            # Set User ID and Drop Creation Only Fields
+            user.id = existing_user.id
+            user.skip_confirmation = None
+            if module.params['update_password'] != 'always':
+                user.password = None
+
+            # Update User
+            to_update.append(user)
+
+    # If Not in Check Mode
+    if not module.check_mode:
+
+        # Apply Operations
+        apply_users(
+            module=module,
+            client=user_client,
+            to_create=to_create,
+            to_update=to_update,
+            to_block=[user.id for user in to_block],
+            to_unblock=[user.id for user in to_unblock]
+        )
+
+    # Exit Module
+    module.exit_json(
+        changed=len(to_create) + len(to_update) + len(to_block) + len(to_unblock) > 0,
+        created=[user.username for user in to_create],
+        updated=[user.username for user in to_update],
+        blocked=[user.username for user in to_block],
+        unblocked=[user.username for user in to_unblock],
+        msg="Gitlab Users Reconciled ({0} Created, {1} Updated, {2} Blocked, {3} Unblocked, {4} Existing)".format(
+            len(to_create),
+            len(to_update),
+            len(to_block),
+            len(to_unblock),
+            len(existing_users)
+        )
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build Client from Module
+    client = build_client(module)
+
+    # Execute Module
+    run_module(
+        module=module,
+        user_client=client.user
+    )
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
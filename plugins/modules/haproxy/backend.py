@@ -41,6 +41,30 @@ options:
     required: false
     default: 'v2'
     type: str
+  worker:
+    description:
+      - Delegate the Data Plane API Requests to a Local Persistent Worker (Started on Demand, Reached over a Unix Socket)
+      - The Worker Keeps Pooled Connections and Cached Configuration Reads across Tasks (Requests fall back to the Module if it cannot be Reached)
+    required: false
+    default: false
+    type: bool
+  worker_socket:
+    description:
+      - The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR, or the Temporary Directory of the User)
+    required: false
+    type: str
+  worker_idle_timeout:
+    description:
+      - The Idle Delay (Seconds) after which a Started Worker Exits
+    required: false
+    default: 600
+    type: int
+  worker_cache_ttl:
+    description:
+      - The Time To Live (Seconds) of the Worker Cached Configuration Reads (Flushed on any Write through the Worker, 0 Disables the Cache)
+    required: false
+    default: 5
+    type: int
   name:
     description:
       - The HA Proxy Backend Name
@@ -326,6 +350,7 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
 from ...module_utils.haproxy.client_backends import BackendClient
 from ...module_utils.haproxy.client import haproxy_client
 from ...module_utils.haproxy.models import Balance, Backend, HttpHealthCheck, HttpCheckParams
@@ -333,6 +358,8 @@ from ...module_utils.haproxy.models import ForwardFor, PostgresSqlCheckParams, S
 from ...module_utils.haproxy.enums import ProxyProtocol, LoadBalancingAlgorithm, HealthCheckType
 from ...module_utils.haproxy.enums import MatchType, TimeoutStatus, ErrorStatus, OkStatus, HttpMethod
 from ...module_utils.haproxy.enums import AdvancedHealthCheckType, EnableDisableEnum, ConditionType
+from ...module_utils.haproxy.diff import diff_model, diff_output, normalize, unwrap_response
+from ...module_utils.haproxy.compact import CompactBackend, compact_from_api_response
 from ...module_utils.commons import filter_none
 
 try:
@@ -348,13 +375,16 @@ def get_backend(client: BackendClient, name: str):
     try:
 
         # Call Client
-        return client.get_backend(name=name)
+        response = client.get_backend(name=name)
 
     except HTTPError:
 
         # Return None
         return None
 
+    # Return Live Backend (Compact, Slotted Variant for the Diff Read Path)
+    return compact_from_api_response(CompactBackend, response) if response else None
+
 
 # Update Backend
 def update_backend(module: AnsibleModule, client: BackendClient, transaction_id: str, name: str, backend: Backend, force_reload: bool):
@@ -437,6 +467,10 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2', no_log=False),
+        worker=dict(type='bool', required=False, default=False),
+        worker_socket=dict(type='str', required=False, default=None, no_log=False),
+        worker_idle_timeout=dict(type='int', required=False, default=600),
+        worker_cache_ttl=dict(type='int', required=False, default=5),
         name=dict(type='str', required=True, no_log=False),
         mode=dict(type='str', required=False, default='HTTP', choices=ProxyProtocol.names(), no_log=False),
         adv_check=dict(type='str', required=False, choices=AdvancedHealthCheckType.names(), no_log=False),
@@ -723,8 +757,11 @@ def run_module(module: AnsibleModule, client: BackendClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_backend and state == 'present':
 
+        # Compute Changes (Only Requested Fields are Compared)
+        changes = diff_model(backend, existing_backend)
+
         # If Existing Instance match requested Instance
-        if existing_backend == backend:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -733,58 +770,71 @@ def run_module(module: AnsibleModule, client: BackendClient):
                 changed=False
             )
 
-        # Update Existing Instance
-        update_backend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=backend.name,
-            backend=backend,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_backend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=backend.name,
+                backend=backend,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
             changed=True,
             instance=filter_none(backend),
+            changes=changes,
+            diff=diff_output(changes),
             msg="Backend [{0} - {1}] Has Been Updated".format(backend.name, backend.mode)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_backend and state == 'present':
 
-        # Create Instance
-        create_backend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            backend=backend,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_backend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                backend=backend,
+                force_reload=force_reload
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
             changed=True,
             instance=filter_none(backend),
+            diff=dict(before={}, after=normalize(backend)),
             msg="[{0} - {1}] Has been Created".format(backend.name, backend.mode)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_backend and state == 'absent':
 
-        # Delete Instance
-        delete_backend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=backend.name,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_backend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=backend.name,
+                force_reload=force_reload
+            )
 
         # Exit Module
         module.exit_json(
             msg="[{0} - {1}] Has been Deleted".format(backend.name, backend.mode),
             instance=filter_none(backend),
+            diff=dict(before=normalize(unwrap_response(existing_backend)), after={}),
             changed=True
         )
 
@@ -805,6 +855,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).backend
 
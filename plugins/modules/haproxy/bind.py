@@ -41,6 +41,30 @@ options:
     required: false
     default: 'v2'
     type: str
+  worker:
+    description:
+      - Delegate the Data Plane API Requests to a Local Persistent Worker (Started on Demand, Reached over a Unix Socket)
+      - The Worker Keeps Pooled Connections and Cached Configuration Reads across Tasks (Requests fall back to the Module if it cannot be Reached)
+    required: false
+    default: false
+    type: bool
+  worker_socket:
+    description:
+      - The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR, or the Temporary Directory of the User)
+    required: false
+    type: str
+  worker_idle_timeout:
+    description:
+      - The Idle Delay (Seconds) after which a Started Worker Exits
+    required: false
+    default: 600
+    type: int
+  worker_cache_ttl:
+    description:
+      - The Time To Live (Seconds) of the Worker Cached Configuration Reads (Flushed on any Write through the Worker, 0 Disables the Cache)
+    required: false
+    default: 5
+    type: int
   parent_name:
     description:
       - The HA Proxy Bind Parent Name
@@ -356,10 +380,13 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
 from ...module_utils.haproxy.client_binds import BindClient
 from ...module_utils.haproxy.client import haproxy_client
 from ...module_utils.haproxy.models import Bind
 from ...module_utils.haproxy.enums import Requirement, SSLVersion, FrontendLevel
+from ...module_utils.haproxy.diff import diff_model, diff_output, normalize, unwrap_response
+from ...module_utils.haproxy.compact import CompactBind, compact_from_api_response
 from ...module_utils.commons import filter_none
 
 try:
@@ -375,7 +402,7 @@ def get_bind(client: BindClient, name: str, parent_name: str, parent_type: str):
     try:
 
         # Call Client
-        return client.get_bind(
+        response = client.get_bind(
             name=name,
             parent_name=parent_name,
             parent_type=parent_type
@@ -386,6 +413,9 @@ def get_bind(client: BindClient, name: str, parent_name: str, parent_type: str):
         # Return None
         return None
 
+    # Return Live Bind (Compact, Slotted Variant for the Diff Read Path)
+    return compact_from_api_response(CompactBind, response) if response else None
+
 
 # Update Bind
 def update_bind(module: AnsibleModule, client: BindClient, transaction_id: str, name: str,
@@ -479,6 +509,10 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2', no_log=False),
+        worker=dict(type='bool', required=False, default=False),
+        worker_socket=dict(type='str', required=False, default=None, no_log=False),
+        worker_idle_timeout=dict(type='int', required=False, default=600),
+        worker_cache_ttl=dict(type='int', required=False, default=5),
         parent_name=dict(type='str', required=True, no_log=False),
         parent_type=dict(type='str', required=False, default='frontend', choices=['frontend', 'backend'], no_log=False),
         name=dict(type='str', required=True, no_log=False),
@@ -626,8 +660,11 @@ def run_module(module: AnsibleModule, client: BindClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_bind and state == 'present':
 
+        # Compute Changes (Only Requested Fields are Compared)
+        changes = diff_model(bind, existing_bind)
+
         # If Existing Instance match requested Instance
-        if existing_bind == bind:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -638,20 +675,25 @@ def run_module(module: AnsibleModule, client: BindClient):
                 instance=filter_none(bind)
             )
 
-        # Update Existing Instance
-        update_bind(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=bind.name,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            bind=bind,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_bind(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=bind.name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                bind=bind,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=diff_output(changes),
             changed=True,
             parent_name=parent_name,
             parent_type=parent_type,
@@ -662,19 +704,23 @@ def run_module(module: AnsibleModule, client: BindClient):
     # If Requested State is 'present' and Instance don't exists
     if not existing_bind and state == 'present':
 
-        # Create Instance
-        create_bind(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            bind=bind,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_bind(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                bind=bind,
+                force_reload=force_reload
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=dict(before={}, after=normalize(bind)),
             changed=True,
             parent_name=parent_name,
             parent_type=parent_type,
@@ -685,19 +731,23 @@ def run_module(module: AnsibleModule, client: BindClient):
     # If Requested State is 'absent' and Instance exists
     if existing_bind and state == 'absent':
 
-        # Delete Instance
-        delete_bind(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=bind.name,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_bind(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=bind.name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            )
 
         # Exit Module
         module.exit_json(
+            diff=dict(before=normalize(unwrap_response(existing_bind)), after={}),
             msg="Bind [{0} - {1}/{2}] Has Been Deleted".format(bind.name, parent_name, parent_type),
             changed=True,
             parent_name=parent_name,
@@ -724,6 +774,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).bind
 
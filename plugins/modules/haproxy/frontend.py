@@ -41,6 +41,30 @@ options:
     required: false
     default: 'v2'
     type: str
+  worker:
+    description:
+      - Delegate the Data Plane API Requests to a Local Persistent Worker (Started on Demand, Reached over a Unix Socket)
+      - The Worker Keeps Pooled Connections and Cached Configuration Reads across Tasks (Requests fall back to the Module if it cannot be Reached)
+    required: false
+    default: false
+    type: bool
+  worker_socket:
+    description:
+      - The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR, or the Temporary Directory of the User)
+    required: false
+    type: str
+  worker_idle_timeout:
+    description:
+      - The Idle Delay (Seconds) after which a Started Worker Exits
+    required: false
+    default: 600
+    type: int
+  worker_cache_ttl:
+    description:
+      - The Time To Live (Seconds) of the Worker Cached Configuration Reads (Flushed on any Write through the Worker, 0 Disables the Cache)
+    required: false
+    default: 5
+    type: int
   name:
     description:
       - The HA Proxy Frontend Name
@@ -173,10 +197,12 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
 from ...module_utils.haproxy.client_frontends import FrontendClient
 from ...module_utils.haproxy.client import haproxy_client
 from ...module_utils.haproxy.models import Frontend, ForwardFor, StatsOptions, StatsAuth
 from ...module_utils.haproxy.enums import ProxyProtocol, EnableDisableEnum, ConditionType
+from ...module_utils.haproxy.diff import diff_model, diff_output, normalize, unwrap_response
 from ...module_utils.commons import filter_none
 
 try:
@@ -281,6 +307,10 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2', no_log=False),
+        worker=dict(type='bool', required=False, default=False),
+        worker_socket=dict(type='str', required=False, default=None, no_log=False),
+        worker_idle_timeout=dict(type='int', required=False, default=600),
+        worker_cache_ttl=dict(type='int', required=False, default=5),
         name=dict(type='str', required=True, no_log=False),
         mode=dict(type='str', required=False, default='HTTP', choices=['HTTP', 'TCP'], no_log=False),
         default_backend=dict(type='str', required=False, default=None, no_log=False),
@@ -450,8 +480,11 @@ def run_module(module: AnsibleModule, client: FrontendClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_frontend and state == 'present':
 
+        # Compute Changes (Only Requested Fields are Compared)
+        changes = diff_model(frontend, existing_frontend)
+
         # If Existing Instance match requested Instance
-        if existing_frontend == frontend:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -460,18 +493,23 @@ def run_module(module: AnsibleModule, client: FrontendClient):
                 changed=False
             )
 
-        # Update Existing Instance
-        update_frontend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=frontend.name,
-            frontend=frontend,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_frontend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=frontend.name,
+                frontend=frontend,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=diff_output(changes),
             changed=True,
             instance=filter_none(frontend),
             msg="Frontend [{0} - {1}] Has Been Updated".format(frontend.name, frontend.mode)
@@ -480,17 +518,21 @@ def run_module(module: AnsibleModule, client: FrontendClient):
     # If Requested State is 'present' and Instance don't exists
     if not existing_frontend and state == 'present':
 
-        # Create Instance
-        create_frontend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            frontend=frontend,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_frontend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                frontend=frontend,
+                force_reload=force_reload
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=dict(before={}, after=normalize(frontend)),
             changed=True,
             instance=filter_none(frontend),
             msg="[{0} - {1}] Has been Created".format(frontend.name, frontend.mode)
@@ -499,17 +541,21 @@ def run_module(module: AnsibleModule, client: FrontendClient):
     # If Requested State is 'absent' and Instance exists
     if existing_frontend and state == 'absent':
 
-        # Delete Instance
-        delete_frontend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=frontend.name,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_frontend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=frontend.name,
+                force_reload=force_reload
+            )
 
         # Exit Module
         module.exit_json(
+            diff=dict(before=normalize(unwrap_response(existing_frontend)), after={}),
             msg="[{0} - {1}] Has been Deleted".format(frontend.name, frontend.mode),
             instance=filter_none(frontend),
             changed=True
@@ -532,6 +578,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).frontend
 
@@ -41,6 +41,30 @@ options:
         required: false
         default: 'v2'
         type: str
+    worker:
+        description:
+        - Delegate the Data Plane API Requests to a Local Persistent Worker (Started on Demand, Reached over a Unix Socket)
+        - The Worker Keeps Pooled Connections and Cached Configuration Reads across Tasks (Requests fall back to the Module if it cannot be Reached)
+        required: false
+        default: false
+        type: bool
+    worker_socket:
+        description:
+        - The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR, or the Temporary Directory of the User)
+        required: false
+        type: str
+    worker_idle_timeout:
+        description:
+        - The Idle Delay (Seconds) after which a Started Worker Exits
+        required: false
+        default: 600
+        type: int
+    worker_cache_ttl:
+        description:
+        - The Time To Live (Seconds) of the Worker Cached Configuration Reads (Flushed on any Write through the Worker, 0 Disables the Cache)
+        required: false
+        default: 5
+        type: int
     transaction_id:
         description:
         - The Transaction ID
@@ -354,10 +378,13 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
 from ...module_utils.haproxy.client_servers import ServerClient
 from ...module_utils.haproxy.models import Server
 from ...module_utils.haproxy.client import haproxy_client
 from ...module_utils.haproxy.enums import WebSocketProtocol, Requirement, EnableDisableEnum, SSLVersion
+from ...module_utils.haproxy.diff import diff_model, diff_output, normalize, unwrap_response
+from ...module_utils.haproxy.compact import CompactServer, compact_from_api_response
 from ...module_utils.commons import filter_none
 
 try:
@@ -373,7 +400,7 @@ def get_server(client: ServerClient, name: str, parent_name: str, parent_type: s
     try:
 
         # Call Client
-        return client.get_server(
+        response = client.get_server(
             name=name,
             parent_name=parent_name,
             parent_type=parent_type
@@ -384,6 +411,9 @@ def get_server(client: ServerClient, name: str, parent_name: str, parent_type: s
         # Return None
         return None
 
+    # Return Live Server (Compact, Slotted Variant for the Diff Read Path)
+    return compact_from_api_response(CompactServer, response) if response else None
+
 
 # Update Server
 def update_server(module: AnsibleModule, client: ServerClient, transaction_id: str,
@@ -479,6 +509,10 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2', no_log=False),
+        worker=dict(type='bool', required=False, default=False),
+        worker_socket=dict(type='str', required=False, default=None, no_log=False),
+        worker_idle_timeout=dict(type='int', required=False, default=600),
+        worker_cache_ttl=dict(type='int', required=False, default=5),
         transaction_id=dict(type='str', required=False, default='', no_log=False),
         force_reload=dict(type='bool', required=False, default=True, no_log=False),
         parent_name=dict(type='str', required=True, no_log=False),
@@ -633,8 +667,11 @@ def run_module(module: AnsibleModule, client: ServerClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_instance and state == 'present':
 
+        # Compute Changes (Only Requested Fields are Compared)
+        changes = diff_model(server, existing_instance)
+
         # If Existing Instance match requested Instance
-        if existing_instance == name:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -649,20 +686,25 @@ def run_module(module: AnsibleModule, client: ServerClient):
                 changed=False
             )
 
-        # Update Existing Instance
-        update_server(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            server=server,
-            name=name,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            force_reload=force_reload
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_server(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                server=server,
+                name=name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=diff_output(changes),
             changed=True,
             instance=filter_none(server),
             parent_name=parent_name,
@@ -677,19 +719,23 @@ def run_module(module: AnsibleModule, client: ServerClient):
     # If Requested State is 'present' and Instance don't exists
     if not existing_instance and state == 'present':
 
-        # Create Instance
-        create_server(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            server=server
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_server(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                server=server
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=dict(before={}, after=normalize(server)),
             changed=True,
             instance=filter_none(server),
             parent_name=parent_name,
@@ -704,19 +750,23 @@ def run_module(module: AnsibleModule, client: ServerClient):
     # If Requested State is 'absent' and Instance exists
     if existing_instance and state == 'absent':
 
-        # Delete Instance
-        delete_server(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            name=server.name,
-            parent_name=parent_name,
-            parent_type=parent_type
-        )
+        # If Not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_server(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                name=server.name,
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
 
         # Exit Module
         module.exit_json(
+            diff=dict(before=normalize(unwrap_response(existing_instance)), after={}),
             changed=True,
             instance=filter_none(server),
             parent_name=parent_name,
@@ -751,6 +801,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).server
 
@@ -41,6 +41,30 @@ options:
     required: false
     default: 'v2'
     type: str
+  worker:
+    description:
+      - Delegate the Data Plane API Requests to a Local Persistent Worker (Started on Demand, Reached over a Unix Socket)
+      - The Worker Keeps Pooled Connections and Cached Configuration Reads across Tasks (Requests fall back to the Module if it cannot be Reached)
+    required: false
+    default: false
+    type: bool
+  worker_socket:
+    description:
+      - The Worker Unix Socket Path (Default under XDG_RUNTIME_DIR, or the Temporary Directory of the User)
+    required: false
+    type: str
+  worker_idle_timeout:
+    description:
+      - The Idle Delay (Seconds) after which a Started Worker Exits
+    required: false
+    default: 600
+    type: int
+  worker_cache_ttl:
+    description:
+      - The Time To Live (Seconds) of the Worker Cached Configuration Reads (Flushed on any Write through the Worker, 0 Disables the Cache)
+    required: false
+    default: 5
+    type: int
   name:
     description:
       - The Certificate Name
@@ -97,6 +121,7 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
 from ...module_utils.haproxy.client_ssl_certificates import SslCertificateClient
 from ...module_utils.haproxy.client import haproxy_client
 
@@ -200,6 +225,10 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2', no_log=False),
+        worker=dict(type='bool', required=False, default=False),
+        worker_socket=dict(type='str', required=False, default=None, no_log=False),
+        worker_idle_timeout=dict(type='int', required=False, default=600),
+        worker_cache_ttl=dict(type='int', required=False, default=5),
         name=dict(type='str', required=True, no_log=False),
         path=dict(type='str', required=False, default="", no_log=False),
         force_update=dict(type='bool', required=False, default=True, no_log=False),
@@ -336,6 +365,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).ssl_certificate
 
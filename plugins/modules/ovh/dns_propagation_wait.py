@@ -0,0 +1,266 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: dns_propagation_wait
+version_added: "1.0.0"
+short_description: Wait until TXT values are visible on all the authoritative nameservers of a zone
+description:
+    - Used to Wait until a TXT Record (eg. an ACME DNS-01 Challenge) is Served by all the Authoritative Nameservers of its Zone
+    - The NS Set of the Zone is Resolved through the Recursive Resolvers, then all Nameservers are Queried Concurrently (Without Recursion)
+    - The Nameservers not Serving the Values Yet are Polled again with exponential backoff and jitter, until a total deadline
+    - Queries are Sent with dnspython (UDP, with TCP Fallback on Truncated Responses)
+    - Return the Propagation Details (attempts, elapsed_ms, nameservers)
+requirements:
+    - dnspython
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    zone:
+        description:
+            - The Zone whose NS Set is Queried (Required when O(nameservers) is not Set)
+        required: false
+        type: str
+    record:
+        description:
+            - The Fully Qualified Name of the TXT Record (eg. '_acme-challenge.www.kube-cloud.com')
+        required: true
+        type: str
+    values:
+        description:
+            - The TXT Values which must be Visible (Other Values are Ignored)
+        required: true
+        type: list
+        elements: str
+    nameservers:
+        description:
+            - The Nameservers to Query (Host Names or Addresses), instead of the NS Set of O(zone)
+        required: false
+        type: list
+        elements: str
+    resolvers:
+        description:
+            - The Recursive Resolvers used to Resolve the NS Set and the Nameserver Addresses (Default from /etc/resolv.conf)
+        required: false
+        type: list
+        elements: str
+    port:
+        description:
+            - The DNS Port of the Resolvers and Nameservers
+        required: false
+        type: int
+        default: 53
+    timeout:
+        description:
+            - The Total Deadline (Seconds)
+        required: false
+        type: int
+        default: 300
+    initial_delay:
+        description:
+            - The First Delay between two Polls (Seconds)
+        required: false
+        type: float
+        default: 1
+    max_delay:
+        description:
+            - The Maximum Delay between two Polls (Seconds)
+        required: false
+        type: float
+        default: 30
+    backoff_factor:
+        description:
+            - The Delay Multiplier applied after each Poll
+        required: false
+        type: float
+        default: 2
+    jitter:
+        description:
+            - The Random Fraction (between 0 and 1) removed from each Delay
+        required: false
+        type: float
+        default: 0.5
+    query_timeout:
+        description:
+            - The Timeout of each DNS Query (Seconds)
+        required: false
+        type: float
+        default: 2
+    max_workers:
+        description:
+            - The Maximum Number of Concurrent DNS Queries
+        required: false
+        type: int
+        default: 8
+'''
+
+EXAMPLES = r'''
+- name: "Wait for ACME Challenge Propagation"
+  kube_cloud.general.ovh.dns_propagation_wait:
+    zone: "kube-cloud.com"
+    record: "_acme-challenge.www.kube-cloud.com"
+    values:
+      - "LHDhK3oGRvkiefQnx7OOczTY5Tic_xZ6HcMOc_gmtoM"
+    timeout: 600
+  register: acme_propagation
+
+- name: "Wait on a Local Stub Nameserver"
+  kube_cloud.general.ovh.dns_propagation_wait:
+    record: "_acme-challenge.kube-cloud.test"
+    values:
+      - "token"
+    nameservers:
+      - "127.0.0.1"
+    port: 5353
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.ovh.dns_resolver import HAS_DNSPYTHON, PropagationWaiter, DnsQueryError
+
+
+# Find and Return the Nameserver Addresses by Host
+def find_nameservers(module: AnsibleModule, waiter: PropagationWaiter) -> dict:
+
+    try:
+
+        # If Nameservers are Provided
+        if module.params['nameservers']:
+
+            # Resolve Provided Nameservers
+            return waiter.resolve_addresses(module.params['nameservers'], max_workers=module.params['max_workers'])
+
+        # Resolve NS Set of the Zone
+        return waiter.find_nameservers(module.params['zone'], max_workers=module.params['max_workers'])
+
+    except DnsQueryError as query_error:
+
+        # Set Module Error
+        module.fail_json(msg="[Find Nameservers] - Failed to Resolve Nameservers : {0}".format(query_error))
+
+
+# Wait for Propagation
+def wait_propagation(module: AnsibleModule, waiter: PropagationWaiter, nameservers: dict) -> dict:
+
+    try:
+
+        # Wait for Values
+        return waiter.wait_txt(
+            name=module.params['record'],
+            values=module.params['values'],
+            nameservers=nameservers,
+            timeout=module.params['timeout'],
+            initial_delay=module.params['initial_delay'],
+            max_delay=module.params['max_delay'],
+            backoff_factor=module.params['backoff_factor'],
+            jitter=module.params['jitter'],
+            max_workers=module.params['max_workers']
+        )
+
+    except TimeoutError as wait_error:
+
+        # Set Module Error
+        module.fail_json(msg="[Wait Propagation] - {0}".format(wait_error))
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        zone=dict(type='str', required=False, default=None),
+        record=dict(type='str', required=True),
+        values=dict(type='list', elements='str', required=True, no_log=False),
+        nameservers=dict(type='list', elements='str', required=False, default=None),
+        resolvers=dict(type='list', elements='str', required=False, default=None),
+        port=dict(type='int', required=False, default=53),
+        timeout=dict(type='int', required=False, default=300),
+        initial_delay=dict(type='float', required=False, default=1),
+        max_delay=dict(type='float', required=False, default=30),
+        backoff_factor=dict(type='float', required=False, default=2),
+        jitter=dict(type='float', required=False, default=0.5),
+        query_timeout=dict(type='float', required=False, default=2),
+        max_workers=dict(type='int', required=False, default=8)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        required_one_of=[('zone', 'nameservers')],
+        supports_check_mode=True
+    )
+
+
+# Instantiate Waiter
+def build_waiter(module: AnsibleModule) -> PropagationWaiter:
+
+    # If dnspython is Missing
+    if not HAS_DNSPYTHON:
+
+        # Set Module Error
+        module.fail_json(msg="[Build Waiter] - Python module dnspython is required")
+
+    try:
+
+        # Build Waiter from Module
+        return PropagationWaiter(
+            resolvers=module.params['resolvers'],
+            port=module.params['port'],
+            query_timeout=module.params['query_timeout']
+        )
+
+    except ValueError as waiter_error:
+
+        # Set Module Error
+        module.fail_json(msg="[Build Waiter] - {0}".format(waiter_error))
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, waiter: PropagationWaiter):
+
+    # Find Nameservers
+    nameservers = find_nameservers(module=module, waiter=waiter)
+
+    # Wait for Propagation
+    result = wait_propagation(module=module, waiter=waiter, nameservers=nameservers)
+
+    # Exit Module
+    module.exit_json(
+        changed=False,
+        msg="TXT {0} Visible on {1} Nameservers after {2} ms".format(
+            module.params['record'],
+            len(nameservers),
+            result['elapsed_ms']
+        ),
+        **result
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build Waiter from Module
+    waiter = build_waiter(module)
+
+    # Execute Module
+    run_module(module, waiter)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
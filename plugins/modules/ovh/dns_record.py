@@ -75,6 +75,26 @@ options:
         required: false
         default: 3600
         type: int
+    cache:
+        description:
+            - Cache the Account Zone List and the Zone Record IDs between Tasks (Zone Entries are Invalidated on Writes)
+            - Cached Entries may be Stale for up to O(cache_ttl) Seconds when the Zone is Changed outside Ansible (or by Tasks not using the Cache)
+            - Records may then be Resolved against Outdated Record IDs (Missed Creates, Updates or Deletes of Removed Records)
+            - Enable it only when the Zones are Managed by Ansible alone
+        required: false
+        default: false
+        type: bool
+    cache_path:
+        description:
+            - The Cache File Path (Default under the Temporary Directory of the User)
+        required: false
+        type: str
+    cache_ttl:
+        description:
+            - The Cache Entries Time To Live (Seconds)
+        required: false
+        default: 300
+        type: int
 '''
 
 EXAMPLES = r'''
@@ -92,7 +112,9 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ...module_utils.ovh.client import ovh_client
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.ovh.client import ovh_zone_client
+from ...module_utils.ovh.models import DnsRecord
 
 
 try:
@@ -102,26 +124,6 @@ except ImportError:
     HAS_OVH = False
 
 
-# OVH Zone URI
-OVH_ZONE_URI = "/domain/zone"
-
-
-# Zone Refresh URI
-OVH_ZONE_REFRESH_URI = "/domain/zone/{0}/refresh"
-
-
-# OVH Record Resource URI
-OVH_RECORD_URI = "/domain/zone/{0}/record/{1}"
-
-
-# OVH Record Creation Resource URI
-CREATE_OVH_RECORD_URI = "/domain/zone/{0}/record"
-
-
-# OVH Record ID Resource URI
-GET_OVH_RECORD_ID_URI = "/domain/zone/{0}/record"
-
-
 # Instantiate Ansible Module
 def build_ansible_module():
 
@@ -139,7 +141,10 @@ def build_ansible_module():
         ], no_log=False),
         target=dict(type='str', required=True, no_log=False),
         ttl=dict(type='int', default=3600, no_log=False),
-        state=dict(type='str', default='present', choices=['present', 'absent'])
+        state=dict(type='str', default='present', choices=['present', 'absent']),
+        cache=dict(type='bool', required=False, default=False),
+        cache_path=dict(type='str', required=False, default=None, no_log=False),
+        cache_ttl=dict(type='int', required=False, default=300)
     )
 
     # Build ansible Module
@@ -154,8 +159,8 @@ def check_ovh_zone(module, client, zone_name):
 
     try:
 
-        # Find OVH Account Domain
-        available_domains = client.get(OVH_ZONE_URI)
+        # Find OVH Account Domain (Cached)
+        available_domains = client.list_zones()
 
         # If Module domain is not managed on OVH Account
         if zone_name not in available_domains:
@@ -175,9 +180,7 @@ def refresh_ovh_zone(module, client, zone_name):
     try:
 
         # Refresh Domain
-        client.post(
-            OVH_ZONE_REFRESH_URI.format(zone_name)
-        )
+        client.refresh_zone(zone_name)
 
     except APIError as api_error:
 
@@ -190,11 +193,11 @@ def get_ovh_record_id(module, client, domain, record_name, record_type):
 
     try:
 
-        # Find if Target record Name already exists
-        return client.get(
-            GET_OVH_RECORD_ID_URI.format(domain),
-            fieldType=record_type,
-            subDomain=record_name
+        # Find if Target record Name already exists (Cached)
+        return client.list_record_ids(
+            domain,
+            field_type=record_type,
+            sub_domain=record_name
         )
 
     except APIError as api_error:
@@ -215,9 +218,7 @@ def get_ovh_record(module, client, domain, record_id):
     try:
 
         # Get Current Entry Details
-        return client.get(
-            OVH_RECORD_URI.format(domain, record_id)
-        )
+        return client.get_record(domain, record_id)
 
     except APIError as api_error:
 
@@ -232,13 +233,15 @@ def create_ovh_record(module, client, domain, record_name, record_type, record_v
 
     try:
 
-        # Create record
-        client.post(
-            CREATE_OVH_RECORD_URI.format(domain),
-            fieldType=record_type,
-            subDomain=record_name,
-            target=record_value,
-            ttl=ttl
+        # Create record (Invalidates Cached Zone Entries)
+        client.create_record(
+            domain,
+            DnsRecord(
+                field_type=record_type,
+                sub_domain=record_name,
+                target=record_value,
+                ttl=ttl
+            )
         )
 
     except APIError as api_error:
@@ -254,13 +257,16 @@ def update_ovh_record(module, client, domain, record_id, record_name, record_typ
 
     try:
 
-        # Update record
-        client.put(
-            OVH_RECORD_URI.format(domain, record_id),
-            fieldType=record_type,
-            subDomain=record_name,
-            target=record_value,
-            ttl=ttl
+        # Update record (Invalidates Cached Zone Entries)
+        client.update_record(
+            domain,
+            DnsRecord(
+                id=record_id,
+                field_type=record_type,
+                sub_domain=record_name,
+                target=record_value,
+                ttl=ttl
+            )
         )
 
     except APIError as api_error:
@@ -276,8 +282,8 @@ def delete_ovh_record(module, client, domain, record_id):
 
     try:
 
-        # Delete record
-        client.delete(OVH_RECORD_URI.format(domain, record_id))
+        # Delete record (Invalidates Cached Zone Entries)
+        client.delete_record(domain, record_id)
 
     except APIError as api_error:
 
@@ -314,7 +320,7 @@ def run_module(module, client):
         record = get_ovh_record(module, client, domain, record_id)
 
         # If Entry match requested record name and target
-        if record['target'] == target and record['ttl'] == ttl:
+        if record.target == target and record.ttl == ttl:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -380,8 +386,11 @@ def main():
     # Build Module
     module = build_ansible_module()
 
-    # Build OVH Client from Module
-    client = ovh_client(module)
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build OVH Zone Client from Module
+    client = ovh_zone_client(module)
 
     # Execute Module
     run_module(module, client)
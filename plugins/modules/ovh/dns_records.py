@@ -0,0 +1,465 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: dns_records
+version_added: "1.0.0"
+short_description: Manage many DNS zone records
+description:
+    - Used to Manage many DNS Records on OVH Cloud in a single Task
+    - The Account Zones are listed Once, the Record IDs of each Zone are listed Once and their Details are fetched concurrently
+    - Only the Differences are written (concurrently), then each Changed Zone is Refreshed exactly Once
+    - Records sharing a Name and a Type (eg. many TXT Values) are matched by Value first
+requirements:
+    - ovh >= 0.5.0
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    endpoint:
+        description:
+            - The OVH API Endpoint
+        required: true
+        type: str
+    application_key:
+        description:
+            - The OVH API Application Key
+        required: true
+        type: str
+    application_secret:
+        description:
+            - The OVH API Application Secret
+        required: true
+        type: str
+    consumer_key:
+        description:
+            - The OVH API Consumer Key
+        required: true
+        type: str
+    domain:
+        description:
+            - The default targeted domain (Zone) of the Records
+        required: false
+        type: str
+    records:
+        description:
+            - The Records to Manage
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            domain:
+                description:
+                    - The targeted domain (Zone), Default to O(domain)
+                required: false
+                type: str
+            record_name:
+                description:
+                    - The name of record in the zone ('' for the Zone Apex)
+                required: true
+                type: str
+            record_type:
+                description:
+                    - The DNS record type
+                choices: ['A', 'AAAA', 'CAA', 'CNAME', 'DKIM', 'DMARC', 'DNAME', 'LOC', 'MX', 'NAPTR', 'NS', 'PTR', 'SPF', 'SRV', 'SSHFP', 'TLSA', 'TXT']
+                default: A
+                type: str
+            target:
+                description:
+                    - The value of the record (Required for 'present' State)
+                    - For 'absent' State, only the Records with this Value are Deleted (All Values when not Set)
+                required: false
+                type: str
+            ttl:
+                description:
+                    - TTL associated with the DNS record
+                required: false
+                default: 3600
+                type: int
+            state:
+                description:
+                    - Wether to add or delete the record
+                required: false
+                default: present
+                choices: ['present', 'absent']
+                type: str
+    max_workers:
+        description:
+            - The Maximum Number of Concurrent API Requests
+        required: false
+        default: 8
+        type: int
+    cache:
+        description:
+            - Cache the Account Zone List and the Zone Records between Tasks (Zone Entries are Invalidated on Writes)
+            - Cached Entries may be Stale for up to O(cache_ttl) Seconds when the Zone is Changed outside Ansible (or by Tasks not using the Cache)
+            - Records may then be Resolved against Outdated Record IDs (Missed Creates, Updates or Deletes of Removed Records)
+            - Enable it only when the Zones are Managed by Ansible alone
+        required: false
+        default: false
+        type: bool
+    cache_path:
+        description:
+            - The Cache File Path (Default under the Temporary Directory of the User)
+        required: false
+        type: str
+    cache_ttl:
+        description:
+            - The Cache Entries Time To Live (Seconds)
+        required: false
+        default: 300
+        type: int
+'''
+
+EXAMPLES = r'''
+- name: "Synchronize OVH DNS Records"
+  kube_cloud.general.ovh.dns_records:
+    endpoint: "ovh-eu"
+    application_key: "2566789999999999"
+    application_secret: "me4567009132467nhst5"
+    consumer_key: "po230O851Ujjhr3"
+    domain: "kube-cloud.com"
+    records:
+      - record_name: "www"
+        record_type: "A"
+        target: "203.0.113.10"
+      - record_name: "_acme-challenge"
+        record_type: "TXT"
+        target: "first-token"
+        ttl: 60
+      - record_name: "_acme-challenge"
+        record_type: "TXT"
+        target: "second-token"
+        ttl: 60
+      - record_name: "legacy"
+        record_type: "CNAME"
+        state: "absent"
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.ovh.client import ovh_zone_client
+from ...module_utils.ovh.models import DnsRecord
+
+
+try:
+    from ovh.exceptions import APIError
+    HAS_OVH = True
+except ImportError:
+    HAS_OVH = False
+
+
+# Record Types with Quoted Values (OVH may return them Quoted)
+QUOTED_RECORD_TYPES = ['TXT', 'SPF', 'DKIM', 'DMARC']
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        endpoint=dict(type='str', required=True, no_log=False),
+        application_key=dict(type='str', required=True, no_log=True),
+        application_secret=dict(type='str', required=True, no_log=True),
+        consumer_key=dict(type='str', required=True, no_log=True),
+        domain=dict(type='str', required=False, default=None, no_log=False),
+        records=dict(
+            type='list',
+            elements='dict',
+            required=True,
+            options=dict(
+                domain=dict(type='str', required=False, default=None, no_log=False),
+                record_name=dict(type='str', required=True, no_log=False),
+                record_type=dict(type='str', default='A', choices=[
+                    'A', 'AAAA', 'CAA', 'CNAME', 'DKIM', 'DMARC', 'DNAME', 'LOC',
+                    'MX', 'NAPTR', 'NS', 'PTR', 'SPF', 'SRV', 'SSHFP', 'TLSA', 'TXT'
+                ], no_log=False),
+                target=dict(type='str', required=False, default=None, no_log=False),
+                ttl=dict(type='int', default=3600, no_log=False),
+                state=dict(type='str', default='present', choices=['present', 'absent'])
+            ),
+            required_if=[
+                ('state', 'present', ('target',))
+            ]
+        ),
+        max_workers=dict(type='int', required=False, default=8),
+        cache=dict(type='bool', required=False, default=False),
+        cache_path=dict(type='str', required=False, default=None, no_log=False),
+        cache_ttl=dict(type='int', required=False, default=300)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Find and Return OVH Account Zones
+def list_ovh_zones(module, client):
+
+    try:
+
+        # Find OVH Account Zones
+        return client.list_zones()
+
+    except APIError as api_error:
+
+        # Set Module Error
+        module.fail_json(msg="[Find Zone] - Failed to call OVH API (GET /domain/zone) : {0}".format(api_error))
+
+
+# Find and Return OVH Zone Records Index
+def get_ovh_records_index(module, client, zone_name):
+
+    try:
+
+        # Find Zone Records
+        return client.get_records_index(zone_name, max_workers=module.params['max_workers'])
+
+    except APIError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Find Records] - Failed to call OVH API (GET /domain/zone/{0}/record) : {1}".format(zone_name, api_error)
+        )
+
+
+# Apply OVH Zone Record Operations
+def apply_ovh_records(module, client, zone_name, **operations):
+
+    try:
+
+        # Apply Operations and Refresh Zone
+        return client.apply_records(zone_name, max_workers=module.params['max_workers'], **operations)
+
+    except APIError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Apply Records] - Failed to call OVH API (Zone {0}) : {1}".format(zone_name, api_error)
+        )
+
+
+# Normalize Record Value
+def normalize_target(field_type, target):
+
+    # Unquote Values of Record Types which may be Quoted
+    return (target or '').strip('"') if field_type in QUOTED_RECORD_TYPES else target
+
+
+# Check if Record Values are Equal
+def same_target(field_type, target, other_target):
+
+    # Compare Normalized Values
+    return normalize_target(field_type, target) == normalize_target(field_type, other_target)
+
+
+# Compute Record Operations of a Zone
+def compute_zone_changes(requested_records, existing_index):
+
+    # Initialize Operations
+    to_create, to_update, to_delete = [], [], []
+
+    # Group Requested Records by Key (Keep Order)
+    requested_keys = {}
+    for params in requested_records:
+        requested_keys.setdefault((params['record_name'].lower(), params['record_type'].upper()), []).append(params)
+
+    # Iterate over Requested Keys
+    for key, key_records in requested_keys.items():
+
+        # Existing Records not Matched Yet
+        remaining = list(existing_index.get(key, []))
+
+        # Requested Present Records (Deduplicated by Value, Last Definition Wins)
+        desired = {}
+        for params in key_records:
+            if params['state'] == 'present':
+                desired[normalize_target(key[1], params['target'])] = DnsRecord(
+                    sub_domain=params['record_name'],
+                    field_type=params['record_type'],
+                    target=params['target'],
+                    ttl=params['ttl']
+                )
+
+        # Unmatched Requested Records
+        unmatched = []
+
+        # Match Requested Records with Existing Records of Same Value
+        for record in desired.values():
+
+            # Find Existing Record of Same Value
+            existing = next((item for item in remaining if same_target(key[1], item.target, record.target)), None)
+
+            # If Not Found
+            if existing is None:
+
+                # Keep Unmatched
+                unmatched.append(record)
+
+                # Next Record
+                continue
+
+            # Consume Existing Record
+            remaining.remove(existing)
+
+            # If TTL differs
+            if existing.ttl != record.ttl:
+
+                # Update Record
+                record.id = existing.id
+                to_update.append(record)
+
+        # Reuse Remaining Existing Records, then Create
+        for record in unmatched:
+
+            # If an Existing Record Remains
+            if remaining:
+
+                # Update Record Value
+                record.id = remaining.pop(0).id
+                to_update.append(record)
+
+            else:
+
+                # Create Record
+                to_create.append(record)
+
+        # Iterate over Requested Absent Records
+        for params in key_records:
+
+            # If Record must be Kept
+            if params['state'] != 'absent':
+
+                # Next Record
+                continue
+
+            # Find Existing Records to Delete (All Values, or the Requested Value)
+            deleted = [
+                item for item in remaining
+                if params['target'] is None or same_target(key[1], item.target, params['target'])
+            ]
+
+            # Delete Records
+            to_delete.extend(deleted)
+            remaining = [item for item in remaining if item not in deleted]
+
+    # Return Operations
+    return to_create, to_update, to_delete
+
+
+# Describe Record
+def describe_record(zone_name, record):
+
+    # Return Description
+    return "{0} {1} {2}".format(
+        record.field_type,
+        "{0}.{1}".format(record.sub_domain, zone_name) if record.sub_domain else zone_name,
+        record.target
+    )
+
+
+# Porcess Module Execution
+def run_module(module, client):
+
+    # Group Requested Records by Zone (Keep Order)
+    zones = {}
+    for params in module.params['records']:
+
+        # Resolve Zone
+        zone_name = params['domain'] or module.params['domain']
+
+        # If Zone is not Provided
+        if not zone_name:
+
+            # Set Module Error
+            module.fail_json(msg="No target domain for the record [{0} {1}]".format(params['record_type'], params['record_name']))
+
+        # Add Record
+        zones.setdefault(zone_name, []).append(params)
+
+    # Find OVH Account Zones Once
+    available_zones = list_ovh_zones(module, client)
+
+    # Find Unknown Zones
+    unknown_zones = [zone_name for zone_name in zones if zone_name not in available_zones]
+
+    # If Zones are Unknown
+    if unknown_zones:
+
+        # Set Module Error
+        module.fail_json(msg="The target domain [{0}] is unknown".format(", ".join(unknown_zones)))
+
+    # Initialize Result
+    created, updated, deleted, refreshed = [], [], [], []
+
+    # Iterate over Zones
+    for zone_name, requested_records in zones.items():
+
+        # Find Zone Records (IDs Listed Once, Details Fetched Concurrently)
+        existing_index = get_ovh_records_index(module, client, zone_name)
+
+        # Compute Zone Operations
+        to_create, to_update, to_delete = compute_zone_changes(requested_records, existing_index)
+
+        # If Zone has Changes and Not in Check Mode
+        if (to_create or to_update or to_delete) and not module.check_mode:
+
+            # Apply Operations and Refresh Zone Once
+            apply_ovh_records(module, client, zone_name, to_create=to_create, to_update=to_update, to_delete=to_delete)
+
+        # If Zone has Changes
+        if to_create or to_update or to_delete:
+
+            # Keep Refreshed Zone
+            refreshed.append(zone_name)
+
+        # Describe Operations
+        created.extend(describe_record(zone_name, record) for record in to_create)
+        updated.extend(describe_record(zone_name, record) for record in to_update)
+        deleted.extend(describe_record(zone_name, record) for record in to_delete)
+
+    # Exit Module
+    module.exit_json(
+        changed=len(refreshed) > 0,
+        created=created,
+        updated=updated,
+        deleted=deleted,
+        refreshed_zones=refreshed,
+        msg="DNS Records Synchronized ({0} Created, {1} Updated, {2} Deleted, {3} Zones Refreshed)".format(
+            len(created),
+            len(updated),
+            len(deleted),
+            len(refreshed)
+        )
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build OVH Client from Module
+    client = ovh_zone_client(module)
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
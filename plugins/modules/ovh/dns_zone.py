@@ -0,0 +1,324 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: dns_zone
+version_added: "1.0.0"
+short_description: Manage the whole content of a DNS zone
+description:
+    - Used to Synchronize all Records of a DNS Zone on OVH Cloud (Records not Listed are Deleted)
+    - The Current Zone is read with a single Export, and compared with the Desired Records
+    - Small Changes are applied with Record Patches (and a single Zone Refresh), large Changes with a single Zone Import
+    - The SOA and the Apex NS Records are Kept, unless Apex NS Records are Listed
+requirements:
+    - ovh >= 0.5.0
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    endpoint:
+        description:
+            - The OVH API Endpoint
+        required: true
+        type: str
+    application_key:
+        description:
+            - The OVH API Application Key
+        required: true
+        type: str
+    application_secret:
+        description:
+            - The OVH API Application Secret
+        required: true
+        type: str
+    consumer_key:
+        description:
+            - The OVH API Consumer Key
+        required: true
+        type: str
+    domain:
+        description:
+            - The targeted domain (Zone)
+        required: true
+        type: str
+    records:
+        description:
+            - The Desired Records of the Zone
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            record_name:
+                description:
+                    - The name of record in the zone ('' for the Zone Apex)
+                required: true
+                type: str
+            record_type:
+                description:
+                    - The DNS record type
+                choices: ['A', 'AAAA', 'CAA', 'CNAME', 'DKIM', 'DMARC', 'DNAME', 'LOC', 'MX', 'NAPTR', 'NS', 'PTR', 'SPF', 'SRV', 'SSHFP', 'TLSA', 'TXT']
+                default: A
+                type: str
+            target:
+                description:
+                    - The value of the record
+                required: true
+                type: str
+            ttl:
+                description:
+                    - TTL associated with the DNS record (0 for the Zone Default TTL)
+                required: false
+                default: 0
+                type: int
+    import_threshold:
+        description:
+            - The Number of Record Changes from which the whole Zone is Imported instead of Patched
+        required: false
+        default: 20
+        type: int
+    max_workers:
+        description:
+            - The Maximum Number of Concurrent API Requests
+        required: false
+        default: 8
+        type: int
+    cache:
+        description:
+            - Use (and Invalidate) the Zone Cache shared with the OVH DNS Modules
+            - Cached Entries may be Stale for up to O(cache_ttl) Seconds when the Zone is Changed outside Ansible (or by Tasks not using the Cache)
+            - Records may then be Resolved against Outdated Record IDs (Missed Creates, Updates or Deletes of Removed Records)
+            - Enable it only when the Zones are Managed by Ansible alone
+        required: false
+        default: false
+        type: bool
+    cache_path:
+        description:
+            - The Cache File Path (Default under the Temporary Directory of the User)
+        required: false
+        type: str
+    cache_ttl:
+        description:
+            - The Cache Entries Time To Live (Seconds)
+        required: false
+        default: 300
+        type: int
+'''
+
+EXAMPLES = r'''
+- name: "Synchronize OVH DNS Zone"
+  kube_cloud.general.ovh.dns_zone:
+    endpoint: "ovh-eu"
+    application_key: "2566789999999999"
+    application_secret: "me4567009132467nhst5"
+    consumer_key: "po230O851Ujjhr3"
+    domain: "kube-cloud.com"
+    import_threshold: 50
+    records:
+      - record_name: ""
+        record_type: "A"
+        target: "203.0.113.10"
+      - record_name: "www"
+        record_type: "CNAME"
+        target: "kube-cloud.com."
+      - record_name: ""
+        record_type: "MX"
+        target: "1 mx1.mail.ovh.net."
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.ovh.client import ovh_zone_client
+from ...module_utils.ovh.models import DnsRecord
+from ...module_utils.ovh.zone_file import render_zone_file
+
+
+try:
+    from ovh.exceptions import APIError
+    HAS_OVH = True
+except ImportError:
+    HAS_OVH = False
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        endpoint=dict(type='str', required=True, no_log=False),
+        application_key=dict(type='str', required=True, no_log=True),
+        application_secret=dict(type='str', required=True, no_log=True),
+        consumer_key=dict(type='str', required=True, no_log=True),
+        domain=dict(type='str', required=True, no_log=False),
+        records=dict(
+            type='list',
+            elements='dict',
+            required=True,
+            options=dict(
+                record_name=dict(type='str', required=True, no_log=False),
+                record_type=dict(type='str', default='A', choices=[
+                    'A', 'AAAA', 'CAA', 'CNAME', 'DKIM', 'DMARC', 'DNAME', 'LOC',
+                    'MX', 'NAPTR', 'NS', 'PTR', 'SPF', 'SRV', 'SSHFP', 'TLSA', 'TXT'
+                ], no_log=False),
+                target=dict(type='str', required=True, no_log=False),
+                ttl=dict(type='int', default=0, no_log=False)
+            )
+        ),
+        import_threshold=dict(type='int', required=False, default=20),
+        max_workers=dict(type='int', required=False, default=8),
+        cache=dict(type='bool', required=False, default=False),
+        cache_path=dict(type='str', required=False, default=None, no_log=False),
+        cache_ttl=dict(type='int', required=False, default=300)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Export and Return OVH Zone
+def export_ovh_zone(module, client, zone_name):
+
+    try:
+
+        # Export Zone
+        return client.export_zone(zone_name)
+
+    except APIError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Export Zone] - Failed to call OVH API (GET /domain/zone/{0}/export) : {1}".format(zone_name, api_error)
+        )
+
+    except ValueError as parse_error:
+
+        # Set Module Error
+        module.fail_json(msg="[Export Zone] - Failed to parse Zone [{0}] : {1}".format(zone_name, parse_error))
+
+
+# Apply OVH Zone Plan
+def apply_ovh_zone_plan(module, client, zone_name, plan):
+
+    try:
+
+        # Apply Plan
+        return client.apply_zone_plan(
+            zone_name,
+            plan,
+            import_threshold=module.params['import_threshold'],
+            max_workers=module.params['max_workers']
+        )
+
+    except APIError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Apply Zone] - Failed to call OVH API (Zone {0}) : {1}".format(zone_name, api_error)
+        )
+
+
+# Describe Record
+def describe_record(zone_name, record):
+
+    # Return Description
+    return "{0} {1} {2}".format(
+        record.field_type,
+        "{0}.{1}".format(record.sub_domain, zone_name) if record.sub_domain else zone_name,
+        record.target
+    )
+
+
+# Porcess Module Execution
+def run_module(module, client):
+
+    # Extract Zone
+    zone_name = module.params['domain']
+
+    # Check OVH Zone
+    if zone_name not in client.list_zones():
+
+        # Set Module Error
+        module.fail_json(msg="The target domain [{0}] is unknown".format(zone_name))
+
+    # Export Current Zone
+    current = export_ovh_zone(module, client, zone_name)
+
+    # Build Desired Records
+    desired_records = [
+        DnsRecord(
+            sub_domain=params['record_name'],
+            field_type=params['record_type'],
+            target=params['target'],
+            ttl=params['ttl'],
+            zone=zone_name
+        )
+        for params in module.params['records']
+    ]
+
+    # Compute Plan
+    plan = client.plan_zone(current, desired_records)
+
+    # Compute Strategy (Check Mode) or Apply Plan
+    if module.check_mode:
+        strategy = 'none' if plan.size == 0 else ('import' if plan.size >= module.params['import_threshold'] else 'patch')
+    else:
+        strategy = apply_ovh_zone_plan(module, client, zone_name, plan)
+
+    # Build Result
+    result = dict(
+        changed=plan.size > 0,
+        strategy=strategy,
+        created=[describe_record(zone_name, record) for record in plan.to_create],
+        updated=[describe_record(zone_name, record) for record in plan.to_update],
+        deleted=[describe_record(zone_name, record) for record in plan.to_delete],
+        msg="DNS Zone [{0}] Synchronized ({1} Created, {2} Updated, {3} Deleted, Strategy : {4})".format(
+            zone_name,
+            len(plan.to_create),
+            len(plan.to_update),
+            len(plan.to_delete),
+            strategy
+        )
+    )
+
+    # If Diff is Requested
+    if module._diff:
+
+        # Add Zone Files Diff
+        result['diff'] = dict(
+            before=render_zone_file(plan.current),
+            after=render_zone_file(plan.desired)
+        )
+
+    # Exit Module
+    module.exit_json(**result)
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build OVH Client from Module
+    client = ovh_zone_client(module)
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
@@ -79,7 +79,9 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ...module_utils.sonarqube.client import AlmAccessTokenClient, sonarqube_client
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_alm_access_token import AlmAccessTokenClient
 from ...module_utils.commons import filter_none
 from ...module_utils.sonarqube.models import AlmToken
 
@@ -247,6 +249,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).alm_access_token
 
@@ -84,7 +84,9 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ...module_utils.sonarqube.client import AlmSettingsGitlabClient, sonarqube_client
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_alm_settings import AlmSettingsGitlabClient
 from ...module_utils.sonarqube.models import AlmSettingsGitlab
 from ...module_utils.commons import filter_none
 
@@ -338,6 +340,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).alm_settings_gitlab
 
@@ -100,7 +100,9 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ...module_utils.sonarqube.client import ProjectClient, sonarqube_client
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_projects import ProjectClient
 from ...module_utils.sonarqube.models import ImportDopProjectSpec
 from ...module_utils.sonarqube.models import Project
 from ...module_utils.sonarqube.models import DevOpsPlatform
@@ -313,6 +315,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).project
 
@@ -0,0 +1,357 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: dop_projects
+version_added: "1.0.0"
+short_description: Manage many DevOps Platform Projects
+description:
+  - Used to Import and Delete many DevOps Platform Projects in a single Task
+  - DevOps Platform Settings are loaded once and existing Projects are searched by batches
+  - Missing Projects are imported with bounded concurrency
+requirements:
+  - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  base_url:
+    description:
+      - The Sonarqube API Base URL
+    required: true
+    type: str
+  username:
+    description:
+      - The Sonarqube API Admin Username
+    required: true
+    type: str
+  password:
+    description:
+      - The Sonarqube API Password
+    required: true
+    type: str
+  projects:
+    description:
+      - The DevOps Platform Projects to Manage
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      project_key:
+        description:
+          - The SonarQube Project Key
+        required: true
+        type: str
+      project_name:
+        description:
+          - The SonarQube Project Name (Defaults to the Project Key)
+        required: false
+        type: str
+      dev_ops_platform_key:
+        description:
+          - The SonarQube DevOps Platform Key (Required for 'present' State)
+        required: false
+        type: str
+      repository_identifier:
+        description:
+          - The SonarQube DevOps Repository ID (Required for 'present' State)
+        required: false
+        type: str
+      monorepo:
+        description:
+          - The SonarQube DevOps Mono Repository Status
+        required: false
+        default: true
+        type: bool
+      project_identifier:
+        description:
+          - The SonarQube DevOps Project Identifier
+        required: false
+        type: str
+      state:
+        description:
+          - The Project State
+        required: false
+        choices: ['present', 'absent']
+        default: 'present'
+        type: str
+  max_workers:
+    description:
+      - The Maximum Number of Concurrent Project Imports
+    required: false
+    type: int
+    default: 8
+'''
+
+EXAMPLES = r'''
+- name: "Import DevOps Platform Projects"
+  kube_cloud.general.sonarqube.dop_projects:
+    base_url: "http://localhost:9000"
+    username: "admin"
+    password: "admin"
+    max_workers: 16
+    projects:
+      - project_key: "kc-is-security-openvpn-service-provisioner"
+        dev_ops_platform_key: "github-connector"
+        repository_identifier: "kube-cloud/kc-is-security-openvpn-service-provisioner"
+        monorepo: false
+      - project_key: "kc-legacy-service"
+        state: 'absent'
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_projects import ProjectClient
+from ...module_utils.sonarqube.models import ImportDopProjectSpec
+
+try:
+    from requests import HTTPError
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Find and Return Existing Projects
+def search_projects(module: AnsibleModule, client: ProjectClient, project_keys: list) -> dict:
+
+    try:
+
+        # Call Client
+        return client.search_projects(project_keys=project_keys)
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Search Projects] - Failed Search SonarQube Projects : {0}".format(
+                api_error
+            )
+        )
+
+
+# Find and Return DOPs Index
+def get_dops(module: AnsibleModule, client: ProjectClient) -> dict:
+
+    try:
+
+        # Call Client
+        return client.get_dops()
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get DOPs] - Failed Retrieve SonarQube DevOps Platforms : {0}".format(
+                api_error
+            )
+        )
+
+
+# Import Projects
+def import_projects(module: AnsibleModule, client: ProjectClient, project_specs: list):
+
+    try:
+
+        # Call Client
+        return client.import_dop_projects(
+            project_specs=project_specs,
+            max_workers=module.params['max_workers']
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Import Projects] - Failed Import DOP Projects : {0}".format(
+                api_error
+            )
+        )
+
+
+# Delete Projects
+def delete_projects(module: AnsibleModule, client: ProjectClient, project_keys: list):
+
+    try:
+
+        # Call Client
+        return client.delete_projects(project_keys=project_keys)
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Delete Projects] - Failed Delete DOP Projects : {0}".format(
+                api_error
+            )
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=True, no_log=True),
+        password=dict(type='str', required=True, no_log=True),
+        projects=dict(
+            type='list',
+            elements='dict',
+            required=True,
+            options=dict(
+                project_key=dict(type='str', required=True, no_log=False),
+                project_name=dict(type='str', required=False, default=None, no_log=False),
+                dev_ops_platform_key=dict(type='str', required=False, default=None, no_log=False),
+                repository_identifier=dict(type='str', required=False, default=None, no_log=False),
+                monorepo=dict(type='bool', required=False, default=True, no_log=False),
+                project_identifier=dict(type='str', required=False, default=None, no_log=False),
+                state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
+            ),
+            required_if=[
+                ('state', 'present', ('dev_ops_platform_key', 'repository_identifier'))
+            ]
+        ),
+        max_workers=dict(type='int', required=False, default=8)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Client from Module
+        return sonarqube_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build Sonarqube API Client"
+        )
+
+
+# Build Requested DOP Project Import Spec
+def build_requested_import_dop_project_spec(params: dict) -> ImportDopProjectSpec:
+
+    # Build Requested Instance
+    return ImportDopProjectSpec(
+        project_key=params['project_key'].strip(),
+        project_name=params['project_name'] or params['project_key'].strip(),
+        dev_ops_platform_key=params['dev_ops_platform_key'],
+        repository_identifier=params['repository_identifier'],
+        monorepo=params['monorepo'],
+        project_identifier=params['project_identifier']
+    )
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: ProjectClient):
+
+    # Extract Projects
+    projects = module.params['projects']
+
+    # Find Existing Projects (Batch Search)
+    existing_projects = search_projects(
+        module=module,
+        client=client,
+        project_keys=[project['project_key'] for project in projects]
+    )
+
+    # Build Specifications of Missing Projects (Indexed by Key to Ignore Duplicates)
+    to_import = list({
+        project['project_key'].strip(): build_requested_import_dop_project_spec(project)
+        for project in projects
+        if project['state'] == 'present' and project['project_key'].strip() not in existing_projects
+    }.values())
+
+    # Build Keys of Existing Projects to Delete
+    to_delete = sorted(set(
+        project['project_key'].strip()
+        for project in projects
+        if project['state'] == 'absent' and project['project_key'].strip() in existing_projects
+    ))
+
+    # If Projects must be Imported
+    if len(to_import) > 0:
+
+        # Load DOPs Index Once
+        dops = get_dops(module=module, client=client)
+
+        # Find Unknown DOP Keys
+        unknown_dops = sorted(set(
+            spec.dev_ops_platform_key for spec in to_import if spec.dev_ops_platform_key not in dops
+        ))
+
+        # If Some DOP Keys are Unknown
+        if len(unknown_dops) > 0:
+
+            # Set Module Error
+            module.fail_json(
+                msg="[Import Projects] - Unknown DevOps Platforms : {0}".format(", ".join(unknown_dops))
+            )
+
+    # If Not in Check Mode
+    if not module.check_mode:
+
+        # Import Missing Projects
+        import_projects(
+            module=module,
+            client=client,
+            project_specs=to_import
+        )
+
+        # Delete Projects
+        delete_projects(
+            module=module,
+            client=client,
+            project_keys=to_delete
+        )
+
+    # Exit Module
+    module.exit_json(
+        changed=len(to_import) > 0 or len(to_delete) > 0,
+        imported=[spec.project_key for spec in to_import],
+        deleted=to_delete,
+        msg="DOP Projects Reconciled ({0} Imported, {1} Deleted, {2} Requested)".format(
+            len(to_import),
+            len(to_delete),
+            len(projects)
+        )
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build Client from Module
+    client = build_client(module).project
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
@@ -70,7 +70,9 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ...module_utils.sonarqube.client import GroupGlobalPermissionClient, sonarqube_client
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_group_global_permissions import GroupGlobalPermissionClient
 from ...module_utils.sonarqube.models import GroupGlobalPermission
 from ...module_utils.commons import filter_none
 
@@ -228,6 +230,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module).group_global_permission
 
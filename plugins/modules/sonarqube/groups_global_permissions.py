@@ -0,0 +1,261 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: groups_global_permissions
+version_added: "1.0.0"
+short_description: Reconcile Global Permissions of many Groups
+description:
+  - Used to Reconcile Sonarqube Global Permissions of many Groups at once
+  - Read the Group/Permission Matrix once, and only Add/Remove the Permissions that differ
+  - Permissions of Groups not listed are left untouched
+requirements:
+  - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  base_url:
+    description:
+      - The Sonarqube API Base URL
+    required: true
+    type: str
+  username:
+    description:
+      - The Sonarqube API Admin Username
+    required: true
+    type: str
+  password:
+    description:
+      - The Sonarqube API Password
+    required: true
+    type: str
+  groups:
+    description:
+      - The Groups to Reconcile, with their exact list of Global Permissions
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      group_name:
+        description:
+          - The SonarQube Group Name
+        required: true
+        type: str
+      permissions:
+        description:
+          - The SonarQube Group Global Permissions (Permissions not listed are Removed)
+        required: false
+        type: list
+        elements: str
+        choices: [
+            'admin', 'gateadmin', 'profileadmin', 'provisioning',
+            'scan', 'applicationcreator'
+        ]
+        default: []
+  max_workers:
+    description:
+      - The Maximum Number of Concurrent API Requests
+    required: false
+    type: int
+    default: 8
+'''
+
+EXAMPLES = r'''
+- name: "Reconcile SonarQube Groups Global Permissions"
+  kube_cloud.general.sonarqube.groups_global_permissions:
+    base_url: "http://localhost:9000"
+    username: "admin"
+    password: "admin"
+    groups:
+      - group_name: "developers"
+        permissions: ['scan']
+      - group_name: "leads"
+        permissions: ['gateadmin', 'profileadmin']
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_group_global_permissions import GroupGlobalPermissionClient
+from ...module_utils.sonarqube.models import GroupGlobalPermission
+from ...module_utils.commons import filter_none
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Find and Return Permissions Matrix
+def get_permissions_matrix(module: AnsibleModule, client: GroupGlobalPermissionClient):
+
+    try:
+
+        # Call Client
+        return client.get_permissions_matrix()
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Permissions Matrix] - Failed Read SonarQube Groups Permissions : {0}".format(
+                api_error
+            )
+        )
+
+
+# Apply Permissions Delta
+def apply_permissions_delta(
+    module: AnsibleModule,
+    client: GroupGlobalPermissionClient,
+    to_add: list,
+    to_remove: list
+):
+
+    try:
+
+        # Call Client
+        return client.apply_permissions_delta(
+            to_add=to_add,
+            to_remove=to_remove,
+            max_workers=module.params['max_workers']
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Apply Permissions] - Failed Reconcile SonarQube Groups Permissions : {0}".format(
+                api_error
+            )
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=True, no_log=True),
+        password=dict(type='str', required=True, no_log=True),
+        groups=dict(
+            type='list',
+            elements='dict',
+            required=True,
+            options=dict(
+                group_name=dict(type='str', required=True),
+                permissions=dict(
+                    type='list',
+                    elements='str',
+                    required=False,
+                    default=[],
+                    no_log=False,
+                    choices=GroupGlobalPermission.AVAILABLE_PERMISSIONS
+                )
+            )
+        ),
+        max_workers=dict(type='int', required=False, default=8)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Client from Module
+        return sonarqube_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build Sonarqube API Client"
+        )
+
+
+# Build Requested Permissions Matrix from Configuration
+def build_requested_matrix(params: dict) -> dict:
+
+    # Build Requested Matrix (Group Name -> Permission Names)
+    return {
+        group['group_name'].strip(): group['permissions'] or []
+        for group in params['groups']
+    }
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: GroupGlobalPermissionClient):
+
+    # Build Requested Matrix
+    desired = build_requested_matrix(module.params)
+
+    # Compute Delta from Current Matrix
+    to_add, to_remove = client.compute_permissions_delta(
+        current=get_permissions_matrix(module=module, client=client),
+        desired=desired
+    )
+
+    # Compute Changed Status
+    changed = len(to_add) > 0 or len(to_remove) > 0
+
+    # If Changes are Required and Not in Check Mode
+    if changed and not module.check_mode:
+
+        # Apply Delta
+        apply_permissions_delta(
+            module=module,
+            client=client,
+            to_add=to_add,
+            to_remove=to_remove
+        )
+
+    # Exit Module
+    module.exit_json(
+        changed=changed,
+        added=[filter_none(permission) for permission in to_add],
+        removed=[filter_none(permission) for permission in to_remove],
+        msg="Permissions of [{0}] Groups Reconciled ({1} Added, {2} Removed)".format(
+            len(desired),
+            len(to_add),
+            len(to_remove)
+        )
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build Client from Module
+    client = build_client(module).group_global_permission
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
@@ -101,7 +101,10 @@ EXAMPLES = r'''
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ...module_utils.sonarqube.client import UserClient, GroupMembershipClient, sonarqube_client
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client import sonarqube_client
+from ...module_utils.sonarqube.client_user import UserClient
+from ...module_utils.sonarqube.client_group_membership import GroupMembershipClient
 from ...module_utils.sonarqube.models import User
 from ...module_utils.commons import filter_none
 
@@ -347,6 +350,9 @@ def main():
     # Build Module
     module = build_ansible_module()
 
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
     # Build Client from Module
     client = build_client(module)
 
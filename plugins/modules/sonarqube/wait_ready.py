@@ -0,0 +1,214 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: wait_ready
+version_added: "1.0.0"
+short_description: Wait until a Sonarqube Server is Ready
+description:
+  - Used to Wait until the Sonarqube Server reports the 'UP' Status (api/system/status)
+  - The Status is polled with exponential backoff and jitter, until a total deadline
+  - Optionally trigger the Database Migration when the Server requires it
+  - Return the Readiness Details (status, version, attempts, elapsed_ms, first_response_ms, migration_triggered, transitions)
+requirements:
+  - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  base_url:
+    description:
+      - The Sonarqube API Base URL
+    required: true
+    type: str
+  username:
+    description:
+      - The Sonarqube API Admin Username (Status API is Public)
+    required: false
+    type: str
+  password:
+    description:
+      - The Sonarqube API Password (Status API is Public)
+    required: false
+    type: str
+  timeout:
+    description:
+      - The Total Deadline (Seconds)
+    required: false
+    type: int
+    default: 300
+  initial_delay:
+    description:
+      - The First Delay between two Polls (Seconds)
+    required: false
+    type: float
+    default: 1
+  max_delay:
+    description:
+      - The Maximum Delay between two Polls (Seconds)
+    required: false
+    type: float
+    default: 30
+  backoff_factor:
+    description:
+      - The Delay Multiplier applied after each Poll
+    required: false
+    type: float
+    default: 2
+  jitter:
+    description:
+      - The Random Fraction (between 0 and 1) removed from each Delay
+    required: false
+    type: float
+    default: 0.5
+  migrate_db:
+    description:
+      - Trigger the Database Migration when the Server requires it (Not Triggered in Check Mode)
+    required: false
+    type: bool
+    default: false
+  request_timeout:
+    description:
+      - The HTTP Request Timeout (Seconds)
+    required: false
+    type: float
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: "Wait for SonarQube"
+  kube_cloud.general.sonarqube.wait_ready:
+    base_url: "http://localhost:9000"
+    timeout: 600
+    migrate_db: true
+  register: sonar_ready
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ...module_utils.commons_instrumentation import instrument_module
+from ...module_utils.sonarqube.client_system import SystemClient
+
+try:
+    from requests import HTTPError
+    from requests.auth import HTTPBasicAuth
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Wait for Server
+def wait_ready(module: AnsibleModule, client: SystemClient) -> dict:
+
+    try:
+
+        # Call Client
+        return client.wait_ready(
+            timeout=module.params['timeout'],
+            initial_delay=module.params['initial_delay'],
+            max_delay=module.params['max_delay'],
+            backoff_factor=module.params['backoff_factor'],
+            jitter=module.params['jitter'],
+            migrate_db=module.params['migrate_db'] and not module.check_mode,
+            request_timeout=module.params['request_timeout']
+        )
+
+    except (HTTPError, TimeoutError) as wait_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Wait Ready] - SonarQube Server is not Ready : {0}".format(
+                wait_error
+            )
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=False, default=None, no_log=True),
+        password=dict(type='str', required=False, default=None, no_log=True),
+        timeout=dict(type='int', required=False, default=300),
+        initial_delay=dict(type='float', required=False, default=1),
+        max_delay=dict(type='float', required=False, default=30),
+        backoff_factor=dict(type='float', required=False, default=2),
+        jitter=dict(type='float', required=False, default=0.5),
+        migrate_db=dict(type='bool', required=False, default=False),
+        request_timeout=dict(type='float', required=False, default=10)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        required_together=[('username', 'password')],
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Authentication (Optional)
+        auth = None
+        if module.params['username']:
+            auth = HTTPBasicAuth(module.params['username'], module.params['password'])
+
+        # Build Client from Module
+        return SystemClient(base_url=module.params['base_url'], auth=auth)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build Sonarqube API Client"
+        )
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: SystemClient):
+
+    # Wait for Server
+    result = wait_ready(module=module, client=client)
+
+    # Exit Module
+    module.exit_json(
+        changed=result['migration_triggered'],
+        msg="SonarQube Server is {0} after {1} ms".format(
+            result['status'],
+            result['elapsed_ms']
+        ),
+        **result
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Record API Calls (Summary Returned as 'api_calls')
+    instrument_module(module)
+
+    # Build Client from Module
+    client = build_client(module)
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
@@ -0,0 +1,222 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import io
+import json
+import os
+import inspect
+from contextlib import redirect_stdout
+from importlib import import_module
+
+from ansible import constants as C
+from ansible.module_utils import basic
+from ansible.module_utils.common import warnings
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.utils.vars import merge_hash
+from ansible.vars.clean import remove_internal_keys
+
+
+# Collection Modules Package (eg. 'ansible_collections.kube_cloud.general.plugins.modules')
+MODULES_PACKAGE = "{0}.modules".format(__name__.rsplit('.', 2)[0])
+
+# Variable Selecting the Execution Side (true : Controller, false : Target Host, Unset : Controller for Local Connections)
+CONTROLLER_EXECUTION_VAR = "kube_cloud_general_controller_execution"
+
+# Module Arguments Serialization Profile (Ansible >= 2.19)
+MODULE_PROFILE = "legacy"
+
+
+class ControllerActionModule(ActionBase):
+    """
+    Action Plugin Executing an API Module In-Process on the Controller.
+
+    The Modules of the Collection only talk to HTTP APIs : When they would Run on the Controller anyway
+    (Local Connection, eg. 'delegate_to: localhost'), the Module is Imported and its 'main' is Called in
+    the Worker Process, without AnsiballZ Packaging, Transfer and Python Startup. Clients Built by the
+    Module are Shared in the Worker Process (eg. by the Items of a Loop).
+
+    The Execution Side is Selected with the 'kube_cloud_general_controller_execution' Variable :
+    true Runs the Module on the Controller whatever the Connection, false always Runs it on the Target
+    Host (Regular Module Execution). Async Tasks, Become Tasks and Modules whose Python Requirements
+    are Missing on the Controller Run on the Target Host.
+
+    Attributes:
+        MODULE_NAME (str): The Module Name, Relative to the Collection Modules (eg. 'haproxy.backend').
+    """
+
+    _supports_check_mode = True
+    _supports_async = True
+
+    # Module Name
+    MODULE_NAME = None
+
+    def run(self, tmp=None, task_vars=None):
+
+        # Initialize Result
+        result = super(ControllerActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        # Initialize Task Vars
+        task_vars = task_vars if task_vars is not None else dict()
+
+        # Load Module if it Runs on the Controller
+        module = self.load_module() if self.is_controller_execution(task_vars) else None
+
+        # If Module Runs on the Target Host
+        if module is None:
+
+            # Execute Module on the Target Host
+            wrap_async = self._task.async_val and not self._connection.has_native_async
+            result = merge_hash(result, self._execute_module(task_vars=task_vars, wrap_async=wrap_async))
+
+            # If Task is not Async
+            if not wrap_async:
+
+                # Remove Temporary Path
+                self._remove_tmp_path(self._connection._shell.tmpdir)
+
+            # Return Result
+            return result
+
+        # Execute Module on the Controller and Return Result
+        return merge_hash(result, self.execute_in_process(module, task_vars))
+
+    def is_controller_execution(self, task_vars: dict) -> bool:
+        """
+        Check if the Module Runs on the Controller.
+
+        Args:
+            task_vars (dict): The Task Variables.
+
+        Returns:
+            bool: True if the Module Runs on the Controller.
+        """
+
+        # If Task is Async or Executed as an other User (Target Host)
+        if self._task.async_val or self._play_context.become:
+            return False
+
+        # If Execution Side is Selected
+        selected = task_vars.get(CONTROLLER_EXECUTION_VAR, None)
+        if selected is not None:
+            return boolean(self._templar.template(selected), strict=False)
+
+        # Controller for Local Connections
+        return self._connection.transport == 'local'
+
+    def load_module(self):
+        """
+        Import the Module on the Controller.
+
+        Returns:
+            module: The Python Module (None if it cannot be Imported or its Requirements are Missing).
+        """
+
+        try:
+
+            # Import Module
+            module = import_module("{0}.{1}".format(MODULES_PACKAGE, self.MODULE_NAME))
+
+        except ImportError:
+
+            # Target Host
+            return None
+
+        # If a Python Requirement of the Module is Missing (eg. 'IMPORTS_OK', 'HAS_OVH')
+        if any(value is False for name, value in vars(module).items() if name == 'IMPORTS_OK' or name.startswith('HAS_')):
+
+            # Target Host
+            return None
+
+        # Return Module
+        return module
+
+    def execute_in_process(self, module, task_vars: dict) -> dict:
+        """
+        Execute the Module In-Process, the Way AnsiballZ Executes it on the Target Host.
+
+        Args:
+            module (module): The Python Module.
+            task_vars (dict): The Task Variables.
+
+        Returns:
+            dict: The Module Result.
+        """
+
+        # Build Module Arguments (Internal Arguments Included)
+        module_args = self._task.args.copy()
+        self._update_module_args(self._task.action, module_args, task_vars)
+        module_args['_ansible_tmpdir'] = None
+        module_args['_ansible_remote_tmp'] = C.DEFAULT_LOCAL_TMP
+
+        # Build Task Environment
+        environment = dict()
+        self._compute_environment_string(environment)
+        saved_environment = {key: os.environ.get(key, None) for key in environment}
+
+        # Save Module Arguments Globals
+        saved_args = basic._ANSIBLE_ARGS
+        saved_profile = getattr(basic, '_ANSIBLE_PROFILE', None)
+
+        # Clear Warnings and Deprecations of Previous Executions in the Process
+        for messages in (getattr(warnings, '_global_warnings', None), getattr(warnings, '_global_deprecations', None)):
+            if messages is not None:
+                messages.clear()
+
+        # Module Output
+        output = io.StringIO()
+        rc = 0
+
+        try:
+
+            # Set Module Arguments and Environment
+            basic._ANSIBLE_ARGS = to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=module_args)))
+            if hasattr(basic, '_ANSIBLE_PROFILE'):
+                basic._ANSIBLE_PROFILE = MODULE_PROFILE
+            os.environ.update({key: to_text(value) for key, value in environment.items()})
+
+            # Execute Module (exit_json and fail_json Print the Result then Exit)
+            with redirect_stdout(output):
+                module.main()
+
+        except SystemExit as exit_error:
+
+            # Keep Exit Code
+            rc = exit_error.code if isinstance(exit_error.code, int) else 1
+
+        finally:
+
+            # Restore Module Arguments Globals
+            basic._ANSIBLE_ARGS = saved_args
+            if hasattr(basic, '_ANSIBLE_PROFILE'):
+                basic._ANSIBLE_PROFILE = saved_profile
+
+            # Restore Environment
+            for key, value in saved_environment.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+        # Parse Module Output
+        result = self.parse_output(dict(rc=rc, stdout=output.getvalue(), stderr=''))
+
+        # Remove Internal Keys
+        remove_internal_keys(result)
+
+        # Return Result
+        return result
+
+    def parse_output(self, output: dict) -> dict:
+        """
+        Parse the Module Output (Ansible >= 2.19 Decodes it with the Serialization Profile).
+        """
+
+        # If Serialization Profiles are Supported
+        if 'profile' in inspect.signature(self._parse_returned_data).parameters:
+            return self._parse_returned_data(output, MODULE_PROFILE)
+
+        # Parse Output
+        return self._parse_returned_data(output)
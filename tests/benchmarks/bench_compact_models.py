@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Memory Benchmark of the Compact (Slotted) Server Snapshot against the Dataclass Server Snapshot.
+
+Run from a Collections Root (Directory Containing 'ansible_collections/kube_cloud/general') :
+
+    PYTHONPATH=<collections root> python tests/benchmarks/bench_compact_models.py
+"""
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from ansible_collections.kube_cloud.general.plugins.module_utils.haproxy.compact import CompactServer, compact_snapshot
+from ansible_collections.kube_cloud.general.plugins.module_utils.haproxy.diff import diff_model, from_api_payload, unwrap_response
+from ansible_collections.kube_cloud.general.plugins.module_utils.haproxy.models import Server
+
+
+# Build a Data Plane API Servers List Response (Wrapped as v2 Configuration Objects)
+def servers_response(count: int) -> dict:
+
+    # Return Response
+    return dict(_version=1, data=[
+        dict(
+            name="server_{0}".format(index),
+            address="10.{0}.{1}.{2}".format(index // 65536 % 256, index // 256 % 256, index % 256),
+            port=8080,
+            check="enabled",
+            weight=100,
+            maxconn=1000,
+            inter=2000
+        )
+        for index in range(count)
+    ])
+
+
+# Parse a Snapshot and Return it with its Retained Memory (Bytes) and Parse Time (Seconds)
+def measure(parse, response):
+
+    # Start Measure
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    # Parse Snapshot
+    snapshot = parse(response)
+
+    # Stop Measure
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Return Snapshot and Measures
+    return snapshot, retained, elapsed
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--servers', type=int, default=50000, help="Servers in the snapshot")
+    arguments = parser.parse_args()
+
+    # Build Response
+    response = servers_response(arguments.servers)
+
+    # Measure Dataclass Snapshot
+    dataclass_servers, dataclass_bytes, dataclass_time = measure(
+        lambda payload: [from_api_payload(Server, item) for item in unwrap_response(payload)],
+        response
+    )
+
+    # Measure Compact Snapshot
+    compact_servers, compact_bytes, compact_time = measure(
+        lambda payload: compact_snapshot(CompactServer, payload),
+        response
+    )
+
+    # Check Snapshots are Equivalent (Round Trip and Diff Read Path)
+    if compact_servers[-1].to_model() != dataclass_servers[-1]:
+        raise SystemExit("compact server differs from the dataclass server")
+    if diff_model(dataclass_servers[-1], compact_servers[-1]):
+        raise SystemExit("compact server diff is not empty")
+
+    # Print Results
+    count = arguments.servers
+    print("{0:<24}{1:>18}{2:>18}".format("{0} servers".format(count), "dataclass Server", "CompactServer"))
+    print("{0:<24}{1:>14.1f} MiB{2:>14.1f} MiB".format("retained memory", dataclass_bytes / 1048576, compact_bytes / 1048576))
+    print("{0:<24}{1:>16.0f} B{2:>16.0f} B".format("bytes per instance", dataclass_bytes / count, compact_bytes / count))
+    print("{0:<24}{1:>16.2f} s{2:>16.2f} s".format("parse time", dataclass_time, compact_time))
+
+
+if __name__ == '__main__':
+    main()
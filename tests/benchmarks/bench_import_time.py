@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the Import Time of the HAProxy and SonarQube Modules (Lazily Built Sub-Clients).
+
+Reports the Cumulative '-X importtime' of each Module (Microseconds, Best of N Fresh Interpreters),
+with ansible.module_utils.basic and requests Preloaded. Pass '--baseline' to Compare with an other
+Tree, eg. a Checkout of the Commit before the Change :
+
+    git worktree add /tmp/before/ansible_collections/kube_cloud/general <commit>
+    PYTHONPATH=<collections root> python tests/benchmarks/bench_import_time.py --baseline /tmp/before
+
+Run from a Collections Root (Directory Containing 'ansible_collections/kube_cloud/general').
+"""
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+
+# Collection Package
+COLLECTION_PACKAGE = "ansible_collections.kube_cloud.general"
+
+# Import Measured in a Fresh Interpreter (Dependencies Preloaded)
+IMPORT_CODE = "import ansible.module_utils.basic, requests, sys; __import__(sys.argv[1])"
+
+
+# Resolve the Collections Root of the Imported Collection
+def current_root() -> str:
+
+    # Import Collection
+    collection = __import__(COLLECTION_PACKAGE, fromlist=['plugins'])
+
+    # Return Root (Above 'ansible_collections')
+    return os.path.abspath(os.path.join(list(collection.__path__)[0], '..', '..', '..'))
+
+
+# List the Modules of the Benchmarked Areas
+def list_modules(root: str, areas: list) -> list:
+
+    # Return Module Names (eg. 'haproxy.backend')
+    return sorted(
+        "{0}.{1}".format(area, os.path.basename(path)[:-3])
+        for area in areas
+        for path in glob.glob(os.path.join(root, 'ansible_collections', 'kube_cloud', 'general', 'plugins', 'modules', area, '*.py'))
+        if not os.path.basename(path).startswith('__')
+    )
+
+
+# Measure the Cumulative Import Time of a Module (Microseconds, Best of Repeats)
+def import_time(root: str, module: str, repeat: int) -> int:
+
+    # Full Module Name
+    name = "{0}.plugins.modules.{1}".format(COLLECTION_PACKAGE, module)
+    times = []
+
+    # Import in Fresh Interpreters
+    for dummy in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', IMPORT_CODE, name],
+            env=dict(os.environ, PYTHONPATH=root),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=False
+        )
+        if process.returncode != 0:
+            raise SystemExit("Failed to import {0} from {1}:\n{2}".format(name, root, process.stderr[-2000:]))
+
+        # Extract Cumulative Time ('import time: self [us] | cumulative | imported package')
+        for line in process.stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == name:
+                times.append(int(parts[1]))
+
+    # Return Best Time
+    return min(times)
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('modules', nargs='*', help="Modules (eg. haproxy.backend), all HAProxy and SonarQube modules by default")
+    parser.add_argument('--baseline', help="Collections root of the tree to compare with")
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per module (best is kept)")
+    arguments = parser.parse_args()
+
+    # Resolve Trees and Modules
+    root = current_root()
+    modules = arguments.modules or list_modules(root, ['haproxy', 'sonarqube'])
+
+    # Measure and Print
+    for module in modules:
+        current = import_time(root, module, arguments.repeat)
+        if arguments.baseline:
+            print("{0:<36}{1:>8} -> {2}".format(module, import_time(arguments.baseline, module, arguments.repeat), current))
+        else:
+            print("{0:<36}{1:>8}".format(module, current))
+
+
+if __name__ == '__main__':
+    main()
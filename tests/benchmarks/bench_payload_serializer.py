@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Micro-Benchmark of the Payload Serializers (filter_none) against the asdict Based Implementation.
+
+Run from a Collections Root (Directory Containing 'ansible_collections/kube_cloud/general') :
+
+    PYTHONPATH=<collections root> python tests/benchmarks/bench_payload_serializer.py
+"""
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import timeit
+from dataclasses import asdict
+
+from ansible_collections.kube_cloud.general.plugins.module_utils.commons import filter_none
+from ansible_collections.kube_cloud.general.plugins.module_utils.haproxy.enums import (
+    HealthCheckType, LoadBalancingAlgorithm, ProxyProtocol
+)
+from ansible_collections.kube_cloud.general.plugins.module_utils.haproxy.models import (
+    Acl, Backend, Balance, HttpHealthCheck
+)
+
+
+# Previous filter_none Implementation (Reference)
+def asdict_filter_none(instance):
+
+    # Return Payload
+    return {name: value for name, value in asdict(instance).items() if value is not None}
+
+
+# Best Time of Repeated Runs (Seconds per Run)
+def best_time(function, number: int, repeat: int) -> float:
+
+    # Return Best Time
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--acls', type=int, default=5000, help="ACL payloads per bulk run")
+    parser.add_argument('--number', type=int, default=2000, help="Backend payloads per timed run")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs (best is kept)")
+    arguments = parser.parse_args()
+
+    # Build Backend with Nested Balance and Health Check
+    backend = Backend(
+        name="web",
+        mode=ProxyProtocol.HTTP,
+        balance=Balance(algorithm=LoadBalancingAlgorithm.ROUNDROBIN),
+        httpchk=HttpHealthCheck(type=HealthCheckType.SEND, uri="/health"),
+        description="Benchmark Backend",
+        connect_timeout=5000
+    )
+
+    # Build ACLs
+    acls = [Acl(acl_name="acl_{0}".format(index), criterion="path_beg", value="/api/{0}".format(index)) for index in range(arguments.acls)]
+
+    # Check Payloads are Equivalent (Previous Payloads Keep Nested None Fields)
+    if json.loads(json.dumps(filter_none(acls[0]))) != json.loads(json.dumps(asdict_filter_none(acls[0]))):
+        raise SystemExit("filter_none payload differs from the asdict payload")
+
+    # Measure
+    rows = [
+        (
+            "Backend, per call",
+            best_time(lambda: asdict_filter_none(backend), arguments.number, arguments.repeat) * 1e6,
+            best_time(lambda: filter_none(backend), arguments.number, arguments.repeat) * 1e6,
+            "us"
+        ),
+        (
+            "{0} Acl payloads".format(arguments.acls),
+            best_time(lambda: [asdict_filter_none(acl) for acl in acls], 1, arguments.repeat) * 1e3,
+            best_time(lambda: [filter_none(acl) for acl in acls], 1, arguments.repeat) * 1e3,
+            "ms"
+        )
+    ]
+
+    # Print Results
+    print("{0:<24}{1:>18}{2:>14}".format("", "asdict + filter", "serializer"))
+    for title, reference, current, unit in rows:
+        print("{0:<24}{1:>15.1f} {3}{2:>11.1f} {3}".format(title, reference, current, unit))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the pbkdf2_hash_many Filter against a pbkdf2_hash (passlib) Loop.
+
+Run from a Collections Root (Directory Containing 'ansible_collections/kube_cloud/general') :
+
+    PYTHONPATH=<collections root> python tests/benchmarks/bench_pbkdf2_hash_many.py
+"""
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.kube_cloud.general.plugins.filter.hash import pbkdf2_hash, pbkdf2_hash_many
+
+
+# Elapsed Time of a Function Call (Seconds) and its Result
+def timed(function):
+
+    # Call Function
+    start = time.perf_counter()
+    result = function()
+
+    # Return Elapsed Time and Result
+    return time.perf_counter() - start, result
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=50, help="Passwords hashed")
+    parser.add_argument('--rounds', type=int, default=100000, help="PBKDF2 rounds")
+    parser.add_argument('--max-workers', type=int, default=0, help="Process pool size (0 : CPU count)")
+    arguments = parser.parse_args()
+
+    # Build Entries (Fixed Salts, so Results are Comparable)
+    entries = [
+        dict(password="password-{0}".format(index), salt="salt-{0:011d}".format(index), rounds=arguments.rounds)
+        for index in range(arguments.entries)
+    ]
+
+    # Measure
+    loop_time, loop_results = timed(lambda: [pbkdf2_hash(entry['password'], entry['salt'], entry['rounds']) for entry in entries])
+    serial_time, serial_results = timed(lambda: pbkdf2_hash_many(entries, max_workers=1))
+    pool_time, pool_results = timed(lambda: pbkdf2_hash_many(entries, max_workers=arguments.max_workers))
+
+    # Check Results are Identical
+    for results in (serial_results, pool_results):
+        if [result['password_single_line'] for result in results] != [result['password_single_line'] for result in loop_results]:
+            raise SystemExit("pbkdf2_hash_many results differ from pbkdf2_hash")
+
+    # Print Results
+    print("{0} entries x {1} rounds".format(arguments.entries, arguments.rounds))
+    print("  {0:<32}{1:>8.2f}s".format("pbkdf2_hash loop (passlib)", loop_time))
+    print("  {0:<32}{1:>8.2f}s".format("pbkdf2_hash_many, serial", serial_time))
+    print("  {0:<32}{1:>8.2f}s".format("pbkdf2_hash_many, process pool", pool_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.kube_cloud.general.plugins.module_utils.commons_enum import (
+    BaseEnum, ENUM_LOOKUPS, build_enum_lookup
+)
+from ansible_collections.kube_cloud.general.plugins.module_utils.haproxy.enums import HttpRequestRuleType
+
+
+# Enumeration whose Member Name Collides with the Value of an other Member
+class CollidingEnum(BaseEnum):
+    FIRST = "second"
+    SECOND = "first"
+
+
+@pytest.fixture(autouse=True)
+def clear_lookups():
+
+    # Start every Test without Lookup Tables
+    ENUM_LOOKUPS.clear()
+    yield
+    ENUM_LOOKUPS.clear()
+
+
+@pytest.mark.parametrize('member', list(HttpRequestRuleType))
+def test_create_by_value(member):
+
+    # Value, Lower and Upper Cased Value
+    assert HttpRequestRuleType.create(member.value) is member
+    assert HttpRequestRuleType.create(member.value.lower()) is member
+    assert HttpRequestRuleType.create(member.value.upper()) is member
+
+
+@pytest.mark.parametrize('member', list(HttpRequestRuleType))
+def test_create_by_name(member):
+
+    # Name and Lower Cased Name
+    assert HttpRequestRuleType.create(member.name) is member
+    assert HttpRequestRuleType.create(member.name.lower()) is member
+
+
+def test_create_known_value():
+
+    # Value Matching (Previously Returned None)
+    assert HttpRequestRuleType.create('set-header') is HttpRequestRuleType.SET_HEADER
+
+
+def test_create_member_and_none():
+
+    # Member is Returned Unchanged, None Stays None
+    assert HttpRequestRuleType.create(HttpRequestRuleType.ALLOW) is HttpRequestRuleType.ALLOW
+    assert HttpRequestRuleType.create(None) is None
+
+
+@pytest.mark.parametrize('value', ['unknown-rule', '', 'set_header_', 42])
+def test_create_unknown_value(value):
+
+    # Unknown Values Return None
+    assert HttpRequestRuleType.create(value) is None
+
+
+def test_create_first_declared_member_wins():
+
+    # Name of a Member Colliding with the Value of an other Member
+    assert CollidingEnum.create('first') is CollidingEnum.FIRST
+    assert CollidingEnum.create('second') is CollidingEnum.FIRST
+
+
+def test_lookup_cache():
+
+    # Table is Built on First Use only
+    assert HttpRequestRuleType not in ENUM_LOOKUPS
+    HttpRequestRuleType.create('allow')
+    lookup = ENUM_LOOKUPS[HttpRequestRuleType]
+
+    # Table is Reused (Misses Included) and Kept per Class
+    HttpRequestRuleType.create('unknown-rule')
+    HttpRequestRuleType.create('deny')
+    assert ENUM_LOOKUPS[HttpRequestRuleType] is lookup
+    assert CollidingEnum not in ENUM_LOOKUPS
+
+    # Table Matches a Fresh Build
+    assert lookup == build_enum_lookup(HttpRequestRuleType)
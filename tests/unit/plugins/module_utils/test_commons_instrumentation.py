@@ -0,0 +1,86 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.kube_cloud.general.plugins.module_utils.commons_instrumentation import (
+    ApiCallRecorder, is_reload
+)
+
+
+# Data Plane API Configuration Root
+CONFIGURATION = "http://localhost:5555/v2/services/haproxy/configuration"
+
+
+# Minimal requests Response
+class FakeResponse:
+
+    def __init__(self, url, status_code=200, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers or {'Content-Length': '2'}
+        self.content = b'{}'
+        self.elapsed = None
+        self.request = None
+
+
+@pytest.mark.parametrize('method, url, status, headers', [
+
+    # Configuration Write Forcing the Reload outside a Transaction
+    ('PUT', CONFIGURATION + "/backends/web?version=3&force_reload=True", 200, None),
+    ('POST', CONFIGURATION + "/servers?backend=web&version=3&force_reload=true", 201, None),
+    ('DELETE', CONFIGURATION + "/servers/web1?backend=web&version=3&force_reload=true", 204, None),
+
+    # Transaction Commit
+    ('PUT', "http://localhost:5555/v2/services/haproxy/transactions/a1b2?force_reload=false", 200, None),
+
+    # Write Scheduling a Reload
+    ('POST', CONFIGURATION + "/backends?version=3&force_reload=false", 202, {'Reload-ID': '1'})
+])
+def test_reload_counted(method, url, status, headers):
+
+    # Call Reloaded HAProxy
+    assert is_reload(method, url, status, headers)
+
+
+@pytest.mark.parametrize('method, url, status', [
+
+    # Reads
+    ('GET', CONFIGURATION + "/backends?force_reload=true", 200),
+
+    # Writes inside a Transaction
+    ('PUT', CONFIGURATION + "/backends/web?transaction_id=a1b2", 202),
+    ('PUT', CONFIGURATION + "/backends/web?transaction_id=a1b2&force_reload=true", 202),
+
+    # Write not Forcing the Reload, without Reload Header
+    ('PUT', CONFIGURATION + "/backends/web?version=3&force_reload=false", 202),
+
+    # Failed Writes and Commits
+    ('PUT', CONFIGURATION + "/backends/web?version=3&force_reload=true", 409),
+    ('PUT', "http://localhost:5555/v2/services/haproxy/transactions/a1b2", 406),
+    ('PUT', CONFIGURATION + "/backends/web?version=3&force_reload=true", 'ConnectionError'),
+
+    # Transaction Creation and other APIs
+    ('POST', "http://localhost:5555/v2/services/haproxy/transactions?version=3", 201),
+    ('POST', "https://sonarqube.local/api/user_groups/create?force_reload=true", 200)
+])
+def test_reload_not_counted(method, url, status):
+
+    # Call did not Reload HAProxy
+    assert not is_reload(method, url, status, {})
+
+
+def test_forced_write_recorded_as_reload():
+
+    # Record a Forced Write and a Read
+    recorder = ApiCallRecorder()
+    recorder.start(module_name='backend')
+    recorder.record_response(FakeResponse(CONFIGURATION + "/backends/web?version=3&force_reload=True"), latency=1.0, method='PUT')
+    recorder.record_response(FakeResponse(CONFIGURATION + "/backends/web"), latency=1.0, method='GET')
+    summary = recorder.summary()
+    recorder.stop()
+
+    # Forced Write Counted as Reload
+    assert summary['reloads'] == 1
+    assert summary['endpoints']['PUT /v2/services/haproxy/configuration/backends/{name}']['reloads'] == 1
+    assert summary['endpoints']['GET /v2/services/haproxy/configuration/backends/{name}']['reloads'] == 0